@@ -0,0 +1,41 @@
+"""On-demand credit ledger reconciliation — verifies
+``credits.balance == sum(credit_ledger.delta)`` for every user and lists any
+drift. The same check runs nightly as the ``credit_ledger_reconcile`` pg_cron
+job; use this after a migration or when a balance looks wrong.
+
+Run (from the repo root, with the backend venv active):
+
+    .\\backend\\.venv\\Scripts\\python backend\\scripts\\reconcile_credits.py
+
+Read-only against the live Supabase project configured in ``backend/.env``.
+Exits non-zero when drift is found.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+
+from agentic_traveler.economy.credit_manager import reconcile_ledger
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("reconcile_credits")
+
+
+def main() -> int:
+    drift = reconcile_ledger()
+    if not drift:
+        logger.info("Credit ledger consistent: every balance equals its ledger sum.")
+        return 0
+    for row in drift:
+        logger.error(
+            "user_id=%s balance=%s ledger_sum=%s (off by %s)",
+            row["user_id"], row["balance"], row["ledger_sum"],
+            int(row["balance"]) - int(row["ledger_sum"]),
+        )
+    logger.error("Credit ledger drift for %d user(s).", len(drift))
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Pre-generate shared destination brief cores (``destination_briefs``) for
+the most-planned destinations, so their planning turns never wait on the
+brief model call.
+
+Destinations are ranked by how many trips list them in
+``trip_destinations``. Every (destination, month) pair already cached and
+still fresh is skipped, so re-running only fills gaps and expired rows.
+
+Run (from the repo root, with the backend venv active):
+
+    .\\backend\\.venv\\Scripts\\python backend\\scripts\\warm_brief_cache.py --top 50
+    .\\backend\\.venv\\Scripts\\python backend\\scripts\\warm_brief_cache.py --destinations "Kyoto, Japan" --months SEP OCT
+
+Writes to the live Supabase project configured in ``backend/.env`` and
+spends one gemini flash call per missing (destination, month).
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from collections import Counter
+
+from agentic_traveler.orchestrator.client_factory import get_client
+from agentic_traveler.orchestrator.sagas.destination_brief import MONTHS, capture_core_brief
+from agentic_traveler.tools import brief_cache
+from agentic_traveler.tools.db_client import get_db
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("warm_brief_cache")
+
+
+def top_destinations(n: int) -> list[str]:
+    """The ``n`` destinations appearing on the most trips (rejected ones excluded)."""
+    rows = (
+        get_db().table("trip_destinations").select("name, status")
+        .neq("status", "rejected").execute().data or []
+    )
+    counts: Counter[str] = Counter()
+    display: dict[str, str] = {}
+    for row in rows:
+        name = (row.get("name") or "").strip()
+        key = brief_cache.destination_key(name)
+        if key:
+            counts[key] += 1
+            display.setdefault(key, name)
+    return [display[key] for key, _ in counts.most_common(n)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=25, help="number of destinations to warm")
+    parser.add_argument("--destinations", nargs="*", help="explicit destinations (skips ranking)")
+    parser.add_argument("--months", nargs="*", default=list(MONTHS), choices=MONTHS)
+    args = parser.parse_args()
+
+    destinations = args.destinations or top_destinations(args.top)
+    client = get_client()
+    generated = skipped = failed = 0
+    for destination in destinations:
+        for month in args.months:
+            if brief_cache.stored(destination, month):
+                skipped += 1
+                continue
+            core = capture_core_brief(client, destination, month)
+            if core is None:
+                failed += 1
+                logger.warning("No brief for %s / %s", destination, month)
+                continue
+            brief_cache.put(destination, month, core)
+            generated += 1
+            logger.info("Cached brief for %s / %s", destination, month)
+
+    logger.info(
+        "Warm-up complete: %d generated, %d already cached, %d failed (%d destinations).",
+        generated, skipped, failed, len(destinations),
+    )
+
+
+if __name__ == "__main__":
+    main()
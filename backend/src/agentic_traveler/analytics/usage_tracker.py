@@ -21,7 +21,7 @@ import uuid
 from typing import Any, Dict, Optional
 
 from agentic_traveler.economy import credit_manager as _credit_manager
-from agentic_traveler.tools.user_repo import UserRepository
+from agentic_traveler.tools import identity_cache
 
 logger = logging.getLogger(__name__)
 
@@ -41,13 +41,8 @@ def _resolve_user_uuid(user_id_str: str) -> Optional[str]:
     except ValueError:
         pass
 
-    # Otherwise treat as telegram_id string and resolve from DB
-    try:
-        user_repo = UserRepository()
-        return user_repo.get_user_ref_by_telegram_id(user_id_str)
-    except Exception:
-        logger.warning("Failed to resolve user UUID for telegram_id %s", user_id_str)
-        return None
+    # Otherwise treat as telegram_id string and resolve via the identity cache
+    return identity_cache.resolve_user_uuid(user_id_str)
 
 
 def log_and_accumulate(
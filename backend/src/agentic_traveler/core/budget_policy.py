@@ -115,6 +115,57 @@ def resolve(call_type: str, user_doc: Optional[Dict[str, Any]] = None) -> Budget
     )
 
 
+# ── Prompt (input) budgets ──────────────────────────────────────────────────
+# Input-side counterpart of BUDGETS, used by orchestrator.prompt_assembler.
+# Per call type: a total prompt ceiling, and per section a (priority,
+# max_tokens) pair. Each section is first capped at its max_tokens (0 = no
+# cap); over the ceiling, the lowest-priority sections shrink first.
+# PINNED_PRIORITY sections (the user's message, the clock) never shrink.
+# Tokens are the local chars/4 estimate, not the SDK count.
+PINNED_PRIORITY = 100
+
+_AGENT_SECTIONS: Dict[str, tuple[int, int]] = {
+    "current_time":         (100, 0),
+    "user_message":         (100, 0),
+    "preference_updated":   (90,  200),
+    "user_profile_summary": (60,  1500),
+    "conversation_history": (40,  4000),
+}
+
+PROMPT_BUDGETS: Dict[str, tuple[int, Dict[str, tuple[int, int]]]] = {
+    "chat_ack":       (6000,  _AGENT_SECTIONS),
+    "trip_companion": (8000,  _AGENT_SECTIONS),
+    "itinerary":      (12000, {**_AGENT_SECTIONS, "conversation_history": (40, 6000)}),
+    # RouterAgent.classify (its usage metric reports call_type "extraction").
+    "router": (2500, {
+        "header":               (100, 0),
+        "user_message":         (100, 0),
+        "known_preferences":    (60,  600),
+        "conversation_history": (40,  1200),
+    }),
+}
+
+# Sections a call type does not list: uncapped, shrunk only after the history.
+_DEFAULT_SECTION = (50, 0)
+
+
+@dataclass
+class PromptBudget:
+    """Resolved input budget for one prompt."""
+    total_tokens: int
+    sections: Dict[str, tuple[int, int]]
+
+    def section(self, name: str) -> tuple[int, int]:
+        """``(priority, max_tokens)`` for section *name*."""
+        return self.sections.get(name, _DEFAULT_SECTION)
+
+
+def resolve_prompt(call_type: str) -> PromptBudget:
+    """Resolve the input PromptBudget for *call_type*. Unknown → "chat_ack"."""
+    total, sections = PROMPT_BUDGETS.get(call_type, PROMPT_BUDGETS["chat_ack"])
+    return PromptBudget(total_tokens=total, sections=sections)
+
+
 # ── Trim helper ─────────────────────────────────────────────────────────────
 
 # Patterns for inline markdown constructs that must not be trimmed mid-span.
@@ -0,0 +1,148 @@
+"""
+Lazily built process singletons and the optional start-up warm-up.
+
+Cloud Run routes the first request (and the startup probe) to an instance as
+soon as ``interfaces.main`` has been imported, so nothing heavy — google-genai,
+the saga registry, the Supabase client, the content libraries — may be
+imported or constructed at import time. Shared objects that are expensive to
+build are created on first use by a ``lazy_singleton`` factory instead, and
+the heavy imports live inside those factories.
+
+``warm_up`` builds every registered singleton (including ones registered by
+modules the warm-up itself imports). With ``WARM_UP_ON_STARTUP=1`` the app
+runs it on a background thread right after start-up, so the instance answers
+health checks immediately and the first user turn finds everything built.
+
+``tests/performance/import_time.py`` reports what ``interfaces.main`` imports
+and enforces the cold-import budget.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Generic, Iterator, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_registry: Dict[str, "LazySingleton[Any]"] = {}
+_registry_lock = threading.Lock()
+
+
+class LazySingleton(Generic[T]):
+    """A zero-argument factory whose result is built once, on first call.
+
+    Thread-safe: concurrent first callers wait for one build. A factory that
+    raises builds nothing, so the next call retries.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], T]):
+        self.name = name
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._value: Optional[T] = None
+        self._built = False
+        self.__doc__ = factory.__doc__
+        self.__wrapped__ = factory
+
+    def __call__(self) -> T:
+        if self._built:
+            return self._value  # type: ignore[return-value]
+        with self._lock:
+            if not self._built:
+                t0 = time.perf_counter()
+                self._value = self._factory()
+                self._built = True
+                logger.info(
+                    "Initialized %s in %.0f ms", self.name, (time.perf_counter() - t0) * 1000,
+                )
+        return self._value  # type: ignore[return-value]
+
+    @property
+    def initialized(self) -> bool:
+        return self._built
+
+    def reset(self) -> None:
+        """Forget the built value (tests, credential rotation)."""
+        with self._lock:
+            self._value, self._built = None, False
+
+    @contextmanager
+    def override(self, value: T) -> Iterator[T]:
+        """Serve ``value`` instead of building, restoring the previous state
+        afterwards (offline harnesses that install a fake client)."""
+        with self._lock:
+            saved = self._value, self._built
+            self._value, self._built = value, True
+        try:
+            yield value
+        finally:
+            with self._lock:
+                self._value, self._built = saved
+
+
+def lazy_singleton(name: str) -> Callable[[Callable[[], T]], LazySingleton[T]]:
+    """Register ``factory`` as the process-wide singleton ``name``."""
+
+    def register(factory: Callable[[], T]) -> LazySingleton[T]:
+        singleton = LazySingleton(name, factory)
+        with _registry_lock:
+            _registry[name] = singleton
+        return singleton
+
+    return register
+
+
+def registered() -> Dict[str, bool]:
+    """Registered singleton names → whether each has been built."""
+    with _registry_lock:
+        return {name: s.initialized for name, s in _registry.items()}
+
+
+def warm_up() -> Dict[str, float]:
+    """Build every registered singleton; returns ``{name: ms}`` for the ones
+    built now. Failures are logged and skipped — the first real call retries.
+    Singletons registered while warming (by modules a factory imports) are
+    built too."""
+    timings: Dict[str, float] = {}
+    attempted: set[str] = set()
+    while True:
+        with _registry_lock:
+            pending = [s for n, s in _registry.items() if n not in attempted and not s.initialized]
+        if not pending:
+            return timings
+        for singleton in pending:
+            attempted.add(singleton.name)
+            t0 = time.perf_counter()
+            try:
+                singleton()
+            except Exception:
+                logger.exception("Warm-up of %s failed; it will be built on first use.", singleton.name)
+                continue
+            timings[singleton.name] = round((time.perf_counter() - t0) * 1000, 1)
+
+
+def warm_up_enabled() -> bool:
+    return os.getenv("WARM_UP_ON_STARTUP", "").lower() in ("1", "true")
+
+
+def start_warm_up() -> Optional[threading.Thread]:
+    """Run ``warm_up`` on a daemon thread when ``WARM_UP_ON_STARTUP`` is set."""
+    if not warm_up_enabled():
+        return None
+
+    def _run() -> None:
+        t0 = time.perf_counter()
+        timings = warm_up()
+        logger.info(
+            "Warm-up finished in %.0f ms: %s", (time.perf_counter() - t0) * 1000, timings,
+        )
+
+    thread = threading.Thread(target=_run, name="warm-up", daemon=True)
+    thread.start()
+    return thread
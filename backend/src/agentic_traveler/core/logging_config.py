@@ -4,10 +4,37 @@ Centralized logging configuration.
 Call ``setup_logging()`` once at application startup (e.g. in the CLI
 entry-point).  All modules that use ``logging.getLogger(__name__)``
 will inherit the configured level and format automatically.
+
+Two modes (``LOG_FORMAT``; defaults to ``json`` on Cloud Run, where
+``K_SERVICE`` is set, and ``console`` elsewhere):
+
+- ``console`` — coloured, human-readable lines written synchronously.
+- ``json`` — request threads only put the record on a bounded queue
+  (``LOG_QUEUE_SIZE``); one listener thread formats it as a Cloud Logging
+  structured entry (severity, trace, turn id, hashed user id) and writes it.
+  When the queue is full the record is dropped and counted
+  (``dropped_records()``), and the count is reported in the next entry that
+  gets through. ``LOG_SAMPLE`` ("logger=rate,…", e.g.
+  ``agentic_traveler.tools.trip_repo=0.1``) keeps only that fraction of a
+  logger's records below WARNING.
+
+Per-request fields come from ``bind_log_context`` (a contextvar, so
+concurrent requests never see each other's).
 """
 
+import atexit
+import contextvars
+import copy
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import random
 import sys
+import threading
+import time
+from typing import Any, Dict, Optional
 
 try:
     import colorama
@@ -40,24 +67,227 @@ class ColorFormatter(logging.Formatter):
         return super().format(record)
 
 
-def setup_logging(verbose: bool = False) -> None:
+# ── Request context ─────────────────────────────────────────────────────────
+
+_log_context: contextvars.ContextVar[Dict[str, str]] = contextvars.ContextVar(
+    "log_context", default={}
+)
+
+
+def bind_log_context(**fields: Optional[str]) -> contextvars.Token:
+    """Add ``trace`` / ``turn_id`` / ``user`` (hashed) fields to every record
+    logged from this context. ``None`` values are ignored."""
+    merged = dict(_log_context.get())
+    merged.update({k: v for k, v in fields.items() if v})
+    return _log_context.set(merged)
+
+
+def reset_log_context(token: contextvars.Token) -> None:
+    _log_context.reset(token)
+
+
+def trace_from_header(header: Optional[str]) -> Optional[str]:
+    """Trace id from an ``X-Cloud-Trace-Context: TRACE_ID/SPAN_ID;o=1`` header."""
+    trace = (header or "").split("/", 1)[0].strip()
+    return trace or None
+
+
+class _ContextFilter(logging.Filter):
+    """Copies the caller's log context onto the record before it is queued
+    (the listener thread cannot see the request's contextvars)."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.log_context = _log_context.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keep ``rate`` of a logger's (and its children's) records below WARNING."""
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.rates = rates
+
+    def _rate(self, name: str) -> float:
+        while name:
+            if name in self.rates:
+                return self.rates[name]
+            name = name.rpartition(".")[0]
+        return 1.0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+        rate = self._rate(record.name)
+        return rate >= 1.0 or random.random() < rate
+
+
+def parse_sample_rates(spec: str) -> Dict[str, float]:
+    """``"a.b=0.1, c=0.5"`` → ``{"a.b": 0.1, "c": 0.5}``; bad entries are skipped."""
+    rates: Dict[str, float] = {}
+    for item in (spec or "").split(","):
+        name, _, rate = item.partition("=")
+        try:
+            rates[name.strip()] = min(1.0, max(0.0, float(rate)))
+        except ValueError:
+            continue
+    rates.pop("", None)
+    return rates
+
+
+# ── Structured (JSON) mode ──────────────────────────────────────────────────
+
+_SEVERITY = {
+    logging.DEBUG: "DEBUG",
+    logging.INFO: "INFO",
+    logging.WARNING: "WARNING",
+    logging.ERROR: "ERROR",
+    logging.CRITICAL: "CRITICAL",
+}
+
+
+class JsonFormatter(logging.Formatter):
+    """One Cloud Logging structured entry per line."""
+
+    def __init__(self, project: Optional[str] = None):
+        super().__init__()
+        self.project = project
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            message = f"{message}\n{record.exc_text}"
+        entry: Dict[str, Any] = {
+            "severity": _SEVERITY.get(record.levelno, "DEFAULT"),
+            "message": message,
+            "time": f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(record.created))}"
+                    f".{int(record.msecs):03d}Z",
+            "logger": record.name,
+            "logging.googleapis.com/sourceLocation": {
+                "file": record.pathname, "line": record.lineno, "function": record.funcName,
+            },
+        }
+        ctx = getattr(record, "log_context", None) or {}
+        trace = ctx.get("trace")
+        if trace:
+            entry["logging.googleapis.com/trace"] = (
+                f"projects/{self.project}/traces/{trace}" if self.project else trace
+            )
+        labels = {k: v for k, v in ctx.items() if k != "trace"}
+        if labels:
+            entry["logging.googleapis.com/labels"] = labels
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that never blocks: a full queue drops the record and counts it."""
+
+    def __init__(self, q: "queue.Queue[logging.LogRecord]"):
+        super().__init__(q)
+        self.dropped = 0
+        self._reported = 0
+        self._lock_dropped = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Render args and the traceback on the caller's thread (the objects may
+        # change after the call returns) but leave all formatting to the listener.
+        # A copy, like the stdlib's: other handlers still see the original.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock_dropped:
+                self.dropped += 1
+            return
+        if self.dropped > self._reported:
+            with self._lock_dropped:
+                total = self.dropped
+                newly = total - self._reported
+            note = logging.LogRecord(
+                "agentic_traveler.logging", logging.WARNING, __file__, 0,
+                "Log queue full: dropped %d record(s) (%d total).", (newly, total), None,
+            )
+            note.log_context = {}
+            try:
+                self.queue.put_nowait(self.prepare(note))
+            except queue.Full:
+                return  # reported with the next record that fits
+            with self._lock_dropped:
+                self._reported = max(self._reported, total)
+
+
+_queue_handler: Optional[BoundedQueueHandler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def dropped_records() -> int:
+    """Records dropped by the JSON mode's full queue since setup."""
+    return _queue_handler.dropped if _queue_handler else 0
+
+
+def _stop_listener() -> None:
+    global _listener, _queue_handler
+    if _listener is not None:
+        _listener.stop()  # drains what is queued
+        _listener = None
+    _queue_handler = None
+
+
+def _structured_handler(stream, sample: Dict[str, float]) -> logging.Handler:
+    global _listener, _queue_handler
+    _stop_listener()
+    sink = logging.StreamHandler(stream)
+    sink.setFormatter(JsonFormatter(project=os.getenv("GOOGLE_CLOUD_PROJECT")))
+    q: "queue.Queue[logging.LogRecord]" = queue.Queue(int(os.getenv("LOG_QUEUE_SIZE", "10000")))
+    _queue_handler = BoundedQueueHandler(q)
+    _queue_handler.addFilter(_ContextFilter())
+    if sample:
+        _queue_handler.addFilter(SamplingFilter(sample))
+    _listener = logging.handlers.QueueListener(q, sink, respect_handler_level=False)
+    _listener.start()
+    return _queue_handler
+
+
+atexit.register(_stop_listener)
+
+
+def setup_logging(verbose: bool = False, mode: Optional[str] = None, stream=None) -> None:
     """
     Configure the root logger.
 
     Args:
         verbose: If True, set level to DEBUG and show module names.
                  Otherwise, set to INFO with a compact format.
+        mode:    ``"console"`` or ``"json"``; defaults to ``LOG_FORMAT``, then
+                 ``json`` on Cloud Run and ``console`` elsewhere.
+        stream:  Where to write (default stderr).
     """
     level = logging.DEBUG if verbose else logging.INFO
+    mode = (mode or os.getenv("LOG_FORMAT") or ("json" if os.getenv("K_SERVICE") else "console")).lower()
     fmt = (
         "[%(asctime)s] %(levelname)-5s %(name)s — %(message)s"
         if verbose
         else "[%(asctime)s] %(levelname)-5s — %(message)s"
     )
-    # Use utf-8 encoding for the stream to avoid UnicodeEncodeError on Windows
-    stream = open(sys.stderr.fileno(), mode='w', encoding='utf-8', buffering=1) if sys.platform == 'win32' else sys.stderr
-    handler = logging.StreamHandler(stream)
-    handler.setFormatter(ColorFormatter(fmt, datefmt="%H:%M:%S"))
+    if stream is None:
+        # Use utf-8 encoding for the stream to avoid UnicodeEncodeError on Windows
+        stream = open(sys.stderr.fileno(), mode='w', encoding='utf-8', buffering=1) if sys.platform == 'win32' else sys.stderr
+    if mode == "json":
+        handler = _structured_handler(stream, parse_sample_rates(os.getenv("LOG_SAMPLE", "")))
+    else:
+        _stop_listener()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(ColorFormatter(fmt, datefmt="%H:%M:%S"))
 
     root = logging.getLogger()
     root.setLevel(level)
@@ -3,15 +3,32 @@
 This module is the SINGLE place where we touch LangSmith APIs other than the
 `@traceable` decorator imported from `langsmith` directly. Keeps the import
 surface tiny and the kill switch local.
+
+Tracing states, cheapest first:
+
+- off (neither ``LANGSMITH_TRACING=true`` nor ``TRACE_FILE``): ``traceable``
+  returns the function unchanged;
+- on, turn not sampled (``LANGSMITH_SAMPLE_RATE`` < 1): one contextvar read
+  per call, then the plain function;
+- on, turn sampled: LangSmith run tree and/or one JSON line per call in
+  ``TRACE_FILE`` (local exporter for offline inspection).
 """
 
 from __future__ import annotations
 
+import contextvars
+import functools
 import hashlib
 import hmac
+import inspect
+import json
 import logging
 import os
-from typing import Any, Callable, TypeVar
+import random
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional, TypeVar
 
 logger = logging.getLogger(__name__)
 
@@ -50,35 +67,180 @@ def hash_user_id(user_id: str | None) -> str:
 
 F = TypeVar("F", bound=Callable[..., Any])
 
-# Re-export `@traceable` from langsmith so callers import from observability,
-# not langsmith directly. This keeps `langsmith` swappable/removable in one
-# place. When LANGSMITH_TRACING is false the decorator is a no-op pass-through.
+# Head-based sampling: the first traced call of a turn (normally
+# orchestrator.process_request*) decides keep/drop once; every nested traced
+# call, including those in copy_context worker threads, follows that decision.
+# An unsampled turn calls the plain function — no LangSmith run tree, no input
+# serialization — so only the wrapper's contextvar read is paid.
+_SAMPLE_RATE = float(os.getenv("LANGSMITH_SAMPLE_RATE", "1.0"))
+_TRACE_FILE = os.getenv("TRACE_FILE", "")
+
+_turn_sampled: contextvars.ContextVar[Optional[bool]] = contextvars.ContextVar(
+    "trace_turn_sampled", default=None
+)
+_current_span: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar(
+    "trace_current_span", default=None
+)
+
+_PREVIEW_CHARS = 2000
+_PREVIEW_ITEMS = 50
+
+
+def is_turn_sampled() -> bool:
+    """True when the current turn's traces are being kept."""
+    return bool(_turn_sampled.get())
+
+
+def _decide() -> bool:
+    return _SAMPLE_RATE >= 1.0 or random.random() < _SAMPLE_RATE
+
+
+def _preview(value: Any, depth: int = 0) -> Any:
+    """JSON-safe, size-bounded copy of a traced input/output."""
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        return value if len(value) <= _PREVIEW_CHARS else value[:_PREVIEW_CHARS] + "…"
+    if depth < 3 and isinstance(value, dict):
+        items = list(value.items())[:_PREVIEW_ITEMS]
+        return {str(k): _preview(v, depth + 1) for k, v in items}
+    if depth < 3 and isinstance(value, (list, tuple)):
+        return [_preview(v, depth + 1) for v in value[:_PREVIEW_ITEMS]]
+    return _preview(repr(value), depth)
+
+
+class FileTraceExporter:
+    """
+    Writes one JSON line per traced call (``TRACE_FILE``) for offline
+    inspection without a LangSmith project. Spans carry ``trace_id`` /
+    ``parent_id`` so a turn's tree can be rebuilt; inputs are bound and
+    previewed only when the span is written, i.e. only for sampled turns.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._fh = None
+
+    def write(self, span: Dict[str, Any]) -> None:
+        line = json.dumps(span, default=repr, ensure_ascii=False)
+        with self._lock:
+            if self._fh is None:
+                self._fh = open(self.path, "a", encoding="utf-8", buffering=1)
+            self._fh.write(line + "\n")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+    def wrap(self, fn: Callable, traced: Callable, name: str,
+             process_inputs: Optional[Callable[[dict], dict]] = None) -> Callable:
+        signature = inspect.signature(fn)
+
+        def _export(*args: Any, **kwargs: Any) -> Any:
+            parent = _current_span.get()
+            span: Dict[str, Any] = {
+                "trace_id": parent["trace_id"] if parent else uuid.uuid4().hex,
+                "span_id": uuid.uuid4().hex[:16],
+                "parent_id": parent["span_id"] if parent else None,
+                "name": name,
+                "start": time.time(),
+                "metadata": {},
+            }
+            token = _current_span.set(span)
+            t = time.perf_counter()
+            output: Any = None
+            try:
+                output = traced(*args, **kwargs)
+                return output
+            except BaseException as exc:
+                span["error"] = f"{type(exc).__name__}: {exc}"
+                raise
+            finally:
+                _current_span.reset(token)
+                span["duration_ms"] = round((time.perf_counter() - t) * 1000, 3)
+                try:
+                    bound = signature.bind_partial(*args, **kwargs)
+                    inputs = {k: v for k, v in bound.arguments.items() if k != "self"}
+                    if process_inputs is not None:
+                        inputs = process_inputs(inputs)
+                    span["inputs"] = _preview(inputs)
+                    span["output"] = _preview(output)
+                    self.write(span)
+                except Exception:
+                    logger.debug("Trace export failed for %s.", name, exc_info=True)
+
+        return _export
+
+
+_langsmith_traceable: Optional[Callable[..., Any]] = None
 if _TRACING_ENABLED:
     try:
-        from langsmith import traceable as _traceable  # type: ignore[import-not-found]
+        from langsmith import traceable as _langsmith_traceable  # type: ignore[import-not-found,no-redef]
 
-        traceable = _traceable
-        logger.info("LangSmith tracing enabled.")
+        logger.info("LangSmith tracing enabled (sample rate %.2f).", _SAMPLE_RATE)
     except Exception:
         logger.warning("langsmith import failed; tracing disabled.", exc_info=True)
 
-        def traceable(*dargs, **dkwargs):  # type: ignore[no-redef]
-            def _decorator(fn: F) -> F:
-                return fn
-            return _decorator
+_exporter: Optional[FileTraceExporter] = FileTraceExporter(_TRACE_FILE) if _TRACE_FILE else None
+
+
+def _noop_traceable(*dargs, **dkwargs):
+    def _decorator(fn: F) -> F:
+        return fn
+    return _decorator
+
+
+def _sampling_traceable(*dargs, **dkwargs):
+    """``@traceable`` with per-turn head sampling over LangSmith and/or the file exporter."""
+    def _decorator(fn: F) -> F:
+        traced: Callable = fn
+        if _langsmith_traceable is not None:
+            traced = _langsmith_traceable(*dargs, **dkwargs)(fn)
+        if _exporter is not None:
+            traced = _exporter.wrap(
+                fn, traced, dkwargs.get("name") or fn.__qualname__, dkwargs.get("process_inputs")
+            )
+        if traced is fn or inspect.iscoroutinefunction(fn) or inspect.isgeneratorfunction(fn):
+            return traced  # type: ignore[return-value]
+
+        @functools.wraps(fn)
+        def _wrapper(*args: Any, **kwargs: Any) -> Any:
+            sampled = _turn_sampled.get()
+            if sampled is None:
+                sampled = _decide()
+                token = _turn_sampled.set(sampled)
+                try:
+                    return traced(*args, **kwargs) if sampled else fn(*args, **kwargs)
+                finally:
+                    _turn_sampled.reset(token)
+            return traced(*args, **kwargs) if sampled else fn(*args, **kwargs)
+
+        return _wrapper  # type: ignore[return-value]
+    return _decorator
+
+
+# Re-export `@traceable` so callers import from observability, not langsmith
+# directly. This keeps `langsmith` swappable/removable in one place. When
+# neither LangSmith nor TRACE_FILE is on, the decorator is a no-op
+# pass-through: decorated functions are the originals.
+if _langsmith_traceable is not None or _exporter is not None:
+    traceable = _sampling_traceable
 else:
-    def traceable(*dargs, **dkwargs):  # type: ignore[no-redef]
-        def _decorator(fn: F) -> F:
-            return fn
-        return _decorator
+    traceable = _noop_traceable
 
 
 def attach_run_metadata(**kw: Any) -> None:
     """
     Attach NON-PII metadata to the current run, if tracing is on.
-    Safe to call when tracing is off (no-op).
+    Safe to call when tracing is off or the turn is not sampled (no-op).
     """
-    if not _TRACING_ENABLED:
+    span = _current_span.get()
+    if span is not None:
+        span["metadata"].update(kw)
+    if not _TRACING_ENABLED or _turn_sampled.get() is False:
         return
     try:
         from langsmith.run_helpers import get_current_run_tree  # type: ignore[import-not-found]
@@ -97,9 +259,13 @@ def record_run_error(message: str) -> None:
     the user, so nothing propagates as an exception — which means LangSmith
     would otherwise record the trace as successful. Setting the run tree's
     ``error`` field surfaces the failure (red run) so it's queryable. Best-effort
-    and a no-op when tracing is off.
+    and a no-op when tracing is off or the turn is not sampled.
     """
-    if not _TRACING_ENABLED:
+    span = _current_span.get()
+    if span is not None:
+        span["error"] = message
+        span["metadata"]["agent_failed"] = True
+    if not _TRACING_ENABLED or _turn_sampled.get() is False:
         return
     try:
         from langsmith.run_helpers import get_current_run_tree  # type: ignore[import-not-found]
@@ -19,6 +19,72 @@ _CONTROL_CHAR_RE = re.compile(
 )
 
 
+# Star ratings: "5* hotel", "4*", "a 3 * room" → "5★ hotel"
+_STAR_RATING_RE = re.compile(r"(\d)\s*\*")
+# Below this many characters per "*", the regex above (tried at every
+# position) beats splitting on "*" and checking each piece in Python.
+_DENSE_STARS_CHARS = 12
+# A "bare" delimiter is NOT part of a *word* pair: whitespace or the start
+# before it, or a non-delimiter before it and whitespace or the end after it.
+# Written delimiter-first so the regex engine can skip straight to candidates.
+_BARE_RE = {
+    "*": re.compile(r"\*(?:(?<![^\s]\*)|(?<!\*\*)(?![^\s]))"),
+    "_": re.compile(r"_(?:(?<![^\s]_)|(?<!__)(?![^\s]))"),
+}
+
+
+def _star_ratings(text: str, stars: int) -> str:
+    """``_STAR_RATING_RE.sub(r"\\1★", text)``, for a text with ``stars`` asterisks."""
+    if not stars:
+        return text
+    if len(text) < stars * _DENSE_STARS_CHARS:
+        return _STAR_RATING_RE.sub(r"\1★", text)
+    pieces = text.split("*")
+    out = []
+    for piece in pieces[:-1]:
+        kept = piece.rstrip()
+        if kept and kept[-1].isdecimal():  # \d is Unicode category Nd
+            out.append(kept)
+            out.append("★")
+        else:
+            out.append(piece)
+            out.append("*")
+    out.append(pieces[-1])
+    return "".join(out)
+
+
+def _is_bare(text: str, i: int, skip: int) -> bool:
+    """``_BARE_RE`` for ``text[i]`` as if ``text[skip]`` were already removed."""
+    before = i - 1 if i - 1 != skip else i - 2
+    if before < 0 or text[before].isspace():
+        return True
+    after = i + 1 if i + 1 != skip else i + 2
+    return text[before] != text[i] and (after >= len(text) or text[after].isspace())
+
+
+def _orphan(text: str, ch: str, skip: int = -1) -> int:
+    """
+    Index of the ``ch`` to drop when its count is odd: the first bare one,
+    else the last one. ``skip`` is an index already dropped (the orphan
+    ``*``); only the two neighbours of it can see a different context, so
+    they are re-checked by hand instead of rebuilding the string.
+    """
+    near = (skip - 1, skip + 1) if skip >= 0 else ()
+    pattern, pos, first = _BARE_RE[ch], 0, -1
+    while True:
+        m = pattern.search(text, pos)
+        if m is None:
+            break
+        if m.start() not in near:
+            first = m.start()
+            break
+        pos = m.start() + 1
+    for i in near:
+        if 0 <= i < len(text) and text[i] == ch and (first < 0 or i < first) and _is_bare(text, i, skip):
+            first = i
+    return first if first >= 0 else text.rfind(ch)
+
+
 def sanitize_telegram_markdown(text: str) -> str:
     """
     Fix unbalanced Telegram MarkdownV1 entities in LLM output before sending.
@@ -30,45 +96,34 @@ def sanitize_telegram_markdown(text: str) -> str:
     Strategy:
     1. Convert star-rating patterns like "5*" / "4 * property" to "5★"
        (Unicode BLACK STAR is safe and visually equivalent).
-    2. If * count is still odd after step 1, strip bare asterisks that are
-       not part of a *word* bold pair until the count is even.
-    3. Same treatment for _ (italic).
+    2. If the * count is still odd after step 1, drop one bare asterisk
+       (not part of a *word* bold pair), else the last one.
+    3. Same treatment for _ (italic), on the text as left by step 2.
+
+    Removing one delimiter makes its count even, so at most one of each is
+    dropped. Both are located on the step-1 text with precompiled patterns
+    and cut out in a single join, without rebuilding the reply in between.
+    Step 1 splits on "*" unless the text is dense in asterisks (long planner
+    replies with a few dozen bold markers are the common case here).
     """
     if not text:
         return text
 
-    # Step 1 — star ratings: "5* hotel", "4*", "a 3 * room" → "5★ hotel"
-    text = re.sub(r"(\d)\s*\*", r"\1★", text)
-
-    # Step 2 — balance remaining *
-    # A "bare" asterisk is one that is NOT immediately adjacent to a non-space
-    # character on both sides (i.e. not part of *bold text*).
-    while text.count("*") % 2 != 0:
-        # Prefer to remove a bare * (surrounded by spaces / at boundary)
-        m = re.search(r"(?<![^\s])\*|(?<!\*)\*(?![^\s])", text)
-        if m:
-            text = text[: m.start()] + text[m.end() :]
-        else:
-            # All remaining * are word-adjacent; remove the last one
-            pos = text.rfind("*")
-            if pos == -1:
-                break
-            text = text[:pos] + text[pos + 1 :]
-            logger.debug("sanitize_telegram_markdown: removed orphan * at pos %d", pos)
-
-    # Step 3 — balance remaining _
-    while text.count("_") % 2 != 0:
-        m = re.search(r"(?<![^\s])_|(?<!_)_(?![^\s])", text)
-        if m:
-            text = text[: m.start()] + text[m.end() :]
-        else:
-            pos = text.rfind("_")
-            if pos == -1:
-                break
-            text = text[:pos] + text[pos + 1 :]
-            logger.debug("sanitize_telegram_markdown: removed orphan _ at pos %d", pos)
+    text = _star_ratings(text, text.count("*"))
+
+    drop_star = _orphan(text, "*") if text.count("*") % 2 else -1
+    drop_under = _orphan(text, "_", skip=drop_star) if text.count("_") % 2 else -1
+    if drop_star < 0 and drop_under < 0:
+        return text
 
-    return text
+    cuts = sorted(i for i in (drop_star, drop_under) if i >= 0)
+    logger.debug("sanitize_telegram_markdown: removed orphan delimiter(s) at %s", cuts)
+    parts, start = [], 0
+    for i in cuts:
+        parts.append(text[start:i])
+        start = i + 1
+    parts.append(text[start:])
+    return "".join(parts)
 
 
 def sanitize_user_input(text: str) -> str:
@@ -8,6 +8,13 @@ Database layout (``credits`` table, one row per user):
     total_spent   : INT   — lifetime credits consumed
     used_promos   : TEXT[] — promo codes already redeemed
 
+Every balance change is appended to ``credit_ledger`` by a single atomic RPC
+(``apply_credit_delta`` / ``redeem_promo_code`` / ``bill_turn``) keyed by an
+idempotency key, so ``balance`` is a materialized sum of the ledger and
+concurrent or retried mutations can neither lose nor double-apply a change.
+A turn is billed in one round trip: ``bill_turn`` accumulates the turn's
+per-model usage and applies its deduction in the same transaction.
+
 1 credit = 1 eurocent.  New users receive DEFAULT_USER_CREDITS on signup.
 
 Cost formula
@@ -26,6 +33,7 @@ import logging
 import math
 import os
 import threading
+import uuid
 from typing import Any, Dict, List, Optional, Tuple
 
 from agentic_traveler.economy.promo_codes import PROMO_CODES
@@ -39,6 +47,9 @@ USD_TO_EUR_RATE = float(os.getenv("USD_TO_EUR_RATE", "0.90"))
 MARKUP_MULTIPLIER = 3
 MARKUP_MULTIPLIER_GROUNDING = 2
 
+# Ledger RPCs are idempotent, so transient failures are retried this many times.
+RPC_ATTEMPTS = 3
+
 # USD per 1 M tokens
 MODEL_PRICING: Dict[str, Dict[str, float]] = {
     "gemini-2.5-flash":              {"input": 0.30, "output": 2.50},
@@ -80,7 +91,10 @@ def has_credits(user_doc: Dict[str, Any]) -> bool:
 
 def initialize_credits(user_id: str, amount: Optional[int] = None) -> None:
     """
-    Insert the initial credits row for a new user.
+    Ensure a credits row exists for a new user and apply the initial grant.
+
+    The grant goes through the ledger keyed ``grant:<user_id>``, so calling
+    this twice never double-grants.
 
     Args:
         user_id: The user's UUID in the ``users`` table.
@@ -95,89 +109,156 @@ def initialize_credits(user_id: str, amount: Optional[int] = None) -> None:
         get_db().table("credits").upsert(
             {
                 "user_id": user_id,
-                "balance": grant,
+                "balance": 0,
                 "initial_grant": grant,
                 "total_spent": 0,
                 "used_promos": [],
-            }
+            },
+            ignore_duplicates=True,
         ).execute()
-        logger.info("Initialized %d credits for user_id=%s", grant, user_id)
     except Exception:
         logger.exception("Failed to initialize credits for user_id=%s", user_id)
+        return
+    if apply_credit_delta(user_id, grant, "grant", f"grant:{user_id}") is not None:
+        logger.info("Initialized %d credits for user_id=%s", grant, user_id)
 
 
-def deduct_credits(user_id: str, amount: int) -> None:
+def apply_credit_delta(
+    user_id: str,
+    delta: int,
+    reason: str,
+    idempotency_key: str,
+) -> Optional[int]:
     """
-    Deduct credits from a user atomically via a Supabase stored procedure.
-    Balance never goes below 0. Uses RPC to avoid a read-then-write race
-    condition under concurrent requests.
+    Apply one balance change through the ``apply_credit_delta`` RPC.
+
+    The RPC locks the user's credits row, appends a ``credit_ledger`` row and
+    updates the materialized balance in one transaction. Debits floor at 0.
+    Replaying an ``idempotency_key`` returns the recorded balance without
+    changing anything, so a failed call is retried (RPC_ATTEMPTS) safely.
 
     Args:
-        user_id: The user's UUID.
-        amount:  Number of credits to deduct.
+        user_id:         The user's UUID.
+        delta:           Positive to add credits, negative to deduct.
+        reason:          Ledger reason ('grant', 'top_up', 'promo', 'turn').
+        idempotency_key: Unique key for this logical change.
+
+    Returns:
+        The balance after the change, or None if it could not be applied.
     """
     from agentic_traveler.tools.db_client import get_db
 
+    params = {
+        "p_user_id": user_id,
+        "p_delta": delta,
+        "p_reason": reason,
+        "p_idempotency_key": idempotency_key,
+    }
+    for attempt in range(1, RPC_ATTEMPTS + 1):
+        try:
+            resp = get_db().rpc("apply_credit_delta", params).execute()
+        except Exception:
+            if attempt == RPC_ATTEMPTS:
+                logger.exception(
+                    "apply_credit_delta failed for user_id=%s key=%s",
+                    user_id, idempotency_key,
+                )
+                return None
+            logger.warning(
+                "apply_credit_delta attempt %d failed for key=%s; retrying.",
+                attempt, idempotency_key, exc_info=True,
+            )
+            continue
+        balance = resp.data if resp is not None else None
+        if balance is None:
+            logger.warning("apply_credit_delta: no credits row for user_id=%s", user_id)
+        return balance
+    return None
+
+
+def deduct_credits(user_id: str, amount: int, idempotency_key: Optional[str] = None) -> None:
+    """
+    Deduct credits from a user atomically via the ledger RPC.
+    Balance never goes below 0.
+
+    Args:
+        user_id:         The user's UUID.
+        amount:          Number of credits to deduct.
+        idempotency_key: Key for this deduction (e.g. ``turn:<turn_id>``).
+                         A fresh key is generated when omitted.
+    """
     if not user_id or amount <= 0:
         return
 
-    try:
-        # The stored procedure handles atomicity and the balance floor at 0.
-        resp = get_db().rpc(
-            "deduct_credits", {"p_user_id": user_id, "p_amount": amount}
-        ).execute()
-        new_balance = resp.data if resp and resp.data is not None else "unknown"
-        logger.info(
-            "💳 Deducted %d credits from user_id=%s. Remaining: %s",
-            amount, user_id, new_balance,
-        )
-    except Exception:
-        logger.exception("Failed to deduct credits from user_id=%s", user_id)
+    key = idempotency_key or f"turn:{uuid.uuid4()}"
+    new_balance = apply_credit_delta(user_id, -amount, "turn", key)
+    logger.info(
+        "💳 Deducted %d credits from user_id=%s. Remaining: %s",
+        amount, user_id, new_balance if new_balance is not None else "unknown",
+    )
 
 
+def deduct_credits_async(
+    user_id: str, amount: int, idempotency_key: Optional[str] = None
+) -> None:
+    """Fire-and-forget credit deduction in a background thread.
 
-def deduct_credits_async(user_id: str, amount: int) -> None:
-    """Fire-and-forget credit deduction in a background thread."""
+    The idempotency key is fixed before the thread starts, so the RPC's own
+    retries (or a caller re-running the turn's billing) can never double-bill.
+    """
+    key = idempotency_key or f"turn:{uuid.uuid4()}"
     threading.Thread(
         target=deduct_credits,
-        args=(user_id, amount),
+        args=(user_id, amount, key),
         daemon=True,
     ).start()
 
 
-def add_credits(user_id: str, amount: int) -> None:
+def add_credits(user_id: str, amount: int, idempotency_key: Optional[str] = None) -> Optional[int]:
     """
-    Add credits to a user's balance.
+    Add credits to a user's balance (admin top-up).
 
     Args:
-        user_id: The user's UUID.
-        amount:  Number of credits to add.
-    """
-    from agentic_traveler.tools.db_client import get_db
+        user_id:         The user's UUID.
+        amount:          Number of credits to add.
+        idempotency_key: Key for this top-up; a retried request with the same
+                         key is applied once. A fresh key is generated when
+                         omitted.
 
+    Returns:
+        The new balance, or None if nothing was applied.
+    """
     if not user_id or amount <= 0:
-        return
+        return None
 
-    try:
-        resp = (
-            get_db()
-            .table("credits")
-            .select("balance")
-            .eq("user_id", user_id)
-            .maybe_single()
-            .execute()
-        )
-        if not resp.data:
-            logger.warning("add_credits: no credits row for user_id=%s", user_id)
-            return
-
-        new_balance = resp.data["balance"] + amount
-        get_db().table("credits").update(
-            {"balance": new_balance}
-        ).eq("user_id", user_id).execute()
+    key = f"top_up:{idempotency_key or uuid.uuid4()}"
+    new_balance = apply_credit_delta(user_id, amount, "top_up", key)
+    if new_balance is not None:
         logger.info("💳 Added %d credits to user_id=%s", amount, user_id)
-    except Exception:
-        logger.exception("Failed to add credits to user_id=%s", user_id)
+    return new_balance
+
+
+def reconcile_ledger() -> List[Dict[str, Any]]:
+    """
+    Verify ``credits.balance == sum(credit_ledger.delta)`` for every user.
+
+    Runs nightly as a pg_cron job; this wrapper lets ops scripts run it on
+    demand (scripts/reconcile_credits.py).
+
+    Returns:
+        One ``{"user_id", "balance", "ledger_sum"}`` dict per drifted user
+        (empty when the ledger is consistent).
+    """
+    from agentic_traveler.tools.db_client import get_db
+
+    resp = get_db().rpc("reconcile_credit_ledger", {}).execute()
+    drift = list(resp.data or []) if resp is not None else []
+    for row in drift:
+        logger.error(
+            "Credit ledger drift for user_id=%s: balance=%s ledger_sum=%s",
+            row.get("user_id"), row.get("balance"), row.get("ledger_sum"),
+        )
+    return drift
 
 
 def calculate_grounding_cost(grounding_count: int) -> int:
@@ -277,28 +358,20 @@ def redeem_promo(
         return False, f'❌ You\'ve already used the code "{normalized}".', 0
 
     try:
-        # Read current balance first
-        resp = (
-            get_db()
-            .table("credits")
-            .select("balance, used_promos")
-            .eq("user_id", user_id)
-            .maybe_single()
-            .execute()
-        )
-        if not resp.data:
+        # One atomic RPC: checks used_promos, credits the amount and appends
+        # the ledger row under the row lock, so concurrent redemptions of the
+        # same code apply exactly once.
+        resp = get_db().rpc(
+            "redeem_promo_code",
+            {"p_user_id": user_id, "p_code": normalized, "p_amount": credit_value},
+        ).execute()
+        outcome = (resp.data if resp is not None else None) or {}
+        status = outcome.get("status")
+        if status == "already_used":
+            return False, f'❌ You\'ve already used the code "{normalized}".', 0
+        if status != "applied":
             return False, "❌ Could not find your credits record.", 0
 
-        current_balance = resp.data["balance"]
-        current_promos = resp.data.get("used_promos") or []
-
-        get_db().table("credits").update(
-            {
-                "balance": current_balance + credit_value,
-                "used_promos": current_promos + [normalized],
-            }
-        ).eq("user_id", user_id).execute()
-
         logger.info(
             "🎉 Promo %s redeemed: +%d credits for user_id=%s",
             normalized, credit_value, user_id,
@@ -318,26 +391,91 @@ def redeem_promo(
         return False, "❌ Something went wrong applying the promo code. Please try again.", 0
 
 
+def bill_turn(
+    user_id: str,
+    cost_credits: int,
+    usage: List[Dict[str, Any]],
+    idempotency_key: str,
+) -> Optional[int]:
+    """
+    Bill one turn through the ``bill_turn`` RPC — a single round trip.
+
+    The RPC accumulates every model's usage into ``usage_tracking`` and
+    applies the ``turn`` ledger deduction in one transaction. Replaying
+    ``idempotency_key`` changes nothing and returns the recorded balance, so
+    a failed call is retried (RPC_ATTEMPTS) safely.
+
+    Args:
+        user_id:         The user's UUID.
+        cost_credits:    Credits to deduct for the whole turn.
+        usage:           Per-model usage vector, one dict per model with
+                         ``model_name``, ``input_tokens``, ``output_tokens``,
+                         ``cached_tokens``, ``is_grounded`` and ``cost_credits``.
+        idempotency_key: Key for the turn (``turn:<turn_id>``).
+
+    Returns:
+        The balance after the turn, or None if it could not be billed.
+    """
+    from agentic_traveler.tools.db_client import get_db
+
+    params = {
+        "p_user_id": user_id,
+        "p_cost_credits": cost_credits,
+        "p_usage": usage,
+        "p_idempotency_key": idempotency_key,
+    }
+    for attempt in range(1, RPC_ATTEMPTS + 1):
+        try:
+            resp = get_db().rpc("bill_turn", params).execute()
+        except Exception:
+            if attempt == RPC_ATTEMPTS:
+                logger.exception(
+                    "bill_turn failed for user_id=%s key=%s", user_id, idempotency_key,
+                )
+                return None
+            logger.warning(
+                "bill_turn attempt %d failed for key=%s; retrying.",
+                attempt, idempotency_key, exc_info=True,
+            )
+            continue
+        balance = resp.data if resp is not None else None
+        logger.info(
+            "💳 Billed %d credits to user_id=%s (%d models). Remaining: %s",
+            cost_credits, user_id, len(usage),
+            balance if balance is not None else "unknown",
+        )
+        return balance
+    return None
+
+
 def record_usage_and_bill(
     *,
     user_id: str,
-    token_records: List[Dict[str, Any]],
+    token_records: Optional[List[Dict[str, Any]]] = None,
     default_agent_name: str = "agent",
     run_async: bool = False,
+    turn_id: Optional[str] = None,
 ) -> int:
     """
-    Consolidates credit billing calculation, atomic database deduction,
-    weekly metrics logging, and database usage telemetry updates.
+    Consolidates credit billing calculation, weekly metrics logging, and the
+    per-turn database write (usage telemetry + credit deduction in one
+    ``bill_turn`` RPC).
 
     Args:
         user_id:            Database UUID or telegram ID.
-        token_records:      List of LLM usage records.
+        token_records:      List of LLM usage records. Defaults to the active
+                            turn's ``current_turn_usage`` capture.
         default_agent_name: Agent name fallback.
-        run_async:          Deduct credits asynchronously if True.
+        run_async:          Bill in a background thread if True.
+        turn_id:            Stable id of the billed turn; the deduction is
+                            keyed ``turn:<turn_id>`` so it applies once.
 
     Returns:
         Total credits deducted.
     """
+    if token_records is None:
+        from agentic_traveler.orchestrator.client_factory import current_turn_usage
+        token_records = current_turn_usage.get()
     if not token_records or not user_id:
         return 0
 
@@ -347,13 +485,8 @@ def record_usage_and_bill(
         logger.warning("record_usage_and_bill: Could not resolve user UUID for %s", user_id)
         return 0
 
-    # 1. Calculate combined total credit cost and deduct
+    # 1. Calculate combined total credit cost
     total_cost = calculate_cost(token_records)
-    if total_cost > 0:
-        if run_async:
-            deduct_credits_async(resolved_uuid, total_cost)
-        else:
-            deduct_credits(resolved_uuid, total_cost)
 
     # 2. Distribute costs proportionally among non-grounding records
     raw_records = []
@@ -415,47 +548,36 @@ def record_usage_and_bill(
         except Exception:
             logger.exception("Failed to record token usage in metrics_tracker.")
 
-    # 4. Group by model and record weekly per-user database telemetry
-    by_model = {}
-    for rec in token_records:
+    # 4. Group by model into the turn's usage vector
+    by_model: Dict[str, Dict[str, Any]] = {}
+    for idx, rec in enumerate(token_records):
         model = rec.get("model_name")
         if not model or model == "grounding":
             continue
         if model not in by_model:
             by_model[model] = {
+                "model_name": model,
                 "input_tokens": 0,
                 "output_tokens": 0,
-                "grounding_used": False,
+                "cached_tokens": 0,
+                "is_grounded": 0,
+                "cost_credits": 0,
             }
         by_model[model]["input_tokens"] += rec.get("input_tokens", 0)
         by_model[model]["output_tokens"] += rec.get("output_tokens", 0)
+        by_model[model]["cached_tokens"] += rec.get("cached_tokens", 0)
+        by_model[model]["cost_credits"] += share_costs.get(idx, 0)
         if rec.get("grounding_used"):
-            by_model[model]["grounding_used"] = True
-
-    model_share_costs = {}
-    for idx, rec in enumerate(token_records):
-        model = rec.get("model_name")
-        if not model or model == "grounding":
-            continue
-        model_share_costs[model] = model_share_costs.get(model, 0) + share_costs.get(idx, 0)
-
-    from agentic_traveler.tools.db_client import get_db
-    for model, usage in by_model.items():
-        try:
-            get_db().rpc("accumulate_user_usage", {
-                "p_user_id": resolved_uuid,
-                "p_model_name": model,
-                "p_input_tokens": usage["input_tokens"],
-                "p_output_tokens": usage["output_tokens"],
-                "p_is_grounded": 1 if usage["grounding_used"] else 0,
-                "p_cost_credits": model_share_costs.get(model, 0)
-            }).execute()
-        except Exception:
-            logger.warning(
-                "Telemetry warning: Failed to accumulate usage in usage_tracking table "
-                "for user_id=%s model=%s.",
-                resolved_uuid, model, exc_info=True
-            )
+            by_model[model]["is_grounded"] = 1
+
+    # 5. One round trip: usage telemetry + ledger deduction in one transaction.
+    # The key is fixed here so a background retry can never double-bill.
+    turn_key = f"turn:{turn_id or uuid.uuid4()}"
+    args = (resolved_uuid, total_cost, list(by_model.values()), turn_key)
+    if run_async:
+        threading.Thread(target=bill_turn, args=args, daemon=True).start()
+    else:
+        bill_turn(*args)
 
     return total_cost
 
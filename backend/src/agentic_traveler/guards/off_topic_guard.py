@@ -10,9 +10,19 @@ Supabase layout (``off_topic_state`` table):
     count            : INT
     last_flagged_ts  : TIMESTAMPTZ
     restricted_until : TIMESTAMPTZ
+
+Write-behind: ``record_off_topic`` and ``reset`` never hit Supabase on the
+turn path. They compare against the state already loaded in the user doc,
+drop no-op writes (a reset when the counter is already clear — the common
+travel-intent turn), and stage the rest in a per-user pending buffer. The
+orchestrator calls ``flush_pending_async`` once the reply is composed, which
+coalesces everything staged for that user into a single write. Until that
+write returns, its fields stay visible to later turns (``_inflight``), whose
+user doc may have been loaded before the write landed.
 """
 
 import logging
+import threading
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 
@@ -23,6 +33,62 @@ RESTRICT_SECONDS = 3600  # 1 hour
 # Counter auto-resets if no off-topic flag within this window.
 RESET_WINDOW_SECONDS = 3600  # 1 hour
 
+# ── write-behind buffer ─────────────────────────────────────────────────────
+
+_lock = threading.Lock()
+
+# user_id → {"upsert": bool, "fields": {column: value}}. ``upsert`` is True once
+# a record_off_topic landed in the buffer (the row may not exist yet); a
+# reset-only entry stays a plain UPDATE, matching the pre-write-behind query.
+_pending: Dict[str, Dict[str, Any]] = {}
+
+# user_id → fields a flush is writing right now. Overlaid under ``_pending``
+# so a turn that loaded its user doc mid-write still counts from them.
+_inflight: Dict[str, Dict[str, Any]] = {}
+
+_turns: int = 0
+_writes_issued: int = 0
+_writes_avoided: int = 0
+
+
+def _reset_stats() -> None:
+    """Clear the pending buffer and counters. For testing use only."""
+    global _turns, _writes_issued, _writes_avoided
+    with _lock:
+        _pending.clear()
+        _inflight.clear()
+        _turns = 0
+        _writes_issued = 0
+        _writes_avoided = 0
+
+
+def _effective_state(user_doc: Dict[str, Any], user_id: Optional[str]) -> Dict[str, Any]:
+    """The off-topic state as of now: the loaded user doc, overlaid with any
+    write still in flight and then with the pending buffer (not yet flushed
+    to Supabase)."""
+    state = dict(user_doc.get("off_topic") or {})
+    if user_id:
+        with _lock:
+            state.update(_inflight.get(user_id) or {})
+            entry = _pending.get(user_id)
+            if entry:
+                state.update(entry["fields"])
+    return state
+
+
+def _stage(user_id: str, fields: Dict[str, Any], upsert: bool) -> None:
+    """Merge ``fields`` into the user's pending write. Overwriting an entry
+    that was never flushed counts as an avoided write."""
+    global _writes_avoided
+    with _lock:
+        entry = _pending.get(user_id)
+        if entry is None:
+            _pending[user_id] = {"upsert": upsert, "fields": dict(fields)}
+            return
+        entry["fields"].update(fields)
+        entry["upsert"] = entry["upsert"] or upsert
+        _writes_avoided += 1
+
 
 def is_restricted(user_doc: Dict[str, Any]) -> Optional[str]:
     """
@@ -34,7 +100,7 @@ def is_restricted(user_doc: Dict[str, Any]) -> Optional[str]:
     Returns:
         A restriction message string, or None if not restricted.
     """
-    off_topic = user_doc.get("off_topic", {})
+    off_topic = _effective_state(user_doc, user_doc.get("id"))
     restricted_until_str = off_topic.get("restricted_until")
 
     if not restricted_until_str:
@@ -64,10 +130,11 @@ def record_off_topic(
     user_doc: Dict[str, Any], user_id: str
 ) -> Dict[str, Any]:
     """
-    Record an off-topic message and persist to Supabase.
+    Record an off-topic message and stage it for the deferred upsert.
 
     Increments the consecutive counter.  If the counter hits THRESHOLD,
-    sets a restriction until now + RESTRICT_SECONDS.
+    sets a restriction until now + RESTRICT_SECONDS.  The write lands on
+    the next ``flush_pending`` for this user.
 
     Args:
         user_doc: The assembled user document dict.
@@ -76,10 +143,8 @@ def record_off_topic(
     Returns:
         Dict with "count", "restricted", and optionally "restricted_until".
     """
-    from agentic_traveler.tools.db_client import get_db
-
-    off_topic = user_doc.get("off_topic", {})
-    count = off_topic.get("count", 0)
+    off_topic = _effective_state(user_doc, user_id)
+    count = off_topic.get("count") or 0
     last_flagged_str = off_topic.get("last_flagged_ts")
 
     now = datetime.now(timezone.utc)
@@ -101,7 +166,6 @@ def record_off_topic(
     count += 1
 
     update: Dict[str, Any] = {
-        "user_id": user_id,
         "count": count,
         "last_flagged_ts": now.isoformat(),
     }
@@ -125,31 +189,98 @@ def record_off_topic(
         )
 
     if user_id:
-        try:
-            get_db().table("off_topic_state").upsert(update).execute()
-        except Exception:
-            logger.exception("Failed to persist off_topic_state for user_id=%s", user_id)
+        _stage(user_id, update, upsert=True)
 
     return result
 
 
-def reset(user_id: str) -> None:
+def reset(user_id: str, user_doc: Optional[Dict[str, Any]] = None) -> None:
     """
     Reset the off-topic counter (called when user sends a travel message).
 
     Only resets count and clears restriction — preserves last_flagged_ts
-    for analytics.
+    for analytics.  When ``user_doc`` shows the counter already clear (and
+    nothing is pending), the reset is a no-op and no write is staged.
 
     Args:
-        user_id: The user's UUID.
+        user_id:  The user's UUID.
+        user_doc: The assembled user document loaded for this turn, if any.
     """
-    from agentic_traveler.tools.db_client import get_db
+    global _writes_avoided
 
     if not user_id:
         return
+    if user_doc is not None:
+        state = _effective_state(user_doc, user_id)
+        if not state.get("count") and not state.get("restricted_until"):
+            with _lock:
+                _writes_avoided += 1
+            return
+    _stage(user_id, {"count": 0, "restricted_until": None}, upsert=False)
+
+
+def flush_pending(user_id: str) -> bool:
+    """
+    Write the coalesced pending state for ``user_id`` (synchronously).
+
+    Counts one turn towards ``write_stats``.  Returns True if a write was
+    issued, False when there was nothing to persist.
+    """
+    from agentic_traveler.tools.db_client import get_db
+
+    global _turns, _writes_issued
+
+    with _lock:
+        _turns += 1
+        entry = _pending.pop(user_id, None) if user_id else None
+        if entry is None:
+            return False
+        _writes_issued += 1
+        # Cumulative, so an overlapping earlier flush's fields stay visible.
+        inflight = {**_inflight.get(user_id, {}), **entry["fields"]}
+        _inflight[user_id] = inflight
+
     try:
-        get_db().table("off_topic_state").update(
-            {"count": 0, "restricted_until": None}
-        ).eq("user_id", user_id).execute()
+        if entry["upsert"]:
+            get_db().table("off_topic_state").upsert(
+                {"user_id": user_id, **entry["fields"]}
+            ).execute()
+        else:
+            get_db().table("off_topic_state").update(
+                entry["fields"]
+            ).eq("user_id", user_id).execute()
     except Exception:
-        logger.exception("Failed to reset off_topic_state for user_id=%s", user_id)
+        logger.exception("Failed to persist off_topic_state for user_id=%s", user_id)
+    finally:
+        with _lock:
+            # A later flush replaced the overlay with a superset; it drops it.
+            if _inflight.get(user_id) is inflight:
+                del _inflight[user_id]
+    return True
+
+
+def flush_pending_async(user_id: str) -> bool:
+    """
+    Fire-and-forget ``flush_pending`` in a background thread, so the write
+    never sits between the composed reply and the user.
+
+    Returns True if a write was scheduled.
+    """
+    with _lock:
+        has_pending = bool(user_id) and user_id in _pending
+    if not has_pending:
+        return flush_pending(user_id)
+    threading.Thread(target=flush_pending, args=(user_id,), daemon=True).start()
+    return True
+
+
+def write_stats() -> Dict[str, Any]:
+    """Return write-behind counters, including writes avoided per 1,000 turns."""
+    with _lock:
+        turns, issued, avoided = _turns, _writes_issued, _writes_avoided
+    return {
+        "turns": turns,
+        "writes_issued": issued,
+        "writes_avoided": avoided,
+        "writes_avoided_per_1k_turns": round(avoided * 1000 / turns, 1) if turns else 0.0,
+    }
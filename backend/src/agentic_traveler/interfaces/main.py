@@ -12,7 +12,12 @@ from fastapi.middleware.cors import CORSMiddleware
 load_dotenv(override=True)
 
 from agentic_traveler.analytics import metrics_tracker  # noqa: E402
-from agentic_traveler.core.logging_config import setup_logging  # noqa: E402
+from agentic_traveler.core.lazy import start_warm_up  # noqa: E402
+from agentic_traveler.core.logging_config import (  # noqa: E402
+    bind_log_context,
+    setup_logging,
+    trace_from_header,
+)
 from agentic_traveler.interfaces.routers.admin import router as admin_router  # noqa: E402
 from agentic_traveler.interfaces.routers.chat import router as chat_router  # noqa: E402
 from agentic_traveler.interfaces.routers.metrics import router as metrics_router  # noqa: E402
@@ -36,6 +41,10 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Failed to set ThreadPoolExecutor: {e}")
 
+    # Build the orchestrator, Supabase client and content libraries in the
+    # background (WARM_UP_ON_STARTUP) instead of on the first user turn.
+    start_warm_up()
+
     yield
     # Shutdown
     logger.info("Shutting down... flushing metrics.")
@@ -59,6 +68,26 @@ if _origins:
         allow_headers=["Authorization", "Content-Type"],
     )
 
+
+class _TraceContextMiddleware:
+    """Tag a request's log entries with its Cloud Trace id (JSON logging).
+    Pure ASGI so SSE streams pass through untouched; each request runs in its
+    own task, so the binding never leaks into another request."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            for key, value in scope.get("headers") or []:
+                if key == b"x-cloud-trace-context":
+                    bind_log_context(trace=trace_from_header(value.decode("latin-1")))
+                    break
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(_TraceContextMiddleware)
+
 app.include_router(telegram_router, tags=["Telegram"])
 app.include_router(tally_router, tags=["Tally"])
 app.include_router(admin_router, prefix="/admin", tags=["Admin"])
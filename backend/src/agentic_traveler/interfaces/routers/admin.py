@@ -16,5 +16,12 @@ async def admin_add_credits(payload: AddCreditsRequest):
     if not user_uuid:
         raise HTTPException(status_code=404, detail=f"User {payload.user_id} not found")
 
-    credit_manager.add_credits(user_uuid, payload.amount)
-    return {"ok": True, "added": payload.amount, "user_id": payload.user_id}
+    new_balance = credit_manager.add_credits(
+        user_uuid, payload.amount, idempotency_key=payload.idempotency_key
+    )
+    if new_balance is None:
+        raise HTTPException(status_code=500, detail="Failed to add credits")
+    return {
+        "ok": True, "added": payload.amount, "user_id": payload.user_id,
+        "balance": new_balance,
+    }
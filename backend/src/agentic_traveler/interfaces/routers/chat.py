@@ -26,7 +26,7 @@ from agentic_traveler.interfaces.schemas import (
     ChatSendRequest,
     ChatSendResponse,
 )
-from agentic_traveler.orchestrator.sagas.planning import ui_block_from_wire
+from agentic_traveler.orchestrator.sagas.slot_ui import ui_block_from_wire
 from agentic_traveler.tools.chat_repo import ChatRepository
 
 logger = logging.getLogger(__name__)
@@ -3,11 +3,13 @@ import os
 import time
 from collections import defaultdict
 from threading import Lock
+from typing import TYPE_CHECKING
 
 import requests as http_requests
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 
 from agentic_traveler.analytics import metrics_tracker
+from agentic_traveler.core.lazy import lazy_singleton
 from agentic_traveler.core.sanitize import sanitize_user_input, sanitize_telegram_markdown
 from agentic_traveler.core.markdown_profile import degrade_for_telegram
 from agentic_traveler.guards import off_topic_guard
@@ -16,14 +18,16 @@ from agentic_traveler.interfaces.dependencies import (
     verify_telegram_secret,
 )
 from agentic_traveler.interfaces.schemas import TelegramWebhookPayload
-from agentic_traveler.orchestrator.agent import OrchestratorAgent
-from agentic_traveler.orchestrator.sagas.planning import (
-    _SLOT_CHOICES,
+from agentic_traveler.orchestrator.sagas.slot_ui import (
+    SLOT_CHOICES,
     ui_block_from_wire,
 )
 from agentic_traveler.tools.chat_repo import ChatRepository
 from agentic_traveler.tools.user_repo import UserRepository
 
+if TYPE_CHECKING:
+    from agentic_traveler.orchestrator.agent import OrchestratorAgent
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
@@ -71,31 +75,23 @@ def _is_rate_limited(user_id: str) -> bool:
         timestamps.append(now)
         return False
 
-# ── lazy-loaded globals (initialized on first request) ──
-
-_user_tool_instance: UserRepository | None = None
-_orchestrator_instance: OrchestratorAgent | None = None
-_chat_repo_instance: ChatRepository | None = None
+# ── lazy-loaded singletons (built on first request or by the start-up warm-up) ──
 
+@lazy_singleton("user_repo")
 def get_user_tool() -> UserRepository:
-    global _user_tool_instance
-    if _user_tool_instance is None:
-        logger.info("Initializing lazy UserRepository...")
-        _user_tool_instance = UserRepository()
-    return _user_tool_instance
-
-def get_orchestrator() -> OrchestratorAgent:
-    global _orchestrator_instance
-    if _orchestrator_instance is None:
-        logger.info("Initializing lazy OrchestratorAgent...")
-        _orchestrator_instance = OrchestratorAgent(user_repo=get_user_tool())
-    return _orchestrator_instance
+    return UserRepository()
+
+@lazy_singleton("orchestrator")
+def get_orchestrator() -> "OrchestratorAgent":
+    # Imported here: the orchestrator pulls in google-genai and every saga,
+    # which the app must not pay for before it can answer a health check.
+    from agentic_traveler.orchestrator.agent import OrchestratorAgent
 
+    return OrchestratorAgent(user_repo=get_user_tool())
+
+@lazy_singleton("chat_repo")
 def get_chat_repo() -> ChatRepository:
-    global _chat_repo_instance
-    if _chat_repo_instance is None:
-        _chat_repo_instance = ChatRepository()
-    return _chat_repo_instance
+    return ChatRepository()
 
 # ── Telegram helpers (zero-overhead performance testing mocks) ──
 
@@ -269,7 +265,7 @@ def _inline_keyboard(slot_request: dict | None) -> dict | None:
 
 def _choice_label(slot: str, value: str) -> str:
     """Human label for a chosen (slot, value), for the edited confirmation text."""
-    for c in _SLOT_CHOICES.get(slot, []):
+    for c in SLOT_CHOICES.get(slot, []):
         if str(c.value) == str(value):
             return c.label
     return value
@@ -619,8 +615,9 @@ async def telegram_webhook(
             is_link_flow = True
 
     if not is_link_flow:
-        user_doc = get_user_tool().get_user_by_telegram_id(user_id)
-        if not user_doc:
+        # Existence check only — the identity cache answers from memory for
+        # linked users instead of running the full user join on every update.
+        if not get_user_tool().get_user_ref_by_telegram_id(user_id):
             msg = (
                 "👋 Welcome to Aletheia Travel\n\n"
                 "Visit our web app for more information:\n"
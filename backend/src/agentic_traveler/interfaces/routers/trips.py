@@ -2,7 +2,6 @@
 Trips router.
 """
 
-import asyncio
 import logging
 
 from uuid import UUID
@@ -13,6 +12,7 @@ from agentic_traveler.interfaces.dependencies import WebUserCtx, verify_supabase
 from agentic_traveler.tools.trip_repo import TripRepository
 from agentic_traveler.tools.user_repo import UserRepository
 from agentic_traveler.economy import credit_manager
+from agentic_traveler.orchestrator.sagas import intel_refresh
 from agentic_traveler.orchestrator.sagas.country_intel import CountryIntelSaga
 
 logger = logging.getLogger(__name__)
@@ -27,7 +27,8 @@ async def refresh_country_intel(
 ):
     """
     Manually triggers a refresh of the country intel for the specified ISO.
-    Enqueues the fetch as a background task.
+    Enqueues the fetch on the intel refresh coordinator; ``status`` is
+    ``enqueued``, ``in_flight`` (joined a running refresh) or ``cooldown``.
     """
     trip_id_str = str(trip_id)
     iso = iso.upper()
@@ -57,18 +58,14 @@ async def refresh_country_intel(
             country_name = dest.name
             break
             
-    # Trigger the saga refresh
-    saga = CountryIntelSaga(client=None) 
-    
+    # Queue on the shared refresh coordinator: a refresh already running for
+    # this trip + country is joined, and a recent one is not repeated.
+    month_name = CountryIntelSaga(client=None)._get_trip_month(trip.model_dump())
     logger.info("Manual intel refresh triggered for trip %s, iso %s (%s)", trip_id_str, iso, country_name)
-    asyncio.create_task(
-        saga._run_fetch_async(
-            trip_id=trip_id_str,
-            user_id=ctx.user_id,
-            iso_country=iso,
-            country_name=country_name,
-            month_name=saga._get_trip_month(trip.model_dump()),
-        )
+    outcome, _ = intel_refresh.request_refresh(
+        trip_id_str, ctx.user_id, iso, country_name, month_name,
     )
-    
-    return {"status": "enqueued", "iso_country": iso}
+    body = {"status": outcome, "iso_country": iso}
+    if outcome == intel_refresh.COOLDOWN:
+        body["retry_after_s"] = int(intel_refresh.cooldown_remaining(trip_id_str, iso))
+    return body
@@ -5,6 +5,10 @@ from pydantic import BaseModel, ConfigDict, Field
 class AddCreditsRequest(BaseModel):
     user_id: str = Field(..., description="The Telegram user ID to add credits to")
     amount: int = Field(..., gt=0, description="The positive amount of credits to add")
+    idempotency_key: str | None = Field(
+        default=None,
+        description="Client-chosen key; retrying the same top-up with it applies it once",
+    )
 
 class TelegramWebhookPayload(BaseModel):
     # Telegram webhooks are complex, so we accept a flexible dict for now
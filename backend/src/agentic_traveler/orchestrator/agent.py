@@ -15,6 +15,8 @@ Architecture (v2 — Thin Router + Specialized Agents):
        - CHAT                   → ChatSaga (→ ChatAgent)
        - OFF_TOPIC              → handled inline; off_topic_guard increments
                                   the counter silently (OffTopicSaga mirrors it).
+       The trip is resolved from the cached summary index and hydrated only
+       to the projection the selected sagas declare (sagas.trip_access).
        Saga side-effects are persisted via TripRepository.
     6. Log token usage for router + delegated agent separately.
     7. Deduct credits asynchronously.
@@ -40,6 +42,7 @@ from agentic_traveler.analytics import metrics_tracker
 from agentic_traveler.analytics.judge import maybe_judge_turn
 from agentic_traveler.orchestrator.client_factory import begin_usage_capture, get_client
 from agentic_traveler.core.budget_policy import resolve as budget_resolve
+from agentic_traveler.core.logging_config import bind_log_context
 from agentic_traveler.orchestrator.capabilities import CAPABILITY_INTENTS
 from agentic_traveler.core.observability import (
     traceable,
@@ -57,12 +60,18 @@ from agentic_traveler.orchestrator.sagas.planning import (
     slot_values_to_side_effect,
 )
 from agentic_traveler.orchestrator.sagas.discovery import has_go_signal
+from agentic_traveler.orchestrator.sagas.trip_access import TripAccess, trip_projection_of, widest
 from agentic_traveler.orchestrator.sagas.trip_resolver import (
     resolve_active_trip,
     resolve_trip_focus,
 )
+from agentic_traveler.tools import geocode_queue
 from agentic_traveler.tools.user_repo import UserRepository
-from agentic_traveler.tools.trip_repo import TripRepository
+from agentic_traveler.tools.trip_repo import (
+    TripRepository,
+    begin_trip_io_capture,
+    invalidate_trip_index,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -130,9 +139,9 @@ class OrchestratorAgent:
 
         Returns {"text": str, "action": str, "slot_request": dict | None}.
         """
-        attach_run_metadata(
-            user_id_hash=hash_user_id(telegram_user_id), surface="telegram"
-        )
+        user_hash = hash_user_id(telegram_user_id)
+        attach_run_metadata(user_id_hash=user_hash, surface="telegram")
+        bind_log_context(user=user_hash)
         user_doc, user_id = self.user_tool.get_user_with_ref(telegram_user_id)
         if not user_doc:
             logger.info("New user detected: %s", telegram_user_id)
@@ -187,7 +196,9 @@ class OrchestratorAgent:
         Returns {"text": str, "action": str, "slot_request": dict | None,
         "focus_trip_id": str | None}.
         """
-        attach_run_metadata(user_id_hash=hash_user_id(user_id), surface="web")
+        user_hash = hash_user_id(user_id)
+        attach_run_metadata(user_id_hash=user_hash, surface="web")
+        bind_log_context(user=user_hash)
         user_doc = self.user_tool.get_user_by_id(user_id)
         if not user_doc:
             logger.warning("process_request_for_user: no user row for id=%s", user_id)
@@ -241,6 +252,7 @@ class OrchestratorAgent:
             user_id=user_id, trip_id=None,
             on_status=status_callback, on_delta=delta_callback,
         )
+        bind_log_context(turn_id=events.turn_id)
 
         # ── 1b. Credit gate ─────────────────────────────────────────────────
         if not credit_manager.has_credits(user_doc):
@@ -259,6 +271,8 @@ class OrchestratorAgent:
         # the router only needs recent turns for intent classification and passing
         # the full history increases token cost and can cause confusion (e.g. the
         # router extracting preferences from old messages instead of the current one).
+        # Both are views of one ConversationContext memoized for this turn, so
+        # the history is rendered once (conversation_context).
         t = time.time()
         conv_context = self.conversation_manager.build_context_block(user_doc)
         router_context = self.conversation_manager.build_context_block(
@@ -275,7 +289,8 @@ class OrchestratorAgent:
         # On extractor failure, prefetched_slots=None → saga re-runs extraction (E3).
         # copy_context() propagates current_turn_usage so both calls are billable
         # (task 51 requirement; parallel thread-pool note in client_factory).
-        ctx = contextvars.copy_context()
+        # One copy per call: a Context can only be entered by one thread at a
+        # time, and the two calls overlap.
         router_ms: float = 0.0
         extractor_ms: float = 0.0
         prefetched_slots: Optional[Dict[str, Any]] = None
@@ -317,6 +332,9 @@ class OrchestratorAgent:
                     conversation_context=router_context,
                     token_records=token_records,
                 )
+                # Usage is already in token_records; don't pin the SDK
+                # response for the rest of the turn.
+                result.pop("raw_response", None)
                 return result, (time.time() - t0) * 1000
 
             def _run_extractor() -> tuple[Dict[str, Any], float]:
@@ -326,10 +344,10 @@ class OrchestratorAgent:
                 return result, (time.time() - t0) * 1000
 
             with concurrent.futures.ThreadPoolExecutor(max_workers=2) as _pool:
-                router_future = _pool.submit(ctx.run, _run_router)
+                router_future = _pool.submit(contextvars.copy_context().run, _run_router)
                 # Only run extractor when there's actual text to extract from (E8: no-text turns).
                 extractor_future = (
-                    _pool.submit(ctx.run, _run_extractor)
+                    _pool.submit(contextvars.copy_context().run, _run_extractor)
                     if message_text.strip() else None
                 )
                 router_result, router_ms = router_future.result()
@@ -388,7 +406,7 @@ class OrchestratorAgent:
         # their specialized agents (router_response for those is a bug side-effect).
         elif intent == "CHAT" and router_response:
             if user_id:
-                off_topic_guard.reset(user_id)
+                off_topic_guard.reset(user_id, user_doc)
             _save_and_finish(
                 self, user_doc, user_id, message_text, router_response,
                 telegram_user_id, token_records, t_total, events, intent,
@@ -400,7 +418,7 @@ class OrchestratorAgent:
 
         # ── 5b. Travel intents — reset off-topic counter ────────────────────
         if user_id:
-            off_topic_guard.reset(user_id)
+            off_topic_guard.reset(user_id, user_doc)
 
         # ── 5c. Resolve the active trip + dispatch via the saga dispatcher ──
         # Pass prefetched slots to sagas that can use them (PlanningSaga).
@@ -526,6 +544,7 @@ class OrchestratorAgent:
             user_id=user_id, trip_id=None,
             on_status=status_callback, on_delta=delta_callback,
         )
+        bind_log_context(turn_id=events.turn_id)
 
         if not credit_manager.has_credits(user_doc):
             return {"text": credit_manager.CREDITS_EXHAUSTED_MSG,
@@ -540,13 +559,7 @@ class OrchestratorAgent:
         # 1. Resolve (or create) the trip this slot-fill belongs to.
         trip: Optional[Dict[str, Any]] = None
         if user_id:
-            try:
-                summaries = [
-                    s.model_dump() for s in self._trip_repo.list_trip_summaries(user_id)
-                ]
-            except Exception:
-                logger.exception("Selection: failed to list trip summaries for %s", user_id)
-                summaries = []
+            summaries = self._trip_summaries(user_id)
             chosen = resolve_active_trip(summaries, "", {})
             if chosen:
                 try:
@@ -662,26 +675,24 @@ class OrchestratorAgent:
         # 1. Resolve which trip this turn is about, honouring the Router's
         #    trip_directive (task 44): "new" ignores existing trips (a fresh one
         #    is created below) and reports which trip, if any, was set aside.
-        trip: Optional[Dict[str, Any]] = None
+        #    Resolution reads the cached summary index; the chosen trip is
+        #    hydrated only as far as the selected sagas need (step 3).
+        trip_io = begin_trip_io_capture()
+        chosen: Optional[Dict[str, Any]] = None
         superseded_title: Optional[str] = None
+        index_hit = True
         if user_id:
-            try:
-                summaries = [
-                    s.model_dump() for s in self._trip_repo.list_trip_summaries(user_id)
-                ]
-            except Exception:
-                logger.exception("Failed to list trip summaries for user %s", user_id)
-                summaries = []
+            summaries = self._trip_summaries(user_id)
+            if focused_trip_id and not any(s.get("id") == focused_trip_id for s in summaries):
+                # Focused on a trip the index has not seen yet (created elsewhere).
+                invalidate_trip_index(user_id)
+                summaries = self._trip_summaries(user_id)
+            index_hit = trip_io["queries"] == 0
             chosen, superseded_title, _create_new = resolve_trip_focus(
                 summaries, message_text, entities, trip_directive,
                 focused_trip_id=focused_trip_id,
             )
-            if chosen:
-                try:
-                    trip_model = self._trip_repo.get_trip(chosen["id"])
-                    trip = trip_model.model_dump() if trip_model else None
-                except Exception:
-                    logger.exception("Failed to hydrate trip %s", chosen.get("id"))
+        access = TripAccess(self._trip_repo, chosen, "summary", user_id=user_id)
 
         # 2. Per-turn state (NOT persisted — task 36 §4.1 #2).
         # prefetched_slots carries the result of the parallel slot extraction
@@ -694,15 +705,18 @@ class OrchestratorAgent:
             "current_time": current_time,
             "preference_raw": preference_raw,
             "router_response": router_response,
-            "trip_id": trip.get("id") if trip else None,
+            "trip_id": chosen.get("id") if chosen else None,
             "message_text": message_text,
             "trip_directive": trip_directive,
             "superseded_trip_title": superseded_title,
             "prefetched_slots": prefetched_slots,
         }
 
-        # 3. Select owner + listeners (deterministic, no LLM).
-        owner, listeners = self._dispatcher.select(intent, entities, trip, state)
+        # 3. Select owner + listeners (deterministic, no LLM), hydrating the
+        #    trip to the widest projection they declare.
+        owner, listeners = self._select_hydrated(intent, entities, access, state)
+        trip = access.trip
+        state["trip_id"] = trip.get("id") if trip else None
         _emit_status(events, "saga_selected", getattr(owner, "name", None))
 
         # 4. Create a fresh DREAMING trip only on CONSENTED intent (task 52):
@@ -723,6 +737,13 @@ class OrchestratorAgent:
                 state["trip_id"] = trip.get("id")
             except Exception:
                 logger.exception("Failed to create initial trip for user %s", user_id)
+        events.emit("metric", {
+            "name": "trip_access",
+            "projection": access.projection if access.trip is not None else None,
+            "index_hit": index_hit,
+            "queries": trip_io["queries"],
+            "bytes": trip_io["bytes"],
+        })
 
         # 5. Bind trip_id so every metric row this turn carries it.
         events.trip_id = state.get("trip_id")
@@ -753,9 +774,8 @@ class OrchestratorAgent:
         return {
             "text": result.text or "",
             "action": "RESPONSE" if result.text else "ERROR",
-            "_raw_response": result._raw_response,
+            "_artifacts": result._artifacts,
             "_latency_ms": result._latency_ms,
-            "_search_responses": result._search_responses,
             "owner_saga": getattr(owner, "name", ""),
             "slot_request": result.slot_request,
             # The resolved/created trip id (or None) — echoed to the UI as the
@@ -763,11 +783,41 @@ class OrchestratorAgent:
             "focus_trip_id": state.get("trip_id"),
         }
 
+    def _select_hydrated(
+        self,
+        intent: str,
+        entities: Dict[str, Any],
+        access: TripAccess,
+        state: SagaState,
+    ) -> tuple[Any, list]:
+        """Select on the cheapest trip projection, hydrate ``access`` to the widest
+        one the selected owner + listeners declare, and select again on the
+        richer trip until it needs nothing more (at most two upgrades), so
+        Chat/OffTopic turns never load the full trip."""
+        while True:
+            owner, listeners = self._dispatcher.select(intent, entities, access.trip, state)
+            need = widest(trip_projection_of(s) for s in [owner, *listeners])
+            if access.covers(need):
+                return owner, listeners
+            access.at(need)
+
+    def _trip_summaries(self, user_id: str) -> list[Dict[str, Any]]:
+        """The user's trip summaries from the cached index ([] on failure)."""
+        try:
+            return [
+                s.model_dump()
+                for s in self._trip_repo.list_trip_summaries(user_id, cached=True)
+            ]
+        except Exception:
+            logger.exception("Failed to list trip summaries for user %s", user_id)
+            return []
+
     def _apply_side_effects(self, user_id: Optional[str], side_effects: list) -> None:
         """Persist a saga's side effects via the TripRepository. Best-effort:
         one failed write never aborts the turn."""
         if not user_id:
             return
+        to_geocode: dict[str, list[tuple[str, str]]] = {}
         for se in side_effects:
             try:
                 if getattr(se, "kind", None) == "profile_patch":
@@ -779,12 +829,20 @@ class OrchestratorAgent:
 
                     apply_profile_patch(user_id, se.payload)
                 else:
-                    self._trip_repo.apply_side_effect(user_id, se)
+                    row = self._trip_repo.apply_side_effect(user_id, se)
+                    if se.kind == "destination_upsert" and not se.payload.get("coords"):
+                        dest_id = getattr(row, "id", None)
+                        if isinstance(dest_id, str):
+                            to_geocode.setdefault(row.trip_id, []).append((dest_id, row.name))
             except Exception:
                 logger.exception(
                     "apply_side_effect failed for kind=%s",
                     getattr(se, "kind", "?"),
                 )
+        # New destinations are geocoded off the turn, rate-limited, and
+        # written back in one batch per trip.
+        for trip_id, rows in to_geocode.items():
+            geocode_queue.enqueue(trip_id, rows)
 
     def _maybe_elicit_profile(
         self,
@@ -945,6 +1003,20 @@ def _save_and_finish(
         is_new_user=False,
     )
 
+    # Write-behind off-topic state: one coalesced upsert per turn at most, off
+    # the reply path; no-op resets were already dropped by the guard.
+    if user_id:
+        try:
+            wrote = off_topic_guard.flush_pending_async(user_id)
+            stats = off_topic_guard.write_stats()
+            events.emit("metric", {
+                "name": "off_topic_state_write",
+                "written": bool(wrote),
+                "writes_avoided_per_1k_turns": stats["writes_avoided_per_1k_turns"],
+            })
+        except Exception:
+            logger.warning("off_topic_state flush failed; ignoring.", exc_info=True)
+
     total_cost_credits = 0.0
     if token_records and user_id:
         try:
@@ -953,6 +1025,7 @@ def _save_and_finish(
                 token_records=token_records,
                 default_agent_name="orchestrator",
                 run_async=True,
+                turn_id=getattr(events, "turn_id", None),
             )
             if hasattr(usage, "total_cost_credits"):
                 total_cost_credits = usage.total_cost_credits
@@ -25,8 +25,10 @@ from agentic_traveler.core.budget_policy import (
 from agentic_traveler.orchestrator.client_factory import get_client, generate_maybe_stream
 from agentic_traveler.core.observability import traceable
 from agentic_traveler.orchestrator.profile_utils import build_profile_summary
+from agentic_traveler.orchestrator.prompt_assembler import agent_prompt
 from agentic_traveler.orchestrator.search_agent import SearchAgent
-from agentic_traveler.orchestrator.utils import has_grounding, check_weather
+from agentic_traveler.orchestrator.turn_artifacts import TurnArtifacts, call_artifacts
+from agentic_traveler.orchestrator.utils import check_weather
 
 logger = logging.getLogger(__name__)
 
@@ -108,7 +110,7 @@ class ChatAgent:
         Streams token deltas through ``events`` when ``events.is_streaming``
         (web SSE); single synchronous call otherwise (Telegram / non-streaming).
 
-        Returns dict with keys: text, action, _raw_response, _latency_ms.
+        Returns dict with keys: text, action, _artifacts, _latency_ms.
         """
 
         # ── execution ────────────────────────────────────────────────────────
@@ -130,13 +132,15 @@ class ChatAgent:
 
         budget = budget_resolve("chat_ack", user_doc)
 
-        user_content = (
-            f"<current_time>{current_time}</current_time>\n"
-            f"<user_profile_summary>\n{profile_summary}\n</user_profile_summary>\n"
-            f"<conversation_history>\n{conversation_context}\n</conversation_history>\n"
-            f"{pref_note}"
-            f"<user_message>\n{message}\n</user_message>"
+        prompt = agent_prompt(
+            "chat_ack",
+            current_time=current_time,
+            profile_summary=profile_summary,
+            conversation_context=conversation_context,
+            message=message,
+            pref_note=pref_note,
         )
+        user_content = prompt.text
 
         logger.debug("ChatAgent prompt length: %d chars", len(user_content))
         t = time.time()
@@ -162,9 +166,9 @@ class ChatAgent:
             )
             response, text = generate_maybe_stream(
                 self._client, _MODEL, user_content, config, events,
+                call_type="chat_ack", prompt_report=prompt.report(),
             )
             latency_ms = (time.time() - t) * 1000
-            grounding_used = has_grounding(response)
 
             # AC-4: Handle MAX_TOKENS finish reason gracefully.
             text, ceiling_hit = handle_finish_reason(response, text, "chat_ack")
@@ -194,10 +198,10 @@ class ChatAgent:
             return {
                 "text": text,
                 "action": "CHAT_RESPONSE",
-                "_raw_response": response,
-                "_search_responses": search_responses,
+                "_artifacts": TurnArtifacts(
+                    call_artifacts(response, latency_ms), tuple(search_responses),
+                ),
                 "_latency_ms": latency_ms,
-                "_grounding_used": grounding_used,
             }
         except Exception:
             logger.exception("ChatAgent LLM call failed.")
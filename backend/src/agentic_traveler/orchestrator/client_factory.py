@@ -53,10 +53,13 @@ def suppress_usage_capture():
 
 
 def _capture_usage(
-    model: str, response, *, latency_ms: Optional[float] = None, call_type: Optional[str] = None
+    model: str, response, *, latency_ms: Optional[float] = None, call_type: Optional[str] = None,
+    prompt_report: Optional[dict] = None,
 ) -> None:
     """Append `response`'s token usage (and any grounding cost) to the active
     turn's records, and emit a per-call llm_call_usage metric (AC-2).
+    ``prompt_report`` (``AssembledPrompt.report()``) adds the per-section
+    prompt token estimates to that metric.
     No active turn or no usage metadata → no-op. Never raises."""
     records = current_turn_usage.get()
     if records is None or response is None:
@@ -66,6 +69,7 @@ def _capture_usage(
         input_tokens = int(getattr(usage, "prompt_token_count", 0) or 0) if usage else 0
         output_tokens = int(getattr(usage, "candidates_token_count", 0) or 0) if usage else 0
         thinking_tokens = int(getattr(usage, "thoughts_token_count", 0) or 0) if usage else 0
+        cached_tokens = int(getattr(usage, "cached_content_token_count", 0) or 0) if usage else 0
         if input_tokens or output_tokens:
             records.append({
                 "model_name": model,
@@ -73,6 +77,7 @@ def _capture_usage(
                 "output_tokens": output_tokens,
                 "total_tokens": input_tokens + output_tokens,
                 "thinking_tokens": thinking_tokens,
+                "cached_tokens": cached_tokens,
             })
             logger.info(
                 "📊 LLM usage | model=%s input_tokens=%d output_tokens=%d thinking_tokens=%d",
@@ -90,6 +95,7 @@ def _capture_usage(
                         "output_tokens": output_tokens,
                         "thinking_tokens": thinking_tokens,
                         "latency_ms": int(latency_ms) if latency_ms is not None else None,
+                        **(prompt_report or {}),
                     })
                 except Exception:
                     logger.debug("llm_call_usage emit failed.", exc_info=True)
@@ -226,26 +232,37 @@ def _trace_inputs(inputs: dict) -> dict:
 
 
 @traceable(name="gemini.generate_content", process_inputs=_trace_inputs)
-def gemini_generate(client, *, model: str, contents, config, call_type: Optional[str] = None):
+def gemini_generate(
+    client, *, model: str, contents, config, call_type: Optional[str] = None,
+    prompt_report: Optional[dict] = None,
+):
     """Single traced wrapper around `client.models.generate_content` — every
     Gemini call goes through here so prompts appear in LangSmith traces and
     token usage lands in the turn's billing records (task 51).
-    ``call_type`` is forwarded to the llm_call_usage metric (AC-2)."""
+    ``call_type`` and ``prompt_report`` are forwarded to the llm_call_usage
+    metric (AC-2)."""
     t = time.time()
     response = client.models.generate_content(model=model, contents=contents, config=config)
-    _capture_usage(model, response, latency_ms=(time.time() - t) * 1000, call_type=call_type)
+    _capture_usage(
+        model, response, latency_ms=(time.time() - t) * 1000,
+        call_type=call_type, prompt_report=prompt_report,
+    )
     return response
 
 
 @traceable(name="gemini.generate_content_stream", process_inputs=_trace_inputs)
-def gemini_generate_stream(client, *, model: str, contents, config, on_delta=None, call_type: Optional[str] = None):
+def gemini_generate_stream(
+    client, *, model: str, contents, config, on_delta=None, call_type: Optional[str] = None,
+    prompt_report: Optional[dict] = None,
+):
     """Synchronous streaming wrapper around `client.models.generate_content_stream`
     (Task 37). Calls ``on_delta(text)`` for each non-empty text chunk and returns
     ``(last_chunk, full_text)``. The SDK's stream is synchronous and runs
     automatic function calling inline, so tool calls fire (and emit their status)
     during iteration. The last chunk carries cumulative ``usage_metadata`` for
     the orchestrator's existing token logging.
-    ``call_type`` is forwarded to the llm_call_usage metric (AC-2)."""
+    ``call_type`` and ``prompt_report`` are forwarded to the llm_call_usage
+    metric (AC-2)."""
     t = time.time()
     full: list[str] = []
     last = None
@@ -265,7 +282,10 @@ def gemini_generate_stream(client, *, model: str, contents, config, on_delta=Non
             if on_delta is not None:
                 on_delta(text)
     # The final chunk carries the cumulative usage for the whole stream.
-    _capture_usage(model, last, latency_ms=(time.time() - t) * 1000, call_type=call_type)
+    _capture_usage(
+        model, last, latency_ms=(time.time() - t) * 1000,
+        call_type=call_type, prompt_report=prompt_report,
+    )
     return last, "".join(full)
 
 
@@ -310,14 +330,18 @@ def _emit_paced(
             time.sleep(delay)
 
 
-def generate_maybe_stream(client, model: str, contents, config, events=None, call_type: Optional[str] = None):
+def generate_maybe_stream(
+    client, model: str, contents, config, events=None, call_type: Optional[str] = None,
+    prompt_report: Optional[dict] = None,
+):
     """Run a Gemini generation, streaming token deltas through ``events`` when
     the turn is streaming (web SSE), else a single synchronous call. In ALL
     paths the active EventEmitter is bound for the duration so tool functions
     can emit their status (Telegram shows tool status too). Returns
     ``(response, text)`` with the same shape callers already expect.
 
-    ``call_type`` identifies the budget type for llm_call_usage metrics (AC-2).
+    ``call_type`` identifies the budget type for llm_call_usage metrics (AC-2);
+    ``prompt_report`` adds the assembled prompt's section sizes to them.
 
     Streaming strategy:
       * **No tools** → real token-by-token streaming (fastest first token).
@@ -332,11 +356,13 @@ def generate_maybe_stream(client, model: str, contents, config, events=None, cal
     token = set_current_emitter(events)
     try:
         if not streaming:
-            resp = gemini_generate(client, model=model, contents=contents, config=config, call_type=call_type)
+            resp = gemini_generate(client, model=model, contents=contents, config=config,
+                                   call_type=call_type, prompt_report=prompt_report)
             return resp, (getattr(resp, "text", None) or "")
 
         if _config_has_tools(config):
-            resp = gemini_generate(client, model=model, contents=contents, config=config, call_type=call_type)
+            resp = gemini_generate(client, model=model, contents=contents, config=config,
+                                   call_type=call_type, prompt_report=prompt_report)
             text = getattr(resp, "text", None) or ""
             if text:
                 _emit_paced(events, text)
@@ -345,7 +371,7 @@ def generate_maybe_stream(client, model: str, contents, config, events=None, cal
         resp, text = gemini_generate_stream(
             client, model=model, contents=contents, config=config,
             on_delta=lambda txt: events.emit("delta", {"text": txt}),
-            call_type=call_type,
+            call_type=call_type, prompt_report=prompt_report,
         )
         if text.strip():
             return resp, text
@@ -354,7 +380,8 @@ def generate_maybe_stream(client, model: str, contents, config, events=None, cal
         logger.warning(
             "Streaming returned empty text (model=%s); one blocking retry.", model,
         )
-        resp = gemini_generate(client, model=model, contents=contents, config=config, call_type=call_type)
+        resp = gemini_generate(client, model=model, contents=contents, config=config,
+                               call_type=call_type, prompt_report=prompt_report)
         text = getattr(resp, "text", None) or ""
         if text:
             events.emit("delta", {"text": text})
@@ -0,0 +1,174 @@
+"""
+Per-turn conversation context.
+
+``ConversationManager.build_context_block`` used to re-render the summary
+and recent messages into a fresh string on every call, and a turn asked for
+it two or three times (full view for the agents, slim view for the router,
+again on the selection path). ``ConversationContext`` renders each message
+once into a segment with a token estimate, and caches every view it is asked
+for:
+
+- ``render()``                  — summary + all recent messages (agents);
+- ``render(max_messages=N)``    — last N messages, no summary (router);
+- ``render_budget(max_tokens)`` — newest messages that fit the budget, plus
+  the summary when it still fits;
+- ``render_summary()``          — the compacted summary only.
+
+``append`` extends the segments and the cached full rendering in place
+instead of rebuilding them.
+
+The context is memoized per turn in a contextvar (see ``tool_events`` for
+the same pattern), keyed on the identity of the user doc it was built from.
+So every ``context_for(user_doc)`` call in one turn, including calls from
+``copy_context`` worker threads, shares one instance, and concurrent turns
+never see each other's.
+"""
+
+from __future__ import annotations
+
+import contextvars
+from typing import Any, Dict, List, Optional, Tuple
+
+# Rough chars-per-token ratio for Gemini on English prose; used only for
+# budgeting views, never for billing.
+CHARS_PER_TOKEN = 4
+
+_SUMMARY_HEADER = "Previous conversation summary:\n"
+_MESSAGES_HEADER = "Recent messages:\n"
+
+_current: contextvars.ContextVar[Optional[Tuple[Dict[str, Any], "ConversationContext"]]] = (
+    contextvars.ContextVar("current_conversation_context", default=None)
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate for prompt budgeting (ceil of chars / 4)."""
+    return -(-len(text or "") // CHARS_PER_TOKEN)
+
+
+def _segment(msg: Dict[str, Any]) -> str:
+    role = "User" if msg.get("role") == "user" else "Agent"
+    return f"{role}: {msg.get('text', '')}"
+
+
+class ConversationContext:
+    """Pre-rendered summary and message segments with cached views."""
+
+    def __init__(self, summary: str = "", messages: Optional[List[Dict[str, Any]]] = None):
+        self.summary = summary or ""
+        self.summary_tokens = estimate_tokens(self.summary)
+        self.segments: List[str] = []
+        self.tokens: List[int] = []
+        self._views: Dict[Any, str] = {}
+        for msg in messages or []:
+            self._add(msg)
+
+    @classmethod
+    def from_history(cls, history: Dict[str, Any]) -> "ConversationContext":
+        return cls(history.get("summary", ""), history.get("recent_messages", []))
+
+    def _add(self, msg: Dict[str, Any]) -> str:
+        seg = _segment(msg)
+        self.segments.append(seg)
+        self.tokens.append(estimate_tokens(seg))
+        return seg
+
+    # ------------------------------------------------------------------
+    # Views
+    # ------------------------------------------------------------------
+
+    @property
+    def total_tokens(self) -> int:
+        return self.summary_tokens + sum(self.tokens)
+
+    def render(self, max_messages: Optional[int] = None) -> str:
+        """
+        Full view (summary + all messages) when ``max_messages`` is None;
+        otherwise the last N messages without the summary. Same text as
+        ``ConversationManager.build_context_block`` always produced.
+        """
+        key = ("full",) if max_messages is None else ("last", max_messages)
+        cached = self._views.get(key)
+        if cached is not None:
+            return cached
+        if max_messages is None:
+            text = self._join(self.summary, self.segments)
+        else:
+            text = self._join("", self.segments[-max_messages:] if max_messages > 0 else [])
+        self._views[key] = text
+        return text
+
+    def render_budget(self, max_tokens: int, include_summary: bool = True) -> str:
+        """
+        The newest messages whose estimated tokens fit ``max_tokens``; the
+        summary is prepended only if it fits in what is left.
+        """
+        key = ("budget", max_tokens, include_summary)
+        cached = self._views.get(key)
+        if cached is not None:
+            return cached
+        remaining, start = max_tokens, len(self.segments)
+        while start > 0 and self.tokens[start - 1] <= remaining:
+            start -= 1
+            remaining -= self.tokens[start]
+        summary = self.summary if include_summary and self.summary_tokens <= remaining else ""
+        text = self._join(summary, self.segments[start:])
+        self._views[key] = text
+        return text
+
+    def render_summary(self) -> str:
+        return f"{_SUMMARY_HEADER}{self.summary}" if self.summary else ""
+
+    @staticmethod
+    def _join(summary: str, segments: List[str]) -> str:
+        parts: List[str] = []
+        if summary:
+            parts.append(f"{_SUMMARY_HEADER}{summary}")
+        if segments:
+            parts.append(_MESSAGES_HEADER + "\n".join(segments))
+        return "\n\n".join(parts)
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def append(self, msg: Dict[str, Any]) -> None:
+        """Add one message; the cached full view is extended, not rebuilt."""
+        full = self._views.get(("full",))
+        had_messages = bool(self.segments)
+        seg = self._add(msg)
+        self._views.clear()
+        if full is not None:
+            if had_messages:
+                self._views[("full",)] = f"{full}\n{seg}"
+            else:
+                self._views[("full",)] = self._join(self.summary, self.segments)
+
+
+def context_for(user_doc: Dict[str, Any]) -> ConversationContext:
+    """Return this turn's context for ``user_doc``, building it on first use."""
+    memo = _current.get()
+    if memo is not None and memo[0] is user_doc:
+        return memo[1]
+    ctx = ConversationContext.from_history(user_doc.get("conversation_history") or {})
+    _current.set((user_doc, ctx))
+    return ctx
+
+
+def current() -> Optional[ConversationContext]:
+    """The context memoized in this turn, or None before it is built."""
+    memo = _current.get()
+    return memo[1] if memo else None
+
+
+def memoized(user_doc: Dict[str, Any]) -> Optional[ConversationContext]:
+    """This turn's context for ``user_doc`` if one was built, else None."""
+    memo = _current.get()
+    return memo[1] if memo is not None and memo[0] is user_doc else None
+
+
+def forget(user_doc: Dict[str, Any]) -> None:
+    """Drop the memo for ``user_doc`` (its history was replaced, e.g. compacted)."""
+    memo = _current.get()
+    if memo is not None and memo[0] is user_doc:
+        _current.set(None)
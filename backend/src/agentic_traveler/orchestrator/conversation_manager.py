@@ -25,6 +25,7 @@ from agentic_traveler.orchestrator.client_factory import (
     suppress_usage_capture,
 )
 from agentic_traveler.core.observability import traceable
+from agentic_traveler.orchestrator import conversation_context
 
 from agentic_traveler.analytics import usage_tracker
 
@@ -85,27 +86,11 @@ class ConversationManager:
                           When None (default), include the full summary + all
                           recent messages for specialized agents that need
                           complete conversational context.
-        """
-        history = self.load(user_doc)
-        parts: List[str] = []
 
-        messages = history["recent_messages"]
-        if max_messages is not None:
-            # Slim path: no summary, only the last N entries
-            messages = messages[-max_messages:]
-        else:
-            # Full path: prepend compacted summary
-            if history["summary"]:
-                parts.append(f"Previous conversation summary:\n{history['summary']}")
-
-        if messages:
-            lines = []
-            for msg in messages:
-                role = "User" if msg.get("role") == "user" else "Agent"
-                lines.append(f"{role}: {msg.get('text', '')}")
-            parts.append("Recent messages:\n" + "\n".join(lines))
-
-        return "\n\n".join(parts) if parts else ""
+        The rendering is memoized for the turn (see ``conversation_context``),
+        so repeated calls in one turn do not re-render the history.
+        """
+        return conversation_context.context_for(user_doc).render(max_messages)
 
     def append_and_save(
         self,
@@ -138,6 +123,14 @@ class ConversationManager:
 
         if len(history["recent_messages"]) > MAX_RECENT:
             history = self._compact(history)
+            conversation_context.forget(user_doc)
+        elif history["recent_messages"] is user_doc.get("conversation_history", {}).get("recent_messages"):
+            # The exchange was appended to the user doc's own list: keep this
+            # turn's memoized context in step without re-rendering it.
+            ctx = conversation_context.memoized(user_doc)
+            if ctx is not None:
+                for msg in history["recent_messages"][-2:]:
+                    ctx.append(msg)
 
         try:
             get_db().table("conversations").upsert(
@@ -25,6 +25,21 @@ a survey. Three guards, applied here:
    the more personal prompts only fire once the user has shown some commitment
    (a destination on the trip), plus a once-per-day cap and a hard opt-out for
    high-structure planners.
+
+Selection cost
+--------------
+``CuriosityIndex`` buckets the library by state and, within a state, by
+motivation tag (prompts without a motivation gate go in the state's open
+bucket), and splits each bucket on ``requires_destination``. ``select``
+takes the union of the open bucket and the buckets of the traveler's
+motivations and only evaluates the profile-score gates of the prompts that
+have any, so it scales with the matching prompts rather than the library
+size. Candidate order is the
+library order, so the day's pick is the same as a full scan would give.
+
+With ``CURIOSITY_LIBRARY_RELOAD_S`` > 0 the injector checks the YAML file's
+mtime at most that often and rebuilds the index on a background thread;
+readers keep using the old index until the new one is swapped in.
 """
 
 from __future__ import annotations
@@ -32,13 +47,18 @@ from __future__ import annotations
 import hashlib
 import logging
 import os
+import threading
+import time
+from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import yaml
 from pydantic import BaseModel, Field
 
+from agentic_traveler.core.lazy import lazy_singleton
+
 logger = logging.getLogger(__name__)
 
 LIBRARY_PATH = Path(__file__).resolve().parent.parent / "content" / "curiosity_prompts.yaml"
@@ -83,6 +103,52 @@ def load_library(path: Path | str = LIBRARY_PATH) -> list[CuriosityPrompt]:
     return [CuriosityPrompt.model_validate(entry) for entry in raw]
 
 
+@dataclass
+class CuriosityIndex:
+    """Library positions bucketed by state, motivation tag and destination gate."""
+    library: list[CuriosityPrompt]
+    # (state, requires_destination) → prompts without a motivation gate
+    open_by_state: dict[tuple[str, bool], list[int]] = field(default_factory=dict)
+    # (state, motivation, requires_destination) → prompts gated on that motivation
+    by_motivation: dict[tuple[str, str, bool], list[int]] = field(default_factory=dict)
+    # positions with profile-score gates (the only ones select still checks)
+    score_gated: set[int] = field(default_factory=set)
+
+    @classmethod
+    def build(cls, library: list[CuriosityPrompt]) -> "CuriosityIndex":
+        index = cls(library=list(library))
+        for pos, p in enumerate(index.library):
+            motivations = {m.lower() for m in (p.trigger.motivation_any or [])}
+            needs_dest = p.trigger.requires_destination
+            if p.trigger.profile:
+                index.score_gated.add(pos)
+            for state in dict.fromkeys(p.trigger.states):
+                if not motivations:
+                    index.open_by_state.setdefault((state, needs_dest), []).append(pos)
+                for m in motivations:
+                    index.by_motivation.setdefault((state, m, needs_dest), []).append(pos)
+        return index
+
+    def candidates(
+        self,
+        state: str,
+        motivations: set[str],
+        has_destination: bool,
+        profile_ok: Callable[[CuriosityPrompt], bool],
+    ) -> list[CuriosityPrompt]:
+        """Prompts for ``state`` whose gates all pass, in library order.
+        ``profile_ok`` is only called for prompts with profile-score gates."""
+        flags = (False, True) if has_destination else (False,)
+        buckets = [self.open_by_state.get((state, f)) for f in flags]
+        buckets += [self.by_motivation.get((state, m, f)) for m in motivations for f in flags]
+        buckets = [b for b in buckets if b]
+        if not buckets:
+            return []
+        positions = buckets[0] if len(buckets) == 1 else sorted(set().union(*buckets))
+        lib, gated = self.library, self.score_gated
+        return [lib[i] for i in positions if i not in gated or profile_ok(lib[i])]
+
+
 # ── delivery framing (the AI-effect counter) ─────────────────────────────────
 
 def frame_curiosity_prompt(text: str) -> str:
@@ -135,6 +201,13 @@ def _motivations(user_doc: dict[str, Any], trip: Optional[dict[str, Any]]) -> se
 
 # ── injector ─────────────────────────────────────────────────────────────────
 
+def _reload_interval_s() -> float:
+    try:
+        return float(os.getenv("CURIOSITY_LIBRARY_RELOAD_S", "0"))
+    except ValueError:
+        return 0.0
+
+
 class CuriosityPromptInjector:
     """Selects zero or one curiosity prompt for a turn."""
 
@@ -142,15 +215,66 @@ class CuriosityPromptInjector:
         self,
         library_path: Path | str = LIBRARY_PATH,
         library: Optional[list[CuriosityPrompt]] = None,
+        reload_interval_s: Optional[float] = None,
     ):
+        self._path = Path(library_path)
+        self._reload_interval_s = 0.0
+        self._reload_lock = threading.Lock()
+        self._next_check = 0.0
+        self._mtime: Optional[float] = None
         if library is not None:
-            self._library = library
+            self._index = CuriosityIndex.build(library)
             return
+        self._reload_interval_s = _reload_interval_s() if reload_interval_s is None else reload_interval_s
+        self._mtime = self._stat()
         try:
-            self._library = load_library(library_path)
+            self._index = CuriosityIndex.build(load_library(self._path))
         except Exception:
             logger.warning("curiosity library failed to load; injector disabled.", exc_info=True)
-            self._library = []
+            self._index = CuriosityIndex.build([])
+
+    # ------------------------------------------------------------------
+    # Hot reload
+    # ------------------------------------------------------------------
+
+    def _stat(self) -> Optional[float]:
+        try:
+            return self._path.stat().st_mtime
+        except OSError:
+            return None
+
+    def reload(self) -> bool:
+        """Re-read the YAML and swap in a new index. A malformed file keeps
+        the current one. Returns True when the index was replaced."""
+        mtime = self._stat()
+        try:
+            index = CuriosityIndex.build(load_library(self._path))
+        except Exception:
+            logger.warning("curiosity library reload failed; keeping the loaded one.", exc_info=True)
+            self._mtime = mtime
+            return False
+        self._index, self._mtime = index, mtime  # one reference swap; readers never wait
+        logger.info("curiosity library reloaded: %d prompts.", len(index.library))
+        return True
+
+    def _maybe_reload(self) -> None:
+        if self._reload_interval_s <= 0:
+            return
+        now = time.monotonic()
+        if now < self._next_check or not self._reload_lock.acquire(blocking=False):
+            return
+        self._next_check = now + self._reload_interval_s
+        if self._stat() == self._mtime:
+            self._reload_lock.release()
+            return
+
+        def _run() -> None:
+            try:
+                self.reload()
+            finally:
+                self._reload_lock.release()
+
+        threading.Thread(target=_run, daemon=True, name="curiosity-reload").start()
 
     def select(
         self,
@@ -171,13 +295,10 @@ class CuriosityPromptInjector:
         if not force and float(scores.get("structure_preference", 0.5) or 0.5) > 0.7:
             return None
 
+        self._maybe_reload()
         motivations = _motivations(user_doc, trip)
         has_destination = bool((trip or {}).get("destinations"))
-        candidates = [
-            p for p in self._library
-            if state in p.trigger.states
-            and self._matches(p, scores, motivations, has_destination)
-        ]
+        candidates = self._candidates(state, scores, motivations, has_destination)
         if not candidates:
             return None
         idx = self._stable_index(user_doc, state, len(candidates))
@@ -185,17 +306,19 @@ class CuriosityPromptInjector:
 
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _matches(
-        p: CuriosityPrompt,
+    def _candidates(
+        self,
+        state: str,
         scores: dict[str, float],
         motivations: set[str],
         has_destination: bool,
-    ) -> bool:
-        if p.trigger.requires_destination and not has_destination:
-            return False
-        if p.trigger.motivation_any and not (set(m.lower() for m in p.trigger.motivation_any) & motivations):
-            return False
+    ) -> list[CuriosityPrompt]:
+        return self._index.candidates(
+            state, motivations, has_destination, lambda p: self._profile_ok(p, scores)
+        )
+
+    @staticmethod
+    def _profile_ok(p: CuriosityPrompt, scores: dict[str, float]) -> bool:
         for key, threshold in (p.trigger.profile or {}).items():
             if key.endswith("_max"):
                 if float(scores.get(key[:-4], 0.5) or 0.5) > threshold:
@@ -214,11 +337,6 @@ class CuriosityPromptInjector:
 
 # ── module singleton ─────────────────────────────────────────────────────────
 
-_INJECTOR: Optional[CuriosityPromptInjector] = None
-
-
+@lazy_singleton("curiosity_library")
 def get_injector() -> CuriosityPromptInjector:
-    global _INJECTOR
-    if _INJECTOR is None:
-        _INJECTOR = CuriosityPromptInjector()
-    return _INJECTOR
+    return CuriosityPromptInjector()
@@ -7,6 +7,7 @@ and Telegram; this task wires `metric` to analytics_events.
 
 import logging
 import time
+import uuid
 from collections import deque
 from typing import Any, Callable, Optional
 
@@ -26,6 +27,8 @@ class EventEmitter:
     ):
         self.user_id = user_id
         self.trip_id = trip_id
+        # One id per turn — the idempotency key for the turn's credit deduction.
+        self.turn_id: str = uuid.uuid4().hex
         self._on_status = on_status
         self._on_delta = on_delta
         self._metric_buffer: deque[dict] = deque()
@@ -21,6 +21,7 @@ from google import genai
 from google.genai import types
 
 from agentic_traveler.orchestrator.client_factory import get_client, gemini_generate
+from agentic_traveler.orchestrator.profile_utils import invalidate_profile_summary
 from agentic_traveler.core.observability import traceable
 
 logger = logging.getLogger(__name__)
@@ -44,6 +45,10 @@ _DIMENSIONS_LIST = [
     "risk_appetite"
 ]
 
+# save_preference re-runs the LLM merge at most this many times when a
+# concurrent write to the same keys makes it stale.
+_MERGE_ATTEMPTS = 3
+
 _PROFILE_GUIDELINES = """\
 Guidelines for travel personality dimensions (0.0 to 1.0 scale):
 - 0.0-0.3 = Strong preference for the left anchor of the trait
@@ -248,25 +253,16 @@ class ProfileAgent:
         structured, response, latency_ms = self._call_llm(prompt)
 
         if persist and response is not None:
-            from agentic_traveler.tools.db_client import get_db
-            from agentic_traveler.tools.user_repo import UserRepository
-
-            try:
-                res = (
-                    get_db()
-                    .table("user_profiles")
-                    .select("profile_data")
-                    .eq("user_id", user_id)
-                    .maybe_single()
-                    .execute()
-                )
-                merged = dict((res.data or {}).get("profile_data") or {}) if res else {}
-                merged.update(structured)  # tags/dims/summary overwrite; answered_questions preserved
-                UserRepository().upsert_structured_profile(user_id, merged)
-            except Exception:
-                logger.exception(
-                    "synthesize_from_answers: merge/upsert failed for user_id=%s", user_id
+            from agentic_traveler.tools import profile_patch_queue
+
+            # tags/dims/summary overwrite; answered_questions and custom keys are
+            # untouched because the patch only names the synthesised keys.
+            ops = profile_patch_queue.profile_ops(structured)
+            if ops and not profile_patch_queue.submit(user_id, ops):
+                logger.error(
+                    "synthesize_from_answers: profile patch failed for user_id=%s", user_id
                 )
+            invalidate_profile_summary(user_id)
 
         return structured, response, latency_ms
 
@@ -284,81 +280,97 @@ class ProfileAgent:
         """
         import contextvars
         import threading
+        from agentic_traveler.tools import profile_patch_queue
         from agentic_traveler.tools.db_client import get_db
 
         should_sync = _sync or (token_records is not None)
 
-        def _async_update():
-            try:
-                # 1. Fetch current profile_data and summary from Supabase (or fallback to user_doc)
-                res = get_db().table("user_profiles").select("profile_data, summary").eq("user_id", user_id).maybe_single().execute()
-                current_profile = {}
-                db_summary = ""
-                if res and res.data:
-                    current_profile = res.data.get("profile_data") or {}
-                    db_summary = res.data.get("summary") or ""
-
+        def _read_profile() -> Tuple[Dict[str, Any], Dict[str, Any]]:
+            """(profile for the LLM prompt, what the DB holds)."""
+            res = get_db().table("user_profiles").select("profile_data, summary").eq("user_id", user_id).maybe_single().execute()
+            current_profile = {}
+            db_summary = ""
+            if res and res.data:
+                current_profile = dict(res.data.get("profile_data") or {})
+                db_summary = res.data.get("summary") or ""
+            # What the DB holds — the patch carries only keys that differ from it.
+            stored = {**current_profile, "summary": db_summary}
+
+            if not current_profile:
+                user_profile = user_doc.get("user_profile", {})
+                current_profile = user_profile.get("profile_data") or {}
+                db_summary = user_profile.get("summary") or ""
                 if not current_profile:
-                    user_profile = user_doc.get("user_profile", {})
-                    current_profile = user_profile.get("profile_data") or {}
-                    db_summary = user_profile.get("summary") or ""
-                    if not current_profile:
-                        # Fallback to key-value pairs directly under user_profile
-                        current_profile = {
-                            k: v for k, v in user_profile.items()
-                            if k not in ("profile_data", "form_response", "summary")
-                        }
-
-                # Make sure summary is present in current_profile context for LLM prompt
-                if "summary" not in current_profile or not current_profile["summary"]:
-                    current_profile["summary"] = db_summary
+                    # Fallback to key-value pairs directly under user_profile
+                    current_profile = {
+                        k: v for k, v in user_profile.items()
+                        if k not in ("profile_data", "form_response", "summary")
+                    }
 
-                # 2. Call update_profile to run LLM
-                updated_structured_data, response, latency_ms = self.update_profile(
-                    preference_raw, dict(current_profile)
-                )
+            # Make sure summary is present in current_profile context for LLM prompt
+            if "summary" not in current_profile or not current_profile["summary"]:
+                current_profile["summary"] = db_summary
+            return dict(current_profile), stored
 
-                # Log and accumulate the usage at the caller boundary!
-                usage = None
-                if response:
-                    from agentic_traveler.analytics import usage_tracker
-                    usage = usage_tracker.log_and_accumulate(
-                        agent_name="profile_agent",
-                        model_name=self._model_name,
-                        user_id=user_id,
-                        response=response,
-                        latency_ms=latency_ms,
+        def _async_update():
+            try:
+                billing_records: List[Dict[str, Any]] = []
+                for attempt in range(1, _MERGE_ATTEMPTS + 1):
+                    # 1. Fetch current profile_data and summary from Supabase (or fallback to user_doc)
+                    current_profile, stored = _read_profile()
+
+                    # 2. Call update_profile to run LLM
+                    updated_structured_data, response, latency_ms = self.update_profile(
+                        preference_raw, dict(current_profile)
                     )
-                    if token_records is not None:
-                        token_records.append({
+
+                    # Log and accumulate the usage at the caller boundary!
+                    if response:
+                        from agentic_traveler.analytics import usage_tracker
+                        usage = usage_tracker.log_and_accumulate(
+                            agent_name="profile_agent",
+                            model_name=self._model_name,
+                            user_id=user_id,
+                            response=response,
+                            latency_ms=latency_ms,
+                        )
+                        record = {
                             "model_name": self._model_name,
                             "input_tokens": usage.get("input_tokens", 0),
                             "output_tokens": usage.get("output_tokens", 0),
                             "agent_name": "profile_agent",
-                        })
-
-                # Merge LLM output into current_profile (retaining standard and custom keys)
-                current_profile.update(updated_structured_data)
-                updated_summary = current_profile.pop("summary", "")
-
-                # 3. Upsert the updated profile_data and summary into user_profiles
-                get_db().table("user_profiles").upsert(
-                    {
-                        "user_id": user_id,
-                        "profile_data": current_profile,
-                        "summary": updated_summary,
-                    }
-                ).execute()
+                        }
+                        if token_records is not None:
+                            token_records.append(record)
+                        elif usage:
+                            billing_records.append(record)
+
+                    # 3. Queue the merged keys as a patch. The per-user worker applies it
+                    # to the latest row with a versioned write, so a concurrent update
+                    # (another message, a Tally submission) is never overwritten. The
+                    # merge was computed from a snapshot read here, outside the worker:
+                    # the guard rejects it if another writer changed one of the keys
+                    # it sets since, and the merge is recomputed from a fresh read.
+                    merged = {**current_profile, **updated_structured_data}
+                    changed = [k for k, v in merged.items() if k not in stored or stored[k] != v]
+                    ops = profile_patch_queue.profile_ops(merged, stored)
+                    if not ops or profile_patch_queue.enqueue(
+                        user_id, ops, guard=profile_patch_queue.unchanged_since(stored, changed),
+                    ).result(timeout=30):
+                        break
+                    logger.info(
+                        "Profile merge for user_id=%s went stale (attempt %d/%d); recomputing.",
+                        user_id, attempt, _MERGE_ATTEMPTS,
+                    )
+                else:
+                    logger.warning(
+                        "Dropped preference for user_id=%s: profile kept changing under the merge.", user_id,
+                    )
+                invalidate_profile_summary(user_id)
 
-                # 4. Bill user immediately if token_records is None and response exists
-                if token_records is None and response and usage:
+                # 4. Bill user immediately if token_records is None and a call was made
+                if billing_records:
                     from agentic_traveler.economy import credit_manager
-                    billing_records = [{
-                        "model_name": self._model_name,
-                        "input_tokens": usage.get("input_tokens", 0),
-                        "output_tokens": usage.get("output_tokens", 0),
-                        "agent_name": "profile_agent",
-                    }]
                     credit_manager.record_usage_and_bill(
                         user_id=user_id,
                         token_records=billing_records,
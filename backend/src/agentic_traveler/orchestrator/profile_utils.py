@@ -4,9 +4,31 @@ Utility to extract a concise text summary from a Supabase user document.
 The ``user_profile`` map mirrors the Tally intake form and the output of
 ProfileAgent.  This module turns it into a short narrative that any LLM
 agent can consume without needing to know the raw field names.
+
+``build_profile_summary`` is read by the router, the Chat/Trip/Planner
+agents and the planning saga on every turn, while the profile changes
+rarely. Rendered summaries are cached per ``(user id, user_profiles.version,
+name, options, dimensions)``; the ``bump_user_profile_version`` trigger
+moves the version on every write, and in-process writers (ProfileAgent,
+``profile_write.apply_profile_patch``) also call
+``invalidate_profile_summary``. Docs without a user id or version (tests,
+legacy shapes) are rendered directly — hashing the profile costs more than
+rendering it.
 """
 
-from typing import Dict, Any, Optional
+import os
+import threading
+from typing import Any, Dict, Hashable, Iterable, Optional
+
+from agentic_traveler.tools.ttl_cache import TTLCache
+
+SUMMARY_CACHE_SIZE = int(os.getenv("PROFILE_SUMMARY_CACHE_SIZE", "5000"))
+SUMMARY_CACHE_TTL_S = float(os.getenv("PROFILE_SUMMARY_CACHE_TTL_S", "3600"))
+
+_summary_cache: "TTLCache[str]" = TTLCache(SUMMARY_CACHE_SIZE, SUMMARY_CACHE_TTL_S)
+_lock = threading.Lock()
+_generations: Dict[str, int] = {}
+_uncached = 0
 
 
 def build_live_context(trip: Optional[Dict[str, Any]]) -> str:
@@ -61,17 +83,86 @@ def relevant_dimensions(saga: Any) -> set[str]:
     return dims
 
 
+def invalidate_profile_summary(user_id: Optional[str]) -> None:
+    """Drop every cached rendering for ``user_id`` (its profile was written)."""
+    if not user_id:
+        return
+    with _lock:
+        _generations[str(user_id)] = _generations.get(str(user_id), 0) + 1
+
+
+def clear_profile_summary_cache() -> None:
+    """Empty the cache and reset its counters (tests)."""
+    global _uncached
+    _summary_cache.clear()
+    with _lock:
+        _generations.clear()
+        _uncached = 0
+
+
+def profile_summary_stats() -> Dict[str, Any]:
+    """Cache counters plus renders that could not be cached (no id/version)."""
+    out = _summary_cache.stats()
+    with _lock:
+        out["uncached"] = _uncached
+    return out
+
+
+def _summary_key(
+    user_doc: Dict[str, Any],
+    include_scores: bool,
+    include_summary: bool,
+    dimensions: Optional[Iterable[str]],
+) -> Optional[Hashable]:
+    user_id = user_doc.get("id")
+    version = user_doc.get("profile_version")
+    if not user_id or version is None:
+        return None
+    with _lock:
+        generation = _generations.get(str(user_id), 0)
+    return (
+        str(user_id), generation, version,
+        user_doc.get("name", user_doc.get("user_name")),
+        include_scores, include_summary,
+        frozenset(dimensions) if dimensions is not None else None,
+    )
+
+
 def build_profile_summary(
     user_doc: Dict[str, Any],
     include_scores: bool = True,
     include_summary: bool = True,
+    dimensions: Optional[Iterable[str]] = None,
 ) -> str:
     """
     Convert a raw user document into a concise text block suitable for LLM prompts.
 
     Tailored to read the outputs of the ProfileAgent and custom user preferences stored
-    in the database `user_profiles.profile_data`.
+    in the database `user_profiles.profile_data`. ``dimensions`` (see
+    ``relevant_dimensions``) limits the personality scores and the extra
+    preferences to those keys. Cached per profile version (module docstring).
     """
+    global _uncached
+    key = _summary_key(user_doc, include_scores, include_summary, dimensions)
+    if key is None:
+        with _lock:
+            _uncached += 1
+        return _render_profile_summary(user_doc, include_scores, include_summary, dimensions)
+    cached = _summary_cache.get(key)
+    if cached is not None:
+        return cached
+    text = _render_profile_summary(user_doc, include_scores, include_summary, dimensions)
+    _summary_cache.put(key, text)
+    return text
+
+
+def _render_profile_summary(
+    user_doc: Dict[str, Any],
+    include_scores: bool,
+    include_summary: bool,
+    dimensions: Optional[Iterable[str]],
+) -> str:
+    dims = set(dimensions) if dimensions is not None else None
     name = user_doc.get("name", user_doc.get("user_name", "Traveler"))
     profile = user_doc.get("user_profile", {})
     profile_data = profile.get("profile_data") or {}
@@ -128,6 +219,8 @@ def build_profile_summary(
         high_traits = []
         low_traits = []
         for dim, val in scores.items():
+            if dims is not None and dim not in dims:
+                continue
             try:
                 val = float(val)
                 if val >= 0.7:
@@ -174,6 +267,9 @@ def build_profile_summary(
         else:
             return str(value)
 
+    if dims is not None:
+        extra_prefs = {k: v for k, v in extra_prefs.items() if k in dims}
+
     if extra_prefs:
         parts.append("\nUser Preferences:")
         for k, v in sorted(extra_prefs.items()):
@@ -20,6 +20,7 @@ from agentic_traveler.orchestrator.profile_questions import (
     PROFILE_QUESTIONS,
     legal_option_values,
 )
+from agentic_traveler.orchestrator.profile_utils import invalidate_profile_summary
 from agentic_traveler.orchestrator.sagas.base import SideEffect
 
 logger = logging.getLogger(__name__)
@@ -72,6 +73,7 @@ def apply_profile_patch(user_id: str, payload: dict, repo: Any = None) -> None:
     repo.merge_answered_question(
         user_id, qid, payload.get("value"), payload.get("source", "chat_tap")
     )
+    invalidate_profile_summary(user_id)
 
 
 def reaction_to_profile_patch(
@@ -0,0 +1,162 @@
+"""
+Token-budgeted prompt assembly.
+
+The agents' user prompts are a fixed sequence of sections (clock, profile
+summary, conversation history, preference note, message). They used to be
+f-string concatenations whose size grew with the history and the profile.
+``assemble`` builds the same text from ``Section``s under the call type's
+``budget_policy.resolve_prompt`` budget:
+
+1. every section is capped at its own ``max_tokens``;
+2. while the prompt is over the total ceiling, the lowest-priority section
+   shrinks first (pinned sections — the message, the clock — never do).
+
+A section shrinks by keeping its head (profile) or its tail (history: the
+newest lines). When the history is exactly this turn's memoized
+``ConversationContext`` rendering, its token-budgeted view is used instead,
+so whole messages and the summary are dropped rather than cut mid-line.
+
+``AssembledPrompt.report()`` goes into the ``llm_call_usage`` metric
+(``prompt_report=`` on ``gemini_generate`` / ``generate_maybe_stream``), so
+per-section prompt size is tracked per call over time.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from agentic_traveler.core.budget_policy import PINNED_PRIORITY, resolve_prompt
+from agentic_traveler.orchestrator.conversation_context import (
+    CHARS_PER_TOKEN,
+    current as current_conversation,
+    estimate_tokens,
+)
+
+logger = logging.getLogger(__name__)
+
+_ELLIPSIS = "…"
+
+
+@dataclass
+class Section:
+    """One named part of a prompt.
+
+    ``template`` wraps the (possibly shrunk) text, e.g.
+    ``"<user_message>\\n{}\\n</user_message>\\n"``. ``keep`` is the end that
+    survives a shrink: ``"head"`` or ``"tail"``.
+    """
+    name: str
+    text: str
+    template: str = "{}"
+    keep: str = "head"
+
+
+@dataclass
+class AssembledPrompt:
+    text: str
+    call_type: str
+    sections: Dict[str, int] = field(default_factory=dict)
+    truncated: List[str] = field(default_factory=list)
+
+    @property
+    def tokens(self) -> int:
+        return estimate_tokens(self.text)
+
+    def report(self) -> Dict[str, Any]:
+        """Fields merged into the ``llm_call_usage`` metric payload."""
+        return {
+            "prompt_budget": self.call_type,
+            "prompt_tokens_est": self.tokens,
+            "prompt_sections": dict(self.sections),
+            "prompt_truncated": list(self.truncated),
+        }
+
+
+def _shrink(section: Section, max_tokens: int) -> str:
+    text = section.text
+    if max_tokens <= 0:
+        return ""
+    if section.name == "conversation_history":
+        ctx = current_conversation()
+        if ctx is not None and text == ctx.render():
+            return ctx.render_budget(max_tokens)
+    max_chars = max_tokens * CHARS_PER_TOKEN - len(_ELLIPSIS) - 1
+    if max_chars <= 0:
+        return ""
+    if section.keep == "tail":
+        cut = text[-max_chars:]
+        newline = cut.find("\n")
+        if 0 <= newline < len(cut) - 1:
+            cut = cut[newline + 1:]  # start on a whole line
+        return f"{_ELLIPSIS}\n{cut}"
+    cut = text[:max_chars]
+    newline = cut.rfind("\n")
+    if newline > 0:
+        cut = cut[:newline]
+    return f"{cut}\n{_ELLIPSIS}"
+
+
+def assemble(call_type: str, sections: List[Section]) -> AssembledPrompt:
+    """Render ``sections`` in order within ``call_type``'s prompt budget."""
+    budget = resolve_prompt(call_type)
+    texts = [s.text for s in sections]
+    truncated: List[str] = []
+
+    def _fit(i: int, max_tokens: int) -> None:
+        texts[i] = _shrink(sections[i], max_tokens)
+        if sections[i].name not in truncated:
+            truncated.append(sections[i].name)
+
+    for i, section in enumerate(sections):
+        _priority, cap = budget.section(section.name)
+        if cap and estimate_tokens(texts[i]) > cap:
+            _fit(i, cap)
+
+    tokens = [estimate_tokens(s.template.format(t)) for s, t in zip(sections, texts)]
+    over = sum(tokens) - budget.total_tokens
+    if over > 0:
+        order = sorted(range(len(sections)), key=lambda i: budget.section(sections[i].name)[0])
+        for i in order:
+            if over <= 0 or budget.section(sections[i].name)[0] >= PINNED_PRIORITY:
+                break
+            own = estimate_tokens(texts[i])
+            if not own:
+                continue
+            _fit(i, own - over)
+            new = estimate_tokens(sections[i].template.format(texts[i]))
+            over -= tokens[i] - new
+            tokens[i] = new
+
+    if truncated:
+        logger.info("Prompt %s over budget; shrank %s.", call_type, ", ".join(truncated))
+    return AssembledPrompt(
+        text="".join(s.template.format(t) for s, t in zip(sections, texts)),
+        call_type=call_type,
+        sections={s.name: estimate_tokens(t) for s, t in zip(sections, texts)},
+        truncated=truncated,
+    )
+
+
+def agent_prompt(
+    call_type: str,
+    *,
+    current_time: str,
+    profile_summary: str,
+    conversation_context: str,
+    message: str,
+    pref_note: str = "",
+) -> AssembledPrompt:
+    """The Chat/Trip/Planner agents' shared user prompt, budgeted."""
+    sections = [
+        Section("current_time", current_time, "<current_time>{}</current_time>\n"),
+        Section("user_profile_summary", profile_summary,
+                "<user_profile_summary>\n{}\n</user_profile_summary>\n"),
+        Section("conversation_history", conversation_context,
+                "<conversation_history>\n{}\n</conversation_history>\n", keep="tail"),
+    ]
+    if pref_note:
+        sections.append(Section("preference_updated", pref_note))
+    sections.append(Section("user_message", message, "<user_message>\n{}\n</user_message>"))
+    return assemble(call_type, sections)
@@ -29,6 +29,7 @@ from google.genai import types
 from agentic_traveler.orchestrator.client_factory import get_client, gemini_generate
 from agentic_traveler.core.observability import traceable
 from agentic_traveler.orchestrator.profile_agent import ProfileAgent
+from agentic_traveler.orchestrator.prompt_assembler import Section, assemble
 from agentic_traveler.tools.feedback_tool import FeedbackTool
 from agentic_traveler.economy import credit_manager
 
@@ -259,18 +260,15 @@ class RouterAgent:
 
         balance = credit_manager.get_balance(user_doc)
 
-        user_prompt = f"""\
-Current Time: {current_time}
-User Name: {user_name}
-Credit Balance: {balance} credits
-Known Preferences: {known_prefs}
-
-Conversation History:
-{conversation_context}
-
-LATEST USER MESSAGE:
-{message}
-"""
+        prompt = assemble("router", [
+            Section("header", f"Current Time: {current_time}\nUser Name: {user_name}\n"
+                              f"Credit Balance: {balance} credits\n"),
+            Section("known_preferences", known_prefs, "Known Preferences: {}\n\n"),
+            Section("conversation_history", conversation_context,
+                    "Conversation History:\n{}\n\n", keep="tail"),
+            Section("user_message", message, "LATEST USER MESSAGE:\n{}\n"),
+        ])
+        user_prompt = prompt.text
 
         t = time.time()
         try:
@@ -279,6 +277,7 @@ LATEST USER MESSAGE:
                 model=_MODEL,
                 contents=user_prompt,
                 call_type="extraction",
+                prompt_report=prompt.report(),
                 config=types.GenerateContentConfig(
                     system_instruction=_SYSTEM_PROMPT,
                     max_output_tokens=400,
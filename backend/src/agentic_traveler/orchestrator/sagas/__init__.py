@@ -3,6 +3,10 @@
 Each saga is a small slot-filling skill that owns one concern. State lives in
 data (`SagaState`), never on the saga instance, so the shape maps 1:1 to a
 future LangGraph migration without the runtime dependency today.
+
+``SagaDispatcher`` is imported on first access: it pulls in every saga and,
+through them, google-genai, which ``interfaces.main`` must not pay for at
+import time (``core.lazy``). The state-as-data types are cheap and eager.
 """
 
 from agentic_traveler.orchestrator.sagas.base import (
@@ -14,7 +18,6 @@ from agentic_traveler.orchestrator.sagas.base import (
     SlotFillStatus,
     SlotRequest,
 )
-from agentic_traveler.orchestrator.sagas.dispatcher import SagaDispatcher
 
 __all__ = [
     "BaseSaga",
@@ -26,3 +29,11 @@ __all__ = [
     "SlotRequest",
     "SagaDispatcher",
 ]
+
+
+def __getattr__(name: str):
+    if name == "SagaDispatcher":
+        from agentic_traveler.orchestrator.sagas.dispatcher import SagaDispatcher
+
+        return SagaDispatcher
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
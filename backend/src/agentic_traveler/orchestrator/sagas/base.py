@@ -13,6 +13,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Optional, Protocol, TypedDict, runtime_checkable
 
+from agentic_traveler.orchestrator.turn_artifacts import TurnArtifacts
+
 
 class SlotFillStatus(str, Enum):
     """Lifecycle of a single slot within a saga turn."""
@@ -108,10 +110,10 @@ class SagaResult:
     slot_request: Optional[SlotRequest] = None
     state_delta: dict[str, Any] = field(default_factory=dict)
     side_effects: list[SideEffect] = field(default_factory=list)
-    # passthrough for the orchestrator's existing token/cost logging
-    _raw_response: Any = None
+    # passthrough for the orchestrator's logging: the model calls reduced to
+    # their artifacts, never the SDK responses themselves
+    _artifacts: Optional[TurnArtifacts] = None
     _latency_ms: float = 0.0
-    _search_responses: list[dict[str, Any]] = field(default_factory=list)
 
 
 @runtime_checkable
@@ -127,7 +129,13 @@ class BaseSaga(Protocol):
     data members to a ``runtime_checkable`` Protocol would make ``isinstance``
     demand them on every saga); the elicitor reads them via
     ``getattr(saga, "requires_profile", [])`` so sagas without them simply elicit
-    nothing. They are populated per saga in Tasks 55/56/59."""
+    nothing. They are populated per saga in Tasks 55/56/59.
+
+    Likewise ``trip_projection`` (``"summary"`` | ``"core"`` | ``"full"``, see
+    ``trip_access``) names the least trip data ``should_activate`` and ``run``
+    read; the dispatcher hydrates no further than the selected sagas need.
+    Read via ``trip_access.trip_projection_of`` — a saga without one gets the
+    full trip."""
 
     name: str
 
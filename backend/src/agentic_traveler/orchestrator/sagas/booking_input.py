@@ -8,12 +8,14 @@ from typing import Any
 
 from agentic_traveler.core.observability import traceable
 from agentic_traveler.orchestrator.sagas.base import BaseSaga, SagaResult, SlotRequest, ChoiceOption
+from agentic_traveler.orchestrator.turn_artifacts import TurnArtifacts, call_artifacts
 from agentic_traveler.tools.booking_parser import parse_booking
 
 logger = logging.getLogger(__name__)
 
 class BookingInputSaga(BaseSaga):
     name = "BookingInputSaga"
+    trip_projection = "full"
 
     def should_activate(self, intent: str, entities: dict[str, Any], trip: dict[str, Any] | None, state: dict[str, Any]) -> tuple[bool, bool]:
         # Activate if router extracted booking_shaped
@@ -96,7 +98,7 @@ class BookingInputSaga(BaseSaga):
         if extraction.confidence < 0.5:
             events.emit("metric", {"name": "booking_parse_low_confidence"})
             text = "I couldn't quite parse that booking — paste the basics or describe it and I'll save it as a note."
-            return SagaResult(text=text, _raw_response=raw_response)
+            return SagaResult(text=text, _artifacts=TurnArtifacts(call_artifacts(raw_response)))
             
         # Summarize
         k = extraction.booking_kind
@@ -123,5 +125,5 @@ class BookingInputSaga(BaseSaga):
                     ChoiceOption("no", "No, cancel", "No"),
                 ]
             ),
-            _raw_response=raw_response
+            _artifacts=TurnArtifacts(call_artifacts(raw_response)),
         )
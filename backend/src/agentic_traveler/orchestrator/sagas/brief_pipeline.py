@@ -0,0 +1,174 @@
+"""Background destination brief pipeline — keeps the brief model call off the
+planning turn's critical path.
+
+``schedule_brief`` is called by PlanningSaga as soon as the turn knows the
+trip's destination (right after slot extraction). It never waits on a model:
+
+- brief already stored for this destination → nothing to do;
+- shared core already in memory (``brief_cache``) or a finished background
+  job for this trip → the personalised brief is returned as a ``trip_patch``
+  SideEffect and lands with the turn's other writes;
+- otherwise a daemon worker is started and the turn replies with whatever
+  context it has. The worker attaches the brief with
+  ``TripRepository.merge_discovery`` (an atomic ``discovery || patch``; the
+  turn writes its discovery keys the same way, so neither clobbers the
+  other), which bumps
+  ``trips.updated_at`` → the TripPanel's Realtime subscription refetches. If
+  the turn is still streaming, a ``brief_ready`` status event goes out on SSE
+  as well.
+
+Jobs leave the table when they finish, except an unattached brief, which is
+kept for the trip's next turn for at most ``_UNCLAIMED_TTL_S``.
+
+Single-flight per trip: while a job for (trip, destination) is running, later
+turns for that trip neither block nor start a second generation. Brief
+generation is platform work on a fresh thread, so it is not billed to the
+turn (no ``current_turn_usage`` there), matching its cross-user caching.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Optional
+
+from agentic_traveler.orchestrator.sagas.base import SideEffect
+from agentic_traveler.orchestrator.sagas.destination_brief import (
+    load_brief,
+    primary_destination,
+    travel_month,
+    personalize_brief,
+)
+from agentic_traveler.tools import brief_cache
+
+logger = logging.getLogger(__name__)
+
+_UNCLAIMED_TTL_S = 600.0
+
+_lock = threading.Lock()
+# trip_id → (destination, Future[brief | None], monotonic expiry of an
+# unclaimed result, None while running)
+_jobs: dict[str, tuple[str, Future, Optional[float]]] = {}
+
+
+def _evict_expired() -> None:
+    """Drop unclaimed results past their TTL. Caller holds ``_lock``."""
+    now = time.monotonic()
+    for trip_id in [t for t, (_d, _f, exp) in _jobs.items() if exp is not None and exp < now]:
+        del _jobs[trip_id]
+
+
+def _attach(trip: dict[str, Any], brief: dict[str, Any]) -> SideEffect:
+    return SideEffect(
+        kind="trip_patch",
+        payload={"id": trip.get("id"), "discovery": {"destination_brief": brief}},
+    )
+
+
+def schedule_brief(
+    client: Any, trip: dict[str, Any], user_doc: dict[str, Any], events: Any
+) -> Optional[SideEffect]:
+    """Non-blocking ``ensure_brief``: a SideEffect when the brief is available
+    right now, else ``None`` (a background job is started or already running)."""
+    destination = primary_destination(trip)
+    trip_id = (trip or {}).get("id")
+    if not destination or not trip_id or client is None:
+        return None
+    existing = ((trip or {}).get("discovery") or {}).get("destination_brief") or {}
+    if existing.get("destination") == destination:
+        return None
+
+    with _lock:
+        _evict_expired()
+        job = _jobs.get(trip_id)
+        if job is not None and job[0] == destination:
+            fut = job[1]
+            if not fut.done():
+                return None  # in flight — single-flight per trip
+            del _jobs[trip_id]
+            brief = fut.result()
+            if brief is not None:
+                return _attach(trip, brief)
+            # The job failed; fall through and try again.
+
+    month = travel_month(trip)
+    core = brief_cache.cache.get((brief_cache.destination_key(destination), month))
+    if core is not None:
+        events.emit("metric", {"name": "brief_captured", "ok": True, "source": "memory",
+                               "latency_ms": 0})
+        return _attach(trip, personalize_brief(core, user_doc))
+
+    with _lock:
+        job = _jobs.get(trip_id)
+        if job is not None and job[0] == destination:
+            return None
+        fut: Future = Future()
+        _jobs[trip_id] = (destination, fut, None)
+    threading.Thread(
+        target=_run,
+        args=(fut, client, trip_id, destination, month, user_doc, events),
+        daemon=True,
+        name="destination-brief",
+    ).start()
+    return None
+
+
+def _run(
+    fut: Future, client: Any, trip_id: str, destination: str, month: str,
+    user_doc: dict[str, Any], events: Any,
+) -> None:
+    t = time.time()
+    brief = None
+    attached = False
+    try:
+        brief, source = load_brief(client, destination, user_doc, month)
+        if brief is not None and events.user_id:
+            from agentic_traveler.tools.trip_repo import TripRepository
+
+            attached = TripRepository().merge_discovery(
+                trip_id, events.user_id, {"destination_brief": brief}
+            )
+        events.emit("metric", {
+            "name": "brief_captured",
+            "ok": brief is not None,
+            "source": source,
+            "background": True,
+            "attached": attached,
+            "latency_ms": int((time.time() - t) * 1000),
+        })
+        if attached:
+            events.emit("status", {
+                "phase": "brief_ready", "trip_id": trip_id, "destination": destination,
+            })
+        # The turn has usually flushed its metrics by now.
+        events.flush_metrics()
+    except Exception:
+        logger.warning("background destination brief failed for trip_id=%s.", trip_id, exc_info=True)
+    finally:
+        fut.set_result(brief)
+        with _lock:
+            job = _jobs.get(trip_id)
+            if job is not None and job[1] is fut:
+                if attached or brief is None:
+                    # On the trip already, or failed (the next turn retries).
+                    del _jobs[trip_id]
+                else:
+                    # Unattached: the next turn picks it up as a SideEffect.
+                    _jobs[trip_id] = (destination, fut, time.monotonic() + _UNCLAIMED_TTL_S)
+            _evict_expired()
+
+
+def wait_idle(timeout: float = 5.0) -> None:
+    """Block until every running brief job has finished (tests, shutdown)."""
+    with _lock:
+        futures = [fut for _dest, fut, _exp in _jobs.values()]
+    for fut in futures:
+        fut.result(timeout=timeout)
+
+
+def clear() -> None:
+    """Forget finished and running jobs (tests)."""
+    with _lock:
+        _jobs.clear()
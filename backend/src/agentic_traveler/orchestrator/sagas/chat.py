@@ -19,6 +19,7 @@ class ChatSaga:
     """Conversational turns — greetings, banter, emotional support, recall."""
 
     name = "ChatSaga"
+    trip_projection = "summary"  # never reads the trip
 
     def __init__(self, client: Any = None):
         self._client = client or get_client()
@@ -73,7 +74,6 @@ class ChatSaga:
         })
         return SagaResult(
             text=result.get("text", ""),
-            _raw_response=result.get("_raw_response"),
+            _artifacts=result.get("_artifacts"),
             _latency_ms=result.get("_latency_ms", 0.0),
-            _search_responses=result.get("_search_responses", []) or [],
         )
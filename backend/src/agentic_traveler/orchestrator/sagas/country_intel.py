@@ -2,23 +2,18 @@
 CountryIntelSaga — Background fetcher for country safety, visa, health, etc.
 """
 
-import asyncio
 import logging
-import threading
 from typing import Any, Optional, Tuple
 
-from agentic_traveler.analytics import metrics_tracker
-from agentic_traveler.economy import credit_manager
 from agentic_traveler.core.observability import traceable
+from agentic_traveler.orchestrator.sagas import intel_refresh
 from agentic_traveler.orchestrator.sagas.base import BaseSaga, SagaState, SagaResult
-from agentic_traveler.tools.country_intel_fetcher import fetch_country_intel
-from agentic_traveler.tools.trip_repo import TripRepository
-from agentic_traveler.tools.user_repo import UserRepository
 
 logger = logging.getLogger(__name__)
 
 class CountryIntelSaga(BaseSaga):
     name = "CountryIntelSaga"
+    trip_projection = "full"
 
     def __init__(self, client: Any = None):
         self._client = client
@@ -104,16 +99,15 @@ class CountryIntelSaga(BaseSaga):
         confirmed = [d for d in destinations if d.get("status") == "confirmed" and d.get("iso_country")]
         if confirmed:
             logger.info("CountryIntelSaga (owner) triggering refresh for %s", confirmed[0]["name"])
-            # Fire-and-forget from a sync worker thread: spawn a daemon thread with
-            # its own event loop so asyncio.create_task isn't called on a non-loop thread.
-            coro = self._run_fetch_async(
+            # Fire-and-forget on the shared refresh worker (deduplicated per
+            # trip + country, cooldown-limited).
+            intel_refresh.request_refresh(
                 trip["id"],
                 user_doc["id"],
                 confirmed[0]["iso_country"],
                 confirmed[0]["name"],
-                month_name=self._get_trip_month(trip),
+                self._get_trip_month(trip),
             )
-            threading.Thread(target=asyncio.run, args=(coro,), daemon=True).start()
 
             return SagaResult(text=f"I'll check the latest facts for {confirmed[0]['name']}. The intel strip will update shortly.")
 
@@ -141,76 +135,15 @@ class CountryIntelSaga(BaseSaga):
 
         month_name = self._get_trip_month(trip)
 
-        # Run async fetch
         for dest in confirmed:
             logger.info("CountryIntelSaga (listener) queueing fetch for %s", dest["name"])
-            coro = self._run_fetch_async(
+            intel_refresh.request_refresh(
                 trip["id"],
                 user_doc["id"],
                 dest["iso_country"],
                 dest["name"],
                 month_name,
             )
-            threading.Thread(target=asyncio.run, args=(coro,), daemon=True).start()
-
-    async def _run_fetch_async(self, trip_id: str, user_id: str, iso_country: str, country_name: str, month_name: str):
-        """Runs the fetch synchronously inside the executor."""
-        loop = asyncio.get_running_loop()
-        
-        # Double check credits right before the heavy LLM operation
-        user_repo = UserRepository()
-        user_doc = await loop.run_in_executor(None, user_repo.get_user_by_id, user_id)
-        if not user_doc or not credit_manager.has_credits(user_doc):
-            logger.info("CountryIntelSaga skipping fetch for %s due to 0 credits", user_id)
-            return
-
-        try:
-            snapshot = await loop.run_in_executor(
-                None,
-                fetch_country_intel,
-                iso_country,
-                country_name,
-                month_name,
-            )
-            
-            # Pop token records and bill the user
-            token_records = snapshot.pop("_token_records", [])
-            if token_records:
-                try:
-                    await loop.run_in_executor(
-                        None,
-                        credit_manager.record_usage_and_bill,
-                        user_id,
-                        token_records,
-                        "country_intel",
-                        False # Since we are already in executor, we don't want a background thread
-                    )
-                except Exception:
-                    logger.exception("Failed to bill for country intel fetch")
-            
-            repo = TripRepository()
-            await loop.run_in_executor(
-                None,
-                repo.upsert_country_intel,
-                trip_id,
-                user_id,
-                snapshot,
-            )
-            
-            metrics_tracker.record_event(
-                "country_intel_fetched",
-                user_id=user_id,
-                trip_id=trip_id,
-                payload={"iso_country": iso_country},
-            )
-        except Exception:
-            logger.exception("Async fetch failed for %s", country_name)
-            metrics_tracker.record_event(
-                "error_raised",
-                user_id=user_id,
-                trip_id=trip_id,
-                payload={"scope": "country_intel_saga", "error_class": "fetch_failed"},
-            )
 
     def _get_trip_month(self, trip: dict[str, Any]) -> str:
         """Extract the month from the trip timeframe or default to 'any'."""
@@ -7,16 +7,23 @@ Mirrors the country-intel "cached world facts, never authoritative" pattern
 (task 38): captured once, refreshed only on explicit request, every render
 carries a verify-with-official-sources disclaimer.
 
+Two layers: the non-personalized core — seasonal windows,
+character, signature experiences, candidate fit hooks — is generated once
+per (destination, travel month) and shared across users via
+``tools.brief_cache``; ``personalize_brief`` then ranks the fit hooks
+against the traveler's profile with a template pass (no model call).
+
 Storage: ``trip.discovery.destination_brief`` (the trips table has no
-dedicated column; ``discovery`` is the planning JSONB bag). The column is
-merge-replaced on write, so ``ensure_brief`` returns a SideEffect carrying the
-full merged ``discovery`` dict.
+dedicated column; ``discovery`` is the planning JSONB bag). Discovery writes
+are key merges (``TripRepository.merge_discovery``), so ``ensure_brief``
+returns a SideEffect carrying only the ``destination_brief`` key.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import re
 import time
 from datetime import datetime, timezone
 from typing import Any, Optional
@@ -25,8 +32,8 @@ from google.genai import types
 
 from agentic_traveler.core.observability import traceable
 from agentic_traveler.orchestrator.client_factory import gemini_generate
-from agentic_traveler.orchestrator.profile_utils import build_profile_summary
 from agentic_traveler.orchestrator.sagas.base import SideEffect
+from agentic_traveler.tools import brief_cache
 
 logger = logging.getLogger(__name__)
 
@@ -34,18 +41,27 @@ _MODEL = "gemini-3.5-flash"
 
 _SYSTEM_PROMPT = """\
 You produce a compact destination knowledge brief for a travel advisor.
+It is shared by every traveler going there, so it must not assume anything
+about who is travelling.
 Facts must be broadly true, seasonal patterns conventional wisdom — this is
 cached guidance, NEVER authoritative; downstream UI adds a "verify with
 official sources" disclaimer. No visa/medical/legal claims.
 Seasonality framework: for each window reason over the triad WEATHER /
 CROWDS / PRICE; prefer naming shoulder windows (weeks adjacent to peak that
 keep most of the weather and shed most of the crowds and cost).
-fit_hooks: 3-6 short tags of what this destination rewards (e.g.
-"slow-mornings", "hiker", "design-lover"), ordered by relevance to the
-traveler profile provided. why-lines: one sentence, sensory and specific,
-no superlative chains. Return ONLY the JSON object.
+month_character: one sentence on what the destination is like in the given
+travel month.
+fit_hooks: 6-10 short tags of what this destination rewards (e.g.
+"slow-mornings", "hiker", "design-lover"), strongest first. why-lines: one
+sentence, sensory and specific, no superlative chains. Return ONLY the JSON
+object.
 """
 
+MONTHS = ("JAN", "FEB", "MAR", "APR", "MAY", "JUN",
+          "JUL", "AUG", "SEP", "OCT", "NOV", "DEC")
+_MAX_FIT_HOOKS = 6
+_WORD = re.compile(r"[a-z]+")
+
 
 def _schema() -> types.Schema:
     S, T = types.Schema, types.Type
@@ -68,6 +84,7 @@ def _schema() -> types.Schema:
             "shoulder": S(type=T.STRING, nullable=True),
             "low": S(type=T.STRING, nullable=True),
         }),
+        "month_character": S(type=T.STRING, nullable=True),
         "signature_experiences": S(type=T.ARRAY, items=S(type=T.STRING)),
         "fit_hooks": S(type=T.ARRAY, items=S(type=T.STRING)),
     })
@@ -77,7 +94,8 @@ def _utcnow_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _primary_destination(trip: dict[str, Any]) -> Optional[str]:
+def primary_destination(trip: dict[str, Any]) -> Optional[str]:
+    """The confirmed destination's name, else the first one listed."""
     dests = (trip or {}).get("destinations") or []
     confirmed = next((d for d in dests if d.get("status") == "confirmed"), None)
     chosen = confirmed or (dests[0] if dests else None)
@@ -85,19 +103,25 @@ def _primary_destination(trip: dict[str, Any]) -> Optional[str]:
     return name.strip() if isinstance(name, str) and name.strip() else None
 
 
-@traceable(name="saga.destination_brief.capture")
-def capture_destination_brief(
-    client: Any, destination: str, user_doc: dict[str, Any]
-) -> Optional[dict[str, Any]]:
-    """One flash structured-output call → the brief dict, or ``None`` on any
-    failure (never raises). fit_hooks are ranked against the traveler's DNA
-    summary at capture time (briefs are trip-scoped, so personalisation is OK)."""
+def travel_month(trip: dict[str, Any]) -> str:
+    """The trip's start month (``discovery.timeframe.start_date``), else the
+    current month — the key of the shared core brief."""
+    timeframe = ((trip or {}).get("discovery") or {}).get("timeframe") or {}
+    start = str(timeframe.get("start_date") or "")
+    if re.match(r"^\d{4}-\d{2}", start) and 1 <= int(start[5:7]) <= 12:
+        return MONTHS[int(start[5:7]) - 1]
+    return MONTHS[datetime.now(timezone.utc).month - 1]
+
+
+@traceable(name="saga.destination_brief.core")
+def capture_core_brief(client: Any, destination: str, month: str) -> Optional[dict[str, Any]]:
+    """One flash structured-output call → the non-personalized core brief,
+    or ``None`` on any failure (never raises)."""
     if client is None or not (destination or "").strip():
         return None
-    dna = build_profile_summary(user_doc or {}, include_scores=False)
     user_content = (
         f"<destination>{destination}</destination>\n"
-        f"<traveler_profile>{dna}</traveler_profile>"
+        f"<travel_month>{month}</travel_month>"
     )
     try:
         raw = gemini_generate(
@@ -106,7 +130,7 @@ def capture_destination_brief(
             contents=user_content,
             config=types.GenerateContentConfig(
                 system_instruction=_SYSTEM_PROMPT,
-                max_output_tokens=700,
+                max_output_tokens=800,
                 response_mime_type="application/json",
                 response_schema=_schema(),
                 automatic_function_calling=types.AutomaticFunctionCallingConfig(disable=True),
@@ -119,11 +143,65 @@ def capture_destination_brief(
     if not isinstance(data, dict) or not data.get("best_windows"):
         return None
     data["destination"] = data.get("destination") or destination
+    data["month"] = month
     data["captured_at"] = _utcnow_iso()
     data["model_version"] = _MODEL
     return data
 
 
+def _profile_words(user_doc: dict[str, Any]) -> set[str]:
+    profile = (user_doc or {}).get("user_profile") or {}
+    data = profile.get("profile_data") or {}
+    text = " ".join(
+        str(x) for x in (
+            profile.get("summary"), data.get("additional_info"), data.get("travel_style"),
+            *(data.get("tags") or []),
+        ) if x
+    )
+    return {w[:4] for w in _WORD.findall(text.lower()) if len(w) > 2}
+
+
+def personalize_brief(core: dict[str, Any], user_doc: dict[str, Any]) -> dict[str, Any]:
+    """Template pass over a shared core brief: fit hooks sharing words with
+    the traveler's profile (tags, summary, notes) move to the front, then
+    the list is trimmed. Order is otherwise the core's (strongest first)."""
+    brief = dict(core)
+    hooks = [h for h in (core.get("fit_hooks") or []) if isinstance(h, str)]
+    words = _profile_words(user_doc)
+
+    def score(hook: str) -> int:
+        return sum(1 for w in _WORD.findall(hook.lower()) if w[:4] in words)
+
+    brief["fit_hooks"] = sorted(hooks, key=score, reverse=True)[:_MAX_FIT_HOOKS]
+    return brief
+
+
+@traceable(name="saga.destination_brief.capture")
+def capture_destination_brief(
+    client: Any, destination: str, user_doc: dict[str, Any], month: Optional[str] = None
+) -> Optional[dict[str, Any]]:
+    """Shared core (cached per destination + month) personalised for this
+    traveler, or ``None`` when the core could not be produced."""
+    brief, _source = load_brief(client, destination, user_doc, month)
+    return brief
+
+
+def load_brief(
+    client: Any, destination: str, user_doc: dict[str, Any], month: Optional[str]
+) -> tuple[Optional[dict[str, Any]], str]:
+    """``(personalised brief | None, source)`` where ``source`` is the
+    ``brief_cache`` outcome, or ``"none"`` when nothing could be loaded."""
+    if client is None or not (destination or "").strip():
+        return None, "none"
+    month = month or MONTHS[datetime.now(timezone.utc).month - 1]
+    core, source = brief_cache.get_or_load(
+        destination, month, lambda: capture_core_brief(client, destination, month)
+    )
+    if core is None:
+        return None, source
+    return personalize_brief(core, user_doc), source
+
+
 @traceable(name="saga.destination_brief.ensure")
 def ensure_brief(
     client: Any, trip: dict[str, Any], user_doc: dict[str, Any], events: Any
@@ -133,22 +211,24 @@ def ensure_brief(
     stored for THAT destination; emits ``brief_captured``. Returns ``None``
     (no write, no metric) when a brief for the current destination already
     exists, or when there's no destination."""
-    destination = _primary_destination(trip)
+    destination = primary_destination(trip)
     if not destination:
         return None
-    discovery = dict((trip or {}).get("discovery") or {})
-    existing = discovery.get("destination_brief") or {}
+    existing = ((trip or {}).get("discovery") or {}).get("destination_brief") or {}
     if existing.get("destination") == destination:
         return None  # already captured for this destination — idempotent
 
     t = time.time()
-    brief = capture_destination_brief(client, destination, user_doc)
+    brief, source = load_brief(client, destination, user_doc, travel_month(trip))
     events.emit("metric", {
         "name": "brief_captured",
         "ok": brief is not None,
+        "source": source,
         "latency_ms": int((time.time() - t) * 1000),
     })
     if brief is None:
         return None
-    discovery["destination_brief"] = brief
-    return SideEffect(kind="trip_patch", payload={"id": (trip or {}).get("id"), "discovery": discovery})
+    return SideEffect(
+        kind="trip_patch",
+        payload={"id": (trip or {}).get("id"), "discovery": {"destination_brief": brief}},
+    )
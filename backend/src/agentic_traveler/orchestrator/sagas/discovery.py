@@ -67,6 +67,7 @@ class DiscoverySaga:
     """Open-ended destination discovery before a trip is shaped."""
 
     name = "DiscoverySaga"
+    trip_projection = "full"
 
     def __init__(self, client: Any = None):
         self._client = client or get_client()
@@ -136,9 +137,8 @@ class DiscoverySaga:
         return SagaResult(
             text=result.get("text", ""),
             side_effects=side_effects,
-            _raw_response=result.get("_raw_response"),
+            _artifacts=result.get("_artifacts"),
             _latency_ms=result.get("_latency_ms", 0.0),
-            _search_responses=result.get("_search_responses", []) or [],
         )
 
     def _maybe_confirm_create(
@@ -0,0 +1,175 @@
+"""
+Country intel refresh coordinator.
+
+Every country intel refresh — CountryIntelSaga as listener (a destination
+was just confirmed) or owner (an intel question), and the trips router's
+manual ``/trips/{id}/intel/refresh`` — goes through ``request_refresh``:
+
+- work runs on ONE shared, bounded ThreadPoolExecutor
+  (INTEL_REFRESH_WORKERS) instead of a thread + event loop per fetch;
+- a refresh already queued or running for the same (trip, country) is
+  joined, not duplicated — twenty taps on the refresh button make one fetch;
+- after a refresh completes, that trip's intel for that country is not
+  refetched for INTEL_REFRESH_COOLDOWN_S (a cooldown per trip and country,
+  so confirming a second country on the same trip still fetches at once);
+  expired cooldowns are pruned whenever a refresh completes;
+- timing and outcome are written to analytics_events
+  (``country_intel_fetched`` / ``error_raised``).
+
+Each fetch makes two LLM calls and bills the user, so the credit check is
+repeated right before it runs.
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from agentic_traveler.analytics.event_sink import emit_metric_now
+from agentic_traveler.economy import credit_manager
+from agentic_traveler.tools.trip_repo import TripRepository
+from agentic_traveler.tools.user_repo import UserRepository
+
+logger = logging.getLogger(__name__)
+
+WORKERS = int(os.getenv("INTEL_REFRESH_WORKERS", "2"))
+COOLDOWN_S = float(os.getenv("INTEL_REFRESH_COOLDOWN_S", "300"))
+
+# Outcomes returned by request_refresh.
+ENQUEUED = "enqueued"
+IN_FLIGHT = "in_flight"
+COOLDOWN = "cooldown"
+
+Key = Tuple[str, str]
+
+_lock = threading.Lock()
+_inflight: Dict[Key, Future] = {}
+_last_done: Dict[Key, float] = {}
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _pool() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="intel-refresh")
+    return _executor
+
+
+def request_refresh(
+    trip_id: str,
+    user_id: str,
+    iso_country: str,
+    country_name: str,
+    month_name: str,
+) -> Tuple[str, Future]:
+    """
+    Queue a refresh of ``trip_id``'s intel for ``iso_country``; never blocks.
+
+    Returns ``(outcome, future)``: ``ENQUEUED`` with a new job, ``IN_FLIGHT``
+    with the job already queued/running for this (trip, country), or
+    ``COOLDOWN`` with an already-resolved future when the last refresh
+    finished less than COOLDOWN_S ago. The future resolves to the outcome
+    string of the job (``"ok"``, ``"no_credits"``, ``"failed"``).
+    """
+    key = (str(trip_id), (iso_country or "").upper())
+    with _lock:
+        fut = _inflight.get(key)
+        if fut is not None:
+            return IN_FLIGHT, fut
+        done_at = _last_done.get(key)
+        if done_at is not None and time.time() - done_at < COOLDOWN_S:
+            skipped: Future = Future()
+            skipped.set_result(COOLDOWN)
+            return COOLDOWN, skipped
+        fut = _pool().submit(_refresh, key, user_id, country_name, month_name)
+        _inflight[key] = fut
+    return ENQUEUED, fut
+
+
+def cooldown_remaining(trip_id: str, iso_country: str) -> float:
+    """Seconds until (trip, country) may be refreshed again (0 when it may)."""
+    with _lock:
+        done_at = _last_done.get((str(trip_id), (iso_country or "").upper()))
+    if done_at is None:
+        return 0.0
+    return max(0.0, COOLDOWN_S - (time.time() - done_at))
+
+
+def _refresh(key: Key, user_id: str, country_name: str, month_name: str) -> str:
+    trip_id, iso_country = key
+    t = time.time()
+    outcome = "failed"
+    try:
+        outcome = _fetch_and_store(trip_id, user_id, iso_country, country_name, month_name)
+    except Exception:
+        logger.exception("Country intel refresh failed for %s", country_name)
+    finally:
+        latency_ms = int((time.time() - t) * 1000)
+        with _lock:
+            _inflight.pop(key, None)
+            _prune_cooldowns()
+            if outcome == "ok":
+                _last_done[key] = time.time()
+        if outcome == "failed":
+            emit_metric_now(
+                "error_raised", user_id=user_id, trip_id=trip_id,
+                payload={"scope": "country_intel_saga", "error_class": "fetch_failed",
+                         "iso_country": iso_country, "latency_ms": latency_ms},
+            )
+        else:
+            emit_metric_now(
+                "country_intel_fetched", user_id=user_id, trip_id=trip_id,
+                payload={"iso_country": iso_country, "outcome": outcome, "latency_ms": latency_ms},
+            )
+    return outcome
+
+
+def _prune_cooldowns() -> None:
+    """Forget cooldowns that have run out. Caller holds ``_lock``."""
+    cutoff = time.time() - COOLDOWN_S
+    for key in [k for k, done_at in _last_done.items() if done_at <= cutoff]:
+        del _last_done[key]
+
+
+def fetch_country_intel(iso_country: str, country_name: str, month_name: str) -> dict:
+    # The fetcher builds google-genai schemas at import; the trips router
+    # imports this module, so defer it to the first refresh (core.lazy).
+    from agentic_traveler.tools.country_intel_fetcher import fetch_country_intel as fetch
+
+    return fetch(iso_country, country_name, month_name)
+
+
+def _fetch_and_store(
+    trip_id: str, user_id: str, iso_country: str, country_name: str, month_name: str
+) -> str:
+    # Double check credits right before the heavy LLM operation.
+    user_doc = UserRepository().get_user_by_id(user_id)
+    if not user_doc or not credit_manager.has_credits(user_doc):
+        logger.info("Country intel refresh skipped for %s: 0 credits", user_id)
+        return "no_credits"
+
+    snapshot = fetch_country_intel(iso_country, country_name, month_name)
+
+    token_records = snapshot.pop("_token_records", [])
+    if token_records:
+        try:
+            credit_manager.record_usage_and_bill(
+                user_id=user_id,
+                token_records=token_records,
+                default_agent_name="country_intel",
+                run_async=False,  # already on a worker thread
+            )
+        except Exception:
+            logger.exception("Failed to bill for country intel fetch")
+
+    TripRepository().upsert_country_intel(trip_id, user_id, snapshot)
+    return "ok"
+
+
+def reset() -> None:
+    """Forget in-flight jobs and cooldowns (tests)."""
+    with _lock:
+        _inflight.clear()
+        _last_done.clear()
@@ -28,7 +28,7 @@ from google.genai import types
 from agentic_traveler.core.observability import traceable
 from agentic_traveler.orchestrator.client_factory import gemini_generate, get_client
 from agentic_traveler.orchestrator.sagas.base import SagaResult, SagaState, SideEffect
-from agentic_traveler.orchestrator.sagas.saga_state import derive_saga_state_local
+from agentic_traveler.orchestrator.sagas.saga_state import saga_phase
 
 logger = logging.getLogger(__name__)
 
@@ -149,6 +149,7 @@ class JournalSaga:
     """Post-trip reflection capture (owner once/day, listener otherwise)."""
 
     name = "JournalSaga"
+    trip_projection = "core"  # journal.last_prompt_date decides ownership
 
     def __init__(self, client: Any = None):
         self._client = client or get_client()
@@ -162,7 +163,7 @@ class JournalSaga:
     ) -> tuple[bool, bool]:
         if not trip:
             return False, False
-        if derive_saga_state_local(trip) != "REMEMBERING":
+        if saga_phase(trip) != "REMEMBERING":
             return False, False
         prompted_today = _is_today((trip.get("journal") or {}).get("last_prompt_date"))
         substantive = intent in ("TRIP", "PLAN")
@@ -28,7 +28,7 @@ from google.genai import types
 from agentic_traveler.core.observability import traceable
 from agentic_traveler.orchestrator.client_factory import gemini_generate, get_client
 from agentic_traveler.orchestrator.sagas.base import SagaResult, SagaState, SideEffect
-from agentic_traveler.orchestrator.sagas.saga_state import derive_saga_state_local
+from agentic_traveler.orchestrator.sagas.saga_state import saga_phase
 
 logger = logging.getLogger(__name__)
 
@@ -155,6 +155,7 @@ class MoodCheckinSaga:
     """Listener saga: captures mood / nudges once a day during LIVING."""
 
     name = "MoodCheckinSaga"
+    trip_projection = "core"  # phase from the summary, then live_state
 
     def __init__(self, client: Any = None):
         self._client = client or get_client()
@@ -168,7 +169,7 @@ class MoodCheckinSaga:
     ) -> tuple[bool, bool]:
         if not trip:
             return False, False
-        if derive_saga_state_local(trip) != "LIVING":
+        if saga_phase(trip) != "LIVING":
             return False, False
         return True, False  # always a listener — never interrupts the reply
 
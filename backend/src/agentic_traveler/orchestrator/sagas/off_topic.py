@@ -26,6 +26,7 @@ class OffTopicSaga:
     """Redirects clearly non-travel turns back to travel."""
 
     name = "OffTopicSaga"
+    trip_projection = "summary"  # never reads the trip
 
     def __init__(self, client: Any = None):
         self._client = client
@@ -32,6 +32,7 @@ from agentic_traveler.orchestrator.sagas.base import (
 )
 from agentic_traveler.orchestrator.sagas.saga_state import derive_saga_state_local
 from agentic_traveler.orchestrator.sagas.slot_extractor import extract_trip_slots
+from agentic_traveler.orchestrator.sagas.slot_ui import SLOT_CHOICES
 from agentic_traveler.orchestrator.curiosity_injector import (
     frame_curiosity_prompt,
     get_injector,
@@ -43,9 +44,8 @@ from agentic_traveler.orchestrator.profile_utils import (
     build_profile_summary,
 )
 from agentic_traveler.orchestrator.sagas.advisor_turn import compose_advisor_turn
-from agentic_traveler.orchestrator.sagas.destination_brief import ensure_brief
+from agentic_traveler.orchestrator.sagas.brief_pipeline import schedule_brief
 from agentic_traveler.orchestrator.trip_agent import TripAgent
-from agentic_traveler.tools.geocoder import geocode_destination
 
 logger = logging.getLogger(__name__)
 
@@ -63,35 +63,6 @@ _SLOT_QUESTIONS = {
     "budget_tier": "What's the budget vibe?",
 }
 
-# Categorical slots answered by selection (deterministic → no extraction cost).
-_SLOT_CHOICES: dict[str, list[ChoiceOption]] = {
-    "travelers": [
-        ChoiceOption("solo", "Just me", "solo"),
-        ChoiceOption("couple", "With my partner", "couple"),
-        ChoiceOption("friends", "With friends", "friends"),
-        ChoiceOption("family", "With family", "family"),
-        ChoiceOption("skip", "Skip for now", "skip"),
-    ],
-    "pace": [
-        ChoiceOption("slow", "Slow — room to breathe", "slow"),
-        ChoiceOption("medium", "Medium — a good rhythm", "medium"),
-        ChoiceOption("fast", "Fast — see a lot", "fast"),
-        ChoiceOption("skip", "Skip for now", "skip"),
-    ],
-    "structure": [
-        ChoiceOption("loose", "Loose, with a few anchors", "loose"),
-        ChoiceOption("full", "A fuller day-by-day plan", "full"),
-        ChoiceOption("skip", "Skip for now", "skip"),
-    ],
-    "budget_tier": [
-        ChoiceOption("$", "$ — shoestring", "$"),
-        ChoiceOption("$$", "$$ — comfortable", "$$"),
-        ChoiceOption("$$$", "$$$ — treat yourself", "$$$"),
-        ChoiceOption("$$$$", "$$$$ — no limits", "$$$$"),
-        ChoiceOption("skip", "Skip for now", "skip"),
-    ],
-}
-
 # Categorical slots whose chosen value writes straight into trip.preferences.
 _PREFERENCE_SLOTS = ("pace", "structure", "budget_tier")
 
@@ -103,7 +74,7 @@ _PREFERENCE_SLOTS = ("pace", "structure", "budget_tier")
 _CHOICE_VALUES = frozenset(
     str(option.value).lower()
     for slot in _PREFERENCE_SLOTS
-    for option in _SLOT_CHOICES[slot]
+    for option in SLOT_CHOICES[slot]
 )
 
 # Travelers is categorical too, but its chosen value writes into trip.travelers
@@ -130,67 +101,7 @@ _DIRECTION_SLOT = "trip_direction"
 
 def _legal_values(slot: str) -> frozenset[str]:
     """Lower-cased set of values a categorical slot legally accepts (incl. 'skip')."""
-    return frozenset(str(o.value).lower() for o in _SLOT_CHOICES.get(slot, []))
-
-
-def ui_block_from_wire(wire: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
-    """Shape a ``SlotRequest.to_wire()`` dict into the channel-facing
-    ``messages.metadata.ui`` block (Task 43), or ``None`` when there's nothing
-    tappable (free-text slot / no slot question).
-
-    The ``kind`` discriminator is a *rendering* decision made here, in the
-    channel-shaping layer, so the frozen ``SlotRequest`` dataclass (§5) needs no
-    new field:
-      * a known categorical slot (anything in ``_SLOT_CHOICES``) → ``multi_choice``:
-        tapping sends a structured ``selection`` and writes deterministically
-        (no LLM).
-      * anything else with choices (the direction confirmation) → ``quick_reply``:
-        tapping sends ``send`` back as a NORMAL message (router re-classifies it).
-    """
-    if not wire or not wire.get("choices"):
-        return None
-    slot = wire["slot"]
-    choices = wire["choices"]
-    is_choice_slot = slot in _SLOT_CHOICES
-    # Task 45: an advisory proposal carries a "confirm" option whose value is the
-    # proposed value — the structural discriminator for the `proposal` kind. The
-    # confirm tap sends a deterministic `selection {slot, [value]}` (validated
-    # server-side against the persisted pending proposal); other/skip send a
-    # plain message that re-engages the composer / skip path.
-    is_proposal = not is_choice_slot and any(c["id"] == "confirm" for c in choices)
-    if is_proposal:
-        return {
-            "kind": "proposal",
-            "slot": slot,
-            "prompt": wire["prompt"],
-            "allow_multi": False,
-            "options": [
-                {"id": c["id"], "label": c["label"],
-                 **({"value": c["value"]} if c["id"] == "confirm" else {"send": c["value"]})}
-                for c in choices
-            ],
-        }
-    block: dict[str, Any] = {
-        "kind": "multi_choice" if is_choice_slot else "quick_reply",
-        "slot": slot,
-        "prompt": wire["prompt"],
-        "allow_multi": bool(wire.get("allow_multi")),
-    }
-    if is_choice_slot:
-        # Deterministic slot: the client echoes the option id back as the value;
-        # the backend re-validates it. The raw value never needs to leave here.
-        block["options"] = [
-            {"id": c["id"], "label": c["label"]} for c in choices
-        ]
-    else:
-        # Quick reply: the client sends `send` as a normal chat message.
-        block["options"] = [
-            {"id": c["id"], "label": c["label"], "send": c["value"]}
-            for c in choices
-        ]
-    if block["allow_multi"]:
-        block["submit_label"] = "Confirm"
-    return block
+    return frozenset(str(o.value).lower() for o in SLOT_CHOICES.get(slot, []))
 
 
 def slot_values_to_side_effect(
@@ -274,8 +185,9 @@ def proposal_selection_to_side_effect(
 
 
 # ── Task 45 — advisory turns (insight-led slot filling) ──────────────────────
-# Only `timeframe` is advisory in the PlanningSaga: destination has a brief by
-# the time timeframe is open, so the composer can ground its insight.
+# Only `timeframe` is advisory in the PlanningSaga: destination usually has a
+# brief by the time timeframe is open, so the composer can ground its insight
+# (a brief still generating in the background is simply absent this turn).
 # Destination *discovery* (no destination yet) is the DiscoverySaga's job.
 _ADVISORY_SLOTS = ("timeframe",)
 _ADVISOR_SLOT_CAP = 350
@@ -305,16 +217,12 @@ def _advisor_state(trip: Optional[dict[str, Any]]) -> dict[str, Any]:
 
 
 def _discovery_patch(trip: Optional[dict[str, Any]], **changes: Any) -> SideEffect:
-    """A trip_patch carrying the trip's discovery dict with ``changes`` merged in
-    (the column is replaced wholesale on write, so we merge here). A ``None``
-    value deletes that key — used to clear ``advisor`` pending state."""
-    disc = dict((trip or {}).get("discovery") or {})
-    for key, val in changes.items():
-        if val is None:
-            disc.pop(key, None)
-        else:
-            disc[key] = val
-    return SideEffect(kind="trip_patch", payload={"id": (trip or {}).get("id"), "discovery": disc})
+    """A trip_patch carrying only the discovery keys in ``changes`` (merged into
+    the column by ``TripRepository.merge_discovery``). A ``None`` value deletes
+    that key — used to clear ``advisor`` pending state."""
+    return SideEffect(
+        kind="trip_patch", payload={"id": (trip or {}).get("id"), "discovery": dict(changes)}
+    )
 
 
 def _set_pending_proposal(
@@ -350,22 +258,19 @@ def _proposal_write(
         advisor.pop("pending_proposal", None)
         return _discovery_patch(trip, timeframe=tf, advisor=advisor or None)
     if slot == "destination":
-        coords = geocode_destination(str(value))
-        payload = {"trip_id": trip_id, "name": str(value), "status": "confirmed"}
-        if coords:
-            payload["coords"] = coords
+        # Coordinates are filled in after the turn (tools.geocode_queue).
         return SideEffect(
             kind="destination_upsert",
-            payload=payload,
+            payload={"trip_id": trip_id, "name": str(value), "status": "confirmed"},
         )
     return None
 
 
 def _coalesce_trip_patches(side_effects: list[SideEffect]) -> list[SideEffect]:
     """Merge all ``trip_patch`` side effects in a turn into ONE, deep-merging
-    JSONB section dicts. ``upsert_trip`` replaces each column wholesale, so two
-    discovery patches in a turn would otherwise clobber each other (e.g. a brief
-    capture + a timeframe write)."""
+    JSONB section dicts, so the turn lands as one write. ``upsert_trip``
+    replaces each column wholesale, so two patches to one section would
+    otherwise clobber each other; ``discovery`` is a key delta either way."""
     merged: dict[str, Any] = {}
     out: list[SideEffect] = []
     patch_index: Optional[int] = None
@@ -396,7 +301,10 @@ def _apply_side_effect_local(
     local = copy.deepcopy(trip)
     if se.kind == "trip_patch":
         for key, val in (se.payload or {}).items():
-            if key != "id":
+            if key == "discovery":
+                merged = {**(local.get("discovery") or {}), **val}
+                local["discovery"] = {k: v for k, v in merged.items() if v is not None}
+            elif key != "id":
                 local[key] = val
     elif se.kind == "destination_upsert":
         local.setdefault("destinations", []).append(
@@ -448,6 +356,7 @@ class PlanningSaga:
     """Owns the trip-planning conversation."""
 
     name = "PlanningSaga"
+    trip_projection = "full"
     # Task 55: Traveler-DNA questions the planning flow weaves in (one per turn,
     # appended to a useful reply, never blocking). These COMPLEMENT the trip slots
     # (pace/budget/structure/travelers) rather than duplicate them: the flow_state
@@ -474,7 +383,7 @@ class PlanningSaga:
         if intent == "CHAT" and trip is not None:
             # Intercept categorical-slot button taps the RouterAgent classifies
             # as CHAT (the payload is a bare choice value, e.g. "slow" or "$$",
-            # not a travel question). Vocab is derived from _SLOT_CHOICES.
+            # not a travel question). Vocab is derived from SLOT_CHOICES.
             msg = state.get("message_text", "").strip().lower()
             if msg in _CHOICE_VALUES:
                 return True, True
@@ -561,13 +470,15 @@ class PlanningSaga:
                 logger.warning("PlanningSaga slot extraction failed.", exc_info=True)
 
         # 2. Capture the destination brief once a destination exists (AC-2).
+        # Never blocks: a cold brief is generated in the background and
+        # attached to the trip when ready; this turn replies without it.
         try:
-            brief_se = ensure_brief(self._client, trip, user_doc, events)
+            brief_se = schedule_brief(self._client, trip, user_doc, events)
             if brief_se is not None:
                 side_effects.append(brief_se)
                 trip = _apply_side_effect_local(trip, brief_se)
         except Exception:
-            logger.warning("ensure_brief failed.", exc_info=True)
+            logger.warning("schedule_brief failed.", exc_info=True)
 
         result = self._decide(
             message, user_doc, trip, state, conversation_context, events,
@@ -740,7 +651,7 @@ class PlanningSaga:
         superseded: Optional[str] = None, user_doc: Optional[dict[str, Any]] = None,
     ) -> SagaResult:
         question = _SLOT_QUESTIONS[slot]
-        choices = _SLOT_CHOICES.get(slot)
+        choices = SLOT_CHOICES.get(slot)
         # Task 45 AC-9: a zero-LLM DNA-default prefix when the profile has signal
         # ("Your last trips ran slow — same again?"). The chip card shows the
         # plain question; the spoken text leads with the personalization.
@@ -858,7 +769,7 @@ class PlanningSaga:
             state, side_effects, events, t,
         )
         result.slot_request = SlotRequest(
-            slot=slot, prompt=_SLOT_QUESTIONS[slot], choices=_SLOT_CHOICES.get(slot),
+            slot=slot, prompt=_SLOT_QUESTIONS[slot], choices=SLOT_CHOICES.get(slot),
             allow_multi=slot in _MULTI_SELECT_SLOTS,
         )
         return result
@@ -944,9 +855,8 @@ class PlanningSaga:
         return SagaResult(
             text=text,
             side_effects=side_effects,
-            _raw_response=result.get("_raw_response"),
+            _artifacts=result.get("_artifacts"),
             _latency_ms=result.get("_latency_ms", 0.0),
-            _search_responses=result.get("_search_responses", []) or [],
         )
 
 
@@ -1023,28 +933,25 @@ def _slots_to_side_effects(
 
     effects: list[SideEffect] = []
 
-    # Destinations → child rows (status 'considering').
+    # Destinations → child rows (status 'considering'). Inserted without
+    # coords; the orchestrator geocodes them after the turn (geocode_queue),
+    # so the reply never waits on Nominatim's 1 req/s limit.
     existing_names = {
         (d.get("name") or "").strip().lower() for d in (trip.get("destinations") or [])
     }
     for name in extracted.get("destinations", []):
         if name.strip().lower() in existing_names:
             continue
-        coords = geocode_destination(name.strip())
-        payload = {"trip_id": trip_id, "name": name, "status": "considering"}
-        if coords:
-            payload["coords"] = coords
         effects.append(SideEffect(
             kind="destination_upsert",
-            payload=payload,
+            payload={"trip_id": trip_id, "name": name, "status": "considering"},
         ))
 
     # JSONB section merges, batched into a single trip_patch.
     patch: dict[str, Any] = {}
     if "timeframe" in extracted:
-        discovery = dict(trip.get("discovery") or {})
-        discovery["timeframe"] = {**(discovery.get("timeframe") or {}), **extracted["timeframe"]}
-        patch["discovery"] = discovery
+        timeframe = ((trip.get("discovery") or {}).get("timeframe") or {})
+        patch["discovery"] = {"timeframe": {**timeframe, **extracted["timeframe"]}}
     if "travelers" in extracted:
         patch["travelers"] = {**(trip.get("travelers") or {}), **extracted["travelers"]}
     prefs_update = {
@@ -5,6 +5,12 @@ Uses key-*presence* semantics (``"pace" in prefs``) to match the SQL
 ``preferences ? 'pace'`` operator exactly, not truthiness. The trip passed in
 is a plain dict (``Trip.model_dump()``), so child collections (destinations,
 bookings) are lists of dicts.
+
+``saga_phase`` reads the ``trips.saga_state`` cache instead, which triggers
+keep equal to ``derive_saga_state()`` on every write (see
+``refresh_trip_saga_state`` in schema_public.sql). Only the date-driven
+phases can go stale between writes, so they are re-checked from the
+timeframe; everything else comes from the row.
 """
 
 from __future__ import annotations
@@ -26,19 +32,10 @@ def derive_saga_state_local(
         return "DREAMING"
     today = today or date.today()
 
-    tf = (trip.get("discovery") or {}).get("timeframe") or {}
-    start = _to_date(tf.get("start_date"))
-    end = _to_date(tf.get("end_date"))
-
-    # LIVING: today within [start, end]
-    if start and end and start <= today <= end:
-        return "LIVING"
-    # REMEMBERING: ended within the last 30 days
-    if end and today > end and (today - end).days <= 30:
-        return "REMEMBERING"
-    # READY_TO_GO: departure within 7 days
-    if start and 0 <= (start - today).days <= 7:
-        return "READY_TO_GO"
+    start, end = _timeframe(trip)
+    dated = _date_phase(start, end, today)
+    if dated:
+        return dated
 
     dests = trip.get("destinations") or []
     confirmed = sum(1 for d in dests if d.get("status") == "confirmed")
@@ -64,6 +61,58 @@ def derive_saga_state_local(
     return "DREAMING"
 
 
+def saga_phase(trip: Optional[dict[str, Any]], today: Optional[date] = None) -> str:
+    """
+    The trip's phase from its maintained ``saga_state`` column, agreeing with
+    ``derive_saga_state_local`` without counting destinations and bookings.
+
+    ``trip`` is a hydrated trip dict or a ``TripSummary`` dict (which carries
+    ``timeframe`` at the top level). The date-driven phase is re-checked
+    against ``today`` (the nightly refresh may not have run yet); a dict with
+    no timeframe at all returns the column as is. A missing or unknown value
+    falls back to ``derive_saga_state_local``. Do not use it on a trip dict
+    changed in memory this turn — the column only reflects what was written.
+    """
+    if not trip:
+        return "DREAMING"
+    cached = trip.get("saga_state")
+    if cached not in STATES:
+        return derive_saga_state_local(trip, today)
+    if "discovery" not in trip and "timeframe" not in trip:
+        return cached
+    start, end = _timeframe(trip)
+    dated = _date_phase(start, end, today or date.today())
+    if dated:
+        return dated
+    if cached in _DATE_PHASES:  # a date boundary passed since the last refresh
+        return derive_saga_state_local(trip, today)
+    return cached
+
+
+_DATE_PHASES = frozenset({"READY_TO_GO", "LIVING", "REMEMBERING"})
+
+
+def _timeframe(trip: dict[str, Any]) -> tuple[Optional[date], Optional[date]]:
+    if "discovery" in trip:
+        tf = (trip.get("discovery") or {}).get("timeframe") or {}
+    else:
+        tf = trip.get("timeframe") or {}  # TripSummary
+    return _to_date(tf.get("start_date")), _to_date(tf.get("end_date"))
+
+
+def _date_phase(start: Optional[date], end: Optional[date], today: date) -> Optional[str]:
+    # LIVING: today within [start, end]
+    if start and end and start <= today <= end:
+        return "LIVING"
+    # REMEMBERING: ended within the last 30 days
+    if end and today > end and (today - end).days <= 30:
+        return "REMEMBERING"
+    # READY_TO_GO: departure within 7 days
+    if start and 0 <= (start - today).days <= 7:
+        return "READY_TO_GO"
+    return None
+
+
 def _to_date(value: Any) -> Optional[date]:
     if isinstance(value, date):
         return value
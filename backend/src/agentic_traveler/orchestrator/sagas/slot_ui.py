@@ -0,0 +1,102 @@
+"""Channel-facing shape of the planning saga's slot questions (Task 43).
+
+The categorical slot choices and ``ui_block_from_wire`` live here rather than
+in ``planning`` so the web and Telegram routers can shape a reply's
+``metadata.ui`` block without importing the saga (and, through it, the agents
+and google-genai) at start-up.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from agentic_traveler.orchestrator.sagas.base import ChoiceOption
+
+# Categorical slots answered by selection (deterministic → no extraction cost).
+SLOT_CHOICES: dict[str, list[ChoiceOption]] = {
+    "travelers": [
+        ChoiceOption("solo", "Just me", "solo"),
+        ChoiceOption("couple", "With my partner", "couple"),
+        ChoiceOption("friends", "With friends", "friends"),
+        ChoiceOption("family", "With family", "family"),
+        ChoiceOption("skip", "Skip for now", "skip"),
+    ],
+    "pace": [
+        ChoiceOption("slow", "Slow — room to breathe", "slow"),
+        ChoiceOption("medium", "Medium — a good rhythm", "medium"),
+        ChoiceOption("fast", "Fast — see a lot", "fast"),
+        ChoiceOption("skip", "Skip for now", "skip"),
+    ],
+    "structure": [
+        ChoiceOption("loose", "Loose, with a few anchors", "loose"),
+        ChoiceOption("full", "A fuller day-by-day plan", "full"),
+        ChoiceOption("skip", "Skip for now", "skip"),
+    ],
+    "budget_tier": [
+        ChoiceOption("$", "$ — shoestring", "$"),
+        ChoiceOption("$$", "$$ — comfortable", "$$"),
+        ChoiceOption("$$$", "$$$ — treat yourself", "$$$"),
+        ChoiceOption("$$$$", "$$$$ — no limits", "$$$$"),
+        ChoiceOption("skip", "Skip for now", "skip"),
+    ],
+}
+
+
+def ui_block_from_wire(wire: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
+    """Shape a ``SlotRequest.to_wire()`` dict into the channel-facing
+    ``messages.metadata.ui`` block (Task 43), or ``None`` when there's nothing
+    tappable (free-text slot / no slot question).
+
+    The ``kind`` discriminator is a *rendering* decision made here, in the
+    channel-shaping layer, so the frozen ``SlotRequest`` dataclass (§5) needs no
+    new field:
+      * a known categorical slot (anything in ``SLOT_CHOICES``) → ``multi_choice``:
+        tapping sends a structured ``selection`` and writes deterministically
+        (no LLM).
+      * anything else with choices (the direction confirmation) → ``quick_reply``:
+        tapping sends ``send`` back as a NORMAL message (router re-classifies it).
+    """
+    if not wire or not wire.get("choices"):
+        return None
+    slot = wire["slot"]
+    choices = wire["choices"]
+    is_choice_slot = slot in SLOT_CHOICES
+    # Task 45: an advisory proposal carries a "confirm" option whose value is the
+    # proposed value — the structural discriminator for the `proposal` kind. The
+    # confirm tap sends a deterministic `selection {slot, [value]}` (validated
+    # server-side against the persisted pending proposal); other/skip send a
+    # plain message that re-engages the composer / skip path.
+    is_proposal = not is_choice_slot and any(c["id"] == "confirm" for c in choices)
+    if is_proposal:
+        return {
+            "kind": "proposal",
+            "slot": slot,
+            "prompt": wire["prompt"],
+            "allow_multi": False,
+            "options": [
+                {"id": c["id"], "label": c["label"],
+                 **({"value": c["value"]} if c["id"] == "confirm" else {"send": c["value"]})}
+                for c in choices
+            ],
+        }
+    block: dict[str, Any] = {
+        "kind": "multi_choice" if is_choice_slot else "quick_reply",
+        "slot": slot,
+        "prompt": wire["prompt"],
+        "allow_multi": bool(wire.get("allow_multi")),
+    }
+    if is_choice_slot:
+        # Deterministic slot: the client echoes the option id back as the value;
+        # the backend re-validates it. The raw value never needs to leave here.
+        block["options"] = [
+            {"id": c["id"], "label": c["label"]} for c in choices
+        ]
+    else:
+        # Quick reply: the client sends `send` as a normal chat message.
+        block["options"] = [
+            {"id": c["id"], "label": c["label"], "send": c["value"]}
+            for c in choices
+        ]
+    if block["allow_multi"]:
+        block["submit_label"] = "Confirm"
+    return block
@@ -0,0 +1,86 @@
+"""Tiered, deferred trip hydration for one turn.
+
+A turn's trip is needed at one of three projections, cheapest first:
+
+- ``summary`` — the ``TripSummary`` index row (id, title, status, saga_state,
+  timeframe, lightweight destinations). Served from the per-user summary
+  index, usually with no query at all.
+- ``core`` — the summary plus the parent ``trips`` row (every JSONB section,
+  e.g. ``live_state``, ``journal``). One query.
+- ``full`` — ``Trip.model_dump()``: the parent row plus all child tables.
+  Five more queries on top of ``core``.
+
+Each saga declares the projection its ``should_activate`` and ``run`` read as
+a class-level ``trip_projection`` (read via ``trip_projection_of``; sagas
+without one get ``full``). ``TripAccess.at`` upgrades monotonically and
+memoizes, so a turn never fetches the same tier twice.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+PROJECTIONS = ("summary", "core", "full")
+
+
+def trip_projection_of(saga: Any) -> str:
+    """The saga's declared projection; ``full`` when it declares none."""
+    projection = getattr(saga, "trip_projection", "full")
+    return projection if projection in PROJECTIONS else "full"
+
+
+def widest(projections: Iterable[str]) -> str:
+    """The most complete of ``projections`` (``summary`` for none)."""
+    return max(projections, key=PROJECTIONS.index, default="summary")
+
+
+class TripAccess:
+    """The turn's trip at its current projection, upgraded on demand.
+
+    ``trip`` is None when the turn has no trip (or it vanished between the
+    index read and hydration — the user's index is dropped then).
+    """
+
+    def __init__(
+        self,
+        repo: Any,
+        trip: Optional[dict[str, Any]],
+        projection: str = "summary",
+        user_id: Optional[str] = None,
+    ):
+        self._repo = repo
+        self._user_id = user_id
+        self._row: Optional[dict[str, Any]] = None  # the parent row, once fetched
+        self.trip = trip
+        self.projection = projection if trip is not None else "full"
+
+    def covers(self, projection: str) -> bool:
+        return PROJECTIONS.index(self.projection) >= PROJECTIONS.index(projection)
+
+    def at(self, projection: str) -> Optional[dict[str, Any]]:
+        """The trip at ``projection`` or richer, fetching what is missing."""
+        if self.trip is None or self.covers(projection):
+            return self.trip
+        trip_id = self.trip["id"]
+        try:
+            if projection == "core":
+                self._row = self._repo.get_trip_core(trip_id)
+                loaded = {**self.trip, **self._row} if self._row else None
+            else:
+                model = (
+                    self._repo.get_trip(trip_id, row=self._row) if self._row
+                    else self._repo.get_trip(trip_id)
+                )
+                loaded = model.model_dump() if model else None
+        except Exception:
+            logger.exception("Failed to hydrate trip %s to %s", trip_id, projection)
+            loaded = None
+        if loaded is None:
+            from agentic_traveler.tools.trip_repo import invalidate_trip_index
+
+            invalidate_trip_index(self._user_id)
+        self.trip, self.projection = loaded, projection if loaded is not None else "full"
+        return self.trip
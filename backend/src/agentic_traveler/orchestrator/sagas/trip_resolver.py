@@ -1,6 +1,7 @@
 """``resolve_active_trip`` — pick which trip a turn is about, from lightweight
 trip *summaries* (task 36 §4.1 #1). The orchestrator then hydrates only the
-chosen trip via ``TripRepository.get_trip()`` — never loads every trip in full.
+chosen trip, and only as far as the selected sagas need (``trip_access``) —
+never loads every trip in full.
 
 Priority (proposal §5.5):
   1. the user explicitly names a trip (its title text appears in the message)
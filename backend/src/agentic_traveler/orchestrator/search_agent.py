@@ -5,8 +5,12 @@ Isolates all grounded calls so the $0.035/prompt grounding fee is only
 incurred when an agent explicitly needs real-time data, not on every call.
 """
 
+import contextvars
 import logging
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Any
 
 from google import genai
@@ -14,12 +18,46 @@ from google.genai import types
 
 from agentic_traveler.orchestrator.client_factory import get_client, gemini_generate
 from agentic_traveler.orchestrator.tool_events import emit_tool_status
+from agentic_traveler.orchestrator.turn_artifacts import call_artifacts
 from agentic_traveler.core.observability import traceable
+from agentic_traveler.tools import search_cache
 
 logger = logging.getLogger(__name__)
 
 _MODEL = "gemini-3.1-flash-lite"
 
+_FALLBACK = "I couldn't retrieve search results right now. Please try again."
+
+# Fan-out trades one grounding fee per query for latency and per-query
+# cacheability; off by default so a cold multi-query search stays one prompt.
+_FANOUT = os.getenv("SEARCH_FANOUT", "").lower() in ("1", "true", "yes")
+FANOUT_CONCURRENCY = int(os.getenv("SEARCH_FANOUT_CONCURRENCY", "4"))
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _fanout_pool() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=FANOUT_CONCURRENCY, thread_name_prefix="search-fanout"
+            )
+        return _pool
+
+
+def _dedupe(queries: list[str]) -> list[str]:
+    """Drop blank queries and repeats of the same normalized query, keeping order."""
+    seen: set[str] = set()
+    out: list[str] = []
+    for q in queries:
+        norm = search_cache.normalize(q)
+        if norm and norm not in seen:
+            seen.add(norm)
+            out.append(q)
+    return out
+
 _SYSTEM_PROMPT = """\
 You are a factual search assistant. Given a list of queries and a desired output
 format, search the web and return results matching that format.
@@ -41,8 +79,9 @@ class SearchAgent:
     when an agent explicitly calls search().
     """
 
-    def __init__(self, client: Optional[genai.Client] = None):
+    def __init__(self, client: Optional[genai.Client] = None, fanout: Optional[bool] = None):
         self._client = client or get_client()
+        self._fanout = _FANOUT if fanout is None else fanout
 
     def search(self, queries: list[str] | str, format: str = "structured", model: str = _MODEL) -> str:
         """
@@ -71,52 +110,129 @@ class SearchAgent:
 
     @traceable(name="search_agent.search_web")
     def search_with_metadata(self, queries: list[str] | str, format: str = "structured", model: str = _MODEL) -> tuple[str, Any, float]:
-        """Internal method that returns the text, raw response, and latency."""
+        """
+        Internal method that returns the text, raw response, and latency.
+
+        Queries already answered (by anyone) within their freshness window are
+        served from search_cache without a grounded call. The rest go out as
+        one batched prompt, or — with fan-out enabled — as one prompt per
+        query, SEARCH_FANOUT_CONCURRENCY at a time. Answers are merged back in
+        input order. The raw response is the last live one (None when every
+        query was a cache hit, so nothing is billed).
+        """
         if isinstance(queries, str):
             queries = [queries]
-            
-        queries_text = "\n".join(f"- {q}" for q in queries)
+        queries = _dedupe(queries)
+        if not queries:
+            return "No results found.", None, 0.0
+
         logger.info("🔍 SearchAgent.search(queries=%d, format=%s)", len(queries), format)
         t = time.time()
-        try:
-            response = gemini_generate(
-                self._client,
-                model=model,
-                contents=f"Format: {format}\n\nQueries:\n{queries_text}",
-                config=types.GenerateContentConfig(
-                    system_instruction=_SYSTEM_PROMPT,
-                    max_output_tokens=3000,
-                    tools=[types.Tool(google_search=types.GoogleSearch())],
-                    safety_settings=[
-                        types.SafetySetting(
-                            category=c,
-                            threshold=types.HarmBlockThreshold.BLOCK_ONLY_HIGH,
-                        ) for c in [
-                            types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
-                            types.HarmCategory.HARM_CATEGORY_HARASSMENT,
-                            types.HarmCategory.HARM_CATEGORY_HATE_SPEECH,
-                            types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
-                        ]
-                    ],
-                ),
-            )
-            lat = (time.time() - t) * 1000
+        if self._fanout and len(queries) > 1:
+            answers, raw = self._search_fanout(queries, format, model)
+        else:
+            answers, raw = self._search_batched(queries, format, model)
+        lat = (time.time() - t) * 1000 if raw is not None else 0.0
+        if raw is not None:
             logger.info("⏱ SearchAgent: %.0fms", lat)
-            return response.text or "No results found.", response, lat
+
+        if len(answers) == 1:
+            return answers[0][1], raw, lat
+        merged = "\n\n".join(f"**{label}**\n{text}" for label, text in answers)
+        return merged, raw, lat
+
+    def _search_batched(self, queries: list[str], format: str, model: str) -> tuple[list[tuple[str, str]], Any]:
+        """Cached answers per query, plus ONE grounded call for the remainder."""
+        hits: dict[int, str] = {}
+        for i, q in enumerate(queries):
+            cached = search_cache.cache.get(search_cache.cache_key(q, format, model))
+            if cached is not None:
+                hits[i] = cached.text
+        pending = [q for i, q in enumerate(queries) if i not in hits]
+        if not pending:
+            return [(q, hits[i]) for i, q in enumerate(queries)], None
+
+        response = None
+        try:
+            response = self._grounded_call(pending, format, model)
+            text = response.text or "No results found."
+            if len(pending) == 1:
+                search_cache.cache.put(
+                    search_cache.cache_key(pending[0], format, model),
+                    search_cache.make_result(pending[0], text, response),
+                )
         except Exception:
             logger.exception("SearchAgent.search failed.")
-            return "I couldn't retrieve search results right now. Please try again.", None, 0.0
+            text = _FALLBACK
+
+        answers: list[tuple[str, str]] = []
+        for i, q in enumerate(queries):
+            if i in hits:
+                answers.append((q, hits[i]))
+            elif q == pending[0]:
+                answers.append(("; ".join(pending), text))
+        return answers, response
+
+    def _search_fanout(self, queries: list[str], format: str, model: str) -> tuple[list[tuple[str, str]], Any]:
+        """One cached-or-grounded lookup per query, run concurrently."""
+        live: list[Any] = []
+
+        def one(query: str) -> str:
+            def load():
+                response = self._grounded_call([query], format, model)
+                live.append(response)
+                return search_cache.make_result(query, response.text or "No results found.", response)
+            try:
+                return search_cache.cache.get_or_load(
+                    search_cache.cache_key(query, format, model), load
+                ).text
+            except Exception:
+                logger.exception("SearchAgent.search failed for %r.", query)
+                return _FALLBACK
+
+        # copy_context per task so usage capture and tool events reach this turn.
+        futures = [
+            _fanout_pool().submit(contextvars.copy_context().run, one, q) for q in queries
+        ]
+        answers = [(q, f.result()) for q, f in zip(queries, futures)]
+        return answers, (live[-1] if live else None)
+
+    def _grounded_call(self, queries: list[str], format: str, model: str) -> Any:
+        search_cache.record_grounded_call()
+        queries_text = "\n".join(f"- {q}" for q in queries)
+        return gemini_generate(
+            self._client,
+            model=model,
+            contents=f"Format: {format}\n\nQueries:\n{queries_text}",
+            config=types.GenerateContentConfig(
+                system_instruction=_SYSTEM_PROMPT,
+                max_output_tokens=3000,
+                tools=[types.Tool(google_search=types.GoogleSearch())],
+                safety_settings=[
+                    types.SafetySetting(
+                        category=c,
+                        threshold=types.HarmBlockThreshold.BLOCK_ONLY_HIGH,
+                    ) for c in [
+                        types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
+                        types.HarmCategory.HARM_CATEGORY_HARASSMENT,
+                        types.HarmCategory.HARM_CATEGORY_HATE_SPEECH,
+                        types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
+                    ]
+                ],
+            ),
+        )
 
     def create_tool(self, context_list: list):
         """
         Creates a tool function for the LLM that wraps search_with_metadata
-        and appends its usage data to context_list.
+        and appends each grounded call's ``CallArtifacts`` to context_list
+        (the raw response is dropped there and then).
         """
         def search_web(queries: list[str], format: str = "structured") -> str:
             emit_tool_status("search_web")
             text, raw, lat = self.search_with_metadata(queries, format)
             if raw:
-                context_list.append({"raw": raw, "lat": lat})
+                context_list.append(call_artifacts(raw, lat))
             return text
             
         search_web.__doc__ = self.search.__doc__
@@ -0,0 +1,85 @@
+"""
+Compact, immutable record of what a turn's model calls produced.
+
+A google-genai response carries every candidate, the grounding metadata and
+the automatic function-calling history. A result dict that holds one pins all
+of that until the turn has been saved, judged and billed, and with 50 turns in
+flight that adds up. Agents (and the ``search_web`` tool) reduce each response
+to a ``CallArtifacts`` right after the call and drop it. Usage, finish reason,
+grounding and citations are all the rest of the turn reads. Billing itself
+reads usage from the ``client_factory`` funnel, not from these records.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass(frozen=True)
+class Citation:
+    title: str
+    uri: str
+
+
+@dataclass(frozen=True)
+class CallArtifacts:
+    """One model call, reduced to what outlives it."""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    thinking_tokens: int = 0
+    finish_reason: Optional[str] = None
+    grounded: bool = False
+    citations: tuple[Citation, ...] = ()
+    latency_ms: float = 0.0
+
+
+@dataclass(frozen=True)
+class TurnArtifacts:
+    """The reply call plus the grounded searches its tools made."""
+
+    response: Optional[CallArtifacts] = None
+    searches: tuple[CallArtifacts, ...] = ()
+
+    @property
+    def grounded(self) -> bool:
+        return any(c.grounded for c in self._calls())
+
+    @property
+    def citations(self) -> tuple[Citation, ...]:
+        """Every cited source, first occurrence wins."""
+        seen: dict[str, Citation] = {}
+        for call in self._calls():
+            for citation in call.citations:
+                seen.setdefault(citation.uri, citation)
+        return tuple(seen.values())
+
+    def _calls(self) -> list[CallArtifacts]:
+        return ([self.response] if self.response else []) + list(self.searches)
+
+
+def call_artifacts(response: Any, latency_ms: float = 0.0) -> Optional[CallArtifacts]:
+    """Extract a response's artifacts (None for no response). Never raises."""
+    if response is None:
+        return None
+    # Lazy imports: utils pulls in the weather tool, which sagas.base (and so
+    # the routers) must not import at start-up.
+    from agentic_traveler.orchestrator.utils import has_grounding
+    from agentic_traveler.tools.search_cache import sources_from
+
+    try:
+        usage = getattr(response, "usage_metadata", None)
+        candidates = getattr(response, "candidates", None) or []
+        finish = getattr(candidates[0], "finish_reason", None) if candidates else None
+        return CallArtifacts(
+            input_tokens=int(getattr(usage, "prompt_token_count", 0) or 0),
+            output_tokens=int(getattr(usage, "candidates_token_count", 0) or 0),
+            thinking_tokens=int(getattr(usage, "thoughts_token_count", 0) or 0),
+            finish_reason=getattr(finish, "name", None) or (str(finish) if finish is not None else None),
+            grounded=has_grounding(response),
+            citations=tuple(Citation(s["title"], s["uri"]) for s in sources_from(response)),
+            latency_ms=float(latency_ms),
+        )
+    except Exception:
+        return CallArtifacts(latency_ms=float(latency_ms))
@@ -0,0 +1,130 @@
+"""
+Cross-user cache for the non-personalized core of destination briefs.
+
+The core of a brief (seasonal windows, character, signature experiences,
+candidate fit hooks) depends only on the destination and the travel month,
+so it is generated once per ``(destination, month)`` and shared by every
+traveler planning that trip. Two tiers:
+
+- in-process TTLCache (single-flight, so concurrent planning turns for the
+  same destination wait on one model call);
+- ``destination_briefs`` table, shared by every backend instance and
+  pre-filled by ``scripts/warm_brief_cache.py``.
+
+Rows older than TTL_S are treated as missing and regenerated. Storage
+failures never fail a turn — the loader result is still returned.
+"""
+
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from agentic_traveler.tools.search_cache import normalize
+from agentic_traveler.tools.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+MAX_ENTRIES = int(os.getenv("BRIEF_CACHE_SIZE", "500"))
+TTL_S = float(os.getenv("BRIEF_CACHE_TTL_S", str(30 * 86400)))
+
+_TABLE = "destination_briefs"
+
+Brief = Dict[str, Any]
+
+cache: "TTLCache[Brief]" = TTLCache(MAX_ENTRIES, TTL_S)
+
+
+def destination_key(destination: str) -> str:
+    return normalize(destination)
+
+
+def _read(dest_key: str, month: str) -> Optional[Brief]:
+    from agentic_traveler.tools.db_client import get_db
+
+    try:
+        res = (
+            get_db()
+            .table(_TABLE)
+            .select("brief, captured_at")
+            .eq("destination_key", dest_key)
+            .eq("month", month)
+            .maybe_single()
+            .execute()
+        )
+    except Exception:
+        logger.warning("brief_cache: read failed for %s/%s.", dest_key, month, exc_info=True)
+        return None
+    row = res.data if res is not None else None
+    if not isinstance(row, dict) or not isinstance(row.get("brief"), dict):
+        return None
+    try:
+        captured = datetime.fromisoformat(str(row.get("captured_at")).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if datetime.now(timezone.utc) - captured > timedelta(seconds=TTL_S):
+        return None
+    return row["brief"]
+
+
+def _write(dest_key: str, month: str, destination: str, brief: Brief) -> None:
+    from agentic_traveler.tools.db_client import get_db
+
+    try:
+        get_db().table(_TABLE).upsert({
+            "destination_key": dest_key,
+            "month": month,
+            "destination": destination,
+            "brief": brief,
+            "model_version": brief.get("model_version"),
+            "captured_at": brief.get("captured_at") or datetime.now(timezone.utc).isoformat(),
+        }, on_conflict="destination_key,month").execute()
+    except Exception:
+        logger.warning("brief_cache: write failed for %s/%s.", dest_key, month, exc_info=True)
+
+
+def get_or_load(
+    destination: str, month: str, loader: Callable[[], Optional[Brief]]
+) -> Tuple[Optional[Brief], str]:
+    """
+    Return ``(core_brief, source)`` for ``destination`` in ``month``.
+
+    ``source`` is ``"memory"``, ``"store"`` or ``"model"`` (``loader`` ran).
+    A ``None`` brief (loader failed) is not cached.
+    """
+    key = (destination_key(destination), month)
+    source = ["memory"]
+
+    def load() -> Optional[Brief]:
+        stored = _read(*key)
+        if stored is not None:
+            source[0] = "store"
+            return stored
+        source[0] = "model"
+        brief = loader()
+        if brief is not None:
+            _write(key[0], month, destination, brief)
+        return brief
+
+    return cache.get_or_load(key, load), source[0]
+
+
+def put(destination: str, month: str, brief: Brief) -> None:
+    """Write-through store (warm-up script)."""
+    key = (destination_key(destination), month)
+    _write(key[0], month, destination, brief)
+    cache.put(key, brief)
+
+
+def stored(destination: str, month: str) -> bool:
+    """True when a fresh core brief is already in the shared table."""
+    return _read(destination_key(destination), month) is not None
+
+
+def clear() -> None:
+    """Empty the in-process tier (tests)."""
+    cache.clear()
+
+
+def stats() -> Dict[str, Any]:
+    return cache.stats()
@@ -0,0 +1,97 @@
+"""
+Deferred geocoding for trip destinations.
+
+Nominatim allows one request per second (``geocoder`` enforces 1.1s between
+calls under a process-wide lock), so geocoding inside a turn made a
+five-city reply wait ~5.5s for coordinates the reply text never uses.
+Destinations are now inserted without ``coords``. The orchestrator then
+``enqueue``s the new rows, and a single background worker:
+
+- drains every pending row, grouped per trip, so destinations confirmed
+  across overlapping turns share one pass;
+- geocodes each distinct name once through ``geocode_destination``, which
+  keeps the rate limit;
+- writes each trip's results back in ONE batched ``trip_destinations``
+  update (``TripRepository.set_destination_coords``). The
+  ``touch_trip_updated_at`` trigger bumps the trip, so the TripPanel's
+  Realtime subscription refetches.
+
+Rows whose name cannot be geocoded keep empty coords.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+from agentic_traveler.tools.geocoder import geocode_destination
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+# trip_id → {destination row id: name}, in arrival order.
+_pending: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
+_worker: "threading.Thread | None" = None
+_idle = threading.Event()
+_idle.set()
+
+
+def enqueue(trip_id: str, rows: List[Tuple[str, str]]) -> None:
+    """Queue ``(destination_id, name)`` rows of ``trip_id`` for geocoding. Never blocks."""
+    global _worker
+    rows = [(dest_id, name) for dest_id, name in rows if dest_id and (name or "").strip()]
+    if not trip_id or not rows:
+        return
+    with _lock:
+        _pending.setdefault(trip_id, {}).update(rows)
+        _idle.clear()
+        if _worker is None:
+            _worker = threading.Thread(target=_drain, daemon=True, name="geocode-queue")
+            _worker.start()
+
+
+def _drain() -> None:
+    global _worker
+    while True:
+        with _lock:
+            if not _pending:
+                _worker = None
+                _idle.set()
+                return
+            batch = list(_pending.items())
+            _pending.clear()
+        try:
+            _geocode_batch(batch)
+        except Exception:
+            logger.exception("Deferred geocoding batch failed")
+
+
+def _geocode_batch(batch: List[Tuple[str, Dict[str, str]]]) -> None:
+    from agentic_traveler.tools.trip_repo import TripRepository
+
+    by_name: Dict[str, "dict | None"] = {}
+    for _trip_id, rows in batch:
+        for name in rows.values():
+            key = name.strip().lower()
+            if key not in by_name:
+                by_name[key] = geocode_destination(name.strip())
+
+    repo = TripRepository()
+    for trip_id, rows in batch:
+        coords = {
+            dest_id: by_name[name.strip().lower()]
+            for dest_id, name in rows.items()
+            if by_name.get(name.strip().lower())
+        }
+        if not coords:
+            continue
+        try:
+            updated = repo.set_destination_coords(trip_id, coords)
+            logger.info("Geocoded %d/%d destination(s) for trip_id=%s", updated, len(rows), trip_id)
+        except Exception:
+            logger.exception("Writing destination coords failed for trip_id=%s", trip_id)
+
+
+def wait_idle(timeout: float = 30.0) -> bool:
+    """Block until the queue is drained (tests, shutdown). True when idle."""
+    return _idle.wait(timeout)
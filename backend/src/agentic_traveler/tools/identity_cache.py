@@ -0,0 +1,118 @@
+"""
+Telegram-ID → user-UUID resolution with an in-process LRU.
+
+A Telegram chat ID maps to exactly one ``users.id`` once the account is
+linked, and the mapping only changes in the account-link flow
+(UserRepository.link_telegram_user / link_telegram_to_web_user), which calls
+``invalidate`` after writing ``users.telegram_id``. Every other caller —
+telegram.py's webhook guard, usage_tracker, admin top-ups — resolves
+through ``resolve_user_uuid`` and pays for the narrow ``select("id")``
+lookup at most once per process instead of the full five-table user join.
+
+Misses are not cached: an unlinked chat can link at any moment (from the web
+app or a Tally submission), and we must not keep answering "unknown" for it.
+
+The mapping also disappears when the account is deleted from the web app,
+which this process never hears about. Entries therefore expire after
+IDENTITY_CACHE_TTL_S, and ``UserRepository.get_user_with_ref`` invalidates
+the chat's entry as soon as the full user fetch comes back empty.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from agentic_traveler.tools.db_client import get_db
+
+logger = logging.getLogger(__name__)
+
+MAX_ENTRIES = int(os.getenv("IDENTITY_CACHE_SIZE", "10000"))
+TTL_S = float(os.getenv("IDENTITY_CACHE_TTL_S", "600"))
+
+_lock = threading.Lock()
+# telegram_id → (user_id, expires_at)
+_cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+_hits = 0
+_misses = 0
+
+
+def resolve_user_uuid(telegram_id: str) -> Optional[str]:
+    """
+    Return the user UUID linked to ``telegram_id``, or None when no user is
+    linked (or the lookup failed).
+    """
+    global _hits, _misses
+    if not telegram_id:
+        return None
+    key = str(telegram_id)
+
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            _cache.move_to_end(key)
+            _hits += 1
+            return entry[0]
+        if entry is not None:
+            del _cache[key]
+        _misses += 1
+
+    try:
+        resp = (
+            get_db()
+            .table("users")
+            .select("id")
+            .eq("telegram_id", key)
+            .maybe_single()
+            .execute()
+        )
+    except Exception:
+        logger.warning("identity_cache: lookup failed for telegram_id=%s", key, exc_info=True)
+        return None
+
+    uid = resp.data.get("id") if resp and resp.data else None
+    if uid:
+        remember(key, uid)
+    return uid
+
+
+def remember(telegram_id: str, user_id: str) -> None:
+    """Record a mapping already known to the caller (e.g. from a full user fetch)."""
+    if not telegram_id or not user_id:
+        return
+    with _lock:
+        _cache[str(telegram_id)] = (str(user_id), time.monotonic() + TTL_S)
+        _cache.move_to_end(str(telegram_id))
+        while len(_cache) > MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+
+def invalidate(telegram_id: Optional[str] = None, user_id: Optional[str] = None) -> None:
+    """
+    Drop cached mappings for ``telegram_id`` and/or any entry pointing at
+    ``user_id``. Called by the account-link flow after ``users.telegram_id``
+    changes, and when a user fetch finds no row for the chat.
+    """
+    with _lock:
+        if telegram_id:
+            _cache.pop(str(telegram_id), None)
+        if user_id:
+            for key in [k for k, (v, _exp) in _cache.items() if v == str(user_id)]:
+                del _cache[key]
+
+
+def clear() -> None:
+    """Empty the cache and reset its counters (tests)."""
+    global _hits, _misses
+    with _lock:
+        _cache.clear()
+        _hits = 0
+        _misses = 0
+
+
+def stats() -> Dict[str, int]:
+    """Current size and hit/miss counters."""
+    with _lock:
+        return {"size": len(_cache), "hits": _hits, "misses": _misses}
@@ -0,0 +1,307 @@
+"""
+Per-user serialized updates to ``user_profiles``.
+
+Profile writers (ProfileAgent.save_preference, synthesize_from_answers,
+UserRepository.merge_answered_question) used to read the row, change it in
+memory and upsert the whole thing back, so two writers for one user — two
+quick messages, or a Tally submission overlapping a chat turn — silently
+lost one update. They now describe their change as JSON-patch operations and
+``enqueue`` it here:
+
+- Patches for one user are applied in enqueue order by a single worker
+  thread per user; the worker exits once that user's queue is empty.
+- The worker reads ``profile_data, summary, version``, applies every pending
+  patch to that snapshot and writes with ``WHERE version = <read version>``.
+  The ``bump_user_profile_version`` trigger increments ``version`` on every
+  UPDATE, so any interleaved write (another process, the web app) makes the
+  conditional update match nothing; the worker then re-reads and re-applies
+  the same operations (MAX_ATTEMPTS).
+
+Operations follow RFC 6902 for ``add`` / ``replace`` / ``remove`` / ``test``
+over the document ``{"profile_data": {...}, "summary": "..."}``, with one
+relaxation: ``add`` creates missing intermediate objects, so
+``/profile_data/answered_questions/<qid>`` works on a fresh profile.
+"""
+
+import copy
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 5
+_BACKOFF_S = 0.05
+
+# Top-level members of the patched document ↔ user_profiles columns.
+_COLUMNS = ("profile_data", "summary")
+
+Op = Dict[str, Any]
+Guard = Callable[[Dict[str, Any]], bool]
+
+
+class PatchError(ValueError):
+    """An operation could not be applied (bad path, failed ``test``)."""
+
+
+class ProfileWriteConflict(RuntimeError):
+    """The versioned write kept losing to concurrent writers."""
+
+
+# ── JSON patch ───────────────────────────────────────────────────────────────
+
+def _parse_pointer(path: str) -> List[str]:
+    if not path.startswith("/"):
+        raise PatchError(f"invalid JSON pointer: {path!r}")
+    return [p.replace("~1", "/").replace("~0", "~") for p in path[1:].split("/")]
+
+
+def _resolve_parent(doc: Any, parts: List[str], create: bool) -> Any:
+    node = doc
+    for part in parts[:-1]:
+        if isinstance(node, list):
+            try:
+                node = node[int(part)]
+            except (ValueError, IndexError):
+                raise PatchError(f"no list index {part!r}") from None
+        elif isinstance(node, dict):
+            if part not in node:
+                if not create:
+                    raise PatchError(f"missing member {part!r}")
+                node[part] = {}
+            node = node[part]
+        else:
+            raise PatchError(f"cannot descend into {type(node).__name__} at {part!r}")
+    return node
+
+
+def apply_patch(doc: Dict[str, Any], ops: List[Op]) -> Dict[str, Any]:
+    """Return a copy of ``doc`` with ``ops`` applied; the input is untouched."""
+    out = copy.deepcopy(doc)
+    for op in ops:
+        kind = op.get("op")
+        parts = _parse_pointer(op.get("path", ""))
+        parent = _resolve_parent(out, parts, create=(kind == "add"))
+        key = parts[-1]
+        if kind in ("add", "replace"):
+            value = copy.deepcopy(op.get("value"))
+            if isinstance(parent, list):
+                if key == "-":
+                    parent.append(value)
+                    continue
+                try:
+                    idx = int(key)
+                except ValueError:
+                    raise PatchError(f"bad list index {key!r}") from None
+                if kind == "add":
+                    parent.insert(idx, value)
+                else:
+                    parent[idx] = value
+            else:
+                if kind == "replace" and key not in parent:
+                    raise PatchError(f"replace of missing member {op['path']!r}")
+                parent[key] = value
+        elif kind == "remove":
+            try:
+                del parent[int(key) if isinstance(parent, list) else key]
+            except (KeyError, IndexError, ValueError):
+                raise PatchError(f"remove of missing member {op['path']!r}") from None
+        elif kind == "test":
+            try:
+                current = parent[int(key) if isinstance(parent, list) else key]
+            except (KeyError, IndexError, ValueError):
+                raise PatchError(f"test of missing member {op['path']!r}") from None
+            if current != op.get("value"):
+                raise PatchError(f"test failed at {op['path']!r}")
+        else:
+            raise PatchError(f"unsupported op {kind!r}")
+    return out
+
+
+def escape_token(key: str) -> str:
+    """Escape one JSON-pointer reference token (``~`` → ``~0``, ``/`` → ``~1``)."""
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def profile_ops(
+    changes: Dict[str, Any], base: Optional[Dict[str, Any]] = None
+) -> List[Op]:
+    """
+    ``add`` operations for every key of ``changes`` whose value differs from
+    ``base`` (a profile_data snapshot, ``summary`` included as a key). The
+    ``summary`` key targets the ``summary`` column; every other key targets
+    ``/profile_data/<key>``. Keys equal to the snapshot produce no operation,
+    so a concurrent change to them is not overwritten with a stale copy.
+    """
+    base = base or {}
+    ops: List[Op] = []
+    for key, value in changes.items():
+        if key in base and base[key] == value:
+            continue
+        path = "/summary" if key == "summary" else f"/profile_data/{escape_token(key)}"
+        ops.append({"op": "add", "path": path, "value": value})
+    return ops
+
+
+_MISSING = object()
+
+
+def unchanged_since(base: Dict[str, Any], keys: List[str]) -> Guard:
+    """
+    Guard that skips a patch when any of ``keys`` no longer has its ``base``
+    value (same key convention as ``profile_ops``; a key absent from ``base``
+    must still be absent). Writers that derived the patch from a snapshot
+    read outside the worker use it to detect a stale merge and recompute.
+    RFC 6902 ``test`` cannot assert that a member is absent, hence a guard.
+    """
+    def guard(doc: Dict[str, Any]) -> bool:
+        for key in keys:
+            current = doc.get("summary", "") if key == "summary" else doc["profile_data"].get(key, _MISSING)
+            if current != base.get(key, _MISSING):
+                return False
+        return True
+
+    return guard
+
+
+# ── per-user queue ───────────────────────────────────────────────────────────
+
+_lock = threading.Lock()
+_queues: Dict[str, Deque[Tuple[List[Op], Optional[Guard], Future]]] = {}
+
+
+def enqueue(user_id: str, ops: List[Op], *, guard: Optional[Guard] = None) -> Future:
+    """
+    Queue ``ops`` for ``user_id``'s profile.
+
+    ``guard``, when given, is called with the current document right before
+    the patch is applied; returning False skips the patch.
+
+    Returns:
+        A Future resolving to True (applied) or False (skipped by the guard),
+        or raising PatchError / ProfileWriteConflict.
+    """
+    fut: Future = Future()
+    if not ops:
+        fut.set_result(False)
+        return fut
+    with _lock:
+        queue = _queues.get(user_id)
+        start_worker = queue is None
+        if start_worker:
+            queue = _queues[user_id] = deque()
+        queue.append((ops, guard, fut))
+    if start_worker:
+        threading.Thread(
+            target=_drain, args=(user_id,), daemon=True, name="profile-patch-worker",
+        ).start()
+    return fut
+
+
+def submit(
+    user_id: str,
+    ops: List[Op],
+    *,
+    guard: Optional[Guard] = None,
+    timeout: float = 30.0,
+) -> bool:
+    """``enqueue`` and wait. Returns True when applied, False when skipped or failed."""
+    try:
+        return bool(enqueue(user_id, ops, guard=guard).result(timeout=timeout))
+    except Exception:
+        logger.exception("Profile patch failed for user_id=%s", user_id)
+        return False
+
+
+def _drain(user_id: str) -> None:
+    while True:
+        with _lock:
+            queue = _queues[user_id]
+            if not queue:
+                del _queues[user_id]
+                return
+            batch = list(queue)
+            queue.clear()
+        try:
+            _apply_batch(user_id, batch)
+        except Exception as exc:  # never leave a caller waiting
+            logger.exception("Profile patch worker failed for user_id=%s", user_id)
+            for _ops, _guard, fut in batch:
+                if not fut.done():
+                    fut.set_exception(exc)
+
+
+def _read(user_id: str) -> Tuple[Optional[Dict[str, Any]], int]:
+    from agentic_traveler.tools.db_client import get_db
+
+    res = (
+        get_db()
+        .table("user_profiles")
+        .select("profile_data, summary, version")
+        .eq("user_id", user_id)
+        .maybe_single()
+        .execute()
+    )
+    row = res.data if res is not None else None
+    if not row:
+        return None, 0
+    doc = {"profile_data": dict(row.get("profile_data") or {}), "summary": row.get("summary") or ""}
+    return doc, int(row.get("version") or 0)
+
+
+def _write(user_id: str, row_exists: bool, version: int, fields: Dict[str, Any]) -> bool:
+    """Versioned write; False means another writer got there first."""
+    from agentic_traveler.tools.db_client import get_db
+
+    table = get_db().table("user_profiles")
+    if not row_exists:
+        try:
+            table.insert({"user_id": user_id, **fields}).execute()
+            return True
+        except Exception:
+            # Most likely the row was created concurrently — re-read and retry.
+            logger.debug("user_profiles insert lost a race for user_id=%s", user_id, exc_info=True)
+            return False
+    resp = table.update(fields).eq("user_id", user_id).eq("version", version).execute()
+    return bool(resp is not None and resp.data)
+
+
+def _apply_batch(user_id: str, batch: List[Tuple[List[Op], Optional[Guard], Future]]) -> None:
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        doc, version = _read(user_id)
+        row_exists = doc is not None
+        current = doc if row_exists else {"profile_data": {}, "summary": ""}
+
+        outcomes: List[Any] = []
+        working = current
+        for ops, guard, _fut in batch:
+            if guard is not None and not guard(working):
+                outcomes.append(False)
+                continue
+            try:
+                working = apply_patch(working, ops)
+                outcomes.append(True)
+            except PatchError as exc:
+                outcomes.append(exc)
+
+        changed = {col: working[col] for col in _COLUMNS if working.get(col) != current.get(col)}
+        if not changed or _write(user_id, row_exists, version, changed):
+            for (_ops, _guard, fut), outcome in zip(batch, outcomes):
+                if isinstance(outcome, Exception):
+                    fut.set_exception(outcome)
+                else:
+                    fut.set_result(outcome)
+            return
+
+        logger.info(
+            "user_profiles version conflict for user_id=%s (attempt %d/%d); re-applying.",
+            user_id, attempt, MAX_ATTEMPTS,
+        )
+        time.sleep(_BACKOFF_S * attempt)
+
+    err = ProfileWriteConflict(f"profile write for {user_id} conflicted {MAX_ATTEMPTS} times")
+    for _ops, _guard, fut in batch:
+        fut.set_exception(err)
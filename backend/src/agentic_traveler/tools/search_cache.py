@@ -0,0 +1,142 @@
+"""
+Shared cache for grounded search answers.
+
+Every grounded call costs a flat per-prompt fee on top of tokens, and many
+travellers ask the same things ("visa requirements for Japan for EU
+citizens", "Oktoberfest 2026 dates"). Answers are cached per normalized
+query, format and model, shared across users, together with the grounding
+sources they were built from.
+
+How long an answer stays fresh depends on what was asked (``classify``):
+live conditions expire in minutes, prices / events / advisories in hours,
+entry rules in a day, everything else in half a day.
+
+Only single-query answers are cached: a batched prompt answers several
+queries in one text that cannot be split back per query. SearchAgent's
+fan-out mode issues one grounded call per query, so every answer becomes
+cacheable.
+"""
+
+import os
+import re
+import threading
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Tuple
+
+from agentic_traveler.tools.ttl_cache import TTLCache
+
+MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_SIZE", "2000"))
+
+# Query class → TTL in seconds. First matching class wins (most volatile first).
+_TTL_BY_CLASS: Dict[str, float] = {
+    "live": 15 * 60,
+    "volatile": 6 * 3600,
+    "regulatory": 24 * 3600,
+    "general": 12 * 3600,
+}
+_CLASS_PATTERNS: List[Tuple[str, "re.Pattern[str]"]] = [
+    ("live", re.compile(
+        r"\b(now|today|tonight|currently|live|right now|this morning|"
+        r"strikes?|delays?|cancell?ations?|closures?|traffic|news)\b"
+    )),
+    ("volatile", re.compile(
+        r"\b(prices?|costs?|fares?|tickets?|rates?|exchange|events?|festivals?|"
+        r"concerts?|schedules?|opening hours|hours|advisor(y|ies)|warnings?|"
+        r"this (week|weekend|month)|tomorrow)\b"
+    )),
+    ("regulatory", re.compile(
+        r"\b(visas?|entry requirements?|passports?|vaccinations?|customs|"
+        r"immigration|permits?|etias|esta)\b"
+    )),
+]
+
+_PUNCT = re.compile(r"[^\w\s]")
+_SPACE = re.compile(r"\s+")
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    """One cached grounded answer."""
+
+    text: str
+    sources: Tuple[Dict[str, str], ...] = ()
+    query_class: str = "general"
+    ttl_s: float = field(default=_TTL_BY_CLASS["general"], compare=False)
+
+
+def normalize(query: str) -> str:
+    """Case-, punctuation- and whitespace-insensitive form of ``query``."""
+    text = unicodedata.normalize("NFKC", query or "").lower()
+    return _SPACE.sub(" ", _PUNCT.sub(" ", text)).strip()
+
+
+def classify(query: str) -> str:
+    """Freshness class of a (normalized) query."""
+    for name, pattern in _CLASS_PATTERNS:
+        if pattern.search(query):
+            return name
+    return "general"
+
+
+def ttl_for(query_class: str) -> float:
+    return _TTL_BY_CLASS.get(query_class, _TTL_BY_CLASS["general"])
+
+
+def cache_key(query: str, format: str, model: str) -> Hashable:
+    return (normalize(query), format, model)
+
+
+def sources_from(response: Any) -> Tuple[Dict[str, str], ...]:
+    """The web sources in a grounded response's grounding metadata."""
+    out: List[Dict[str, str]] = []
+    try:
+        for candidate in (getattr(response, "candidates", None) or []):
+            meta = getattr(candidate, "grounding_metadata", None)
+            for chunk in (getattr(meta, "grounding_chunks", None) or []):
+                web = getattr(chunk, "web", None)
+                uri = getattr(web, "uri", None) if web else None
+                if uri:
+                    out.append({"title": getattr(web, "title", "") or "", "uri": uri})
+    except Exception:
+        pass
+    return tuple(out)
+
+
+def make_result(query: str, text: str, response: Any) -> SearchResult:
+    query_class = classify(normalize(query))
+    return SearchResult(
+        text=text,
+        sources=sources_from(response),
+        query_class=query_class,
+        ttl_s=ttl_for(query_class),
+    )
+
+
+cache: "TTLCache[SearchResult]" = TTLCache(MAX_ENTRIES, lambda result: result.ttl_s)
+
+_counter_lock = threading.Lock()
+_grounded_calls = 0
+
+
+def record_grounded_call(n: int = 1) -> None:
+    global _grounded_calls
+    with _counter_lock:
+        _grounded_calls += n
+
+
+def clear() -> None:
+    """Empty the cache and reset every counter (tests)."""
+    global _grounded_calls
+    cache.clear()
+    with _counter_lock:
+        _grounded_calls = 0
+
+
+def stats() -> Dict[str, Any]:
+    """Cache counters plus live grounded calls made and calls saved by hits."""
+    out = cache.stats()
+    with _counter_lock:
+        out["grounded_calls"] = _grounded_calls
+    out["grounded_calls_saved"] = out["hits"]
+    return out
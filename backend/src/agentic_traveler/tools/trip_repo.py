@@ -10,22 +10,45 @@ Architecture notes (Task 34):
   row until Task 37 wires the auto-trigger that does this automatically.
 - get_trip() loads the full trip shape (parent + all 5 child tables) in 6
   separate queries; total latency is well under 50 ms for typical trip sizes.
+  get_trip_core() loads the parent row alone (1 query).
+- list_trip_summaries(cached=True) serves the per-user summary index from an
+  in-process TTL cache. Every write method that knows the user calls
+  invalidate_trip_index(); writers on other instances are bounded by the TTL.
+- Trip reads are counted per turn (queries + response bytes) once
+  begin_trip_io_capture() has been called in the turn's context.
 - JSONB columns accept any dict; Python layer logs at DEBUG which patch keys
   it received. No strict whitelist enforcement in the DB — saga code validates.
 """
 
 from __future__ import annotations
 
+import json
 import logging
+import os
+import threading
+from contextvars import ContextVar
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
 from agentic_traveler.tools.db_client import get_db
+from agentic_traveler.tools.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+TRIP_SUMMARY_CACHE_SIZE = int(os.getenv("TRIP_SUMMARY_CACHE_SIZE", "5000"))
+TRIP_SUMMARY_CACHE_TTL_S = float(os.getenv("TRIP_SUMMARY_CACHE_TTL_S", "120"))
+
+_summary_index: "TTLCache[list[TripSummary]]" = TTLCache(
+    TRIP_SUMMARY_CACHE_SIZE, TRIP_SUMMARY_CACHE_TTL_S,
+)
+_index_lock = threading.Lock()
+_index_generations: dict[str, int] = {}
+
+# Per-turn read accounting: {"queries": n, "bytes": n} or None (not capturing).
+_turn_io: ContextVar[Optional[dict[str, int]]] = ContextVar("trip_turn_io", default=None)
+
 # ---------------------------------------------------------------------------
 # Allowed top-level column / JSONB-section names for upsert_trip validation.
 # Unknown keys are accepted (JSONB is schema-less) but logged at DEBUG.
@@ -47,13 +70,18 @@ class TripSummary(BaseModel):
     ``destinations`` carries the lightweight destination rows from the
     ``trip_destinations`` relation (``name``/``iso_country``/``status``) so the
     trip resolver can match a turn to a trip by destination without hydrating the
-    full trip (task 52 AC-5). ``reference_date`` doubles as the tie-break date."""
+    full trip (task 52 AC-5). ``reference_date`` doubles as the tie-break date.
+    ``saga_state`` is the trigger-maintained phase cache (read it through
+    ``sagas.saga_state.saga_phase``) and ``timeframe`` is
+    ``discovery.timeframe``, so the date-driven phases stay exact."""
     id: str
     title: str | None = None
     status: str
+    saga_state: str | None = None
     reference_date: str | None = None
     vision_summary: str | None = None
     updated_at: str
+    timeframe: dict[str, Any] | None = None
     destinations: list[dict[str, Any]] = Field(default_factory=list)
 
 
@@ -163,32 +191,20 @@ class TripRepository:
     # Parent — reads
     # ------------------------------------------------------------------
 
-    def get_trip(self, trip_id: str) -> Trip | None:
+    def get_trip(self, trip_id: str, *, row: dict[str, Any] | None = None) -> Trip | None:
         """
         Load the full trip document: parent row + all 5 child tables.
 
+        ``row`` is a parent row the caller already holds (``get_trip_core``);
+        only the child tables are fetched then.
+
         Returns None if the trip doesn't exist. Does NOT assert user ownership
         — callers must do that if they want isolation (see assert_owner).
         """
-        db = get_db()
-
-        # Parent row
-        try:
-            resp = (
-                db.table("trips")
-                .select("*")
-                .eq("id", trip_id)
-                .maybe_single()
-                .execute()
-            )
-        except Exception:
-            logger.exception("get_trip: failed to fetch parent for trip_id=%s", trip_id)
-            return None
-
-        if not resp or not resp.data:
-            return None
-
-        row = resp.data
+        if row is None:
+            row = self.get_trip_core(trip_id)
+            if row is None:
+                return None
 
         # Child collections (5 queries; each is cheap for small trips)
         destinations = self._load_destinations(trip_id)
@@ -208,29 +224,63 @@ class TripRepository:
             checklist=checklist,
         )
 
-    def list_trip_summaries(self, user_id: str) -> list[TripSummary]:
+    def get_trip_core(self, trip_id: str) -> dict[str, Any] | None:
         """
-        Return the summary shape for all of a user's trips.
-        Used to populate LLM context without dumping the full JSONB sections.
-        Ordered by reference_date DESC (nulls last), then updated_at DESC.
+        Load the parent ``trips`` row alone (JSONB sections included, no child
+        tables) in one query. Returns None if the trip doesn't exist. Does NOT
+        assert user ownership.
         """
-        db = get_db()
         try:
             resp = (
-                db.table("trips")
-                .select(
-                    "id, title, status, reference_date, vision_summary, updated_at, "
-                    "trip_destinations(name, iso_country, status)"
-                )
-                .eq("user_id", user_id)
-                .order("reference_date", desc=True, nullsfirst=False)
-                .order("updated_at", desc=True)
+                get_db().table("trips")
+                .select("*")
+                .eq("id", trip_id)
+                .maybe_single()
                 .execute()
             )
+        except Exception:
+            logger.exception("get_trip_core: failed to fetch trip_id=%s", trip_id)
+            return None
+        _count_read(resp)
+        if not resp or not resp.data:
+            return None
+        return resp.data
+
+    def list_trip_summaries(self, user_id: str, *, cached: bool = False) -> list[TripSummary]:
+        """
+        Return the summary shape for all of a user's trips.
+        Used to populate LLM context without dumping the full JSONB sections.
+        Ordered by reference_date DESC (nulls last), then updated_at DESC.
+
+        ``cached=True`` serves the in-process summary index (the turn path);
+        a failed fetch is never cached.
+        """
+        try:
+            if not cached:
+                return self._fetch_trip_summaries(user_id)
+            with _index_lock:
+                key = (user_id, _index_generations.get(user_id, 0))
+            return list(_summary_index.get_or_load(
+                key, lambda: self._fetch_trip_summaries(user_id),
+            ) or [])
         except Exception:
             logger.exception("list_trip_summaries: failed for user_id=%s", user_id)
             return []
 
+    def _fetch_trip_summaries(self, user_id: str) -> list[TripSummary]:
+        resp = (
+            get_db().table("trips")
+            .select(
+                "id, title, status, saga_state, reference_date, vision_summary, updated_at, "
+                "timeframe:discovery->timeframe, "
+                "trip_destinations(name, iso_country, status)"
+            )
+            .eq("user_id", user_id)
+            .order("reference_date", desc=True, nullsfirst=False)
+            .order("updated_at", desc=True)
+            .execute()
+        )
+        _count_read(resp)
         rows = resp.data or []
         return [_summary_from_row(r) for r in rows]
 
@@ -285,6 +335,7 @@ class TripRepository:
                 logger.exception("upsert_trip: insert failed for user_id=%s", user_id)
                 raise
 
+        invalidate_trip_index(user_id)
         result = self.get_trip(trip_id)
         if result is None:
             raise RuntimeError(f"upsert_trip: could not re-read trip_id={trip_id} after write")
@@ -299,11 +350,31 @@ class TripRepository:
         db = get_db()
         try:
             db.table("trips").delete().eq("id", trip_id).execute()
+            invalidate_trip_index(user_id)
             logger.info("delete_trip: deleted trip_id=%s for user_id=%s", trip_id, user_id)
         except Exception:
             logger.exception("delete_trip: failed for trip_id=%s", trip_id)
             raise
 
+    def merge_discovery(self, trip_id: str, user_id: str, patch: dict[str, Any]) -> bool:
+        """
+        Atomically merge top-level keys into ``trips.discovery`` (``discovery ||
+        patch``; a ``None`` value deletes the key) via the
+        ``merge_trip_discovery`` RPC. Both the turn's ``trip_patch`` and the
+        background brief pipeline write discovery this way, so neither clobbers
+        keys the other wrote concurrently. Bumps ``updated_at``, so Realtime
+        subscribers see the change.
+
+        Returns False when the trip does not exist or belongs to another user.
+        """
+        resp = get_db().rpc("merge_trip_discovery", {
+            "p_trip_id": trip_id,
+            "p_user_id": user_id,
+            "p_patch": patch,
+        }).execute()
+        invalidate_trip_index(user_id)
+        return bool(resp is not None and resp.data)
+
     def upsert_country_intel(
         self,
         trip_id: str,
@@ -364,11 +435,29 @@ class TripRepository:
         try:
             resp = db.table("trip_destinations").upsert(row, on_conflict="id").execute()
             self._touch_parent(trip_id)
+            invalidate_trip_index(user_id)
             return TripDestination(**resp.data[0])
         except Exception:
             logger.exception("upsert_destination: failed for trip_id=%s", trip_id)
             raise
 
+    def set_destination_coords(self, trip_id: str, coords_by_id: dict[str, dict[str, Any]]) -> int:
+        """
+        Write geocoded ``coords`` onto several trip_destinations rows of one trip
+        in a single UPDATE (``set_destination_coords`` RPC). Used by the
+        deferred geocoder (tools.geocode_queue); no ownership check — the rows
+        were created by this trip's turn. The child-table trigger bumps the
+        parent's updated_at. Returns the number of rows updated.
+        """
+        rows = [{"id": dest_id, "coords": coords} for dest_id, coords in coords_by_id.items()]
+        if not rows:
+            return 0
+        resp = get_db().rpc("set_destination_coords", {
+            "p_trip_id": trip_id,
+            "p_rows": rows,
+        }).execute()
+        return int(resp.data or 0) if resp is not None else 0
+
     def upsert_booking(
         self,
         trip_id: str,
@@ -391,6 +480,7 @@ class TripRepository:
         try:
             resp = db.table("trip_bookings").upsert(row, on_conflict="id").execute()
             self._touch_parent(trip_id)
+            invalidate_trip_index(user_id)
             return TripBooking(**resp.data[0])
         except Exception:
             logger.exception("upsert_booking: failed for trip_id=%s", trip_id)
@@ -421,6 +511,7 @@ class TripRepository:
                 row, on_conflict="trip_id,n"
             ).execute()
             self._touch_parent(trip_id)
+            invalidate_trip_index(user_id)
             return TripDay(**resp.data[0])
         except Exception:
             logger.exception("upsert_day: failed for trip_id=%s", trip_id)
@@ -448,6 +539,7 @@ class TripRepository:
         try:
             resp = db.table("trip_day_blocks").upsert(row, on_conflict="id").execute()
             self._touch_parent(trip_id)
+            invalidate_trip_index(user_id)
             return TripDayBlock(**resp.data[0])
         except Exception:
             logger.exception("upsert_day_block: failed for trip_id=%s", trip_id)
@@ -475,6 +567,7 @@ class TripRepository:
         try:
             resp = db.table("trip_checklist").upsert(row, on_conflict="id").execute()
             self._touch_parent(trip_id)
+            invalidate_trip_index(user_id)
             return TripChecklistItem(**resp.data[0])
         except Exception:
             logger.exception("upsert_checklist_item: failed for trip_id=%s", trip_id)
@@ -484,25 +577,36 @@ class TripRepository:
     # Side-effect dispatcher (Task 36)
     # ------------------------------------------------------------------
 
-    def apply_side_effect(self, user_id: str, side_effect: Any) -> None:
+    def apply_side_effect(self, user_id: str, side_effect: Any) -> Any:
         """Apply a saga ``SideEffect`` by routing ``kind`` to the matching typed
         method. Duck-typed (``.kind`` + ``.payload``) to avoid importing the
         orchestrator's saga types here.
 
         Child kinds carry ``trip_id`` in their payload; ``trip_patch`` carries
-        the parent ``id`` (and JSONB sections to merge-replace).
+        the parent ``id`` (and JSONB sections to merge-replace). A patch's
+        ``discovery`` is a key delta, not the whole column: it goes through
+        ``merge_discovery`` (a ``null`` value deletes the key), so a brief the
+        background pipeline merged mid-turn survives the turn's write.
+
+        Returns the written row model (None when the side effect was skipped).
         """
         kind = getattr(side_effect, "kind", None)
         payload = dict(getattr(side_effect, "payload", {}) or {})
 
         if kind == "trip_patch":
-            self.upsert_trip(user_id, payload)
-            return
+            trip_id = payload.get("id")
+            discovery = payload.pop("discovery", None) if trip_id else None
+            if discovery:
+                if not self.merge_discovery(trip_id, user_id, discovery):
+                    raise PermissionError(f"Trip {trip_id!r} not found.")
+                if set(payload) == {"id"}:
+                    return self.get_trip(trip_id)
+            return self.upsert_trip(user_id, payload)
 
         trip_id = payload.pop("trip_id", None)
         if not trip_id:
             logger.warning("apply_side_effect: %s missing trip_id; skipping.", kind)
-            return
+            return None
 
         child_methods = {
             "destination_upsert": self.upsert_destination,
@@ -514,8 +618,8 @@ class TripRepository:
         method = child_methods.get(kind)
         if method is None:
             logger.warning("apply_side_effect: unknown kind %r; skipping.", kind)
-            return
-        method(trip_id, user_id, payload)
+            return None
+        return method(trip_id, user_id, payload)
 
     # ------------------------------------------------------------------
     # Private helpers
@@ -600,6 +704,7 @@ class TripRepository:
                 .order("ord")
                 .execute()
             )
+            _count_read(resp)
             return [TripDestination(**r) for r in (resp.data or [])]
         except Exception:
             logger.exception("_load_destinations: failed for trip_id=%s", trip_id)
@@ -614,6 +719,7 @@ class TripRepository:
                 .order("datetime_local", nullsfirst=True)
                 .execute()
             )
+            _count_read(resp)
             return [TripBooking(**r) for r in (resp.data or [])]
         except Exception:
             logger.exception("_load_bookings: failed for trip_id=%s", trip_id)
@@ -628,6 +734,7 @@ class TripRepository:
                 .order("n")
                 .execute()
             )
+            _count_read(resp)
             return [TripDay(**r) for r in (resp.data or [])]
         except Exception:
             logger.exception("_load_days: failed for trip_id=%s", trip_id)
@@ -643,6 +750,7 @@ class TripRepository:
                 .order("ord")
                 .execute()
             )
+            _count_read(resp)
             return [TripDayBlock(**r) for r in (resp.data or [])]
         except Exception:
             logger.exception("_load_day_blocks: failed for trip_id=%s", trip_id)
@@ -658,6 +766,7 @@ class TripRepository:
                 .order("ord")
                 .execute()
             )
+            _count_read(resp)
             return [TripChecklistItem(**r) for r in (resp.data or [])]
         except Exception:
             logger.exception("_load_checklist: failed for trip_id=%s", trip_id)
@@ -673,6 +782,42 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def invalidate_trip_index(user_id: Optional[str]) -> None:
+    """Drop ``user_id``'s cached trip summaries (one of their trips was written)."""
+    if not user_id:
+        return
+    with _index_lock:
+        _index_generations[user_id] = _index_generations.get(user_id, 0) + 1
+
+
+def clear_trip_index() -> None:
+    """Empty the summary index and reset its counters (tests)."""
+    _summary_index.clear()
+    with _index_lock:
+        _index_generations.clear()
+
+
+def trip_index_stats() -> dict[str, Any]:
+    return _summary_index.stats()
+
+
+def begin_trip_io_capture() -> dict[str, int]:
+    """Start counting this context's trip reads; returns the live counters."""
+    io = {"queries": 0, "bytes": 0}
+    _turn_io.set(io)
+    return io
+
+
+def _count_read(resp: Any) -> None:
+    io = _turn_io.get()
+    if io is None:
+        return
+    io["queries"] += 1
+    data = getattr(resp, "data", None)
+    if data:
+        io["bytes"] += len(json.dumps(data, default=str))
+
+
 def _summary_from_row(row: dict[str, Any]) -> TripSummary:
     """Build a TripSummary from a trips row that embeds the nested
     ``trip_destinations`` relation (PostgREST returns it under the table name).
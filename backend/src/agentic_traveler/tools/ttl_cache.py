@@ -0,0 +1,131 @@
+"""
+In-process TTL + LRU cache with single-flight loading.
+
+Used by the tool data layers (weather, search) whose upstream calls are slow
+or billed and whose answers are shared across users. ``get_or_load`` makes
+concurrent callers asking for the same missing key wait on ONE upstream
+fetch instead of each issuing their own.
+
+Loader failures (exceptions) and ``None`` results are never cached, so a
+transient upstream error is retried by the next caller.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """Thread-safe mapping with per-entry expiry, an LRU bound and hit/miss counters."""
+
+    def __init__(self, max_entries: int, ttl_s: "float | Callable[[V], float]",
+                 clock: Callable[[], float] = time.time):
+        """``ttl_s`` is seconds, or a callable computing the TTL from the value."""
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._inflight: Dict[Hashable, Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+
+    def _ttl_for(self, value: V) -> float:
+        return self.ttl_s(value) if callable(self.ttl_s) else self.ttl_s
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the live value for ``key`` (counting a hit or miss), else None."""
+        with self._lock:
+            value = self._lookup(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def _lookup(self, key: Hashable) -> Optional[V]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: V, ttl_s: Optional[float] = None) -> None:
+        if value is None:
+            return
+        ttl = self._ttl_for(value) if ttl_s is None else ttl_s
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (self._clock() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Optional[V]]) -> Optional[V]:
+        """
+        Return the cached value for ``key`` or run ``loader`` once for all
+        concurrent callers of the same key. Exceptions from ``loader``
+        propagate to every waiting caller.
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is not None:
+                self.hits += 1
+                return value
+            self.misses += 1
+            fut = self._inflight.get(key)
+            owner = fut is None
+            if owner:
+                fut = self._inflight[key] = Future()
+                self.loads += 1
+
+        if not owner:
+            return fut.result()
+
+        try:
+            value = loader()
+        except BaseException as exc:
+            fut.set_exception(exc)
+            raise
+        else:
+            self.put(key, value)
+            fut.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.loads = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "hits": self.hits,
+                "misses": self.misses,
+                "loads": self.loads,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
@@ -12,6 +12,7 @@ consumers (credit_manager, off_topic_guard, etc.) can read sub-keys like
 import logging
 from typing import Any, Dict, Optional, Tuple
 
+from agentic_traveler.tools import identity_cache
 from agentic_traveler.tools.db_client import get_db
 
 logger = logging.getLogger(__name__)
@@ -39,9 +40,10 @@ class UserRepository:
         Return the user UUID for the given Telegram ID, or None.
 
         The UUID is the Supabase equivalent of the Firestore DocumentReference.
+        Resolved through the identity cache (a narrow ``users.id`` lookup,
+        at most once per process) rather than the full user join.
         """
-        _doc, uid = self.get_user_with_ref(telegram_id)
-        return uid
+        return identity_cache.resolve_user_uuid(telegram_id)
 
     def get_user_with_ref(
         self, telegram_id: str
@@ -68,9 +70,12 @@ class UserRepository:
             return None, None
 
         if resp is None or not resp.data:
+            # Deleted (e.g. from the web app) since the guard resolved it.
+            identity_cache.invalidate(telegram_id=telegram_id)
             return None, None
 
         user_id = resp.data["id"]
+        identity_cache.remember(telegram_id, user_id)
         assembled = _assemble_user_doc(resp.data)
         return assembled, user_id
 
@@ -174,37 +179,33 @@ class UserRepository:
         """Deterministically record a Traveler-DNA answer (Task 54): merge
         ``profile_data.answered_questions[qid] = {value, set_at, source}`` into the
         existing profile_data. Zero LLM, idempotent. A ``tally_backfill`` never
-        clobbers a richer chat/dna answer (Task 54 AC-9). The partial upsert
-        preserves the ``summary`` column (PostgREST updates only given columns)."""
+        clobbers a richer chat/dna answer (Task 54 AC-9). Applied through the
+        per-user profile patch queue, so the ``summary`` column and answers written
+        concurrently by other writers are preserved."""
         from datetime import datetime, timezone
 
-        try:
-            res = (
-                get_db()
-                .table("user_profiles")
-                .select("profile_data")
-                .eq("user_id", user_id)
-                .maybe_single()
-                .execute()
-            )
-            profile_data = dict((res.data or {}).get("profile_data") or {}) if res else {}
-            answered = dict(profile_data.get("answered_questions") or {})
+        from agentic_traveler.tools import profile_patch_queue
+
+        def _not_clobbering(doc: Dict[str, Any]) -> bool:
+            answered = (doc.get("profile_data") or {}).get("answered_questions") or {}
             existing = answered.get(qid)
-            if (
+            return not (
                 source == "tally_backfill"
                 and isinstance(existing, dict)
                 and existing.get("source") in ("chat_tap", "chat_text", "dna_page")
-            ):
-                return
-            answered[qid] = {
+            )
+
+        op = {
+            "op": "add",
+            "path": f"/profile_data/answered_questions/{profile_patch_queue.escape_token(qid)}",
+            "value": {
                 "value": value,
                 "set_at": datetime.now(timezone.utc).isoformat(),
                 "source": source,
-            }
-            profile_data["answered_questions"] = answered
-            get_db().table("user_profiles").upsert(
-                {"user_id": user_id, "profile_data": profile_data}
-            ).execute()
+            },
+        }
+        try:
+            profile_patch_queue.enqueue(user_id, [op], guard=_not_clobbering).result(timeout=30)
         except Exception:
             logger.exception(
                 "Failed to merge answered question qid=%s user_id=%s", qid, user_id
@@ -285,6 +286,7 @@ class UserRepository:
 
                 # 2. Delete the new orphan row first to free up submission_id constraint
                 db.table("users").delete().eq("id", new_user_id).execute()
+                identity_cache.invalidate(user_id=new_user_id)
 
                 # 3. Update existing row with new metadata
                 db.table("users").update(
@@ -314,6 +316,7 @@ class UserRepository:
             db.table("users").update(
                 {"telegram_id": telegram_id}
             ).eq("id", new_user_id).execute()
+            identity_cache.invalidate(telegram_id=telegram_id, user_id=new_user_id)
 
             logger.info(
                 "Linked telegram_id=%s to submission_id=%s", telegram_id, submission_id
@@ -361,6 +364,7 @@ class UserRepository:
                 .execute()
             )
             if resp and resp.data:
+                identity_cache.invalidate(telegram_id=telegram_id, user_id=user_id)
                 logger.info("Successfully linked telegram_id=%s to web user_id=%s", telegram_id, user_id)
                 return True, "✅ Linked! Your Telegram chat is now connected to your web account."
             else:
@@ -412,6 +416,9 @@ def _assemble_user_doc(row: Dict[str, Any]) -> Dict[str, Any]:
             # Flatten profile_data fields so agents can read them directly
             **(profile_row.get("profile_data") or {}),
         },
+        # user_profiles.version, bumped on every write; keys the rendered-summary
+        # cache. Kept out of user_profile, whose keys are preferences.
+        "profile_version": profile_row.get("version"),
         # Credits (nested under credits to match old shape)
         "credits": {
             "balance": credits_row.get("balance", 0),
@@ -1,12 +1,65 @@
-import requests
 import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 
+import requests
+from requests.adapters import HTTPAdapter
+
+from agentic_traveler.tools.ttl_cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
+# Resolved coordinates never move; keep them for a month.
+COORDS_TTL_S = float(os.getenv("WEATHER_COORDS_TTL_S", str(30 * 24 * 3600)))
+# Open-Meteo refreshes its forecast models hourly, so a forecast is reused
+# until the next top of the hour (never longer than this cap).
+FORECAST_TTL_S = float(os.getenv("WEATHER_FORECAST_TTL_S", "3600"))
+# ~1 km — finer than the forecast model grid, so nearby lookups share an entry.
+_COORD_DECIMALS = 2
+
+_coords_cache: TTLCache[Dict[str, Any]] = TTLCache(max_entries=4096, ttl_s=COORDS_TTL_S)
+_forecast_cache: TTLCache[Dict[str, Any]] = TTLCache(
+    max_entries=1024,
+    ttl_s=lambda _v: min(FORECAST_TTL_S, 3600 - time.time() % 3600),
+)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """One pooled keep-alive session shared by every weather lookup."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=2, pool_maxsize=16)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+
+def _http_get(url: str, params: Dict[str, Any]) -> requests.Response:
+    return _get_session().get(url, params=params, timeout=10)
+
+
+def clear_caches() -> None:
+    """Empty the coordinate and forecast caches (tests)."""
+    _coords_cache.clear()
+    _forecast_cache.clear()
+
+
 class WeatherService:
     """
     A service to interact with Open-Meteo APIs for geocoding and weather data.
+
+    Coordinates and forecasts are cached process-wide (see COORDS_TTL_S /
+    FORECAST_TTL_S); concurrent identical lookups share one upstream fetch.
     """
     GEOCODING_API = "https://geocoding-api.open-meteo.com/v1/search"
     WEATHER_API = "https://api.open-meteo.com/v1/forecast"
@@ -18,90 +71,103 @@ class WeatherService:
         Handles "City, Region, Country" by fetching multiple results 
         and performing robust fuzzy matching on administrative levels.
         """
+        key = " ".join((location or "").lower().split())
         try:
-            # The API may fail on exact matches for detailed strings (e.g., "Kuta, Lombok, Indonesia")
-            # so we query with "City, Country" to get better initial results for local disambiguation.
-            if "," in location:
-                parts = [p.strip() for p in location.split(",")]
-                if len(parts) >= 3:
-                    # Usually: City, Region, Country
-                    search_name = f"{parts[0]}, {parts[-1]}"
-                else:
-                    search_name = location
+            return _coords_cache.get_or_load(key, lambda: cls._fetch_coordinates(location))
+        except Exception as e:
+            logger.error(f"Error fetching coordinates for {location}: {e}")
+            return None
+
+    @classmethod
+    def _fetch_coordinates(cls, location: str) -> Optional[Dict[str, Any]]:
+        """Uncached geocoding lookup; raises on transport/HTTP errors."""
+        # The API may fail on exact matches for detailed strings (e.g., "Kuta, Lombok, Indonesia")
+        # so we query with "City, Country" to get better initial results for local disambiguation.
+        if "," in location:
+            parts = [p.strip() for p in location.split(",")]
+            if len(parts) >= 3:
+                # Usually: City, Region, Country
+                search_name = f"{parts[0]}, {parts[-1]}"
             else:
                 search_name = location
+        else:
+            search_name = location
+        
+        logger.info(f"WeatherService: Querying geocoding API for search_name='{search_name}' (original: '{location}')")
+        resp = _http_get(cls.GEOCODING_API, {"name": search_name, "count": 10})
+        resp.raise_for_status()
+        data = resp.json()
+        results = data.get("results")
+        if not results:
+            logger.warning(f"No coordinates found for location: {location} (search_name: '{search_name}')")
+            return None
+        
+        # 1. Start with the first result as a baseline
+        best_match = results[0]
+        
+        # 2. If the user provided multiple parts (City, Island, Country), 
+        # find the result that matches the most descriptive tokens.
+        if "," in location:
+            tokens = [t.strip().lower() for t in location.split(",")]
+            city_token = tokens[0]
+            region_tokens = tokens[1:]
             
-            logger.info(f"WeatherService: Querying geocoding API for search_name='{search_name}' (original: '{location}')")
-            resp = requests.get(cls.GEOCODING_API, params={"name": search_name, "count": 10}, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
-            results = data.get("results")
-            if not results:
-                logger.warning(f"No coordinates found for location: {location} (search_name: '{search_name}')")
-                return None
-            
-            # 1. Start with the first result as a baseline
-            best_match = results[0]
-            
-            # 2. If the user provided multiple parts (City, Island, Country), 
-            # find the result that matches the most descriptive tokens.
-            if "," in location:
-                tokens = [t.strip().lower() for t in location.split(",")]
-                city_token = tokens[0]
-                region_tokens = tokens[1:]
+            max_score = -1
+            for res in results:
+                res_name = (res.get("name") or "").lower()
+                res_country = (res.get("country") or "").lower()
+                res_admin1 = (res.get("admin1") or "").lower()
+                res_admin2 = (res.get("admin2") or "").lower()
                 
-                max_score = -1
-                for res in results:
-                    res_name = (res.get("name") or "").lower()
-                    res_country = (res.get("country") or "").lower()
-                    res_admin1 = (res.get("admin1") or "").lower()
-                    res_admin2 = (res.get("admin2") or "").lower()
-                    
-                    score = 0
-                    # Does the primary city match? (Partial match allowed for Kuta/Kute)
-                    if city_token in res_name or res_name in city_token:
-                        score += 5
-                    
-                    # How many extra regions/countries match?
-                    for rt in region_tokens:
-                        if rt in res_country or rt in res_admin1 or rt in res_admin2:
-                            score += 10 # Region/Island matches are high weight
-                    
-                    if score > max_score:
-                        max_score = score
-                        best_match = res
-                        # If we found a perfect match for BOTH city and a region, we're likely done
-                        if score >= 15:
-                            break
-
-            return {
-                "lat": best_match["latitude"],
-                "lng": best_match["longitude"],
-                "name": best_name if (best_name := best_match.get("name")) else location,
-                "country": best_match.get("country", ""),
-                "admin1": best_match.get("admin1", ""),
-                "admin2": best_match.get("admin2", "")
-            }
-        except Exception as e:
-            logger.error(f"Error fetching coordinates for {location}: {e}")
-            return None
+                score = 0
+                # Does the primary city match? (Partial match allowed for Kuta/Kute)
+                if city_token in res_name or res_name in city_token:
+                    score += 5
+                
+                # How many extra regions/countries match?
+                for rt in region_tokens:
+                    if rt in res_country or rt in res_admin1 or rt in res_admin2:
+                        score += 10 # Region/Island matches are high weight
+                
+                if score > max_score:
+                    max_score = score
+                    best_match = res
+                    # If we found a perfect match for BOTH city and a region, we're likely done
+                    if score >= 15:
+                        break
+
+        return {
+            "lat": best_match["latitude"],
+            "lng": best_match["longitude"],
+            "name": best_name if (best_name := best_match.get("name")) else location,
+            "country": best_match.get("country", ""),
+            "admin1": best_match.get("admin1", ""),
+            "admin2": best_match.get("admin2", "")
+        }
 
     @classmethod
     def get_weather(cls, lat: float, lng: float, days: int = 7) -> Optional[Dict[str, Any]]:
         """
         Fetch weather forecast for the given coordinates and number of days.
+        Cached by (rounded lat/lon, start date, days).
         """
-        try:
-            params = {
-                "latitude": lat,
-                "longitude": lng,
-                "daily": "weather_code,temperature_2m_max,temperature_2m_min,precipitation_sum",
-                "timezone": "auto",
-                "forecast_days": days
-            }
-            resp = requests.get(cls.WEATHER_API, params=params, timeout=10)
+        lat_r, lng_r = round(lat, _COORD_DECIMALS), round(lng, _COORD_DECIMALS)
+        start = datetime.now(timezone.utc).date().isoformat()
+        params = {
+            "latitude": lat_r,
+            "longitude": lng_r,
+            "daily": "weather_code,temperature_2m_max,temperature_2m_min,precipitation_sum",
+            "timezone": "auto",
+            "forecast_days": days
+        }
+
+        def _fetch() -> Dict[str, Any]:
+            resp = _http_get(cls.WEATHER_API, params)
             resp.raise_for_status()
             return resp.json()
+
+        try:
+            return _forecast_cache.get_or_load((lat_r, lng_r, start, days), _fetch)
         except Exception as e:
             logger.error(f"Error fetching weather for ({lat}, {lng}): {e}")
             return None
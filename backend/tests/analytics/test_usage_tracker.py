@@ -6,6 +6,7 @@ these tests verify token extraction, grounding detection,
 credit calculations, and both metrics_tracker and Supabase integrations.
 """
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 import pytest
 
@@ -164,6 +165,16 @@ def test_usage_tracking_database_accumulation_system_compaction(mock_get_db, moc
         )
 
 
+class _InlineThread:
+    """Runs a background thread's target synchronously on start()."""
+
+    def __init__(self, target, args=(), kwargs=None, daemon=None):
+        self._target, self._args, self._kwargs = target, args, kwargs or {}
+
+    def start(self):
+        self._target(*self._args, **self._kwargs)
+
+
 @patch("agentic_traveler.tools.db_client.get_db")
 def test_save_and_finish_aggregates_usage_and_costs(mock_get_db):
     """_save_and_finish aggregates multiple small model calls in a turn to avoid overcharging."""
@@ -197,7 +208,8 @@ def test_save_and_finish_aggregates_usage_and_costs(mock_get_db):
     events = EventEmitter(user_id="test-uuid-123", trip_id=None)
     with patch("agentic_traveler.analytics.metrics_tracker.record_token_usage") as mock_record, \
          patch("agentic_traveler.analytics.usage_tracker._resolve_user_uuid", return_value="test-uuid-123"), \
-         patch("agentic_traveler.economy.credit_manager.deduct_credits_async") as mock_deduct, \
+         patch("agentic_traveler.economy.credit_manager.threading",
+               SimpleNamespace(Thread=_InlineThread)), \
          patch("agentic_traveler.orchestrator.event_emitter.flush_metrics"):
 
         _save_and_finish(
@@ -213,9 +225,6 @@ def test_save_and_finish_aggregates_usage_and_costs(mock_get_db):
             intent="CHAT",
         )
         
-        # Verify total turn-level credit deduction is exactly 1 credit
-        mock_deduct.assert_called_once_with("test-uuid-123", 1)
-        
         # Verify weekly summary records the aggregated cost of 1 credit once for this model
         mock_record.assert_called_once_with(
             agent_name="orchestrator",
@@ -224,13 +233,18 @@ def test_save_and_finish_aggregates_usage_and_costs(mock_get_db):
             output_tokens=140,
             total_cost_credits=1
         )
-        
-        # Verify Supabase RPC records the aggregated cost of 1 credit
-        mock_rpc.assert_called_once_with("accumulate_user_usage", {
+
+        # Verify one bill_turn RPC carries the aggregated usage and the 1-credit deduction
+        mock_rpc.assert_called_once_with("bill_turn", {
             "p_user_id": "test-uuid-123",
-            "p_model_name": "gemini-3.1-flash-lite",
-            "p_input_tokens": 300,
-            "p_output_tokens": 140,
-            "p_is_grounded": 0,
-            "p_cost_credits": 1
+            "p_cost_credits": 1,
+            "p_usage": [{
+                "model_name": "gemini-3.1-flash-lite",
+                "input_tokens": 300,
+                "output_tokens": 140,
+                "cached_tokens": 0,
+                "is_grounded": 0,
+                "cost_credits": 1,
+            }],
+            "p_idempotency_key": f"turn:{events.turn_id}",
         })
@@ -0,0 +1,74 @@
+"""Lazily built singletons and the start-up warm-up (core.lazy)."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from agentic_traveler.core import lazy
+
+
+@pytest.fixture(autouse=True)
+def _empty_registry(monkeypatch):
+    monkeypatch.setattr(lazy, "_registry", {})
+
+
+def test_builds_once_even_under_concurrent_first_calls():
+    factory = MagicMock(side_effect=lambda: object())
+    single = lazy.lazy_singleton("thing")(factory)
+    assert not single.initialized
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(single())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    factory.assert_called_once()
+    assert len({id(r) for r in results}) == 1
+    assert lazy.registered() == {"thing": True}
+
+    single.reset()
+    assert single() is not results[0] and factory.call_count == 2
+
+
+def test_failed_build_is_retried_on_next_call():
+    factory = MagicMock(side_effect=[RuntimeError("no creds"), "client"])
+    single = lazy.lazy_singleton("db")(factory)
+    with pytest.raises(RuntimeError):
+        single()
+    assert single() == "client"
+
+
+def test_warm_up_builds_late_registrations_and_skips_failures():
+    def builds_another():
+        lazy.lazy_singleton("late")(lambda: "late")
+        return "early"
+
+    lazy.lazy_singleton("early")(builds_another)
+    lazy.lazy_singleton("broken")(MagicMock(side_effect=RuntimeError("down")))
+
+    timings = lazy.warm_up()
+
+    assert set(timings) == {"early", "late"}
+    assert lazy.registered() == {"early": True, "broken": False, "late": True}
+
+
+def test_start_warm_up_only_when_enabled(monkeypatch):
+    lazy.lazy_singleton("thing")(lambda: "x")
+    monkeypatch.delenv("WARM_UP_ON_STARTUP", raising=False)
+    assert lazy.start_warm_up() is None
+
+    monkeypatch.setenv("WARM_UP_ON_STARTUP", "true")
+    thread = lazy.start_warm_up()
+    thread.join(timeout=5)
+    assert lazy.registered() == {"thing": True}
+
+
+def test_override_serves_a_fake_and_restores_the_built_value():
+    single = lazy.lazy_singleton("db")(lambda: "real")
+    assert single() == "real"
+    with single.override("fake"):
+        assert single() == "fake"
+    assert single() == "real"
@@ -0,0 +1,128 @@
+"""Structured (JSON) logging mode: queue hand-off, context fields, drops, sampling."""
+
+import io
+import json
+import logging
+import queue
+import sys
+import threading
+
+import pytest
+
+from agentic_traveler.core import logging_config
+from agentic_traveler.core.logging_config import (
+    BoundedQueueHandler,
+    JsonFormatter,
+    SamplingFilter,
+    bind_log_context,
+    parse_sample_rates,
+    reset_log_context,
+    setup_logging,
+    trace_from_header,
+)
+
+
+@pytest.fixture
+def restore_root():
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    logging_config._stop_listener()
+    root.handlers, root.level = handlers, level
+
+
+def _entries(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_json_mode_writes_structured_entries_from_the_listener(restore_root, monkeypatch):
+    monkeypatch.setenv("GOOGLE_CLOUD_PROJECT", "proj")
+    stream = io.StringIO()
+    setup_logging(mode="json", stream=stream)
+    log = logging.getLogger("agentic_traveler.test")
+
+    def request(n):
+        token = bind_log_context(trace=f"trace{n}", turn_id=f"turn{n}", user="hash")
+        try:
+            log.info("turn %d done", n)
+        finally:
+            reset_log_context(token)
+
+    threads = [threading.Thread(target=request, args=(n,)) for n in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        log.exception("failed")
+    logging_config._stop_listener()
+
+    entries = _entries(stream)
+    by_turn = {e["logging.googleapis.com/labels"]["turn_id"]: e for e in entries[:3]}
+    assert set(by_turn) == {"turn0", "turn1", "turn2"}
+    assert by_turn["turn1"]["message"] == "turn 1 done"
+    assert by_turn["turn1"]["severity"] == "INFO"
+    assert by_turn["turn1"]["logging.googleapis.com/trace"] == "projects/proj/traces/trace1"
+    assert by_turn["turn1"]["logging.googleapis.com/labels"]["user"] == "hash"
+    assert entries[3]["severity"] == "ERROR"
+    assert "ValueError: boom" in entries[3]["message"]
+    assert "logging.googleapis.com/labels" not in entries[3]
+
+
+def test_full_queue_drops_and_reports_the_count():
+    q = queue.Queue(maxsize=2)
+    handler = BoundedQueueHandler(q)
+    log = logging.getLogger("agentic_traveler.test.drops")
+    for i in range(4):
+        handler.handle(log.makeRecord(log.name, logging.INFO, __file__, 0, "m%d", (i,), None))
+    assert handler.dropped == 2
+
+    q.get_nowait()
+    q.get_nowait()
+    handler.handle(log.makeRecord(log.name, logging.INFO, __file__, 0, "next", (), None))
+    assert q.get_nowait().getMessage() == "next"
+    note = q.get_nowait()
+    assert note.levelno == logging.WARNING
+    assert "dropped 2 record(s)" in note.getMessage()
+
+
+def test_prepare_leaves_the_callers_record_intact():
+    q = queue.Queue()
+    handler = BoundedQueueHandler(q)
+    log = logging.getLogger("agentic_traveler.test.prepare")
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = log.makeRecord(log.name, logging.ERROR, __file__, 0, "m%d", (1,), sys.exc_info())
+    handler.handle(record)
+
+    queued = q.get_nowait()
+    assert queued is not record
+    assert queued.msg == "m1" and "ValueError: boom" in queued.exc_text
+    assert record.args == (1,) and record.exc_info[0] is ValueError
+
+
+def test_sampling_applies_below_warning_by_logger_prefix(monkeypatch):
+    rates = parse_sample_rates("agentic_traveler.tools=0, bad=x, agentic_traveler.tools.keep=1")
+    assert rates == {"agentic_traveler.tools": 0.0, "agentic_traveler.tools.keep": 1.0}
+    f = SamplingFilter(rates)
+
+    def rec(name, level):
+        return logging.LogRecord(name, level, __file__, 0, "m", (), None)
+
+    assert not f.filter(rec("agentic_traveler.tools.trip_repo", logging.DEBUG))
+    assert f.filter(rec("agentic_traveler.tools.trip_repo", logging.WARNING))
+    assert f.filter(rec("agentic_traveler.tools.keep.x", logging.DEBUG))
+    assert f.filter(rec("agentic_traveler.orchestrator", logging.DEBUG))
+
+
+def test_trace_header_and_formatter_without_project():
+    assert trace_from_header("105445aa7843bc8bf206b12000100000/1;o=1") == "105445aa7843bc8bf206b12000100000"
+    assert trace_from_header(None) is None
+    record = logging.LogRecord("x", logging.WARNING, __file__, 1, "hi", (), None)
+    record.log_context = {"trace": "abc"}
+    entry = json.loads(JsonFormatter().format(record))
+    assert entry["logging.googleapis.com/trace"] == "abc"
+    assert entry["severity"] == "WARNING"
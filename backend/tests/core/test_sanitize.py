@@ -210,3 +210,49 @@ class TestSanitizeTelegramMarkdown:
             assert result.count("*") % 2 == 0, (
                 f"Odd * count in output for input {sample!r}: {result!r}"
             )
+
+
+# ── equivalence with the previous loop-based implementation ─────────────────
+
+def _reference_sanitize_telegram_markdown(text: str) -> str:
+    """The slice-and-rescan implementation the single-pass one replaced."""
+    import re
+
+    if not text:
+        return text
+    text = re.sub(r"(\d)\s*\*", r"\1★", text)
+    for ch, bare in (("*", r"(?<![^\s])\*|(?<!\*)\*(?![^\s])"), ("_", r"(?<![^\s])_|(?<!_)_(?![^\s])")):
+        while text.count(ch) % 2 != 0:
+            m = re.search(bare, text)
+            if m:
+                text = text[: m.start()] + text[m.end():]
+            else:
+                pos = text.rfind(ch)
+                if pos == -1:
+                    break
+                text = text[:pos] + text[pos + 1:]
+    return text
+
+
+def test_matches_reference_on_random_delimiter_soup():
+    """Property check (seeded, stdlib only): identical output on inputs dense
+    in *, _, digits and whitespace, where the adjacency rules interact."""
+    import random
+
+    rng = random.Random(41)
+    # Dense and sparse in "*" (both star-rating code paths), with a non-ASCII
+    # digit and whitespace: \d and \s are Unicode-aware.
+    for alphabet, max_len in (("**__  \n\t5a★b3", 24), ("*_  \n\t5a★b3xyzwvu\u0663\u2003", 60)):
+        for _ in range(5000):
+            sample = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, max_len)))
+            assert sanitize_telegram_markdown(sample) == _reference_sanitize_telegram_markdown(sample), sample
+
+
+def test_matches_reference_on_long_planner_replies():
+    import random
+
+    rng = random.Random(7)
+    words = ["*Day", "1*", "_Kyoto_", "5*", "ryokan", "4 *", "_", "*", "walk", "\n", "**", "__", "snake_case"]
+    for size in (4000, 20000):
+        sample = " ".join(rng.choice(words) for _ in range(size // 5))
+        assert sanitize_telegram_markdown(sample) == _reference_sanitize_telegram_markdown(sample)
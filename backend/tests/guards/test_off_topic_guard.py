@@ -4,18 +4,32 @@ Tests for the off-topic guard module.
 Tests use plain dicts and mocks — no real Supabase calls.
 """
 
+import threading
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
+import pytest
+
+from agentic_traveler.guards import off_topic_guard
 from agentic_traveler.guards.off_topic_guard import (
     RESET_WINDOW_SECONDS,
     THRESHOLD,
+    flush_pending,
     is_restricted,
     record_off_topic,
     reset,
+    write_stats,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clean_buffer():
+    """Each test starts with an empty write-behind buffer and zeroed counters."""
+    off_topic_guard._reset_stats()
+    yield
+    off_topic_guard._reset_stats()
+
+
 def _user_doc(count=0, last_flagged_ts=None, restricted_until=None):
     """Build a minimal user doc with off_topic fields."""
     off_topic = {}
@@ -70,11 +84,16 @@ def test_counter_increments():
 
     with patch("agentic_traveler.tools.db_client.get_db") as mock_get_db:
         result = record_off_topic(doc, user_id="uuid-123")
+        # Write-behind: nothing hits Supabase until the turn flushes.
+        mock_get_db.assert_not_called()
+        assert flush_pending("uuid-123") is True
 
     assert result["count"] == 3
     assert result["restricted"] is False
-    # Supabase upsert should have been called
     mock_get_db.return_value.table.assert_called_with("off_topic_state")
+    upsert_row = mock_get_db.return_value.table.return_value.upsert.call_args[0][0]
+    assert upsert_row["user_id"] == "uuid-123"
+    assert upsert_row["count"] == 3
 
 
 def test_restriction_after_threshold():
@@ -129,9 +148,10 @@ def test_no_auto_reset_within_window():
 # ── reset ─────────────────────────────────────────────────────────────────────
 
 def test_reset_clears_counter():
-    """reset() calls Supabase update with count=0 and restricted_until=None."""
+    """reset() + flush calls Supabase update with count=0 and restricted_until=None."""
     with patch("agentic_traveler.tools.db_client.get_db") as mock_get_db:
         reset("uuid-123")
+        assert flush_pending("uuid-123") is True
 
     mock_get_db.return_value.table.assert_called_with("off_topic_state")
     update_call = mock_get_db.return_value.table.return_value.update
@@ -146,3 +166,105 @@ def test_reset_with_no_user_id():
         reset("")
 
     mock_get_db.assert_not_called()
+
+
+# ── write-behind ──────────────────────────────────────────────────────────────
+
+def test_reset_skipped_when_already_clear():
+    """A reset against a loaded doc whose counter is already zero stages nothing."""
+    with patch("agentic_traveler.tools.db_client.get_db") as mock_get_db:
+        reset("uuid-1", _user_doc())
+        assert flush_pending("uuid-1") is False
+
+    mock_get_db.assert_not_called()
+    assert write_stats()["writes_avoided"] == 1
+
+
+def test_reset_written_when_counter_nonzero():
+    """A reset after real off-topic activity is still persisted."""
+    now = datetime.now(timezone.utc).isoformat()
+    with patch("agentic_traveler.tools.db_client.get_db") as mock_get_db:
+        reset("uuid-1", _user_doc(count=2, last_flagged_ts=now))
+        assert flush_pending("uuid-1") is True
+
+    update_call = mock_get_db.return_value.table.return_value.update
+    assert update_call.call_args[0][0] == {"count": 0, "restricted_until": None}
+
+
+def test_increments_coalesce_into_one_upsert():
+    """Several staged increments for one user collapse into a single write."""
+    doc = _user_doc()
+    with patch("agentic_traveler.tools.db_client.get_db") as mock_get_db:
+        record_off_topic(doc, user_id="uuid-1")
+        result = record_off_topic(doc, user_id="uuid-1")
+        assert flush_pending("uuid-1") is True
+
+    # The second call counted from the pending state, not the stale doc.
+    assert result["count"] == 2
+    upsert = mock_get_db.return_value.table.return_value.upsert
+    assert upsert.call_count == 1
+    assert upsert.call_args[0][0]["count"] == 2
+    assert write_stats()["writes_avoided"] == 1
+
+
+def test_pending_restriction_visible_before_flush():
+    """is_restricted sees a restriction that has been staged but not flushed."""
+    now = datetime.now(timezone.utc).isoformat()
+    doc = {**_user_doc(count=THRESHOLD - 1, last_flagged_ts=now), "id": "uuid-1"}
+    record_off_topic(doc, user_id="uuid-1")
+    assert is_restricted(doc) is not None
+
+
+def test_in_flight_write_stays_visible_until_it_returns():
+    """A turn whose user doc predates the running flush counts from the flush."""
+    started, release = threading.Event(), threading.Event()
+
+    def slow_execute():
+        started.set()
+        release.wait(timeout=5)
+
+    stale = _user_doc()
+    with patch("agentic_traveler.tools.db_client.get_db") as mock_get_db:
+        mock_get_db.return_value.table.return_value.upsert.return_value.execute.side_effect = slow_execute
+        record_off_topic(stale, user_id="uuid-1")
+        flusher = threading.Thread(target=flush_pending, args=("uuid-1",))
+        flusher.start()
+        assert started.wait(timeout=5)
+
+        assert record_off_topic(stale, user_id="uuid-1")["count"] == 2
+        release.set()
+        flusher.join(timeout=5)
+
+    assert off_topic_guard._inflight == {}
+    assert off_topic_guard._pending["uuid-1"]["fields"]["count"] == 2
+
+
+def test_reset_during_in_flight_write_is_not_skipped():
+    started, release = threading.Event(), threading.Event()
+    stale = _user_doc()
+    with patch("agentic_traveler.tools.db_client.get_db") as mock_get_db:
+        mock_get_db.return_value.table.return_value.upsert.return_value.execute.side_effect = (
+            lambda: (started.set(), release.wait(timeout=5))
+        )
+        record_off_topic(stale, user_id="uuid-1")
+        flusher = threading.Thread(target=flush_pending, args=("uuid-1",))
+        flusher.start()
+        assert started.wait(timeout=5)
+        reset("uuid-1", stale)
+        release.set()
+        flusher.join(timeout=5)
+
+    assert off_topic_guard._pending["uuid-1"]["fields"] == {"count": 0, "restricted_until": None}
+
+
+def test_writes_avoided_per_1k_turns():
+    """write_stats reports avoided writes normalised per 1,000 flushed turns."""
+    with patch("agentic_traveler.tools.db_client.get_db"):
+        for _ in range(4):
+            reset("uuid-1", _user_doc())
+            flush_pending("uuid-1")
+
+    stats = write_stats()
+    assert stats["turns"] == 4
+    assert stats["writes_issued"] == 0
+    assert stats["writes_avoided_per_1k_turns"] == 1000.0
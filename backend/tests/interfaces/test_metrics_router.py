@@ -3,18 +3,25 @@
 The Supabase JWT dependency is overridden; emit_metric_now is patched (no DB).
 """
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
-with patch("agentic_traveler.interfaces.routers.telegram.UserRepository"), \
-     patch("agentic_traveler.interfaces.routers.telegram.OrchestratorAgent"):
+with patch("agentic_traveler.interfaces.routers.telegram.UserRepository"):
     from agentic_traveler.interfaces.main import app
+    from agentic_traveler.interfaces.routers.telegram import get_orchestrator
 
 from agentic_traveler.interfaces.dependencies import WebUserCtx, verify_supabase_jwt
 
 
+@pytest.fixture(autouse=True)
+def _no_orchestrator():
+    """Serve a mock from the router's lazy orchestrator (no Gemini, no sagas)."""
+    with get_orchestrator.override(MagicMock()):
+        yield
+
+
 @pytest.fixture
 def client():
     app.dependency_overrides[verify_supabase_jwt] = lambda: WebUserCtx(
@@ -5,9 +5,15 @@ import pytest
 from fastapi.testclient import TestClient
 
 # Mock heavy dependencies before imports
-with patch("agentic_traveler.interfaces.routers.telegram.UserRepository"), \
-     patch("agentic_traveler.interfaces.routers.telegram.OrchestratorAgent"):
+with patch("agentic_traveler.interfaces.routers.telegram.UserRepository"):
     from agentic_traveler.interfaces.main import app
+    from agentic_traveler.interfaces.routers.telegram import get_orchestrator
+
+@pytest.fixture(autouse=True)
+def _no_orchestrator():
+    """Serve a mock from the router's lazy orchestrator (no Gemini, no sagas)."""
+    with get_orchestrator.override(MagicMock()):
+        yield
 
 @pytest.fixture
 def client():
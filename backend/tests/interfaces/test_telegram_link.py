@@ -6,13 +6,18 @@ from unittest.mock import MagicMock, patch
 import pytest
 from fastapi.testclient import TestClient
 
-# Patch UserRepository and OrchestratorAgent before importing FastAPI app
-with patch("agentic_traveler.interfaces.routers.telegram.UserRepository"), \
-     patch("agentic_traveler.interfaces.routers.telegram.OrchestratorAgent"):
+# Patch UserRepository before importing FastAPI app
+with patch("agentic_traveler.interfaces.routers.telegram.UserRepository"):
     from agentic_traveler.interfaces.main import app
     import agentic_traveler.interfaces.routers.telegram as telegram_router
     telegram_router.FRONTEND_ORIGIN = "http://localhost:3000"
 
+@pytest.fixture(autouse=True)
+def _no_orchestrator():
+    """Serve a mock from the router's lazy orchestrator (no Gemini, no sagas)."""
+    with telegram_router.get_orchestrator.override(MagicMock()):
+        yield
+
 @pytest.fixture
 def client():
     """FastAPI test client."""
@@ -53,7 +58,7 @@ def start_unlinked_update():
 @patch("agentic_traveler.interfaces.routers.telegram.get_user_tool")
 def test_unlinked_user_is_blocked(mock_tool, mock_send, client, unlinked_update):
     # Simulate that user is not found in database
-    mock_tool.return_value.get_user_by_telegram_id.return_value = None
+    mock_tool.return_value.get_user_ref_by_telegram_id.return_value = None
 
     resp = client.post(
         "/webhook/test-secret",
@@ -74,7 +79,7 @@ def test_unlinked_user_is_blocked(mock_tool, mock_send, client, unlinked_update)
 @patch("agentic_traveler.interfaces.routers.telegram.get_user_tool")
 def test_unlinked_user_start_is_blocked(mock_tool, mock_send, client, start_unlinked_update):
     # Simulate that user is not found in database
-    mock_tool.return_value.get_user_by_telegram_id.return_value = None
+    mock_tool.return_value.get_user_ref_by_telegram_id.return_value = None
 
     resp = client.post(
         "/webhook/test-secret",
@@ -1,17 +1,23 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
 # Patch heavy dependencies before importing the main module
-with patch("agentic_traveler.interfaces.routers.telegram.UserRepository"), \
-     patch("agentic_traveler.interfaces.routers.telegram.OrchestratorAgent"):
+with patch("agentic_traveler.interfaces.routers.telegram.UserRepository"):
     from agentic_traveler.interfaces.main import app
     from agentic_traveler.interfaces.routers.telegram import (
-        _is_rate_limited, _user_timestamps, _rate_lock,
+        _is_rate_limited, _user_timestamps, _rate_lock, get_orchestrator,
     )
 
 
+@pytest.fixture(autouse=True)
+def _no_orchestrator():
+    """Serve a mock from the router's lazy orchestrator (no Gemini, no sagas)."""
+    with get_orchestrator.override(MagicMock()):
+        yield
+
+
 @pytest.fixture
 def client():
     """FastAPI test client."""
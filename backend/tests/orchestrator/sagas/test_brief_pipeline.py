@@ -0,0 +1,161 @@
+"""Background destination brief pipeline tests. Gemini mocked per TESTING_STRATEGY.md."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from agentic_traveler.orchestrator.event_emitter import EventEmitter
+from agentic_traveler.orchestrator.sagas import brief_pipeline
+from agentic_traveler.tools import brief_cache
+
+_GEN = "agentic_traveler.orchestrator.sagas.destination_brief.gemini_generate"
+_MERGE = "agentic_traveler.tools.trip_repo.TripRepository.merge_discovery"
+
+_VALID = (
+    '{"destination": "Kyoto, Japan",'
+    ' "best_windows": [{"months": ["NOV"], "why": "maple light on temple moss"}],'
+    ' "avoid_windows": [], "signature_experiences": ["Fushimi Inari at dawn"],'
+    ' "fit_hooks": ["temple-hopper", "food-led", "walkable"]}'
+)
+
+
+class _Resp:
+    def __init__(self, text):
+        self.text = text
+
+
+class _SlowModel:
+    def __init__(self, delay=0.1):
+        self.delay = delay
+        self.calls = 0
+        self.release = threading.Event()
+
+    def __call__(self, *_a, **_kw):
+        self.calls += 1
+        self.release.wait(timeout=self.delay)
+        return _Resp(_VALID)
+
+
+@pytest.fixture(autouse=True)
+def _isolated():
+    brief_cache.clear()
+    brief_pipeline.clear()
+    with patch.object(brief_cache, "_read", return_value=None), \
+         patch.object(brief_cache, "_write"), \
+         patch.object(EventEmitter, "flush_metrics"):
+        yield
+    brief_pipeline.wait_idle()
+    brief_pipeline.clear()
+    brief_cache.clear()
+
+
+def _trip(discovery=None):
+    return {
+        "id": "trip-1",
+        "destinations": [{"name": "Kyoto, Japan", "status": "confirmed"}],
+        "discovery": discovery or {},
+    }
+
+
+def _events(statuses=None):
+    return EventEmitter(
+        user_id="u1", trip_id="trip-1",
+        on_status=(statuses.append if statuses is not None else None),
+    )
+
+
+def test_cold_brief_does_not_block_the_turn_and_attaches_when_ready():
+    model = _SlowModel(delay=0.2)
+    statuses = []
+    with patch(_GEN, side_effect=model), patch(_MERGE, return_value=True) as merge:
+        t = time.perf_counter()
+        se = brief_pipeline.schedule_brief(object(), _trip({"vision": "x"}), {}, _events(statuses))
+        elapsed = time.perf_counter() - t
+        brief_pipeline.wait_idle()
+
+    assert se is None
+    assert elapsed < 0.1  # the model call did not run on the caller's thread
+    trip_id, user_id, patch_ = merge.call_args.args
+    assert (trip_id, user_id) == ("trip-1", "u1")
+    assert list(patch_) == ["destination_brief"]  # only the brief key — no clobbering
+    assert patch_["destination_brief"]["destination"] == "Kyoto, Japan"
+    assert statuses == [{"phase": "brief_ready", "trip_id": "trip-1", "destination": "Kyoto, Japan"}]
+
+
+def test_duplicate_turns_do_not_double_generate():
+    model = _SlowModel(delay=1.0)
+    with patch(_GEN, side_effect=model), patch(_MERGE, return_value=True) as merge:
+        for _ in range(5):
+            assert brief_pipeline.schedule_brief(object(), _trip(), {}, _events()) is None
+        model.release.set()
+        brief_pipeline.wait_idle()
+    assert model.calls == 1
+    assert merge.call_count == 1
+
+
+def test_warm_core_is_attached_in_the_same_turn():
+    with patch(_GEN, return_value=_Resp(_VALID)), patch(_MERGE, return_value=True):
+        brief_pipeline.schedule_brief(object(), _trip(), {}, _events())
+        brief_pipeline.wait_idle()
+
+    other_trip = dict(_trip(), id="trip-2")
+    events = _events()
+    with patch(_GEN) as gen:
+        se = brief_pipeline.schedule_brief(object(), other_trip, {}, events)
+    gen.assert_not_called()
+    assert se is not None and se.payload["id"] == "trip-2"
+    assert se.payload["discovery"]["destination_brief"]["destination"] == "Kyoto, Japan"
+    metric = [r for r in events._metric_buffer if r["event_name"] == "brief_captured"][0]
+    assert metric["payload"]["source"] == "memory"
+
+
+def test_unattached_result_is_handed_to_the_next_turn():
+    with patch(_GEN, return_value=_Resp(_VALID)), patch(_MERGE, return_value=False):
+        brief_pipeline.schedule_brief(object(), _trip(), {}, _events())
+        brief_pipeline.wait_idle()
+    brief_cache.clear()  # force the finished-job path, not the warm-core one
+
+    with patch(_GEN) as gen:
+        se = brief_pipeline.schedule_brief(object(), _trip(), {}, _events())
+    gen.assert_not_called()
+    assert se is not None
+    assert se.payload["discovery"]["destination_brief"]["destination"] == "Kyoto, Japan"
+
+
+def test_failed_job_is_retried_on_the_next_turn():
+    with patch(_GEN, return_value=_Resp("garbage")), patch(_MERGE) as merge:
+        brief_pipeline.schedule_brief(object(), _trip(), {}, _events())
+        brief_pipeline.wait_idle()
+    merge.assert_not_called()
+
+    with patch(_GEN, return_value=_Resp(_VALID)) as gen, patch(_MERGE, return_value=True):
+        brief_pipeline.schedule_brief(object(), _trip(), {}, _events())
+        brief_pipeline.wait_idle()
+    assert gen.call_count == 1
+
+
+def test_finished_jobs_leave_the_table():
+    with patch(_GEN, return_value=_Resp("garbage")), patch(_MERGE):
+        brief_pipeline.schedule_brief(object(), _trip(), {}, _events())
+        brief_pipeline.wait_idle()
+    with patch(_GEN, return_value=_Resp(_VALID)), patch(_MERGE, return_value=True):
+        brief_pipeline.schedule_brief(object(), dict(_trip(), id="trip-2"), {}, _events())
+        brief_pipeline.wait_idle()
+    assert brief_pipeline._jobs == {}
+
+
+def test_unclaimed_result_expires():
+    with patch(_GEN, return_value=_Resp(_VALID)), patch(_MERGE, return_value=False), \
+         patch.object(brief_pipeline, "_UNCLAIMED_TTL_S", -1):
+        brief_pipeline.schedule_brief(object(), _trip(), {}, _events())
+        brief_pipeline.wait_idle()
+    assert brief_pipeline._jobs == {}
+
+
+def test_existing_brief_for_destination_is_a_no_op():
+    trip = _trip({"destination_brief": {"destination": "Kyoto, Japan"}})
+    with patch(_GEN) as gen:
+        assert brief_pipeline.schedule_brief(object(), trip, {}, _events()) is None
+    gen.assert_not_called()
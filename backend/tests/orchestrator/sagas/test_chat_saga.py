@@ -13,7 +13,7 @@ def saga():
     s._chat_agent = MagicMock()
     s._chat_agent.process_request.return_value = {
         "text": "Hello, how can I help?",
-        "_raw_response": None, "_latency_ms": 1.0, "_search_responses": []
+        "_artifacts": None, "_latency_ms": 1.0
     }
     return s
 
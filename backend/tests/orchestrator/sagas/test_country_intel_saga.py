@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from agentic_traveler.orchestrator.event_emitter import EventEmitter
 from agentic_traveler.orchestrator.sagas.country_intel import CountryIntelSaga
@@ -94,16 +94,14 @@ def test_owner_run_acknowledges_refresh_and_never_returns_fallback():
     """AC-2: an owned intel turn fires the async refresh and returns the
     'I'll check the latest facts for <name>' ack — not the static fallback."""
     saga = CountryIntelSaga(client=None)
-    # Replace the async fetch so no real thread/LLM/DB work runs (and no
-    # un-awaited-coroutine warning pollutes the test output).
-    saga._run_fetch_async = MagicMock(return_value=None)
     state = {"activation_mode": "owner"}
-    with patch("agentic_traveler.orchestrator.sagas.country_intel.threading.Thread") as MockThread:
+    # Replace the coordinator so no real worker/LLM/DB work runs.
+    with patch("agentic_traveler.orchestrator.sagas.country_intel.intel_refresh.request_refresh") as req:
         result = saga.run(
             "do I need a visa for Japan?", {"id": "u1"}, _confirmed_trip(),
             state, {}, _events(),
         )
-    MockThread.assert_called_once()          # a refresh was queued
+    req.assert_called_once_with("t1", "u1", "JP", "Kyoto", "any month")  # a refresh was queued
     assert "Kyoto" in result.text
     assert result.text != _FALLBACK
     assert "I can look up travel facts" not in result.text
@@ -1,12 +1,17 @@
 """Destination brief tests (task 45). Gemini mocked per TESTING_STRATEGY.md."""
 
+import time
 from unittest.mock import patch
 
+import pytest
+
 from agentic_traveler.orchestrator.event_emitter import EventEmitter
 from agentic_traveler.orchestrator.sagas.destination_brief import (
     capture_destination_brief,
     ensure_brief,
+    personalize_brief,
 )
+from agentic_traveler.tools import brief_cache
 
 _VALID = (
     '{"destination": "Taormina, Sicily",'
@@ -40,6 +45,18 @@ def _trip(dest_name="Taormina, Sicily", discovery=None, status="confirmed"):
     }
 
 
+@pytest.fixture(autouse=True)
+def _fresh_brief_cache():
+    """Isolate the shared core cache; the table tier is an in-memory dict."""
+    store = {}
+    brief_cache.clear()
+    with patch.object(brief_cache, "_read", side_effect=lambda k, m: store.get((k, m))), \
+         patch.object(brief_cache, "_write",
+                      side_effect=lambda k, m, _d, b: store.__setitem__((k, m), b)):
+        yield store
+    brief_cache.clear()
+
+
 # ── capture ──────────────────────────────────────────────────────────────────
 
 def test_capture_happy_path():
@@ -83,8 +100,8 @@ def test_ensure_brief_captures_and_writes_into_discovery():
     assert se is not None and se.kind == "trip_patch"
     disc = se.payload["discovery"]
     assert disc["destination_brief"]["destination"] == "Taormina, Sicily"
-    # Merge, not replace — sibling discovery keys survive.
-    assert disc["vision_summary"] == "x"
+    # A key delta for merge_discovery — sibling keys are not rewritten.
+    assert set(disc) == {"destination_brief"}
     ok = [r for r in events._metric_buffer if r["event_name"] == "brief_captured"]
     assert ok and ok[0]["payload"]["ok"] is True
 
@@ -126,3 +143,77 @@ def test_ensure_brief_capture_failure_emits_not_ok_and_no_side_effect():
     assert se is None
     rows = [r for r in events._metric_buffer if r["event_name"] == "brief_captured"]
     assert rows and rows[0]["payload"]["ok"] is False
+
+
+# ── shared core + personalisation ─────────────────────────────────
+
+_GEN = "agentic_traveler.orchestrator.sagas.destination_brief.gemini_generate"
+
+
+def _user(*tags, summary=""):
+    return {"user_profile": {"summary": summary, "profile_data": {"tags": list(tags)}}}
+
+
+def test_core_is_generated_once_and_shared_across_users():
+    with patch(_GEN, return_value=_Resp(_VALID)) as gen:
+        a = capture_destination_brief(object(), "Taormina, Sicily", _user("Foodie"), month="JUN")
+        b = capture_destination_brief(object(), "taormina,  sicily", _user("walking tours"), month="JUN")
+    assert gen.call_count == 1
+    assert a["best_windows"] == b["best_windows"]
+    assert a["fit_hooks"][0] == "food-led"
+    assert b["fit_hooks"][0] == "walkable"
+
+
+def test_core_is_keyed_by_travel_month():
+    with patch(_GEN, return_value=_Resp(_VALID)) as gen:
+        capture_destination_brief(object(), "Taormina, Sicily", {}, month="JUN")
+        capture_destination_brief(object(), "Taormina, Sicily", {}, month="DEC")
+    assert gen.call_count == 2
+    assert "<travel_month>DEC</travel_month>" in gen.call_args.kwargs["contents"]
+
+
+def test_core_prompt_carries_no_profile():
+    with patch(_GEN, return_value=_Resp(_VALID)) as gen:
+        capture_destination_brief(object(), "Taormina, Sicily", _user("Secret-tag"), month="JUN")
+    assert "Secret" not in gen.call_args.kwargs["contents"]
+
+
+def test_store_tier_serves_other_instances(_fresh_brief_cache):
+    with patch(_GEN, return_value=_Resp(_VALID)):
+        capture_destination_brief(object(), "Taormina, Sicily", {}, month="JUN")
+    brief_cache.clear()  # a fresh process: memory tier empty, table row present
+    events = _events()
+    with patch(_GEN) as gen:
+        se = ensure_brief(object(), _trip(discovery={"timeframe": {"start_date": "2099-06-10"}}), {}, events)
+    gen.assert_not_called()
+    assert se is not None
+    rows = [r for r in events._metric_buffer if r["event_name"] == "brief_captured"]
+    assert rows[0]["payload"]["source"] == "store"
+
+
+def test_personalize_keeps_core_order_without_profile_signal_and_trims():
+    core = {"fit_hooks": [f"hook-{i}" for i in range(9)]}
+    out = personalize_brief(core, {})
+    assert out["fit_hooks"] == [f"hook-{i}" for i in range(6)]
+    assert len(core["fit_hooks"]) == 9
+
+
+def test_planning_latency_cold_vs_warm_cache():
+    """The brief step of a planning turn: a model call cold, a lookup warm."""
+    def slow(*_a, **_kw):
+        time.sleep(0.05)
+        return _Resp(_VALID)
+
+    latencies = {}
+    with patch(_GEN, side_effect=slow):
+        for label in ("cold", "warm"):
+            events = _events()
+            t = time.perf_counter()
+            se = ensure_brief(object(), _trip(), _user("hiker"), events)
+            latencies[label] = time.perf_counter() - t
+            assert se is not None
+            source = [r for r in events._metric_buffer
+                      if r["event_name"] == "brief_captured"][0]["payload"]["source"]
+            assert source == ("model" if label == "cold" else "memory")
+    assert latencies["cold"] >= 0.05
+    assert latencies["warm"] < latencies["cold"] / 5
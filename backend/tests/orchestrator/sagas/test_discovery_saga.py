@@ -13,7 +13,7 @@ def saga():
     s._trip_agent = MagicMock()
     s._trip_agent.process_request.return_value = {
         "text": "How about Japan?",
-        "_raw_response": None, "_latency_ms": 1.0, "_search_responses": []
+        "_artifacts": None, "_latency_ms": 1.0
     }
     return s
 
@@ -0,0 +1,119 @@
+"""Country intel refresh coordinator tests. LLM fetch + DB mocked per TESTING_STRATEGY.md."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agentic_traveler.orchestrator.sagas import intel_refresh
+
+_MOD = "agentic_traveler.orchestrator.sagas.intel_refresh"
+
+
+@pytest.fixture
+def upstream():
+    """Slow fake fetch + repos; records every upstream fetch and metric."""
+    calls = []
+    gate = threading.Event()
+
+    def fetch(iso, name, month):
+        calls.append(iso)
+        gate.wait(timeout=2)
+        return {"iso_country": iso, "_token_records": []}
+
+    users = MagicMock()
+    users.get_user_by_id.return_value = {"id": "u1", "credits": {"balance": 10}}
+    intel_refresh.reset()
+    with patch(f"{_MOD}.fetch_country_intel", side_effect=fetch), \
+         patch(f"{_MOD}.UserRepository", return_value=users), \
+         patch(f"{_MOD}.credit_manager.has_credits", return_value=True), \
+         patch(f"{_MOD}.TripRepository") as trips, \
+         patch(f"{_MOD}.emit_metric_now") as metric:
+        yield {"calls": calls, "gate": gate, "trips": trips.return_value, "metric": metric}
+    gate.set()
+    intel_refresh.reset()
+
+
+def test_twenty_concurrent_refreshes_make_one_upstream_fetch(upstream):
+    def fire(_):
+        return intel_refresh.request_refresh("trip-1", "u1", "jp", "Japan", "May")
+
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        results = list(pool.map(fire, range(20)))
+    upstream["gate"].set()
+    assert {fut.result(timeout=5) for _, fut in results} == {"ok"}
+
+    assert upstream["calls"] == ["JP"]
+    outcomes = [outcome for outcome, _ in results]
+    assert outcomes.count(intel_refresh.ENQUEUED) == 1
+    assert outcomes.count(intel_refresh.IN_FLIGHT) == 19
+    upstream["trips"].upsert_country_intel.assert_called_once()
+
+
+def test_cooldown_blocks_a_repeat_but_not_another_country(upstream):
+    upstream["gate"].set()
+    _, fut = intel_refresh.request_refresh("trip-1", "u1", "JP", "Japan", "May")
+    fut.result(timeout=5)
+
+    outcome, fut = intel_refresh.request_refresh("trip-1", "u1", "JP", "Japan", "May")
+    assert outcome == intel_refresh.COOLDOWN and fut.result() == intel_refresh.COOLDOWN
+    assert 0 < intel_refresh.cooldown_remaining("trip-1", "JP") <= intel_refresh.COOLDOWN_S
+
+    outcome, fut = intel_refresh.request_refresh("trip-1", "u1", "IT", "Italy", "May")
+    assert outcome == intel_refresh.ENQUEUED
+    fut.result(timeout=5)
+    assert upstream["calls"] == ["JP", "IT"]
+
+    with patch.object(intel_refresh, "COOLDOWN_S", 0):
+        outcome, fut = intel_refresh.request_refresh("trip-1", "u1", "JP", "Japan", "May")
+        fut.result(timeout=5)
+    assert outcome == intel_refresh.ENQUEUED
+
+
+def test_expired_cooldowns_are_pruned(upstream):
+    upstream["gate"].set()
+    intel_refresh._last_done[("trip-old", "FR")] = time.time() - intel_refresh.COOLDOWN_S - 1
+    _, fut = intel_refresh.request_refresh("trip-1", "u1", "JP", "Japan", "May")
+    fut.result(timeout=5)
+    assert set(intel_refresh._last_done) == {("trip-1", "JP")}
+
+
+def test_outcome_and_timing_are_recorded(upstream):
+    upstream["gate"].set()
+    _, fut = intel_refresh.request_refresh("trip-1", "u1", "JP", "Japan", "May")
+    fut.result(timeout=5)
+    name = upstream["metric"].call_args.args[0]
+    kwargs = upstream["metric"].call_args.kwargs
+    assert name == "country_intel_fetched"
+    assert kwargs["trip_id"] == "trip-1" and kwargs["user_id"] == "u1"
+    assert kwargs["payload"]["outcome"] == "ok"
+    assert kwargs["payload"]["latency_ms"] >= 0
+
+
+def test_failed_fetch_records_error_and_allows_retry(upstream):
+    with patch(f"{_MOD}.fetch_country_intel", side_effect=RuntimeError("LLM down")):
+        _, fut = intel_refresh.request_refresh("trip-1", "u1", "JP", "Japan", "May")
+        assert fut.result(timeout=5) == "failed"
+    assert upstream["metric"].call_args.args[0] == "error_raised"
+
+    upstream["gate"].set()
+    outcome, fut = intel_refresh.request_refresh("trip-1", "u1", "JP", "Japan", "May")
+    assert outcome == intel_refresh.ENQUEUED and fut.result(timeout=5) == "ok"
+
+
+def test_no_credits_skips_fetch(upstream):
+    with patch(f"{_MOD}.credit_manager.has_credits", return_value=False):
+        _, fut = intel_refresh.request_refresh("trip-1", "u1", "JP", "Japan", "May")
+        assert fut.result(timeout=5) == "no_credits"
+    assert upstream["calls"] == []
+
+
+def test_refresh_never_blocks_the_caller(upstream):
+    t = time.perf_counter()
+    _, fut = intel_refresh.request_refresh("trip-2", "u1", "JP", "Japan", "May")
+    assert time.perf_counter() - t < 0.5
+    assert not fut.done()
+    upstream["gate"].set()
+    assert fut.result(timeout=5) == "ok"
@@ -16,11 +16,11 @@ def saga():
     s._trip_agent = MagicMock()
     s._planner.process_request.return_value = {
         "text": "Here is your day-by-day plan.",
-        "_raw_response": None, "_latency_ms": 1.0, "_search_responses": [],
+        "_artifacts": None, "_latency_ms": 1.0,
     }
     s._trip_agent.process_request.return_value = {
         "text": "Some destination ideas.",
-        "_raw_response": None, "_latency_ms": 1.0, "_search_responses": [],
+        "_artifacts": None, "_latency_ms": 1.0,
     }
     return s
 
@@ -15,8 +15,8 @@ from agentic_traveler.orchestrator.sagas.planning import (
     PlanningSaga,
     slot_selection_to_side_effect,
     slot_values_to_side_effect,
-    ui_block_from_wire,
 )
+from agentic_traveler.orchestrator.sagas.slot_ui import ui_block_from_wire
 
 _EXTRACT = "agentic_traveler.orchestrator.sagas.planning.extract_trip_slots"
 
@@ -30,11 +30,11 @@ def saga():
     s._trip_agent = MagicMock()
     s._planner.process_request.return_value = {
         "text": "Here is your day-by-day plan.",
-        "_raw_response": None, "_latency_ms": 1.0, "_search_responses": [],
+        "_artifacts": None, "_latency_ms": 1.0,
     }
     s._trip_agent.process_request.return_value = {
         "text": "Some destination ideas.",
-        "_raw_response": None, "_latency_ms": 1.0, "_search_responses": [],
+        "_artifacts": None, "_latency_ms": 1.0,
     }
     return s
 
@@ -618,7 +618,7 @@ from agentic_traveler.orchestrator.sagas.advisor_turn import AdvisorTurn  # noqa
 from agentic_traveler.orchestrator.sagas.planning import _dna_default_line  # noqa: E402
 
 _COMPOSE = "agentic_traveler.orchestrator.sagas.planning.compose_advisor_turn"
-_ENSURE = "agentic_traveler.orchestrator.sagas.planning.ensure_brief"
+_ENSURE = "agentic_traveler.orchestrator.sagas.planning.schedule_brief"
 
 
 def _trip_dest_no_timeframe():
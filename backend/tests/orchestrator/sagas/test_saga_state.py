@@ -3,9 +3,10 @@
 Mirrors the branch order of the SQL function. No DB / LLM.
 """
 
+import random
 from datetime import date, timedelta
 
-from agentic_traveler.orchestrator.sagas.saga_state import derive_saga_state_local
+from agentic_traveler.orchestrator.sagas.saga_state import derive_saga_state_local, saga_phase
 
 TODAY = date(2027, 6, 1)
 
@@ -105,3 +106,53 @@ def test_presence_semantics_empty_string_pace_still_counts():
         travelers={"count": 2},
     )
     assert derive_saga_state_local(trip, TODAY) == "DETAILING"
+
+
+def _random_trip(rng):
+    def day(lo, hi):
+        return str(TODAY + timedelta(days=rng.randint(lo, hi)))
+
+    timeframe = {}
+    if rng.random() < 0.7:
+        timeframe["start_date"] = day(-60, 30)
+    if rng.random() < 0.6:
+        timeframe["end_date"] = day(-50, 40)
+    return _trip(
+        discovery={"timeframe": timeframe} if timeframe else {},
+        destinations=[
+            {"name": f"d{i}", "status": rng.choice(["considering", "confirmed", "dropped"])}
+            for i in range(rng.randint(0, 3))
+        ],
+        bookings=[{"kind": "flight"}] * rng.randint(0, 1),
+        preferences=rng.choice([{}, {"pace": "slow", "structure": "loose", "budget_tier": "$$"}]),
+        travelers=rng.choice([{}, {"count": 2}]),
+    )
+
+
+def test_cached_phase_agrees_with_a_fresh_derivation():
+    # The column is what the trigger derived on the trip's last write, up to
+    # a few weeks ago; saga_phase must still agree with deriving today.
+    rng = random.Random(46)
+    for _ in range(2000):
+        trip = _random_trip(rng)
+        written = TODAY - timedelta(days=rng.randint(0, 40))
+        trip["saga_state"] = derive_saga_state_local(trip, written)
+        assert saga_phase(trip, TODAY) == derive_saga_state_local(trip, TODAY), trip
+
+
+def test_summary_returns_the_column_and_missing_cache_derives():
+    summary = {"id": "t1", "status": "dreaming", "saga_state": "ANCHORING"}
+    assert saga_phase(summary, TODAY) == "ANCHORING"
+
+    trip = _trip(destinations=[{"name": "Iceland", "status": "considering"}], saga_state=None)
+    assert saga_phase(trip, TODAY) == "SHAPING"
+    assert saga_phase(None, TODAY) == "DREAMING"
+
+
+def test_summary_timeframe_rechecks_date_phases():
+    summary = {
+        "id": "t1", "status": "dreaming", "saga_state": "ANCHORING",
+        "timeframe": {"start_date": str(TODAY - timedelta(days=1)),
+                      "end_date": str(TODAY + timedelta(days=3))},
+    }
+    assert saga_phase(summary, TODAY) == "LIVING"
@@ -0,0 +1,61 @@
+"""Tiered trip hydration (trip_access) and the projections sagas declare."""
+
+from unittest.mock import MagicMock, patch
+
+from agentic_traveler.orchestrator.sagas.dispatcher import SagaDispatcher
+from agentic_traveler.orchestrator.sagas.trip_access import TripAccess, trip_projection_of, widest
+
+_SUMMARY = {"id": "t1", "status": "dreaming", "saga_state": "LIVING", "destinations": []}
+
+
+def _repo():
+    repo = MagicMock()
+    repo.get_trip_core.return_value = {"id": "t1", "live_state": {"mood": "ok"}, "discovery": {}}
+    repo.get_trip.return_value.model_dump.return_value = {"id": "t1", "bookings": []}
+    return repo
+
+
+def test_upgrades_once_per_tier_and_reuses_the_core_row():
+    repo = _repo()
+    access = TripAccess(repo, dict(_SUMMARY), user_id="u1")
+
+    assert access.at("summary") is access.trip
+    core = access.at("core")
+    assert core["live_state"] == {"mood": "ok"} and core["saga_state"] == "LIVING"
+    access.at("core")
+    repo.get_trip_core.assert_called_once_with("t1")
+
+    assert access.at("full") == {"id": "t1", "bookings": []}
+    repo.get_trip.assert_called_once_with("t1", row=repo.get_trip_core.return_value)
+    assert access.projection == "full"
+
+
+def test_summary_straight_to_full_loads_the_whole_trip():
+    repo = _repo()
+    TripAccess(repo, dict(_SUMMARY)).at("full")
+    repo.get_trip.assert_called_once_with("t1")
+    repo.get_trip_core.assert_not_called()
+
+
+def test_vanished_trip_drops_the_users_index():
+    repo = _repo()
+    repo.get_trip_core.return_value = None
+    access = TripAccess(repo, dict(_SUMMARY), user_id="u1")
+    with patch("agentic_traveler.tools.trip_repo.invalidate_trip_index") as invalidate:
+        assert access.at("core") is None
+    invalidate.assert_called_once_with("u1")
+    assert access.covers("full")
+
+
+def test_no_trip_needs_no_hydration():
+    access = TripAccess(_repo(), None)
+    assert access.covers("full") and access.at("full") is None
+
+
+def test_registered_sagas_declare_a_projection():
+    declared = {s.name: trip_projection_of(s) for s in SagaDispatcher(client=MagicMock()).sagas}
+    assert declared["ChatSaga"] == declared["OffTopicSaga"] == "summary"
+    assert declared["MoodCheckinSaga"] == declared["JournalSaga"] == "core"
+    assert declared["PlanningSaga"] == "full"
+    assert trip_projection_of(object()) == "full"
+    assert widest(["summary", "core"]) == "core" and widest([]) == "summary"
@@ -68,9 +68,19 @@ def test_capture_appends_record_when_turn_active():
         "output_tokens": 60,
         "total_tokens": 180,
         "thinking_tokens": 0,
+        "cached_tokens": 0,
     }]
 
 
+def test_capture_records_cached_tokens():
+    """Context-cache hits are billed alongside input/output (bill_turn RPC)."""
+    records = begin_usage_capture()
+    response = _response()
+    response.usage_metadata.cached_content_token_count = 90
+    gemini_generate(_client(response), model="m", contents="x", config=None)
+    assert records[0]["cached_tokens"] == 90
+
+
 def test_no_capture_without_active_turn():
     """Default context (scripts, webhooks, background work) → silent no-op."""
     gemini_generate(
@@ -122,6 +132,7 @@ def test_stream_captures_usage_from_last_chunk():
         "output_tokens": 80,
         "total_tokens": 280,
         "thinking_tokens": 0,
+        "cached_tokens": 0,
     }]
 
 
@@ -215,4 +226,5 @@ def test_booking_parser_usage_is_captured():
         "output_tokens": 40,
         "total_tokens": 340,
         "thinking_tokens": 0,
+        "cached_tokens": 0,
     }]
@@ -0,0 +1,86 @@
+"""Per-turn ConversationContext: views, memoization and incremental append."""
+
+import contextvars
+from unittest.mock import MagicMock, patch
+
+from agentic_traveler.orchestrator import conversation_context
+from agentic_traveler.orchestrator.conversation_context import ConversationContext, estimate_tokens
+from agentic_traveler.orchestrator.conversation_manager import ConversationManager
+
+
+def _doc(summary="They want Kyoto in November.", n=6):
+    return {
+        "conversation_history": {
+            "summary": summary,
+            "recent_messages": [
+                {"role": "user" if i % 2 == 0 else "agent", "text": f"message {i}"}
+                for i in range(n)
+            ],
+        }
+    }
+
+
+def _in_new_turn(fn, *args):
+    return contextvars.copy_context().run(fn, *args)
+
+
+def test_views_match_the_historical_context_block():
+    ctx = ConversationContext.from_history(_doc(n=3)["conversation_history"])
+    assert ctx.render() == (
+        "Previous conversation summary:\nThey want Kyoto in November.\n\n"
+        "Recent messages:\nUser: message 0\nAgent: message 1\nUser: message 2"
+    )
+    assert ctx.render(max_messages=2) == "Recent messages:\nAgent: message 1\nUser: message 2"
+    assert ctx.render_summary() == "Previous conversation summary:\nThey want Kyoto in November."
+    assert ConversationContext().render() == ""
+
+
+def test_budget_view_keeps_newest_messages_and_summary_only_if_it_fits():
+    ctx = ConversationContext.from_history(_doc(summary="s" * 400, n=6)["conversation_history"])
+    per_msg = estimate_tokens("User: message 0")
+
+    two = ctx.render_budget(per_msg * 2)
+    assert two == "Recent messages:\nUser: message 4\nAgent: message 5"
+    assert "summary" not in two
+    with_summary = ctx.render_budget(per_msg * 6 + ctx.summary_tokens)
+    assert with_summary == ctx.render()
+    assert ctx.render_budget(per_msg * 2, include_summary=False) == two
+
+
+def test_context_is_built_once_per_turn_and_isolated_between_turns():
+    doc = _doc()
+
+    def turn():
+        first = conversation_context.context_for(doc)
+        ConversationManager().build_context_block(doc)
+        return first, conversation_context.context_for(doc)
+
+    a1, a2 = _in_new_turn(turn)
+    b1, _ = _in_new_turn(turn)
+    assert a1 is a2
+    assert a1 is not b1
+
+
+def test_append_extends_the_cached_rendering():
+    ctx = ConversationContext.from_history(_doc(n=2)["conversation_history"])
+    ctx.render()
+    ctx.render(max_messages=1)
+    with patch.object(ConversationContext, "_join", wraps=ConversationContext._join) as join:
+        ctx.append({"role": "user", "text": "and Osaka?"})
+        full = ctx.render()
+    join.assert_not_called()
+    assert full.endswith("Agent: message 1\nUser: and Osaka?")
+    assert ctx.render(max_messages=1) == "Recent messages:\nUser: and Osaka?"
+
+
+def test_append_and_save_keeps_the_turn_context_in_step():
+    doc = _doc(n=2)
+
+    def turn():
+        manager = ConversationManager()
+        manager.build_context_block(doc)
+        with patch("agentic_traveler.tools.db_client.get_db", return_value=MagicMock()):
+            manager.append_and_save(doc, "u1", "hi", "hello")
+        return manager.build_context_block(doc)
+
+    assert _in_new_turn(turn).endswith("User: hi\nAgent: hello")
@@ -190,6 +190,67 @@ def test_focused_trip_id_threads_into_resolution(mock_user_repo, patched_deps):
     assert resp["focus_trip_id"] == "focus-1"
 
 
+def _one_trip(deps):
+    sm = MagicMock()
+    sm.model_dump.return_value = {
+        "id": "trip-9", "status": "planning", "title": "Lisbon",
+        "saga_state": "REMEMBERING", "reference_date": None, "vision_summary": None,
+        "updated_at": "2027-01-01", "timeframe": None, "destinations": [],
+    }
+    deps["trip_repo"].return_value.list_trip_summaries.return_value = [sm]
+    return sm.model_dump.return_value
+
+
+def test_summary_owner_never_hydrates_the_trip(mock_user_repo, patched_deps):
+    """A Chat turn runs on the summary index row: no get_trip / get_trip_core,
+    and the trip_access metric reports what the turn fetched."""
+    mock_user_repo.get_user_by_id.return_value = {"user_name": "Alice"}
+    _route(patched_deps, intent="CHAT")
+    summary = _one_trip(patched_deps)
+    owner = _owner(patched_deps, "ChatSaga", "Hello!")
+    owner.trip_projection = "summary"
+
+    with patch("agentic_traveler.orchestrator.agent.EventEmitter") as mock_ee:
+        OrchestratorAgent(user_repo=mock_user_repo).process_request_for_user("user-1", "hi")
+
+    repo = patched_deps["trip_repo"].return_value
+    repo.list_trip_summaries.assert_called_once_with("user-1", cached=True)
+    repo.get_trip.assert_not_called()
+    repo.get_trip_core.assert_not_called()
+    assert owner.run.call_args.args[2] == summary
+    access = [
+        c.args[1] for c in mock_ee.return_value.emit.call_args_list
+        if c.args[:1] == ("metric",) and c.args[1].get("name") == "trip_access"
+    ]
+    assert access == [{"name": "trip_access", "projection": "summary",
+                       "index_hit": True, "queries": 0, "bytes": 0}]
+
+
+def test_selection_is_redone_on_the_hydrated_trip(mock_user_repo, patched_deps):
+    """A saga selected on the summary that declares ``core`` gets the core row,
+    and selection re-runs on it (here the owner changes once the row is read)."""
+    mock_user_repo.get_user_by_id.return_value = {"user_name": "Alice"}
+    _route(patched_deps, intent="CHAT")
+    _one_trip(patched_deps)
+    repo = patched_deps["trip_repo"].return_value
+    repo.get_trip_core.return_value = {"id": "trip-9", "journal": {"last_prompt_date": "today"}}
+    journal, chat = MagicMock(), MagicMock()
+    journal.name, journal.trip_projection = "JournalSaga", "core"
+    chat.name, chat.trip_projection = "ChatSaga", "summary"
+    chat.run.return_value = SagaResult(text="Hello!")
+    select = patched_deps["dispatcher"].return_value.select
+    select.side_effect = [(journal, []), (chat, [journal])]
+
+    OrchestratorAgent(user_repo=mock_user_repo).process_request_for_user("user-1", "hi")
+
+    assert select.call_count == 2
+    assert select.call_args_list[1].args[2]["journal"] == {"last_prompt_date": "today"}
+    repo.get_trip_core.assert_called_once_with("trip-9")
+    repo.get_trip.assert_not_called()
+    journal.run.assert_called_once()
+    chat.run.assert_called_once()
+
+
 # ---------------------------------------------------------------------------
 # task 43 — selection entrypoint (deterministic tap, no router/extraction)
 # ---------------------------------------------------------------------------
@@ -254,6 +315,29 @@ def test_web_selection_illegal_value_is_rejected_no_write(mock_user_repo, patche
     assert resp["slot_request"]["slot"] == "pace"
 
 
+def test_new_destinations_are_geocoded_after_the_turn(mock_user_repo, patched_deps):
+    """destination_upsert rows written without coords are handed to the
+    deferred geocoder in one batch per trip; rows with coords are not."""
+    from agentic_traveler.orchestrator.sagas.base import SideEffect
+    from agentic_traveler.tools.trip_repo import TripDestination
+
+    rows = iter([
+        TripDestination(id="d1", trip_id="trip-1", name="Kyoto"),
+        TripDestination(id="d2", trip_id="trip-1", name="Osaka"),
+        TripDestination(id="d3", trip_id="trip-1", name="Nara", coords={"lat": 1}),
+    ])
+    patched_deps["trip_repo"].return_value.apply_side_effect.side_effect = lambda *_a: next(rows)
+    agent = OrchestratorAgent(user_repo=mock_user_repo)
+    effects = [
+        SideEffect("destination_upsert", {"trip_id": "trip-1", "name": "Kyoto"}),
+        SideEffect("destination_upsert", {"trip_id": "trip-1", "name": "Osaka"}),
+        SideEffect("destination_upsert", {"trip_id": "trip-1", "name": "Nara", "coords": {"lat": 1}}),
+    ]
+    with patch("agentic_traveler.orchestrator.agent.geocode_queue.enqueue") as enqueue:
+        agent._apply_side_effects("user-1", effects)
+    enqueue.assert_called_once_with("trip-1", [("d1", "Kyoto"), ("d2", "Osaka")])
+
+
 # ---------------------------------------------------------------------------
 # task 51 — global LLM cost deduction (contextvar funnel)
 # ---------------------------------------------------------------------------
@@ -302,6 +386,41 @@ def test_turn_bills_usage_captured_by_nested_calls(mock_user_repo, patched_deps)
     )
 
 
+def test_overlapping_router_and_extractor_both_run(mock_user_repo, patched_deps):
+    """The router and the slot extractor overlap on two threads; each needs
+    its own copied context, or the second raises "already entered" and the
+    prefetched slots are silently lost (E3 fallback)."""
+    import threading
+
+    mock_user_repo.get_user_with_ref.return_value = ({"user_name": "Alice"}, "user-id-123")
+    both_running = threading.Barrier(2, timeout=2)
+    result = {
+        "intent": "PLAN", "preference_raw": None, "response": None,
+        "entities": {}, "raw_response": None, "latency_ms": 1,
+    }
+
+    def classify(**_kw):
+        both_running.wait()
+        return result
+
+    def extract(*_a, **_kw):
+        both_running.wait()
+        return {"pace": "slow"}
+
+    patched_deps["router"].return_value.classify.side_effect = classify
+    owner = MagicMock()
+    owner.name = "PlanningSaga"
+    owner.run.return_value = SagaResult(text="Noted.")
+    patched_deps["dispatcher"].return_value.select.return_value = (owner, [])
+
+    with patch("agentic_traveler.orchestrator.sagas.slot_extractor.extract_trip_slots",
+               side_effect=extract):
+        OrchestratorAgent(user_repo=mock_user_repo).process_request("123", "slow please")
+
+    state = patched_deps["dispatcher"].return_value.select.call_args.args[3]
+    assert state["prefetched_slots"] == {"pace": "slow"}
+
+
 def test_error_turn_is_not_billed_even_with_captured_usage(mock_user_repo, patched_deps):
     """AC-2: LLM calls happened, but the turn failed — credits stay put."""
     from types import SimpleNamespace
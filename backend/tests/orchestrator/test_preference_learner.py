@@ -77,14 +77,17 @@ def test_save_scalar_field_via_raw_pref(mock_bill, mock_log, mock_update, mock_g
 
     # Check database calls
     mock_db.table.assert_any_call("user_profiles")
-    mock_query.upsert.assert_called_once_with({
-        "user_id": "user-uuid-123",
+    # Versioned write of the patched row (profile patch queue)
+    mock_query.update.assert_called_once_with({
         "profile_data": {
             "trip_vibe": ["Adventure", "Nature"],
             "budget_priority": "luxury",
         },
         "summary": "Likes luxury."
     })
+    mock_query.update.return_value.eq.assert_called_once_with("user_id", "user-uuid-123")
+    mock_query.update.return_value.eq.return_value.eq.assert_called_once_with("version", 0)
+    mock_query.upsert.assert_not_called()
 
     # Since token_records is None, check immediate billing
     mock_bill.assert_called_once_with(
@@ -157,8 +160,7 @@ def test_save_list_field_merges_via_raw_pref(mock_bill, mock_log, mock_update, m
         }
     )
 
-    mock_query.upsert.assert_called_once_with({
-        "user_id": "user-uuid-123",
+    mock_query.update.assert_called_once_with({
         "profile_data": {
             "trip_vibe": ["Adventure", "Nature", "Beach"],
             "budget_priority": "mid-range",
@@ -225,3 +227,26 @@ def test_save_with_token_records_accumulates(mock_bill, mock_log, mock_update, m
 
     # Bypasses immediate billing
     mock_bill.assert_not_called()
+
+
+@patch("agentic_traveler.tools.db_client.get_db")
+@patch("agentic_traveler.tools.profile_patch_queue.enqueue")
+@patch("agentic_traveler.orchestrator.profile_agent.ProfileAgent.update_profile")
+def test_fallback_profile_does_not_write_the_version(mock_update, mock_enqueue, mock_get_db):
+    """No user_profiles row yet: the user_doc fallback must not queue user_profiles.version."""
+    from agentic_traveler.tools.user_repo import _assemble_user_doc
+
+    mock_get_db.return_value.table.return_value.select.return_value.eq.return_value \
+        .maybe_single.return_value.execute.return_value = None
+    mock_update.return_value = ({"budget_priority": "luxury"}, None, 0.0)
+    user_doc = _assemble_user_doc({
+        "id": "user-uuid-123",
+        "user_profiles": {"profile_data": {}, "version": 3},
+    })
+    user_doc["user_profile"]["budget_priority"] = "mid-range"  # legacy flat key
+
+    ProfileAgent().save_preference("I prefer luxury budget", user_doc, "user-uuid-123", _sync=True)
+
+    ops = mock_enqueue.call_args.args[1]
+    assert {"op": "add", "path": "/profile_data/budget_priority", "value": "luxury"} in ops
+    assert not any(op["path"].endswith("/version") for op in ops)
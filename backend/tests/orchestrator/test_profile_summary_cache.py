@@ -0,0 +1,101 @@
+"""Rendered profile summaries cached per user and user_profiles.version."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agentic_traveler.orchestrator import profile_utils
+from agentic_traveler.orchestrator.profile_utils import (
+    build_profile_summary,
+    invalidate_profile_summary,
+    profile_summary_stats,
+)
+from agentic_traveler.orchestrator.profile_write import apply_profile_patch
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    profile_utils.clear_profile_summary_cache()
+    yield
+    profile_utils.clear_profile_summary_cache()
+
+
+def _doc(version=3, pace="slow", user_id="u1"):
+    data = {
+        "personality_dimensions_scores": {"social_energy": 0.9, "structure_preference": 0.1},
+        "pace": pace,
+        "dietary": "vegetarian",
+    }
+    return {
+        "id": user_id,
+        "name": "Ana",
+        "user_profile": {"profile_data": data, "summary": "Slow traveller.", **data},
+        "profile_version": version,
+    }
+
+
+def _counting():
+    return patch.object(
+        profile_utils, "_render_profile_summary", wraps=profile_utils._render_profile_summary
+    )
+
+
+def test_same_version_renders_once_across_docs_and_agents():
+    with _counting() as render:
+        first = build_profile_summary(_doc())
+        again = build_profile_summary(_doc())  # next turn: fresh doc, same version
+        slim = build_profile_summary(_doc(), include_scores=False)
+        build_profile_summary(_doc(), include_scores=False)
+    assert first == again
+    assert "version" not in first and "pace: slow" in first
+    assert "Personality" not in slim
+    assert render.call_count == 2
+    assert profile_summary_stats()["hits"] == 2
+
+
+def test_version_bump_and_invalidation_rerender():
+    build_profile_summary(_doc())
+    assert "pace: fast" in build_profile_summary(_doc(version=4, pace="fast"))
+
+    with _counting() as render:
+        invalidate_profile_summary("u1")
+        build_profile_summary(_doc(version=4, pace="fast"))
+    assert render.call_count == 1
+
+
+def test_doc_without_version_is_rendered_uncached():
+    doc = _doc()
+    del doc["profile_version"]
+    with _counting() as render:
+        assert build_profile_summary(doc) == build_profile_summary(_doc())
+        build_profile_summary(doc)
+    assert render.call_count == 3
+    assert profile_summary_stats()["uncached"] == 2
+
+
+def test_dimensions_restrict_scores_and_preferences():
+    slim = build_profile_summary(_doc(), dimensions={"social_energy", "pace"})
+    assert "social_energy (0.9)" in slim and "structure_preference" not in slim
+    assert "pace: slow" in slim and "dietary" not in slim
+    assert "dietary" in build_profile_summary(_doc())
+
+
+def test_apply_profile_patch_invalidates_the_user():
+    with _counting() as render:
+        build_profile_summary(_doc())
+        apply_profile_patch("u1", {"qid": "pace", "value": "fast"}, repo=MagicMock())
+        build_profile_summary(_doc())
+    assert render.call_count == 2
+
+
+def test_profile_version_stays_out_of_preferences():
+    from agentic_traveler.tools.user_repo import _assemble_user_doc
+
+    doc = _assemble_user_doc({
+        "id": "u1", "name": "Ana",
+        "user_profiles": {"profile_data": {"pace": "slow"}, "summary": "", "version": 3},
+    })
+    assert doc["profile_version"] == 3
+    assert "version" not in doc["user_profile"]
+    summary = build_profile_summary(doc)
+    assert "pace: slow" in summary and "version" not in summary
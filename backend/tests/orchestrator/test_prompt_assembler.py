@@ -0,0 +1,104 @@
+"""Token-budgeted prompt assembly (prompt_assembler + budget_policy.resolve_prompt)."""
+
+import contextvars
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from agentic_traveler.core.budget_policy import resolve_prompt
+from agentic_traveler.orchestrator import conversation_context
+from agentic_traveler.orchestrator.client_factory import begin_usage_capture, current_turn_usage, gemini_generate
+from agentic_traveler.orchestrator.conversation_context import estimate_tokens
+from agentic_traveler.orchestrator.event_emitter import EventEmitter
+from agentic_traveler.orchestrator.prompt_assembler import Section, agent_prompt, assemble
+
+
+def _history(n, text="x" * 200):
+    return "Recent messages:\n" + "\n".join(f"User: {i} {text}" for i in range(n))
+
+
+def test_within_budget_prompt_is_unchanged():
+    prompt = agent_prompt(
+        "chat_ack", current_time="Mon 10:00", profile_summary="Likes food.",
+        conversation_context="Recent messages:\nUser: hi", message="Kyoto?",
+        pref_note="\n<preference_updated>\nlikes trains\n</preference_updated>\n",
+    )
+    assert prompt.text == (
+        "<current_time>Mon 10:00</current_time>\n"
+        "<user_profile_summary>\nLikes food.\n</user_profile_summary>\n"
+        "<conversation_history>\nRecent messages:\nUser: hi\n</conversation_history>\n"
+        "\n<preference_updated>\nlikes trains\n</preference_updated>\n"
+        "<user_message>\nKyoto?\n</user_message>"
+    )
+    assert prompt.truncated == []
+    assert set(prompt.sections) == {
+        "current_time", "user_profile_summary", "conversation_history", "preference_updated", "user_message",
+    }
+
+
+def test_section_cap_keeps_the_newest_history_lines():
+    _, cap = resolve_prompt("chat_ack").section("conversation_history")
+    history = _history(200)
+    prompt = agent_prompt("chat_ack", current_time="t", profile_summary="p",
+                          conversation_context=history, message="m")
+
+    assert prompt.truncated == ["conversation_history"]
+    assert prompt.sections["conversation_history"] <= cap
+    assert "User: 199 " in prompt.text and "User: 0 " not in prompt.text
+
+
+def test_lowest_priority_section_shrinks_first_and_message_is_pinned():
+    budget = resolve_prompt("router")
+    message = "m" * 4000  # ~1000 tokens, pinned
+    prompt = assemble("router", [
+        Section("header", "Current Time: t\n"),
+        Section("known_preferences", "p" * 2000, "Known Preferences: {}\n\n"),
+        Section("conversation_history", _history(20), "Conversation History:\n{}\n\n", keep="tail"),
+        Section("user_message", message, "LATEST USER MESSAGE:\n{}\n"),
+    ])
+
+    assert prompt.tokens <= budget.total_tokens
+    assert message in prompt.text
+    assert prompt.sections["known_preferences"] == estimate_tokens("p" * 2000)  # untouched
+    assert prompt.truncated == ["conversation_history"]
+
+
+def test_memoized_history_shrinks_by_whole_messages():
+    doc = {"conversation_history": {
+        "summary": "s" * 16000,
+        "recent_messages": [{"role": "user", "text": f"{i} " + "y" * 400} for i in range(10)],
+    }}
+
+    def turn():
+        history = conversation_context.context_for(doc).render()
+        return agent_prompt("chat_ack", current_time="t", profile_summary="p",
+                            conversation_context=history, message="m")
+
+    prompt = contextvars.copy_context().run(turn)
+    assert "Previous conversation summary" not in prompt.text
+    assert "…" not in prompt.text
+    assert "User: 9 " in prompt.text
+
+
+def test_prompt_report_lands_in_llm_call_usage():
+    prompt = agent_prompt("trip_companion", current_time="t", profile_summary="p",
+                          conversation_context="h", message="m")
+    response = SimpleNamespace(
+        usage_metadata=SimpleNamespace(prompt_token_count=10, candidates_token_count=5),
+        candidates=[SimpleNamespace(grounding_metadata=None)], text="ok",
+    )
+    client = MagicMock()
+    client.models.generate_content.return_value = response
+    events = EventEmitter(user_id="u1", trip_id=None)
+
+    begin_usage_capture()
+    try:
+        with patch("agentic_traveler.orchestrator.client_factory.get_current_emitter", return_value=events):
+            gemini_generate(client, model="m", contents=prompt.text, config=None,
+                            call_type="trip_companion", prompt_report=prompt.report())
+    finally:
+        current_turn_usage.set(None)
+
+    payload = [r for r in events._metric_buffer if r["event_name"] == "llm_call_usage"][0]["payload"]
+    assert payload["prompt_sections"] == prompt.sections
+    assert payload["prompt_tokens_est"] == prompt.tokens
+    assert payload["prompt_truncated"] == []
@@ -0,0 +1,186 @@
+"""Tests for the shared grounded-search cache and SearchAgent fan-out."""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from agentic_traveler.orchestrator import client_factory
+from agentic_traveler.orchestrator.search_agent import SearchAgent
+from agentic_traveler.tools import search_cache
+
+
+class _FakeGroundedClient:
+    """Counts grounded prompts; answers each with the queries it was asked."""
+
+    def __init__(self, delay=0.0, fail_on=None):
+        self.calls = []
+        self.delay = delay
+        self.fail_on = fail_on
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        self.models = SimpleNamespace(generate_content=self._generate)
+
+    def _generate(self, model, contents, config=None):
+        with self._lock:
+            self.calls.append(contents)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if self.fail_on and self.fail_on in contents:
+                raise RuntimeError("upstream 503")
+            asked = [line[2:] for line in contents.splitlines() if line.startswith("- ")]
+            web = SimpleNamespace(uri=f"https://example.com/{len(self.calls)}", title="Example")
+            return SimpleNamespace(
+                text="ANSWER: " + " | ".join(asked),
+                candidates=[SimpleNamespace(
+                    grounding_metadata=SimpleNamespace(grounding_chunks=[SimpleNamespace(web=web)])
+                )],
+                usage_metadata=SimpleNamespace(prompt_token_count=100, candidates_token_count=50),
+            )
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    search_cache.clear()
+    yield
+    search_cache.clear()
+
+
+# ── normalization / classes ───────────────────────────────────────────────────
+
+def test_normalize_ignores_case_punctuation_and_spacing():
+    assert search_cache.normalize("  Visa rules for JAPAN?? ") == search_cache.normalize(
+        "visa   rules for japan"
+    )
+
+
+@pytest.mark.parametrize("query,cls", [
+    ("Is the Louvre open today", "live"),
+    ("Oktoberfest 2026 ticket prices", "volatile"),
+    ("Visa requirements for Japan for EU citizens", "regulatory"),
+    ("History of the Alhambra", "general"),
+])
+def test_query_classes_drive_ttl(query, cls):
+    result = search_cache.make_result(query, "x", None)
+    assert result.query_class == cls
+    assert result.ttl_s == search_cache.ttl_for(cls)
+    assert search_cache.ttl_for("live") < search_cache.ttl_for("volatile") < search_cache.ttl_for("regulatory")
+
+
+# ── batched mode ─────────────────────────────────────────────────────────────
+
+def test_repeat_query_is_served_across_agents_without_grounding():
+    client = _FakeGroundedClient()
+    first, raw, _ = SearchAgent(client=client).search_with_metadata("Visa rules for Japan")
+    second, raw2, lat2 = SearchAgent(client=client).search_with_metadata("visa rules for japan!")
+
+    assert first == second == "ANSWER: Visa rules for Japan"
+    assert raw is not None and raw2 is None and lat2 == 0.0
+    assert len(client.calls) == 1
+    stats = search_cache.stats()
+    assert stats["grounded_calls"] == 1 and stats["grounded_calls_saved"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_cache_keeps_grounding_sources():
+    client = _FakeGroundedClient()
+    SearchAgent(client=client).search_with_metadata("Visa rules for Japan")
+    entry = search_cache.cache.get(search_cache.cache_key("Visa rules for Japan", "structured",
+                                                          "gemini-3.1-flash-lite"))
+    assert entry.sources == ({"title": "Example", "uri": "https://example.com/1"},)
+
+
+def test_batched_partial_hit_sends_only_the_remainder_in_input_order():
+    client = _FakeGroundedClient()
+    agent = SearchAgent(client=client, fanout=False)
+    agent.search_with_metadata("Louvre history")
+
+    text, _, _ = agent.search_with_metadata(["Rome ticket prices", "Louvre history", "Paris weather now"])
+
+    assert client.calls[-1].endswith("- Rome ticket prices\n- Paris weather now")
+    assert text.index("Rome ticket prices") < text.index("ANSWER: Louvre history")
+    assert len(client.calls) == 2
+
+
+def test_failures_are_not_cached():
+    client = _FakeGroundedClient(fail_on="Kyoto")
+    agent = SearchAgent(client=client)
+    text, raw, _ = agent.search_with_metadata("Kyoto temples")
+    assert raw is None and "couldn't retrieve" in text
+    agent.search_with_metadata("Kyoto temples")
+    assert len(client.calls) == 2
+
+
+# ── fan-out mode ─────────────────────────────────────────────────────────────
+
+def test_fanout_runs_uncached_queries_in_parallel_under_the_cap():
+    client = _FakeGroundedClient(delay=0.05)
+    queries = [f"museum {i} opening hours" for i in range(8)]
+    with patch("agentic_traveler.orchestrator.search_agent._pool", None), \
+         patch("agentic_traveler.orchestrator.search_agent.FANOUT_CONCURRENCY", 3):
+        text, raw, _ = SearchAgent(client=client, fanout=True).search_with_metadata(queries)
+
+    assert len(client.calls) == 8 and raw is not None
+    assert 1 < client.max_active <= 3
+    positions = [text.index(f"ANSWER: museum {i} opening hours") for i in range(8)]
+    assert positions == sorted(positions)
+
+
+def test_fanout_savings_over_repeated_turns():
+    """Three users asking overlapping questions: every repeat is free."""
+    client = _FakeGroundedClient()
+    agent = SearchAgent(client=client, fanout=True)
+    turns = [
+        ["Visa for Japan", "Tokyo metro fares"],
+        ["visa for japan", "Kyoto festivals this week"],
+        ["Tokyo metro fares", "Kyoto festivals this week", "Visa for Japan"],
+    ]
+    for turn in turns:
+        agent.search_with_metadata(turn)
+
+    stats = search_cache.stats()
+    assert stats["grounded_calls"] == len(client.calls) == 3
+    assert stats["grounded_calls_saved"] == 4
+    assert stats["hit_ratio"] == round(4 / 7, 3)
+
+
+def test_fanout_usage_lands_in_the_turn_records():
+    client = _FakeGroundedClient()
+    records = client_factory.begin_usage_capture()
+    try:
+        SearchAgent(client=client, fanout=True).search_with_metadata(["a b", "c d"])
+    finally:
+        client_factory.current_turn_usage.set(None)
+    assert sum(1 for r in records if r["model_name"] == "grounding") == 2
+    assert sum(1 for r in records if r["model_name"] == "gemini-3.1-flash-lite") == 2
+
+
+def test_concurrent_identical_queries_collapse_to_one_call():
+    client = _FakeGroundedClient(delay=0.05)
+    agent = SearchAgent(client=client, fanout=True)
+    threads = [
+        threading.Thread(target=agent.search_with_metadata, args=(["Lisbon tram 28", "Porto wine"],))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(client.calls) == 2
+
+
+def test_search_tool_records_artifacts_instead_of_responses():
+    calls = []
+    search_web = SearchAgent(client=_FakeGroundedClient()).create_tool(calls)
+    assert search_web(["Visa rules for Japan"]).startswith("ANSWER")
+    assert [(c.grounded, c.input_tokens, c.citations[0].uri) for c in calls] == [
+        (True, 100, "https://example.com/1"),
+    ]
@@ -0,0 +1,63 @@
+"""Model responses are reduced to TurnArtifacts right after the call."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from agentic_traveler.orchestrator.trip_agent import TripAgent
+from agentic_traveler.orchestrator.turn_artifacts import (
+    CallArtifacts,
+    Citation,
+    TurnArtifacts,
+    call_artifacts,
+)
+
+
+def _response(*uris, finish="STOP"):
+    chunks = [SimpleNamespace(web=SimpleNamespace(uri=u, title=u[-1])) for u in uris]
+    return SimpleNamespace(
+        text="reply",
+        candidates=[SimpleNamespace(
+            finish_reason=SimpleNamespace(name=finish),
+            grounding_metadata=SimpleNamespace(grounding_chunks=chunks),
+        )],
+        usage_metadata=SimpleNamespace(
+            prompt_token_count=120, candidates_token_count=40, thoughts_token_count=7,
+        ),
+    )
+
+
+def test_call_artifacts_keeps_usage_finish_grounding_and_citations():
+    art = call_artifacts(_response("https://a.example/1"), latency_ms=12.5)
+    assert art == CallArtifacts(
+        input_tokens=120, output_tokens=40, thinking_tokens=7, finish_reason="STOP",
+        grounded=True, citations=(Citation("1", "https://a.example/1"),), latency_ms=12.5,
+    )
+    assert call_artifacts(None) is None
+    assert call_artifacts(SimpleNamespace()) == CallArtifacts()
+
+
+def test_turn_citations_merge_reply_and_searches_without_duplicates():
+    turn = TurnArtifacts(
+        call_artifacts(_response()),
+        (call_artifacts(_response("https://a.example/1", "https://b.example/2")),
+         call_artifacts(_response("https://a.example/1"))),
+    )
+    assert turn.grounded
+    assert [c.uri for c in turn.citations] == ["https://a.example/1", "https://b.example/2"]
+    assert not TurnArtifacts().grounded and TurnArtifacts().citations == ()
+
+
+def test_agent_result_holds_artifacts_not_the_sdk_response():
+    client = MagicMock()
+    response = _response("https://a.example/1", finish="MAX_TOKENS")
+    response.text = "Paris is lovely. And"
+    client.models.generate_content.return_value = response
+
+    result = TripAgent(client=client).process_request(
+        user_doc={"user_name": "Ana"}, message="Paris?",
+        conversation_context="", current_time="now",
+    )
+
+    assert response not in result.values()
+    art = result["_artifacts"]
+    assert art.response.finish_reason == "MAX_TOKENS" and art.grounded
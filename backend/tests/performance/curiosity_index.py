@@ -0,0 +1,126 @@
+"""
+Curiosity prompt selection against a large synthetic library.
+
+Times ``CuriosityPromptInjector`` candidate selection with the state /
+motivation index against the previous full scan (every prompt's trigger
+checked on every eligible turn), over a synthetic library of ``--size``
+prompts spread across the seven saga states and a set of motivation tags.
+Both paths must pick the same candidates; the script exits 1 if they differ.
+Run from ``backend/``:
+
+    python tests/performance/curiosity_index.py
+    python tests/performance/curiosity_index.py --size 10000 --number 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from typing import Any, Dict, List
+
+from agentic_traveler.orchestrator.curiosity_injector import (
+    CuriosityPrompt,
+    CuriosityPromptInjector,
+)
+
+STATES = ["DREAMING", "SHAPING", "ANCHORING", "DETAILING", "READY_TO_GO", "LIVING", "REMEMBERING"]
+MOTIVATION_TAGS = [f"motivation_{i}" for i in range(40)]
+
+
+def synthetic_library(size: int, seed: int = 42) -> List[CuriosityPrompt]:
+    """``size`` prompts: ~70% motivation-gated, some destination-gated or score-gated."""
+    rng = random.Random(seed)
+    return [
+        CuriosityPrompt(
+            id=f"synthetic_{i}",
+            source={"author": "Synthetic", "title": "Benchmark"},
+            trigger={
+                "states": rng.sample(STATES, rng.randint(1, 2)),
+                "motivation_any": rng.sample(MOTIVATION_TAGS, rng.randint(1, 3))
+                if rng.random() < 0.7 else None,
+                "requires_destination": rng.random() < 0.3,
+                "profile": {"exploration_tolerance_min": 0.4} if rng.random() < 0.2 else {},
+            },
+            text=f"Synthetic question {i}?",
+            rationale="benchmark",
+        )
+        for i in range(size)
+    ]
+
+
+def _turns(n: int, seed: int = 7) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "state": rng.choice(STATES),
+            "motivations": set(rng.sample(MOTIVATION_TAGS, rng.randint(0, 3))),
+            "scores": {"exploration_tolerance": rng.random()},
+            "has_destination": rng.random() < 0.5,
+        }
+        for _ in range(n)
+    ]
+
+
+def _scan(library: List[CuriosityPrompt], t: Dict[str, Any]) -> list:
+    """The pre-index selection: every trigger gate checked on every prompt."""
+    out = []
+    for p in library:
+        trig = p.trigger
+        if t["state"] not in trig.states:
+            continue
+        if trig.requires_destination and not t["has_destination"]:
+            continue
+        if trig.motivation_any and not {m.lower() for m in trig.motivation_any} & t["motivations"]:
+            continue
+        if CuriosityPromptInjector._profile_ok(p, t["scores"]):
+            out.append(p)
+    return out
+
+
+def _indexed(inj: CuriosityPromptInjector, t: Dict[str, Any]) -> list:
+    return inj._candidates(t["state"], t["scores"], t["motivations"], t["has_destination"])
+
+
+def run(size: int = 10_000, number: int = 500) -> Dict[str, Any]:
+    t0 = time.perf_counter()
+    library = synthetic_library(size)
+    inj = CuriosityPromptInjector(library=library)
+    build_ms = (time.perf_counter() - t0) * 1000
+    turns = _turns(number)
+
+    mismatches = sum(1 for t in turns if _scan(library, t) != _indexed(inj, t))
+
+    t0 = time.perf_counter()
+    for t in turns:
+        _scan(library, t)
+    scan_us = (time.perf_counter() - t0) / number * 1e6
+    t0 = time.perf_counter()
+    for t in turns:
+        _indexed(inj, t)
+    index_us = (time.perf_counter() - t0) / number * 1e6
+
+    return {
+        "library_size": size,
+        "load_and_index_ms": round(build_ms, 1),
+        "full_scan_us_per_select": round(scan_us, 1),
+        "indexed_us_per_select": round(index_us, 1),
+        "speedup": round(scan_us / index_us, 1) if index_us else None,
+        "mismatches": mismatches,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=10_000, help="synthetic prompts")
+    parser.add_argument("--number", type=int, default=500, help="select calls timed")
+    args = parser.parse_args(argv)
+    result = run(args.size, args.number)
+    print(json.dumps(result, indent=2))
+    return 1 if result["mismatches"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,451 @@
+"""
+Micro-benchmarks for the per-turn CPU work of the orchestrator.
+
+Every turn runs these on a 0.5-CPU Cloud Run instance, so a slow regression
+in any of them is paid on every message. Each case runs against a realistic,
+worst-case-sized fixture: a fully elicited Traveler-DNA profile, a history at
+the compaction threshold, and a 14-day itinerary.
+
+Timings are ``timeit``-style: each case is auto-ranged to at least
+``MIN_RUN_S`` per repeat, and the best of ``REPEATS`` is kept. Absolute
+microseconds depend on the machine, so every repeat of the case is also
+divided by a repeat of a fixed pure-Python calibration loop, timed right
+before it. ``rel`` is the median of those ratios — a machine-independent
+cost that one noisy repeat cannot move — and it is what ``--compare`` gates
+on by default.
+
+Run from ``backend/`` with the venv active:
+
+    python tests/performance/hot_paths.py                    # print timings
+    python tests/performance/hot_paths.py --compare          # vs the stored baseline
+    python tests/performance/hot_paths.py --save             # refresh the baseline
+    python tests/performance/hot_paths.py --compare --threshold 15 --only profile
+
+``--compare`` exits 1 when any case is slower than the baseline by more than
+``--threshold`` percent (default 25; micro-timings are noisy). Allocation-
+bound cases do not scale with the calibration loop across CPUs and Python
+builds, so save the baseline on the machine that runs the gate.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+HERE = Path(__file__).resolve().parent
+BASELINE = HERE / "baselines" / "hot_paths.json"
+
+MIN_RUN_S = 0.05
+REPEATS = 7
+DEFAULT_THRESHOLD_PCT = 25.0
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+_LOREM = (
+    "We want long unhurried mornings, one anchor per day, food markets over "
+    "museums, and at least one onsen afternoon; my partner is pescatarian and "
+    "I get tired after about 12 km of walking, so build in tram rides. "
+)
+
+
+def large_user_doc() -> dict[str, Any]:
+    """A fully elicited profile: every DNA question answered, scores for all
+    dimensions, hard overrides, and a synthesis summary."""
+    answered = {
+        f"q_{i:02d}": {"value": ["slow", "food", "design"] if i % 3 == 0 else f"answer-{i}",
+                       "source": "chat", "answered_at": "2026-09-01T10:00:00+00:00"}
+        for i in range(40)
+    }
+    answered["q_skipped"] = {"value": "__skip__"}
+    profile_data = {
+        "tags": [f"tag-{i}" for i in range(30)],
+        "tone_preference": "warm, concise, no exclamation marks",
+        "additional_info": _LOREM * 4,
+        "personality_dimensions_scores": {f"dim_{i}": (i % 10) / 10 for i in range(24)},
+        "hard_overrides": [{"slot": f"ask.slot_{i}", "value": f"v{i}"} for i in range(6)],
+        "reply_length_preference": "short",
+        "answered_questions": answered,
+        "interests": ["food", "temples", "design", "onsen", "markets", "architecture"],
+        "dietary": ["pescatarian"],
+    }
+    return {
+        "id": "00000000-0000-0000-0000-000000000001",
+        "name": "Load Tester",
+        "user_name": "Load Tester",
+        "user_profile": {
+            "profile_data": profile_data,
+            "summary": _LOREM * 8,
+            **profile_data,
+        },
+        "credits": {"balance": 500},
+        "conversation_history": long_history(),
+        "off_topic": {"count": 0},
+    }
+
+
+def long_history(messages: int = 14) -> dict[str, Any]:
+    """History at the compaction threshold (MAX_RECENT + one exchange)."""
+    return {
+        "summary": _LOREM * 10,
+        "recent_messages": [
+            {"role": "user" if i % 2 == 0 else "agent", "text": _LOREM * 3,
+             "ts": "2026-09-01T10:00:00+00:00"}
+            for i in range(messages)
+        ],
+    }
+
+
+def fourteen_day_trip_row(start: Optional[date] = None) -> dict[str, Any]:
+    """A trips row plus children for a 14-day itinerary starting on ``start``
+    (default today, i.e. in progress): 3 destinations, 8 bookings,
+    14 days × 6 blocks, 30 checklist items."""
+    start = start or date.today()
+    trip_id = "10000000-0000-0000-0000-000000000001"
+    stamp = "2026-09-01T10:00:00+00:00"
+
+    def child(i: int, **fields: Any) -> dict[str, Any]:
+        return {"id": f"{trip_id[:-4]}{i:04d}", "trip_id": trip_id,
+                "created_at": stamp, "updated_at": stamp, **fields}
+
+    days, blocks = [], []
+    for n in range(14):
+        day = child(1000 + n, n=n + 1, date=(start + timedelta(days=n)).isoformat(),
+                    title=f"Day {n + 1}", energy_target=3, ai_note=_LOREM)
+        days.append(day)
+        for b in range(6):
+            blocks.append(child(2000 + n * 10 + b, day_id=day["id"], ord=b,
+                                time_slot=f"{9 + b * 2:02d}:00", title=f"Block {b}",
+                                type="activity", duration_min=90, energy=2,
+                                walk="15 min", why=_LOREM, lat=35.0 + b / 100, lng=135.7))
+    return {
+        "id": trip_id,
+        "user_id": "00000000-0000-0000-0000-000000000001",
+        "status": "active",
+        "saga_state": "LIVING",
+        "title": "Kyoto & Osaka, slowly",
+        "reference_date": start.isoformat(),
+        "vision_summary": _LOREM,
+        "discovery": {
+            "vision": _LOREM,
+            "timeframe": {"start_date": start.isoformat(),
+                          "end_date": (start + timedelta(days=13)).isoformat()},
+            "destination_brief": {"destination": "Kyoto, Japan", "fit_hooks": ["food-led"] * 6},
+        },
+        "travelers": {"count": 2, "composition": "couple"},
+        "preferences": {"pace": "slow", "structure": "loose", "budget_tier": "$$"},
+        "country_intel": [{"iso_country": "JP", "sections": {"visa": _LOREM, "money": _LOREM}}],
+        "budget": {"currency": "EUR", "total": 4200},
+        "live_state": {"last_mood": {"label": "tired but happy", "energy": 2}},
+        "scratchpad": {},
+        "journal": {},
+        "cover": {},
+        "created_at": stamp,
+        "updated_at": stamp,
+        "destinations": [
+            child(i, name=name, iso_country="JP", status="confirmed", ord=i,
+                  coords={"lat": 35.0, "lng": 135.7})
+            for i, name in enumerate(["Kyoto, Japan", "Osaka, Japan", "Nara, Japan"])
+        ],
+        "bookings": [
+            child(100 + i, kind="accommodation" if i % 2 else "ground",
+                  payload={"name": f"Booking {i}", "notes": _LOREM},
+                  datetime_local=f"{start.isoformat()}T1{i}:00", confirmation_code=f"ABC{i}")
+            for i in range(8)
+        ],
+        "days": days,
+        "day_blocks": blocks,
+        "checklist": [child(3000 + i, scope="pre_trip", label=f"Item {i}", done=i % 3 == 0, ord=i)
+                      for i in range(30)],
+    }
+
+
+def _reply_text() -> str:
+    """A long model reply with markdown the Telegram sanitizer must balance."""
+    return (
+        "*Morning:* Nanzen-ji before the crowds, then the _Philosopher's Path_ north. "
+        "Lunch at a 5* kaiseki counter; the 4 * ryokan nearby is worth a look. "
+    ) * 25 + "Trailing * asterisk and an orphan _ underscore"
+
+
+def adversarial_planner_reply(chars: int) -> str:
+    """A planner-sized reply dense in word-adjacent ``*``/``_`` with odd
+    counts of both and the only bare ones at the very end, so the sanitizer
+    has to get past every delimiter before it finds the orphans."""
+    day = "→*Day{n}x*·*Fushimi*Inari*at*dawn*·then·_snake_case_·_Nishiki_market_·lunch.\n"
+    out, size, n = [], 0, 1
+    while size < chars:
+        out.append(day.format(n=n))
+        size += len(out[-1])
+        n += 1
+    text = "".join(out)[:chars]
+    text += " *" if text.count("*") % 2 == 0 else ""
+    text += " _" if text.count("_") % 2 == 0 else ""
+    return text
+
+
+# ---------------------------------------------------------------------------
+# Cases
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+    description: str
+
+
+def _profile_summary() -> Callable[[], Any]:
+    from agentic_traveler.orchestrator.profile_utils import build_profile_summary
+
+    doc = large_user_doc()
+    return lambda: build_profile_summary(doc)
+
+
+def _live_context() -> Callable[[], Any]:
+    from agentic_traveler.orchestrator.profile_utils import build_live_context
+
+    trip = fourteen_day_trip_row()
+    return lambda: build_live_context(trip)
+
+
+def _context_block() -> Callable[[], Any]:
+    from agentic_traveler.orchestrator.conversation_manager import ConversationManager
+
+    manager, doc = ConversationManager(client=None), large_user_doc()
+
+    def run() -> tuple[str, str]:
+        turn_doc = dict(doc)  # a new turn's user doc: no memoized context yet
+        return manager.build_context_block(turn_doc), manager.build_context_block(turn_doc, max_messages=4)
+
+    return run
+
+
+def _sanitize_reply() -> Callable[[], Any]:
+    from agentic_traveler.core.sanitize import sanitize_telegram_markdown
+
+    text = _reply_text()
+    return lambda: sanitize_telegram_markdown(text)
+
+
+def _sanitize_planner(chars: int) -> Callable[[], Callable[[], Any]]:
+    def setup() -> Callable[[], Any]:
+        from agentic_traveler.core.sanitize import sanitize_telegram_markdown
+
+        text = adversarial_planner_reply(chars)
+        return lambda: sanitize_telegram_markdown(text)
+
+    return setup
+
+
+def _sanitize_input() -> Callable[[], Any]:
+    from agentic_traveler.core.sanitize import sanitize_user_input
+
+    text = (_LOREM + "\x00\x07") * 12
+    return lambda: sanitize_user_input(text)
+
+
+def _saga_state() -> Callable[[], Any]:
+    from agentic_traveler.orchestrator.sagas.saga_state import derive_saga_state_local
+
+    living = fourteen_day_trip_row()
+    planning = fourteen_day_trip_row(date.today() + timedelta(days=60))
+    planning["bookings"] = []
+    return lambda: (derive_saga_state_local(living), derive_saga_state_local(planning))
+
+
+def _dispatcher_select() -> Callable[[], Any]:
+    from agentic_traveler.orchestrator.sagas.dispatcher import SagaDispatcher
+
+    dispatcher = SagaDispatcher(client=None)
+    trip = fourteen_day_trip_row()
+    entities = {"destinations": ["Kyoto, Japan"], "intel_question": False}
+    state = {"intent": "TRIP", "entities": entities, "trip_id": trip["id"],
+             "message_text": "What should we do this afternoon?", "prefetched_slots": {}}
+    return lambda: dispatcher.select("TRIP", entities, trip, state)
+
+
+def _trip_validation() -> Callable[[], Any]:
+    from agentic_traveler.tools.trip_repo import Trip
+
+    row = fourteen_day_trip_row()
+    return lambda: Trip(**row).model_dump()
+
+
+def _event_serialization() -> Callable[[], Any]:
+    from agentic_traveler.interfaces.routers.chat import _sse
+    from agentic_traveler.orchestrator.event_emitter import EventEmitter
+
+    chunks = [f"chunk {i} of the streamed reply " for i in range(120)]
+
+    def run() -> list[str]:
+        frames: list[str] = []
+        events = EventEmitter(
+            user_id="u", trip_id="t",
+            on_status=lambda p: frames.append(_sse("status", p)),
+            on_delta=lambda p: frames.append(_sse("delta", p)),
+        )
+        for phase in ("router", "saga_selected", "composing"):
+            events.emit("status", {"phase": phase, "text": f"{phase}…"})
+        for chunk in chunks:
+            events.emit("delta", {"text": chunk})
+        for i in range(12):
+            events.emit("metric", {"name": "stage_timing", "stage": f"s{i}", "latency_ms": i})
+        return frames
+
+    return run
+
+
+CASES: tuple[Case, ...] = (
+    Case("build_profile_summary", _profile_summary, "fully elicited profile"),
+    Case("build_live_context", _live_context, "in-progress 14-day trip with a mood"),
+    Case("build_context_block", _context_block, "full + router-slim history at the compaction threshold"),
+    Case("sanitize_telegram_markdown", _sanitize_reply, "~4 KB reply with unbalanced markers"),
+    Case("sanitize_planner_4k", _sanitize_planner(4_000), "4 KB planner reply, adversarial delimiters"),
+    Case("sanitize_planner_20k", _sanitize_planner(20_000), "20 KB planner reply, adversarial delimiters"),
+    Case("sanitize_user_input", _sanitize_input, "~2.5 KB message with control chars"),
+    Case("derive_saga_state_local", _saga_state, "14-day trip, live and two months out"),
+    Case("dispatcher_select", _dispatcher_select, "all sagas' should_activate, live trip"),
+    Case("trip_model_validation", _trip_validation, "Trip(**row).model_dump(), 14 days × 6 blocks"),
+    Case("event_serialization", _event_serialization, "3 status + 120 delta SSE frames + 12 metrics"),
+)
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def _calibration() -> None:
+    total = 0
+    for i in range(20_000):
+        total += i * i % 7
+    "-".join(str(i) for i in range(500))
+
+
+def _loops_for(fn: Callable[[], Any], min_run_s: float) -> int:
+    loops = 1
+    while True:
+        t = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        if time.perf_counter() - t >= min_run_s:
+            return loops
+        loops *= 2
+
+
+def _best(fn: Callable[[], Any], loops: int) -> float:
+    t = time.perf_counter()
+    for _ in range(loops):
+        fn()
+    return (time.perf_counter() - t) / loops
+
+
+def measure(fn: Callable[[], Any], min_run_s: float = MIN_RUN_S,
+            repeats: int = REPEATS) -> tuple[float, float]:
+    """
+    ``(best seconds per call, median ratio to the calibration loop)`` over
+    ``repeats``, auto-ranging both loop counts. The two are interleaved repeat
+    by repeat, and each ratio pairs adjacent timings, so CPU throttling or a
+    noisy neighbour hits both sides of it alike.
+    """
+    loops, cal_loops = _loops_for(fn, min_run_s), _loops_for(_calibration, min_run_s)
+    timings, ratios = [], []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            cal = _best(_calibration, cal_loops)
+            timings.append(_best(fn, loops))
+            ratios.append(timings[-1] / cal)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return min(timings), statistics.median(ratios)
+
+
+def run(only: Optional[str] = None, min_run_s: float = MIN_RUN_S, repeats: int = REPEATS) -> dict[str, Any]:
+    """Time every case (or those whose name contains ``only``)."""
+    results = {}
+    for case in CASES:
+        if only and only not in case.name:
+            continue
+        seconds, rel = measure(case.setup(), min_run_s, repeats)
+        results[case.name] = {"us": round(seconds * 1e6, 2), "rel": float(f"{rel:.4g}")}
+    calibration, _ = measure(_calibration, min_run_s, repeats)
+    return {
+        "python": sys.version.split()[0],
+        "calibration_us": round(calibration * 1e6, 2),
+        "cases": results,
+    }
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], threshold_pct: float,
+            metric: str = "rel") -> tuple[list[str], list[str]]:
+    """Return ``(report_lines, regressed_case_names)``."""
+    lines, regressed = [], []
+    for name, now in current["cases"].items():
+        base = baseline.get("cases", {}).get(name)
+        if not base:
+            lines.append(f"{name:28s} {now[metric]:>10}  (no baseline)")
+            continue
+        change = (now[metric] - base[metric]) / base[metric] * 100.0 if base[metric] else 0.0
+        flag = ""
+        if change > threshold_pct:
+            flag = "  REGRESSION"
+            regressed.append(name)
+        lines.append(f"{name:28s} {base[metric]:>10} → {now[metric]:<10} ({change:+.1f}%){flag}")
+    return lines, regressed
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--only", help="run cases whose name contains this")
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="compare against the baseline")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--threshold", type=float,
+                        default=float(os.getenv("BENCH_REGRESSION_PCT", DEFAULT_THRESHOLD_PCT)),
+                        help="regression threshold in percent (env BENCH_REGRESSION_PCT)")
+    parser.add_argument("--absolute", action="store_true",
+                        help="gate on raw microseconds instead of calibrated cost")
+    args = parser.parse_args(argv)
+
+    logging_quiet()
+    current = run(args.only)
+    print(f"calibration: {current['calibration_us']} µs")
+    for name, row in current["cases"].items():
+        print(f"{name:28s} {row['us']:>10} µs   rel={row['rel']}")
+
+    if args.save:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline → {args.baseline}")
+    if args.compare:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        lines, regressed = compare(baseline, current, args.threshold,
+                                   metric="us" if args.absolute else "rel")
+        print(f"\nvs {args.baseline.name} (threshold {args.threshold:g}%):")
+        print("\n".join(lines))
+        return 1 if regressed else 0
+    return 0
+
+
+def logging_quiet() -> None:
+    import logging
+
+    logging.basicConfig(level=logging.ERROR)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
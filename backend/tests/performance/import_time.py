@@ -0,0 +1,122 @@
+"""
+Cold-import profile of the API entry point, and the start-up budget.
+
+Cloud Run sends an instance traffic once ``interfaces.main`` is imported, so
+everything that module imports is paid on every cold start. This runs
+``python -X importtime -c "import agentic_traveler.interfaces.main"`` in a
+fresh interpreter (best of RUNS), and reports the cumulative import time, the
+slowest modules, the third-party packages by self time, and whether any of the
+packages that must load lazily (``core.lazy``) were imported. Run from
+``backend/``:
+
+    python tests/performance/import_time.py
+    python tests/performance/import_time.py --runs 5 --budget-ms 1200 --top 30
+
+Exits 1 when the best run exceeds the budget (``IMPORT_BUDGET_MS``, default
+1500) or a lazy package was imported eagerly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+TARGET = "agentic_traveler.interfaces.main"
+DEFAULT_BUDGET_MS = 1500.0
+
+# Heavy dependencies only a turn (or the warm-up) may import.
+LAZY_PACKAGES = ("google.genai", "supabase", "httpx", "agentic_traveler.orchestrator.agent")
+
+_SRC = Path(__file__).resolve().parents[2] / "src"
+
+# interfaces.main refuses to import without these; values are never used.
+_REQUIRED_ENV = {
+    "FRONTEND_ORIGIN": "http://localhost:3000",
+    "TALLY_FORM_URL": "https://tally.so/r/placeholder",
+    "SUPABASE_URL": "http://localhost:54321",
+    "SUPABASE_SERVICE_KEY": "placeholder",
+}
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, float, float]]:
+    """``(module, self_ms, cumulative_ms)`` per ``-X importtime`` line."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us) / 1000, int(cumulative_us) / 1000))
+    return rows
+
+
+def profile_once(target: str = TARGET) -> list[tuple[str, float, float]]:
+    env = {**_REQUIRED_ENV, **os.environ}
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (str(_SRC), env.get("PYTHONPATH")) if p)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True, text=True, env=env, check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {target} failed:\n{proc.stderr[-2000:]}")
+    return parse_importtime(proc.stderr)
+
+
+def measure(runs: int = 3, top: int = 15, target: str = TARGET) -> dict[str, Any]:
+    """Profile ``runs`` cold imports and report on the fastest one."""
+    best = min((profile_once(target) for _ in range(runs)), key=lambda rows: _total(rows, target))
+    by_package: dict[str, float] = defaultdict(float)
+    for name, self_ms, _ in best:
+        if not name.startswith("agentic_traveler"):
+            by_package[name.split(".")[0]] += self_ms
+    imported = {name for name, _, _ in best}
+    return {
+        "target": target,
+        "total_ms": round(_total(best, target), 1),
+        "modules": len(best),
+        "slowest": [
+            {"module": name, "cumulative_ms": round(cum, 1), "self_ms": round(self_ms, 1)}
+            for name, self_ms, cum in sorted(best, key=lambda r: r[2], reverse=True)[:top]
+        ],
+        "packages_self_ms": {
+            name: round(ms, 1)
+            for name, ms in sorted(by_package.items(), key=lambda kv: kv[1], reverse=True)[:top]
+        },
+        "eager_lazy_packages": [p for p in LAZY_PACKAGES if p in imported],
+    }
+
+
+def _total(rows: list[tuple[str, float, float]], target: str) -> float:
+    return next(cum for name, _, cum in rows if name == target)
+
+
+def budget_ms() -> float:
+    return float(os.getenv("IMPORT_BUDGET_MS", DEFAULT_BUDGET_MS))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=budget_ms())
+    args = parser.parse_args(argv)
+
+    report = measure(args.runs, args.top)
+    report["budget_ms"] = args.budget_ms
+    print(json.dumps(report, indent=2))
+    if report["total_ms"] > args.budget_ms:
+        print(f"FAIL: cold import {report['total_ms']} ms > budget {args.budget_ms} ms", file=sys.stderr)
+        return 1
+    if report["eager_lazy_packages"]:
+        print(f"FAIL: imported eagerly: {report['eager_lazy_packages']}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
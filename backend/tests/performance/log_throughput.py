@@ -0,0 +1,96 @@
+"""
+Per-log-call latency under concurrency, console vs JSON logging mode.
+
+Cloud Run serves up to 50 turns at once from one process (see the executor
+size in interfaces/main.py), and every one of them logs. This measures what
+a single ``logger.info`` costs the calling thread when THREADS threads log at
+once: in ``console`` mode the caller formats (with colours) and writes under
+the handler lock; in ``json`` mode it only enqueues.
+
+Output goes to the null device so the terminal is not the bottleneck. Run
+from ``backend/``:
+
+    python tests/performance/log_throughput.py
+    python tests/performance/log_throughput.py --threads 50 --calls 2000 --modes json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import threading
+import time
+from typing import Any
+
+from agentic_traveler.core import logging_config
+from agentic_traveler.core.logging_config import bind_log_context, setup_logging
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def measure(mode: str, threads: int = 50, calls: int = 1000) -> dict[str, Any]:
+    """Per-call latency (µs) of ``logger.info`` from ``threads`` threads at once."""
+    root = logging.getLogger()
+    saved = root.handlers[:], root.level
+    sink = open(os.devnull, "w", encoding="utf-8")
+    setup_logging(mode=mode, stream=sink)
+    log = logging.getLogger("agentic_traveler.orchestrator.agent")
+    start = threading.Barrier(threads)
+    samples: list[list[float]] = [[] for _ in range(threads)]
+
+    def worker(n: int) -> None:
+        bind_log_context(trace=f"{n:032x}", turn_id=f"turn-{n}", user="0" * 64)
+        own = samples[n]
+        start.wait()
+        for i in range(calls):
+            t = time.perf_counter()
+            log.info("Saga %s selected for turn %d (intent=%s)", "planning", i, "PLAN")
+            own.append((time.perf_counter() - t) * 1e6)
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    t0 = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    wall = time.perf_counter() - t0
+    dropped = logging_config.dropped_records()
+    logging_config._stop_listener()
+    root.handlers, root.level = saved
+    sink.close()
+
+    flat = [v for s in samples for v in s]
+    return {
+        "mode": mode,
+        "threads": threads,
+        "calls": len(flat),
+        "mean_us": round(statistics.fmean(flat), 2),
+        "p50_us": round(_percentile(flat, 50), 2),
+        "p99_us": round(_percentile(flat, 99), 2),
+        "max_us": round(max(flat), 2),
+        "wall_s": round(wall, 3),
+        "dropped": dropped,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threads", type=int, default=50)
+    parser.add_argument("--calls", type=int, default=1000, help="log calls per thread")
+    parser.add_argument("--modes", nargs="+", default=["console", "json"])
+    args = parser.parse_args(argv)
+
+    results = [measure(mode, args.threads, args.calls) for mode in args.modes]
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
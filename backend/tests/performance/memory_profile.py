@@ -0,0 +1,355 @@
+"""
+Memory footprint per turn, and steady-state growth, for the 512 MB instance.
+
+A Cloud Run instance serves up to 50 turns at once from one process with 512 MB.
+Its memory goes to thread stacks, module-level caches, the stream event
+buffers, hydrated trips and LLM response objects. This replays the
+``orchestrator_load`` scenarios through the real ``OrchestratorAgent``, one
+turn at a time, against the same in-memory Supabase and recorded LLM. There
+are two modes:
+
+- ``profile`` (default) runs ``tracemalloc`` around every turn and reports,
+  per scenario/phase (chat, planning, living), the bytes a turn allocates at
+  peak and the bytes it still holds once its background work has finished.
+  It also reports the top allocators per phase and the growth that survives
+  the whole run, each attributed to the innermost ``agentic_traveler`` line.
+- ``steady`` warms up, replays TURNS turns without tracing, and reports the
+  growth in RSS and live Python blocks. Bounded caches level off, so growth
+  that keeps scaling with turns is a leak. ``--budget-mb``
+  (``MEMORY_BUDGET_MB``, default 8) makes it exit 1 past the budget.
+  ``steady_state_isolated`` runs it in a fresh interpreter, so a host
+  process (pytest with its captured logs) does not add to the RSS.
+
+The fake database is emptied after every conversation, so the rows a replay
+writes do not count as growth. Allocations made inside the fake itself are
+left out of the traces. Run from ``backend/``:
+
+    python tests/performance/memory_profile.py --conversations 4 --top 10
+    python tests/performance/memory_profile.py --mode steady --turns 1000 --budget-mb 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import itertools
+import json
+import linecache
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import tracemalloc
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+import orchestrator_load as load
+
+DEFAULT_BUDGET_MB = 8.0
+TRACE_FRAMES = 32
+
+_SRC = Path(load.HERE).parents[1] / "src"
+_APP_ROOT = str(_SRC / "agentic_traveler")
+_EXCLUDED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, load.__file__, all_frames=True),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+)
+
+
+def budget_mb() -> float:
+    return float(os.getenv("MEMORY_BUDGET_MB", DEFAULT_BUDGET_MB))
+
+
+def rss_mb() -> Optional[float]:
+    """Current resident set size (Linux); None where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return round(pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024), 2)
+
+
+def _settle() -> None:
+    """Let background writers finish so their allocations are accounted."""
+    from agentic_traveler.orchestrator.sagas import brief_pipeline
+    from agentic_traveler.tools import geocode_queue
+
+    brief_pipeline.wait_idle()
+    geocode_queue.wait_idle()
+    gc.collect()
+
+
+def _flush_metrics() -> None:
+    # The weekly counters would otherwise flush to the real DB at exit.
+    from agentic_traveler.analytics import metrics_tracker
+
+    metrics_tracker.flush(sync=True)
+
+
+def _app_frame(traceback: tracemalloc.Traceback) -> str:
+    """``module/path.py:line`` of the innermost backend frame, else the
+    innermost frame (stdlib / third party)."""
+    for frame in reversed(traceback):  # oldest first
+        if frame.filename.startswith(_APP_ROOT):
+            rel = os.path.relpath(frame.filename, _APP_ROOT).replace(os.sep, "/")
+            return f"{rel}:{frame.lineno}"
+    frame = traceback[-1]
+    parts = frame.filename.replace(os.sep, "/").split("/")
+    return f"{'/'.join(parts[-2:])}:{frame.lineno}"
+
+
+def _diff_by_frame(after: tracemalloc.Snapshot, before: tracemalloc.Snapshot) -> Counter:
+    grouped: Counter = Counter()
+    for stat in after.compare_to(before, "traceback"):
+        if stat.size_diff:
+            grouped[_app_frame(stat.traceback)] += stat.size_diff
+    return grouped
+
+
+def _top(grouped: Counter, n: int, scale: float = 1.0) -> list[dict[str, Any]]:
+    return [
+        {"where": where, "kib": round(size / scale / 1024, 1), "line": _source(where)}
+        for where, size in grouped.most_common(n) if size > 0
+    ]
+
+
+def _source(where: str) -> str:
+    path, _, lineno = where.rpartition(":")
+    full = os.path.join(_APP_ROOT, path) if "/" in path or path.endswith(".py") else path
+    return linecache.getline(full, int(lineno)).strip() if lineno.isdigit() else ""
+
+
+def cache_sizes() -> dict[str, int]:
+    """Entries held by the module-level caches a turn fills."""
+    from agentic_traveler.orchestrator.profile_utils import profile_summary_stats
+    from agentic_traveler.tools import brief_cache, identity_cache, search_cache
+    from agentic_traveler.tools.trip_repo import trip_index_stats
+
+    return {
+        "profile_summary": profile_summary_stats()["size"],
+        "trip_index": trip_index_stats()["size"],
+        "brief": brief_cache.stats()["size"],
+        "search": search_cache.stats()["size"],
+        "identity": identity_cache.stats()["size"],
+    }
+
+
+def _conversations(scenarios: list[dict[str, Any]], turns: int) -> Iterator[dict[str, Any]]:
+    """Cycle the scenarios until at least ``turns`` turns are scheduled."""
+    scheduled = 0
+    for scenario in itertools.cycle(scenarios):
+        if scheduled >= turns:
+            return
+        scheduled += len(scenario["turns"])
+        yield scenario
+
+
+def _run_conversation(
+    agent: Any, db: load.FakeSupabase, scenario: dict[str, Any], credits: int,
+    around: Optional[Callable[[str, Callable[[], Any]], Any]] = None,
+) -> int:
+    """``orchestrator_load._run_conversation`` without the latency accounting,
+    driven from this module so the fake's frames can be told apart from the
+    turn's. ``around(phase, call)`` wraps each turn."""
+    user_id = db.seed_user(scenario.get("user") or {}, credits)
+    focused: Optional[str] = None
+    for turn in scenario["turns"]:
+        def call(turn: dict[str, Any] = turn) -> Any:
+            return agent.process_request_for_user(
+                user_id, turn.get("text", ""),
+                selection=turn.get("selection"),
+                capability=turn.get("capability"),
+                focused_trip_id=focused,
+            )
+
+        resp = around(turn.get("phase", "?"), call) if around else call()
+        focused = (resp or {}).get("focus_trip_id") or focused
+    return len(scenario["turns"])
+
+
+def _replay(
+    agent: Any, db: load.FakeSupabase, scenarios: Iterable[dict[str, Any]], credits: int,
+    around: Optional[Callable[[str, Callable[[], Any]], Any]] = None,
+) -> int:
+    """Replay each conversation, emptying the fake DB after it; returns turns."""
+    replayed = 0
+    for scenario in scenarios:
+        replayed += _run_conversation(agent, db, scenario, credits, around)
+        _settle()
+        with db.lock:
+            db.tables.clear()
+    return replayed
+
+
+def profile(
+    scenarios: list[dict[str, Any]],
+    recording: dict[str, Any],
+    *,
+    conversations: Optional[int] = None,
+    warmup: int = 1,
+    top: int = 10,
+    credits: int = 1_000_000,
+) -> dict[str, Any]:
+    """Trace every turn of ``conversations`` conversations (after ``warmup``
+    untraced passes over the scenarios) and summarise per scenario/phase."""
+    from agentic_traveler.orchestrator.agent import OrchestratorAgent
+
+    conversations = conversations or len(scenarios) * 2
+    db = load.FakeSupabase()
+    client = load.RecordedGenAIClient(recording, latency_scale=0)
+    per_turn: dict[str, list[dict[str, int]]] = defaultdict(list)
+    allocators: dict[str, Counter] = defaultdict(Counter)
+    scenario_name = ""
+
+    def traced(phase: str, call: Callable[[], Any]) -> Any:
+        gc.collect()
+        before = tracemalloc.take_snapshot().filter_traces(_EXCLUDED)
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        try:
+            return call()
+        finally:
+            _settle()
+            held, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot().filter_traces(_EXCLUDED)
+            key = f"{scenario_name}/{phase}"
+            per_turn[key].append({"peak": peak - base, "retained": held - base})
+            allocators[key].update(_diff_by_frame(after, before))
+
+    with load.offline(db, client):
+        agent = OrchestratorAgent()
+        _replay(agent, db, scenarios * warmup, credits)
+        tracemalloc.start(TRACE_FRAMES)
+        try:
+            gc.collect()
+            start = tracemalloc.take_snapshot().filter_traces(_EXCLUDED)
+            for scenario in itertools.islice(itertools.cycle(scenarios), conversations):
+                scenario_name = scenario.get("name", "?")
+                _replay(agent, db, [scenario], credits, traced)
+            gc.collect()
+            end = tracemalloc.take_snapshot().filter_traces(_EXCLUDED)
+        finally:
+            tracemalloc.stop()
+        _flush_metrics()
+
+    return {
+        "mode": "profile",
+        "conversations": conversations,
+        "turns": sum(len(v) for v in per_turn.values()),
+        "by_phase": {
+            key: {
+                "turns": len(rows),
+                "peak_kib": load._distribution([r["peak"] / 1024 for r in rows]),
+                "retained_kib": load._distribution([r["retained"] / 1024 for r in rows]),
+                "top_allocators": _top(allocators[key], top, scale=len(rows)),
+            }
+            for key, rows in sorted(per_turn.items())
+        },
+        "retained_over_run": _top(_diff_by_frame(end, start), top),
+        "caches": cache_sizes(),
+        "threads": threading.active_count(),
+        "rss_mb": rss_mb(),
+    }
+
+
+def steady_state(
+    scenarios: list[dict[str, Any]],
+    recording: dict[str, Any],
+    *,
+    turns: int = 1000,
+    warmup_turns: int = 100,
+    credits: int = 1_000_000,
+) -> dict[str, Any]:
+    """RSS and live-block growth across ``turns`` replayed turns, measured
+    after ``warmup_turns`` have filled the caches and imported everything."""
+    from agentic_traveler.orchestrator.agent import OrchestratorAgent
+
+    db = load.FakeSupabase()
+    client = load.RecordedGenAIClient(recording, latency_scale=0)
+    with load.offline(db, client):
+        agent = OrchestratorAgent()
+        _replay(agent, db, _conversations(scenarios, warmup_turns), credits)
+        rss_before, blocks_before = rss_mb(), sys.getallocatedblocks()
+        replayed = _replay(agent, db, _conversations(scenarios, turns), credits)
+        rss_after, blocks_after = rss_mb(), sys.getallocatedblocks()
+        _flush_metrics()
+
+    return {
+        "mode": "steady",
+        "turns": replayed,
+        "warmup_turns": warmup_turns,
+        "rss_mb": {"before": rss_before, "after": rss_after},
+        "rss_growth_mb": (
+            round(rss_after - rss_before, 2)
+            if rss_before is not None and rss_after is not None else None
+        ),
+        "allocated_blocks_growth": blocks_after - blocks_before,
+        "caches": cache_sizes(),
+        "threads": threading.active_count(),
+    }
+
+
+def steady_state_isolated(turns: int = 1000, warmup_turns: int = 100) -> dict[str, Any]:
+    """``steady_state`` on the default scenarios, in a fresh interpreter."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (str(_SRC), env.get("PYTHONPATH")) if p)
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp) / "steady.json"
+        proc = subprocess.run(
+            [sys.executable, __file__, "--mode", "steady", "--turns", str(turns),
+             "--warmup-turns", str(warmup_turns), "--budget-mb", "inf", "--out", str(out)],
+            capture_output=True, text=True, env=env, check=False,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"steady-state replay failed:\n{proc.stderr[-2000:]}")
+        return json.loads(out.read_text(encoding="utf-8"))
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--mode", choices=("profile", "steady"), default="profile")
+    parser.add_argument("--scenarios", type=Path, default=load.DEFAULT_SCENARIOS)
+    parser.add_argument("--recording", type=Path, default=load.DEFAULT_RECORDING)
+    parser.add_argument("--conversations", type=int, default=None,
+                        help="profile: traced conversations (default: 2 × scenarios)")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--turns", type=int, default=1000, help="steady: turns to replay")
+    parser.add_argument("--warmup-turns", type=int, default=100)
+    parser.add_argument("--budget-mb", type=float, default=budget_mb(),
+                        help="steady: maximum RSS growth")
+    parser.add_argument("--out", type=Path, help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    # Before the backend is imported: a developer .env must not turn on
+    # LangSmith tracing for a run that is meant to stay in-process.
+    os.environ["LANGSMITH_TRACING"] = "false"
+    scenarios = load.load_scenarios(args.scenarios)
+    recording = load.load_recording(args.recording)
+
+    if args.mode == "profile":
+        report = profile(scenarios, recording, conversations=args.conversations, top=args.top)
+    else:
+        report = steady_state(scenarios, recording, turns=args.turns, warmup_turns=args.warmup_turns)
+        report["budget_mb"] = args.budget_mb
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(text + "\n", encoding="utf-8")
+    growth = report.get("rss_growth_mb")
+    if growth is not None and growth > args.budget_mb:
+        print(f"FAIL: RSS grew {growth} MB over {report['turns']} turns "
+              f"(budget {args.budget_mb} MB)", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
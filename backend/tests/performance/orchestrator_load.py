@@ -0,0 +1,917 @@
+"""
+Offline, deterministic load profile for the full orchestrator.
+
+``locustfile.py`` measures the HTTP layer against the MOCK_LLM client; it
+cannot drive a realistic multi-turn planning conversation or say where a
+turn's time goes. This harness replays scripted conversations (dreaming →
+shaping → detailing → living, see ``scenarios/``) through
+``OrchestratorAgent.process_request_for_user`` in-process, at a configurable
+concurrency, against:
+
+- ``FakeSupabase`` — an in-memory stand-in for the supabase-py client (the
+  PostgREST query builder plus the RPCs a turn calls), installed as the
+  ``db_client`` singleton so every repository runs its real code;
+- ``RecordedGenAIClient`` — replays LLM responses from a recording
+  (``recordings/``), keyed by the calling function, with recorded latency.
+
+Nominatim is replaced by a deterministic stub; nothing leaves the process.
+
+The report gives throughput, P50/P95/P99 turn latency, DB round trips and LLM
+calls per turn (work on raw background threads is reported separately, since
+it does not belong to any one turn), and peak RSS. ``--out`` writes it as a
+JSON artifact for comparing commits.
+
+Run from ``backend/`` with the venv active:
+
+    python tests/performance/orchestrator_load.py --concurrency 8 --conversations 32 \\
+        --out tests/performance/reports/load_profile.json
+    python tests/performance/orchestrator_load.py --compare base.json head.json
+
+Refresh a recording against the real model (Gemini credentials in ``.env``;
+the database stays fake):
+
+    python tests/performance/orchestrator_load.py --record tests/performance/recordings/default.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextvars
+import copy
+import itertools
+import json
+import logging
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+HERE = Path(__file__).resolve().parent
+DEFAULT_SCENARIOS = HERE / "scenarios"
+DEFAULT_RECORDING = HERE / "recordings" / "default.json"
+
+logger = logging.getLogger("orchestrator_load")
+
+
+# ---------------------------------------------------------------------------
+# Per-turn accounting
+# ---------------------------------------------------------------------------
+
+@dataclass
+class TurnStats:
+    """Counters for one replayed turn. Bound through a ContextVar, so work the
+    orchestrator submits with ``copy_context().run`` (router + extractor) is
+    attributed to the turn; raw background threads land in ``_background``."""
+    db_round_trips: int = 0
+    llm_calls: int = 0
+    llm_overrides: dict[str, Any] = field(default_factory=dict)
+
+
+_current: contextvars.ContextVar[Optional[TurnStats]] = contextvars.ContextVar(
+    "load_turn_stats", default=None
+)
+_background = TurnStats()
+_background_lock = threading.Lock()
+
+
+def _count(attr: str) -> None:
+    stats = _current.get()
+    if stats is not None:
+        setattr(stats, attr, getattr(stats, attr) + 1)
+        return
+    with _background_lock:
+        setattr(_background, attr, getattr(_background, attr) + 1)
+
+
+# ---------------------------------------------------------------------------
+# Fake Supabase (PostgREST subset used by the repositories)
+# ---------------------------------------------------------------------------
+
+# Embedded relations that are one-to-one (child PK = parent FK): PostgREST
+# returns an object for these, a list for everything else.
+_ONE_TO_ONE = frozenset({"user_profiles", "credits", "conversations", "off_topic_state"})
+
+# Column defaults the schema would fill in on insert.
+_TABLE_DEFAULTS: dict[str, dict[str, Any]] = {
+    "trips": {
+        "status": "dreaming", "saga_state": None, "title": None, "reference_date": None,
+        "vision_summary": None, "discovery": {}, "travelers": {}, "preferences": {},
+        "country_intel": [], "budget": {}, "live_state": {}, "scratchpad": {},
+        "journal": {}, "cover": {},
+    },
+    "trip_destinations": {"status": "considering", "coords": None, "ord": 0, "iso_country": None},
+    "trip_checklist": {"done": False, "ord": 0},
+    "trip_day_blocks": {"ord": 0},
+    "user_profiles": {"profile_data": {}, "form_response": {}, "summary": "", "version": 0},
+    "conversations": {"recent_messages": [], "summary": ""},
+    "off_topic_state": {"count": 0, "last_flagged_ts": None, "restricted_until": None},
+}
+
+# Tables whose primary key is ``user_id`` rather than ``id``.
+_USER_KEYED = frozenset({"user_profiles", "credits", "conversations", "off_topic_state"})
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _split_columns(spec: str) -> list[str]:
+    """Split a select spec on top-level commas (``"a, rel(b, c)"`` → 2 parts)."""
+    parts, depth, buf = [], 0, []
+    for ch in spec:
+        if ch == "," and depth == 0:
+            parts.append("".join(buf).strip())
+            buf = []
+            continue
+        depth += ch == "("
+        depth -= ch == ")"
+        buf.append(ch)
+    if "".join(buf).strip():
+        parts.append("".join(buf).strip())
+    return parts
+
+
+class _Response:
+    def __init__(self, data: Any, count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+
+class _Query:
+    def __init__(self, db: "FakeSupabase", table: str):
+        self._db = db
+        self._table = table
+        self._op = "select"
+        self._columns = "*"
+        self._values: Any = None
+        self._on_conflict = "id"
+        self._filters: list[Callable[[dict], bool]] = []
+        self._order: list[tuple[str, bool]] = []
+        self._limit: Optional[int] = None
+        self._single: Optional[str] = None
+        self._count: Optional[str] = None
+
+    # -- operations ----------------------------------------------------
+    def select(self, columns: str = "*", count: Optional[str] = None, **_kw) -> "_Query":
+        self._columns, self._count = columns, count
+        return self
+
+    def insert(self, values: Any, **_kw) -> "_Query":
+        self._op, self._values = "insert", values
+        return self
+
+    def upsert(self, values: Any, on_conflict: str = "", **_kw) -> "_Query":
+        self._op, self._values = "upsert", values
+        self._on_conflict = on_conflict or ("user_id" if self._table in _USER_KEYED else "id")
+        return self
+
+    def update(self, values: dict, **_kw) -> "_Query":
+        self._op, self._values = "update", values
+        return self
+
+    def delete(self, **_kw) -> "_Query":
+        self._op = "delete"
+        return self
+
+    # -- filters / modifiers -------------------------------------------
+    def _where(self, pred: Callable[[dict], bool]) -> "_Query":
+        self._filters.append(pred)
+        return self
+
+    def eq(self, col: str, value: Any) -> "_Query":
+        return self._where(lambda r: _norm(r.get(col)) == _norm(value))
+
+    def neq(self, col: str, value: Any) -> "_Query":
+        return self._where(lambda r: _norm(r.get(col)) != _norm(value))
+
+    def in_(self, col: str, values: Any) -> "_Query":
+        wanted = {_norm(v) for v in values}
+        return self._where(lambda r: _norm(r.get(col)) in wanted)
+
+    def gt(self, col: str, value: Any) -> "_Query":
+        return self._where(lambda r: r.get(col) is not None and r.get(col) > value)
+
+    def gte(self, col: str, value: Any) -> "_Query":
+        return self._where(lambda r: r.get(col) is not None and r.get(col) >= value)
+
+    def lt(self, col: str, value: Any) -> "_Query":
+        return self._where(lambda r: r.get(col) is not None and r.get(col) < value)
+
+    def lte(self, col: str, value: Any) -> "_Query":
+        return self._where(lambda r: r.get(col) is not None and r.get(col) <= value)
+
+    def is_(self, col: str, value: Any) -> "_Query":
+        target = None if value in (None, "null") else value
+        return self._where(lambda r: r.get(col) is target or r.get(col) == target)
+
+    def order(self, col: str, desc: bool = False, **_kw) -> "_Query":
+        self._order.append((col, desc))
+        return self
+
+    def limit(self, n: int, **_kw) -> "_Query":
+        self._limit = n
+        return self
+
+    def single(self) -> "_Query":
+        self._single = "single"
+        return self
+
+    def maybe_single(self) -> "_Query":
+        self._single = "maybe"
+        return self
+
+    # -- execution ------------------------------------------------------
+    def execute(self) -> _Response:
+        _count("db_round_trips")
+        self._db.simulate_latency()
+        with self._db.lock:
+            rows = getattr(self, f"_exec_{self._op}")()
+        if self._single is not None:
+            return _Response(rows[0] if rows else None)
+        return _Response(rows, len(rows) if self._count else None)
+
+    def _matching(self) -> list[dict]:
+        return [r for r in self._db.rows(self._table) if all(f(r) for f in self._filters)]
+
+    def _exec_select(self) -> list[dict]:
+        rows = self._matching()
+        for col, desc in reversed(self._order):
+            rows.sort(key=lambda r: (r.get(col) is None, r.get(col) or ""), reverse=desc)
+        if self._limit is not None:
+            rows = rows[: self._limit]
+        return [self._project(r) for r in rows]
+
+    def _project(self, row: dict) -> dict:
+        out: dict[str, Any] = {}
+        for part in _split_columns(self._columns):
+            if part == "*":
+                out.update(copy.deepcopy(row))
+            elif "(" in part:
+                rel, inner = part[:-1].split("(", 1)
+                out[rel.strip()] = self._embed(row, rel.strip(), inner)
+            elif "->" in part:  # "alias:column->key" JSON path
+                alias, _, path = part.rpartition(":")
+                col, key = path.split("->", 1)
+                value = copy.deepcopy((row.get(col) or {}).get(key))
+                out[alias or key] = value
+            else:
+                out[part] = copy.deepcopy(row.get(part))
+        return out
+
+    def _embed(self, parent: dict, rel: str, columns: str) -> Any:
+        fk = self._table[:-1] + "_id"  # users → user_id, trips → trip_id
+        sub = _Query(self._db, rel).select(columns)
+        children = [sub._project(r) for r in self._db.rows(rel) if r.get(fk) == parent.get("id")]
+        if rel in _ONE_TO_ONE:
+            return children[0] if children else None
+        return children
+
+    def _exec_insert(self) -> list[dict]:
+        rows = self._values if isinstance(self._values, list) else [self._values]
+        return [copy.deepcopy(self._db.insert(self._table, r)) for r in rows]
+
+    def _exec_upsert(self) -> list[dict]:
+        rows = self._values if isinstance(self._values, list) else [self._values]
+        keys = [k.strip() for k in self._on_conflict.split(",")]
+        out = []
+        for values in rows:
+            existing = None
+            if all(values.get(k) is not None for k in keys):
+                existing = next(
+                    (r for r in self._db.rows(self._table)
+                     if all(_norm(r.get(k)) == _norm(values.get(k)) for k in keys)),
+                    None,
+                )
+            if existing is not None:
+                existing.update(copy.deepcopy(values))
+                out.append(copy.deepcopy(existing))
+            else:
+                out.append(copy.deepcopy(self._db.insert(self._table, values)))
+        return out
+
+    def _exec_update(self) -> list[dict]:
+        rows = self._matching()
+        for r in rows:
+            r.update(copy.deepcopy(self._values))
+        return [copy.deepcopy(r) for r in rows]
+
+    def _exec_delete(self) -> list[dict]:
+        rows = self._matching()
+        ids = {id(r) for r in rows}
+        self._db.tables[self._table] = [r for r in self._db.rows(self._table) if id(r) not in ids]
+        return rows
+
+
+class _Rpc:
+    def __init__(self, db: "FakeSupabase", name: str, params: dict):
+        self._db, self._name, self._params = db, name, params or {}
+
+    def execute(self) -> _Response:
+        _count("db_round_trips")
+        self._db.simulate_latency()
+        handler = _RPCS.get(self._name)
+        with self._db.lock:
+            return _Response(handler(self._db, self._params) if handler else None)
+
+
+def _norm(value: Any) -> Any:
+    return str(value) if isinstance(value, uuid.UUID) else value
+
+
+def _rpc_debit(db: "FakeSupabase", params: dict) -> Optional[int]:
+    credits = db.first("credits", user_id=params.get("p_user_id"))
+    if credits is None:
+        return None
+    delta = params.get("p_delta")
+    if delta is None:
+        delta = -int(params.get("p_cost_credits") or params.get("p_amount") or 0)
+    credits["balance"] = max(0, int(credits.get("balance", 0)) + int(delta))
+    return credits["balance"]
+
+
+def _rpc_merge_trip_discovery(db: "FakeSupabase", params: dict) -> bool:
+    trip = db.first("trips", id=params.get("p_trip_id"), user_id=params.get("p_user_id"))
+    if trip is None:
+        return False
+    merged = {**(trip.get("discovery") or {}), **(params.get("p_patch") or {})}
+    trip["discovery"] = {k: v for k, v in merged.items() if v is not None}
+    trip["updated_at"] = _now_iso()
+    return True
+
+
+def _rpc_set_destination_coords(db: "FakeSupabase", params: dict) -> int:
+    updated = 0
+    for item in params.get("p_rows") or []:
+        row = db.first("trip_destinations", id=item.get("id"), trip_id=params.get("p_trip_id"))
+        if row is not None:
+            row["coords"] = item.get("coords")
+            updated += 1
+    return updated
+
+
+_RPCS: dict[str, Callable[["FakeSupabase", dict], Any]] = {
+    "apply_credit_delta": _rpc_debit,
+    "bill_turn": _rpc_debit,
+    "merge_trip_discovery": _rpc_merge_trip_discovery,
+    "set_destination_coords": _rpc_set_destination_coords,
+}
+
+
+class FakeSupabase:
+    """In-memory supabase-py ``Client`` for the PostgREST calls the backend
+    makes. ``latency_ms`` adds a fixed sleep per round trip (the real client
+    pays a network hop per ``execute()``)."""
+
+    def __init__(self, latency_ms: float = 0.0):
+        self.tables: dict[str, list[dict]] = {}
+        self.lock = threading.RLock()
+        self.latency_s = latency_ms / 1000.0
+
+    def simulate_latency(self) -> None:
+        if self.latency_s > 0:
+            time.sleep(self.latency_s)
+
+    def table(self, name: str) -> _Query:
+        return _Query(self, name)
+
+    def rpc(self, name: str, params: Optional[dict] = None) -> _Rpc:
+        return _Rpc(self, name, params or {})
+
+    def rows(self, table: str) -> list[dict]:
+        return self.tables.setdefault(table, [])
+
+    def first(self, table: str, **match: Any) -> Optional[dict]:
+        return next(
+            (r for r in self.rows(table) if all(_norm(r.get(k)) == _norm(v) for k, v in match.items())),
+            None,
+        )
+
+    def insert(self, table: str, values: dict) -> dict:
+        now = _now_iso()
+        row = {**_TABLE_DEFAULTS.get(table, {}), "created_at": now, "updated_at": now}
+        if table not in _USER_KEYED:
+            row["id"] = str(uuid.uuid4())
+        row.update(copy.deepcopy(values))
+        self.rows(table).append(row)
+        return row
+
+    def seed_user(self, user: dict[str, Any], credits: int) -> str:
+        """Insert a users row plus its one-to-one children; returns the id."""
+        with self.lock:
+            user_id = str(uuid.uuid4())
+            self.insert("users", {
+                "id": user_id, "name": user.get("name", "Load Tester"),
+                "telegram_id": f"load-{user_id[:8]}", "location": user.get("location"),
+                "source": "load_test",
+            })
+            self.insert("user_profiles", {
+                "user_id": user_id, "profile_data": copy.deepcopy(user.get("profile_data") or {}),
+                "summary": user.get("summary", ""),
+            })
+            self.insert("credits", {"user_id": user_id, "balance": credits, "initial_grant": credits})
+            self.insert("conversations", {"user_id": user_id})
+            self.insert("off_topic_state", {"user_id": user_id})
+        return user_id
+
+
+# ---------------------------------------------------------------------------
+# Recorded LLM client
+# ---------------------------------------------------------------------------
+
+_SKIP_MODULES = ("agentic_traveler.orchestrator.client_factory", "agentic_traveler.core.observability")
+
+
+def call_site(depth: int = 2) -> str:
+    """``module:qualname`` of the first backend frame that is not the Gemini
+    funnel — the stable key a recording is looked up by, e.g.
+    ``orchestrator.router_agent:RouterAgent.classify``."""
+    frame = sys._getframe(depth)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("agentic_traveler.") and not module.startswith(_SKIP_MODULES):
+            code = frame.f_code
+            return f"{module[len('agentic_traveler.'):]}:{getattr(code, 'co_qualname', code.co_name)}"
+        frame = frame.f_back
+    return "unknown"
+
+
+class _Usage:
+    def __init__(self, prompt: int, output: int):
+        self.prompt_token_count = prompt
+        self.candidates_token_count = output
+        self.thoughts_token_count = 0
+        self.cached_content_token_count = 0
+
+
+class _Part:
+    def __init__(self, text: str):
+        self.text = text
+        self.function_call = None
+        self.thought = None
+
+
+class _Content:
+    def __init__(self, text: str):
+        self.parts = [_Part(text)]
+        self.role = "model"
+
+
+class _Candidate:
+    def __init__(self, text: str):
+        self.content = _Content(text)
+        self.grounding_metadata = None
+        self.finish_reason = "STOP"
+
+
+class RecordedResponse:
+    """The slice of ``GenerateContentResponse`` the backend reads."""
+
+    def __init__(self, text: str, prompt_tokens: int, output_tokens: int):
+        self.text = text
+        self.candidates = [_Candidate(text)]
+        self.usage_metadata = _Usage(prompt_tokens, output_tokens)
+        self.function_calls = None
+        self.automatic_function_calling_history = []
+
+
+def _approx_tokens(value: Any) -> int:
+    return max(1, len(str(value)) // 4)
+
+
+class RecordedGenAIClient:
+    """Replays recorded responses keyed by ``call_site()``.
+
+    Lookup order per call: the running turn's ``llm`` overrides (from the
+    scenario), then the recording's ``calls`` entry, then its ``default``
+    (JSON or text, following ``response_mime_type``). Every call sleeps for
+    the recorded ``latency_ms`` × ``latency_scale``; token counts are
+    estimated from the prompt and response size. Unmatched call sites are
+    collected in ``unmatched`` so a recording can be extended.
+    """
+
+    def __init__(self, recording: dict[str, Any], latency_scale: float = 1.0):
+        self._calls: dict[str, Any] = recording.get("calls") or {}
+        self._default: dict[str, Any] = recording.get("default") or {}
+        self._scale = latency_scale
+        self.unmatched: set[str] = set()
+        self.models = self
+
+    def _resolve(self, key: str, config: Any) -> tuple[Any, float]:
+        stats = _current.get()
+        entry = self._calls.get(key)
+        latency = (entry or {}).get("latency_ms", self._default.get("latency_ms", 0))
+        if stats is not None and key in stats.llm_overrides:
+            return stats.llm_overrides[key], latency
+        if entry is not None:
+            return entry.get("response"), latency
+        self.unmatched.add(key)
+        if getattr(config, "response_mime_type", None) == "application/json":
+            return self._default.get("json", {}), latency
+        return self._default.get("text", ""), latency
+
+    def _respond(self, contents: Any, config: Any) -> RecordedResponse:
+        _count("llm_calls")
+        payload, latency_ms = self._resolve(call_site(3), config)
+        text = payload if isinstance(payload, str) else json.dumps(payload)
+        if latency_ms and self._scale > 0:
+            time.sleep(latency_ms * self._scale / 1000.0)
+        system = getattr(config, "system_instruction", None) or ""
+        return RecordedResponse(text, _approx_tokens(contents) + _approx_tokens(system), _approx_tokens(text))
+
+    def generate_content(self, model: str, contents: Any, config: Any = None) -> RecordedResponse:
+        return self._respond(contents, config)
+
+    def generate_content_stream(self, model: str, contents: Any, config: Any = None) -> Iterator[RecordedResponse]:
+        yield self._respond(contents, config)
+
+
+class RecordingGenAIClient:
+    """Wraps a real ``genai.Client`` and records one response per call site
+    (the last one seen) in the recording format ``RecordedGenAIClient`` reads."""
+
+    def __init__(self, client: Any):
+        self._client = client
+        self.calls: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.models = self
+
+    def _record(self, key: str, text: str, latency_ms: float, config: Any) -> None:
+        response: Any = text
+        if getattr(config, "response_mime_type", None) == "application/json":
+            try:
+                response = json.loads(text)
+            except ValueError:
+                pass
+        with self._lock:
+            self.calls[key] = {"latency_ms": round(latency_ms), "response": response}
+
+    def generate_content(self, model: str, contents: Any, config: Any = None) -> Any:
+        key, t = call_site(2), time.perf_counter()
+        resp = self._client.models.generate_content(model=model, contents=contents, config=config)
+        self._record(key, getattr(resp, "text", None) or "", (time.perf_counter() - t) * 1000, config)
+        return resp
+
+    def generate_content_stream(self, model: str, contents: Any, config: Any = None) -> Iterator[Any]:
+        key, t, parts = call_site(2), time.perf_counter(), []
+        for chunk in self._client.models.generate_content_stream(model=model, contents=contents, config=config):
+            parts.append(getattr(chunk, "text", None) or "")
+            yield chunk
+        self._record(key, "".join(parts), (time.perf_counter() - t) * 1000, config)
+
+
+# ---------------------------------------------------------------------------
+# Scenarios
+# ---------------------------------------------------------------------------
+
+_DATE_TOKEN = re.compile(r"\{today([+-]\d+)?\}")
+
+
+def _expand(value: Any, today: date) -> Any:
+    """Resolve ``{today}`` / ``{today+N}`` placeholders to ISO dates, so a
+    scenario's "living" phase is always in progress."""
+    if isinstance(value, str):
+        return _DATE_TOKEN.sub(lambda m: (today + timedelta(days=int(m.group(1) or 0))).isoformat(), value)
+    if isinstance(value, list):
+        return [_expand(v, today) for v in value]
+    if isinstance(value, dict):
+        return {k: _expand(v, today) for k, v in value.items()}
+    return value
+
+
+def load_scenarios(path: Path = DEFAULT_SCENARIOS) -> list[dict[str, Any]]:
+    files = sorted(path.glob("*.json")) if path.is_dir() else [path]
+    today = date.today()
+    return [_expand(json.loads(f.read_text(encoding="utf-8")), today) for f in files]
+
+
+def load_recording(path: Path = DEFAULT_RECORDING) -> dict[str, Any]:
+    return _expand(json.loads(Path(path).read_text(encoding="utf-8")), date.today())
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+@dataclass
+class TurnResult:
+    scenario: str
+    phase: str
+    latency_ms: float
+    db_round_trips: int
+    llm_calls: int
+    ok: bool
+
+
+def _geocode_stub(name: str) -> Optional[dict]:
+    seed = sum(map(ord, name.strip().lower()))
+    return {"lat": (seed % 180) - 90.0, "lng": (seed * 7 % 360) - 180.0,
+            "display_name": name, "geocoded_at": _now_iso()}
+
+
+@contextmanager
+def offline(db: FakeSupabase, client: Any) -> Iterator[None]:
+    """Route every backend DB and LLM call to ``db`` / ``client`` and stub the
+    geocoder, restoring the originals afterwards."""
+    from agentic_traveler.orchestrator import client_factory
+    from agentic_traveler.tools import db_client, geocode_queue
+
+    real_get_client = client_factory.get_client
+    patched: list[tuple[Any, str, Any]] = [
+        (geocode_queue, "geocode_destination", geocode_queue.geocode_destination),
+    ]
+    # Modules bind get_client at import; swap every binding.
+    for module in list(sys.modules.values()):
+        if getattr(module, "__name__", "").startswith("agentic_traveler") \
+                and getattr(module, "get_client", None) is real_get_client:
+            patched.append((module, "get_client", real_get_client))
+    geocode_queue.geocode_destination = _geocode_stub
+    for module, name, _orig in patched:
+        if name == "get_client":
+            setattr(module, name, lambda: client)
+    try:
+        with db_client.get_db.override(db):
+            yield
+    finally:
+        for module, name, orig in patched:
+            setattr(module, name, orig)
+
+
+def _run_conversation(agent: Any, db: FakeSupabase, scenario: dict[str, Any], credits: int) -> list[TurnResult]:
+    user_id = db.seed_user(scenario.get("user") or {}, credits)
+    focused: Optional[str] = None
+    results = []
+    for turn in scenario["turns"]:
+        stats = TurnStats(llm_overrides=turn.get("llm") or {})
+        token = _current.set(stats)
+        t = time.perf_counter()
+        ok = True
+        try:
+            resp = agent.process_request_for_user(
+                user_id, turn.get("text", ""),
+                selection=turn.get("selection"),
+                capability=turn.get("capability"),
+                focused_trip_id=focused,
+            )
+            focused = resp.get("focus_trip_id") or focused
+            ok = resp.get("action") not in ("ERROR", "NO_CREDITS", "ONBOARDING_REQUIRED")
+        except Exception:
+            logger.exception("Turn failed (%s / %s)", scenario.get("name"), turn.get("phase"))
+            ok = False
+        finally:
+            latency = (time.perf_counter() - t) * 1000
+            _current.reset(token)
+        results.append(TurnResult(
+            scenario=scenario.get("name", "?"), phase=turn.get("phase", "?"),
+            latency_ms=latency, db_round_trips=stats.db_round_trips,
+            llm_calls=stats.llm_calls, ok=ok,
+        ))
+    return results
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100.0
+    lo, hi = int(k), min(int(k) + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def _distribution(values: list[float]) -> dict[str, float]:
+    return {
+        "mean": round(sum(values) / len(values), 2) if values else 0.0,
+        "p50": round(_percentile(values, 50), 2),
+        "p95": round(_percentile(values, 95), 2),
+        "p99": round(_percentile(values, 99), 2),
+        "max": round(max(values), 2) if values else 0.0,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=HERE,
+            capture_output=True, text=True, timeout=5, check=True,
+        ).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def summarize(results: list[TurnResult], wall_s: float, config: dict[str, Any],
+              background: TurnStats, unmatched: set[str]) -> dict[str, Any]:
+    phases: dict[str, list[TurnResult]] = {}
+    for r in results:
+        phases.setdefault(r.phase, []).append(r)
+    return {
+        "schema": 1,
+        "commit": _git_commit(),
+        "timestamp": _now_iso(),
+        "python": sys.version.split()[0],
+        "config": config,
+        "turns": len(results),
+        "errors": sum(not r.ok for r in results),
+        "wall_s": round(wall_s, 3),
+        "throughput_turns_per_s": round(len(results) / wall_s, 2) if wall_s else 0.0,
+        "latency_ms": _distribution([r.latency_ms for r in results]),
+        "db_round_trips_per_turn": _distribution([r.db_round_trips for r in results]),
+        "llm_calls_per_turn": _distribution([r.llm_calls for r in results]),
+        "background": {"db_round_trips": background.db_round_trips, "llm_calls": background.llm_calls},
+        "by_phase": {
+            phase: {
+                "turns": len(rs),
+                "latency_ms": _distribution([r.latency_ms for r in rs]),
+                "db_round_trips_mean": round(sum(r.db_round_trips for r in rs) / len(rs), 2),
+                "llm_calls_mean": round(sum(r.llm_calls for r in rs) / len(rs), 2),
+            }
+            for phase, rs in phases.items()
+        },
+        "peak_rss_mb": _peak_rss_mb(),
+        "unrecorded_call_sites": sorted(unmatched),
+    }
+
+
+def run_load(
+    scenarios: list[dict[str, Any]],
+    recording: dict[str, Any],
+    *,
+    concurrency: int = 4,
+    conversations: Optional[int] = None,
+    llm_latency_scale: float = 1.0,
+    db_latency_ms: float = 0.0,
+    credits: int = 1_000_000,
+    client: Any = None,
+) -> dict[str, Any]:
+    """Replay ``conversations`` conversations (cycling through ``scenarios``)
+    on ``concurrency`` worker threads and return the summary dict."""
+    from agentic_traveler.analytics import metrics_tracker
+    from agentic_traveler.orchestrator.agent import OrchestratorAgent
+    from agentic_traveler.orchestrator.sagas import brief_pipeline
+    from agentic_traveler.tools import geocode_queue
+
+    conversations = conversations or concurrency * 2
+    db = FakeSupabase(latency_ms=db_latency_ms)
+    client = client or RecordedGenAIClient(recording, latency_scale=llm_latency_scale)
+    global _background
+    _background = TurnStats()
+    config = {
+        "concurrency": concurrency, "conversations": conversations,
+        "scenarios": [s.get("name") for s in scenarios],
+        "llm_latency_scale": llm_latency_scale, "db_latency_ms": db_latency_ms,
+    }
+    with offline(db, client):
+        agent = OrchestratorAgent()
+        jobs = list(itertools.islice(itertools.cycle(scenarios), conversations))
+        t = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="load") as pool:
+            batches = list(pool.map(lambda s: _run_conversation(agent, db, s, credits), jobs))
+        wall = time.perf_counter() - t
+        # Let background writers (briefs, geocoding) finish against the fake DB.
+        brief_pipeline.wait_idle()
+        geocode_queue.wait_idle()
+        # The weekly counters would otherwise flush to the real DB at exit.
+        metrics_tracker.flush(sync=True)
+    results = [r for batch in batches for r in batch]
+    return summarize(results, wall, config, _background, getattr(client, "unmatched", set()))
+
+
+# ---------------------------------------------------------------------------
+# Comparison
+# ---------------------------------------------------------------------------
+
+_COMPARED = (
+    ("throughput_turns_per_s", None, True),
+    ("latency_ms", "p50", False),
+    ("latency_ms", "p95", False),
+    ("latency_ms", "p99", False),
+    ("db_round_trips_per_turn", "mean", False),
+    ("llm_calls_per_turn", "mean", False),
+    ("peak_rss_mb", None, False),
+)
+
+
+def compare(base: dict[str, Any], head: dict[str, Any], threshold_pct: float = 10.0) -> list[str]:
+    """Human-readable deltas for the headline metrics; a line is flagged
+    ``REGRESSION`` when it is worse than ``threshold_pct``."""
+    lines = []
+    for key, sub, higher_is_better in _COMPARED:
+        a, b = base.get(key), head.get(key)
+        if sub is not None:
+            a, b = (a or {}).get(sub), (b or {}).get(sub)
+        if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
+            continue
+        change = ((b - a) / a * 100.0) if a else 0.0
+        worse = -change if higher_is_better else change
+        flag = "  REGRESSION" if worse > threshold_pct else ""
+        name = f"{key}.{sub}" if sub else key
+        lines.append(f"{name:32s} {a:>10} → {b:<10} ({change:+.1f}%){flag}")
+    return lines
+
+
+def _print_report(report: dict[str, Any]) -> None:
+    lat = report["latency_ms"]
+    print(f"{report['turns']} turns in {report['wall_s']}s "
+          f"({report['throughput_turns_per_s']} turns/s), {report['errors']} errors")
+    print(f"latency ms      p50={lat['p50']} p95={lat['p95']} p99={lat['p99']} max={lat['max']}")
+    print(f"db trips/turn   mean={report['db_round_trips_per_turn']['mean']} "
+          f"p95={report['db_round_trips_per_turn']['p95']}")
+    print(f"llm calls/turn  mean={report['llm_calls_per_turn']['mean']} "
+          f"p95={report['llm_calls_per_turn']['p95']}")
+    print(f"background      {report['background']}")
+    print(f"peak RSS MB     {report['peak_rss_mb']}")
+    for phase, row in report["by_phase"].items():
+        print(f"  {phase:10s} n={row['turns']:<4} p50={row['latency_ms']['p50']:<9} "
+              f"p95={row['latency_ms']['p95']:<9} db={row['db_round_trips_mean']:<6} "
+              f"llm={row['llm_calls_mean']}")
+    if report["unrecorded_call_sites"]:
+        print("unrecorded call sites (served the default):", ", ".join(report["unrecorded_call_sites"]))
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scenarios", type=Path, default=DEFAULT_SCENARIOS,
+                        help="scenario file or directory of *.json scenarios")
+    parser.add_argument("--recording", type=Path, default=DEFAULT_RECORDING)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--conversations", type=int, default=None,
+                        help="conversations to replay (default: 2 × concurrency)")
+    parser.add_argument("--llm-latency-scale", type=float, default=1.0,
+                        help="multiplier on recorded LLM latency (0 = CPU only)")
+    parser.add_argument("--db-latency-ms", type=float, default=0.0,
+                        help="simulated latency per DB round trip")
+    parser.add_argument("--out", type=Path, help="write the JSON report here")
+    parser.add_argument("--record", type=Path,
+                        help="run once against the real model and write a recording")
+    parser.add_argument("--compare", nargs=2, type=Path, metavar=("BASE", "HEAD"),
+                        help="compare two reports and exit")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="regression threshold in percent for --compare")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        base, head = (json.loads(p.read_text(encoding="utf-8")) for p in args.compare)
+        lines = compare(base, head, args.threshold)
+        print("\n".join(lines))
+        return 1 if any(line.endswith("REGRESSION") for line in lines) else 0
+
+    logging.basicConfig(level=logging.WARNING)
+    # Before the backend is imported: a developer .env must not turn on
+    # LangSmith tracing for a run that is meant to stay in-process.
+    os.environ["LANGSMITH_TRACING"] = "false"
+    scenarios = load_scenarios(args.scenarios)
+
+    if args.record:
+        from agentic_traveler.orchestrator.client_factory import get_client
+
+        real = get_client()
+        if real is None:
+            print("No Gemini credentials configured; cannot record.", file=sys.stderr)
+            return 2
+        recorder = RecordingGenAIClient(real)
+        run_load(scenarios, {}, concurrency=1, conversations=len(scenarios), client=recorder)
+        # Keep the hand-written fallback of the recording being replaced.
+        default = (
+            json.loads(args.recording.read_text(encoding="utf-8")).get("default", {})
+            if args.recording.exists() else {}
+        )
+        args.record.parent.mkdir(parents=True, exist_ok=True)
+        args.record.write_text(json.dumps(
+            {"default": default, "calls": dict(sorted(recorder.calls.items()))},
+            indent=2, ensure_ascii=False,
+        ) + "\n", encoding="utf-8")
+        print(f"Recorded {len(recorder.calls)} call sites → {args.record}")
+        return 0
+
+    report = run_load(
+        scenarios, load_recording(args.recording),
+        concurrency=args.concurrency, conversations=args.conversations,
+        llm_latency_scale=args.llm_latency_scale, db_latency_ms=args.db_latency_ms,
+    )
+    _print_report(report)
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Report → {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
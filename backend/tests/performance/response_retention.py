@@ -0,0 +1,159 @@
+"""
+Memory an in-flight turn pins through its agent result, raw responses vs
+TurnArtifacts.
+
+Between the reply call and the end of the turn (history save, judge sampling,
+billing) the agent result dict stays alive. Before TurnArtifacts it held the
+reply's ``GenerateContentResponse`` and every grounded search response. Those
+carry candidates, grounding chunks and supports, the search entry point widget
+and the automatic function-calling history, which repeats the whole prompt
+and every tool result. This builds SDK responses of production shape and size
+(parsed from API-style JSON, as the SDK does) on TURNS threads at once. Each
+thread keeps its result in either shape until every turn is in flight, then
+the traced bytes are read. Run from ``backend/``:
+
+    python tests/performance/response_retention.py
+    python tests/performance/response_retention.py --turns 50 --searches 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import threading
+import tracemalloc
+from typing import Any
+
+from google.genai import types
+
+from agentic_traveler.orchestrator.turn_artifacts import TurnArtifacts, call_artifacts
+
+_PROMPT_CHARS = 6000    # assembled chat/trip prompt (profile, context, message)
+_REPLY_CHARS = 1800
+_SEARCH_CHARS = 2500
+_WIDGET_CHARS = 5000    # search_entry_point.rendered_content (HTML + CSS)
+
+
+def _text(seed: str, n: int) -> str:
+    return (f"{seed} " * (n // (len(seed) + 1) + 1))[:n]
+
+
+def _grounding(seed: str, chunks: int = 8, supports: int = 12) -> dict[str, Any]:
+    return {
+        "grounding_chunks": [
+            {"web": {"uri": f"https://vertexaisearch.cloud.google.com/grounding-api-redirect/{seed}{i:04d}"
+                            + "x" * 180, "title": f"source-{i}.example.com"}}
+            for i in range(chunks)
+        ],
+        "grounding_supports": [
+            {"segment": {"start_index": i * 100, "end_index": i * 100 + 90, "text": _text(seed, 90)},
+             "grounding_chunk_indices": [i % chunks, (i + 1) % chunks],
+             "confidence_scores": [0.91, 0.74]}
+            for i in range(supports)
+        ],
+        "search_entry_point": {"rendered_content": _text(f"<style>{seed}</style>", _WIDGET_CHARS)},
+        "web_search_queries": [f"{seed} query {i}" for i in range(3)],
+    }
+
+
+def _response(seed: str, text: str, afc: list[dict[str, Any]] | None = None) -> types.GenerateContentResponse:
+    return types.GenerateContentResponse.model_validate({
+        "candidates": [{
+            "content": {"role": "model", "parts": [{"text": text}]},
+            "finish_reason": "STOP",
+            "grounding_metadata": _grounding(seed),
+        }],
+        "usage_metadata": {"prompt_token_count": 2100, "candidates_token_count": 480,
+                           "thoughts_token_count": 256, "total_token_count": 2836},
+        "model_version": "gemini-3.5-flash",
+        "response_id": seed,
+        "sdk_http_response": {"headers": {f"x-header-{i}": _text(seed, 40) for i in range(12)}},
+        "automatic_function_calling_history": afc or [],
+    })
+
+
+def _turn_responses(turn: int, searches: int) -> tuple[types.GenerateContentResponse, list]:
+    """The reply (after ``searches`` tool calls) and the search responses."""
+    search_responses = [
+        _response(f"t{turn}s{j}", _text(f"search {turn}.{j}", _SEARCH_CHARS)) for j in range(searches)
+    ]
+    afc: list[dict[str, Any]] = [{"role": "user", "parts": [{"text": _text(f"prompt {turn}", _PROMPT_CHARS)}]}]
+    for j, s in enumerate(search_responses):
+        afc.append({"role": "model", "parts": [{"function_call": {
+            "name": "search_web", "args": {"queries": [f"q{turn}.{j}"], "format": "structured"}}}]})
+        afc.append({"role": "user", "parts": [{"function_response": {
+            "name": "search_web", "response": {"result": s.text}}}]})
+    return _response(f"t{turn}", _text(f"reply {turn}", _REPLY_CHARS), afc), search_responses
+
+
+def _result(shape: str, reply: Any, searches: list) -> dict[str, Any]:
+    if shape == "raw":  # the agent result before TurnArtifacts
+        return {
+            "text": reply.text, "action": "CHAT_RESPONSE",
+            "_raw_response": reply,
+            "_search_responses": [{"raw": s, "lat": 900.0} for s in searches],
+            "_latency_ms": 2400.0,
+        }
+    return {
+        "text": reply.text, "action": "CHAT_RESPONSE",
+        "_artifacts": TurnArtifacts(
+            call_artifacts(reply, 2400.0), tuple(call_artifacts(s, 900.0) for s in searches),
+        ),
+        "_latency_ms": 2400.0,
+    }
+
+
+def measure(shape: str, turns: int = 50, searches: int = 2) -> dict[str, Any]:
+    """Traced bytes held per in-flight turn with ``turns`` turns in flight."""
+    call_artifacts(_response("warm", "warm"))  # import the lazy helpers untraced
+    in_flight = threading.Barrier(turns + 1)
+    release = threading.Event()
+
+    def turn(n: int) -> None:
+        reply, search_responses = _turn_responses(n, searches)
+        result = _result(shape, reply, search_responses)
+        del reply, search_responses
+        in_flight.wait()
+        release.wait()  # saving history, judging, billing…
+        assert result["text"]
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        threads = [threading.Thread(target=turn, args=(n,)) for n in range(turns)]
+        for t in threads:
+            t.start()
+        in_flight.wait()
+        gc.collect()
+        held, peak = tracemalloc.get_traced_memory()
+        release.set()
+        for t in threads:
+            t.join()
+    finally:
+        tracemalloc.stop()
+    return {
+        "shape": shape,
+        "turns": turns,
+        "searches_per_turn": searches,
+        "held_kib_per_turn": round((held - base) / turns / 1024, 1),
+        "peak_kib_per_turn": round((peak - base) / turns / 1024, 1),
+        "held_mib_total": round((held - base) / 1024 / 1024, 2),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--turns", type=int, default=50)
+    parser.add_argument("--searches", type=int, default=2, help="grounded searches per turn")
+    args = parser.parse_args(argv)
+
+    results = [measure(shape, args.turns, args.searches) for shape in ("raw", "artifacts")]
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,9 @@
+"""Smoke test for the curiosity prompt index benchmark."""
+
+import curiosity_index
+
+
+def test_index_matches_full_scan_on_a_synthetic_library():
+    result = curiosity_index.run(size=500, number=50)
+    assert result["mismatches"] == 0
+    assert result["library_size"] == 500
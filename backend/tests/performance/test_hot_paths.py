@@ -0,0 +1,38 @@
+"""Smoke test for the hot-path micro-benchmarks (hot_paths.py).
+
+Only checks that every case still runs against its fixture and that the
+regression gate works; the timings themselves are taken by the CLI.
+"""
+
+import json
+
+import pytest
+
+import hot_paths
+
+
+@pytest.mark.parametrize("case", hot_paths.CASES, ids=lambda c: c.name)
+def test_every_case_runs(case):
+    case.setup()()
+
+
+def test_stored_baseline_covers_every_case():
+    baseline = json.loads(hot_paths.BASELINE.read_text(encoding="utf-8"))
+    assert set(baseline["cases"]) == {c.name for c in hot_paths.CASES}
+    assert all(row["rel"] > 0 for row in baseline["cases"].values())
+
+
+def test_compare_flags_only_cases_over_the_threshold():
+    baseline = {"cases": {"a": {"rel": 1.0, "us": 10}, "b": {"rel": 1.0, "us": 10}}}
+    current = {"cases": {"a": {"rel": 1.2, "us": 12}, "b": {"rel": 1.5, "us": 9}, "c": {"rel": 1, "us": 1}}}
+
+    _, regressed = hot_paths.compare(baseline, current, threshold_pct=25)
+    assert regressed == ["b"]
+    _, regressed = hot_paths.compare(baseline, current, threshold_pct=10, metric="us")
+    assert regressed == ["a"]
+
+
+def test_run_reports_relative_cost():
+    report = hot_paths.run(only="sanitize_user_input", min_run_s=0.001, repeats=1)
+    assert list(report["cases"]) == ["sanitize_user_input"]
+    assert report["cases"]["sanitize_user_input"]["rel"] > 0
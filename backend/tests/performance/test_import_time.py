@@ -0,0 +1,21 @@
+"""Cold-import budget for the API entry point (see import_time.py)."""
+
+import pytest
+
+import import_time
+
+
+def test_parse_importtime_reads_self_and_cumulative():
+    rows = import_time.parse_importtime(
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   json.decoder\n"
+        "import time:      2500 |       2620 | json\n"
+    )
+    assert rows == [("json.decoder", 0.12, 0.12), ("json", 2.5, 2.62)]
+
+
+@pytest.mark.perf
+def test_main_imports_within_budget_and_defers_heavy_packages():
+    report = import_time.measure(runs=2, top=5)
+    assert report["eager_lazy_packages"] == []
+    assert report["total_ms"] <= import_time.budget_ms(), report["slowest"]
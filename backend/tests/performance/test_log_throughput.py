@@ -0,0 +1,16 @@
+"""Smoke test for the concurrent logging latency benchmark."""
+
+import logging
+
+import log_throughput
+
+
+def test_measure_reports_latency_and_restores_root_logger():
+    root = logging.getLogger()
+    before = root.handlers[:]
+    for mode in ("console", "json"):
+        result = log_throughput.measure(mode, threads=4, calls=20)
+        assert result["calls"] == 80
+        assert 0 < result["p50_us"] <= result["p99_us"] <= result["max_us"]
+        assert result["dropped"] == 0
+    assert root.handlers == before
@@ -0,0 +1,44 @@
+"""Memory profile smoke test and the steady-state growth budget (memory_profile.py)."""
+
+import os
+
+import pytest
+
+import memory_profile as mp
+import orchestrator_load as load
+from agentic_traveler.orchestrator.profile_utils import clear_profile_summary_cache
+from agentic_traveler.tools import brief_cache, search_cache
+from agentic_traveler.tools.trip_repo import clear_trip_index
+
+pytestmark = pytest.mark.perf
+
+
+@pytest.fixture(autouse=True)
+def _clean_caches():
+    yield
+    brief_cache.clear()
+    search_cache.clear()
+    clear_profile_summary_cache()
+    clear_trip_index()
+
+
+def test_profile_reports_per_turn_footprint_by_phase():
+    scenarios = load.load_scenarios()
+    chat = [s for s in scenarios if s["name"] == "casual_chat"]
+    report = mp.profile(chat, load.load_recording(), conversations=1, top=3)
+
+    assert report["turns"] == len(chat[0]["turns"])
+    phase = report["by_phase"]["casual_chat/dreaming"]
+    assert phase["peak_kib"]["max"] > 0
+    assert len(phase["top_allocators"]) <= 3
+    assert set(report["caches"]) >= {"profile_summary", "trip_index"}
+
+
+def test_steady_state_rss_growth_stays_within_budget():
+    if mp.rss_mb() is None:
+        pytest.skip("current RSS is only readable on Linux")
+    turns = int(os.getenv("MEMORY_BUDGET_TURNS", "1000"))
+    report = mp.steady_state_isolated(turns=turns)
+
+    assert report["turns"] >= turns
+    assert report["rss_growth_mb"] <= mp.budget_mb(), report
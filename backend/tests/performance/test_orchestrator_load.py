@@ -0,0 +1,60 @@
+"""Smoke test for the offline orchestrator load profile (orchestrator_load.py).
+
+Runs every scenario once with LLM latency switched off, so it stays fast and
+proves the harness still drives the real orchestrator end to end.
+"""
+
+import json
+
+import pytest
+
+import orchestrator_load as load
+from agentic_traveler.tools import brief_cache, search_cache
+
+
+@pytest.fixture(autouse=True)
+def _clean_caches():
+    yield
+    brief_cache.clear()
+    search_cache.clear()
+
+
+def test_every_scenario_replays_without_errors():
+    scenarios = load.load_scenarios()
+    report = load.run_load(
+        scenarios, load.load_recording(),
+        concurrency=2, conversations=len(scenarios), llm_latency_scale=0,
+    )
+
+    assert report["turns"] == sum(len(s["turns"]) for s in scenarios)
+    assert report["errors"] == 0
+    assert report["unrecorded_call_sites"] == []
+    assert set(report["by_phase"]) == {"dreaming", "shaping", "detailing", "living"}
+    assert report["latency_ms"]["p99"] >= report["latency_ms"]["p50"] > 0
+    assert report["db_round_trips_per_turn"]["mean"] > 0
+    assert report["llm_calls_per_turn"]["mean"] > 0
+    json.dumps(report)  # the artifact must serialise
+
+
+def test_turn_counters_follow_the_turn_context():
+    db = load.FakeSupabase()
+    user_id = db.seed_user({"name": "A"}, credits=10)
+    stats = load.TurnStats()
+    token = load._current.set(stats)
+    try:
+        row = db.table("users").select("*, credits(*)").eq("id", user_id).maybe_single().execute().data
+        db.rpc("bill_turn", {"p_user_id": user_id, "p_cost_credits": 3}).execute()
+    finally:
+        load._current.reset(token)
+
+    assert row["credits"]["balance"] == 10
+    assert db.first("credits", user_id=user_id)["balance"] == 7
+    assert stats.db_round_trips == 2
+
+
+def test_compare_flags_regressions_past_the_threshold():
+    base = {"throughput_turns_per_s": 10.0, "latency_ms": {"p50": 100, "p95": 200, "p99": 300}}
+    head = {"throughput_turns_per_s": 9.5, "latency_ms": {"p50": 100, "p95": 260, "p99": 305}}
+    lines = load.compare(base, head, threshold_pct=10)
+    flagged = [line.split()[0] for line in lines if line.endswith("REGRESSION")]
+    assert flagged == ["latency_ms.p95"]
@@ -0,0 +1,9 @@
+"""Smoke test for the in-flight response retention benchmark."""
+
+import response_retention
+
+
+def test_artifacts_pin_far_less_than_raw_responses():
+    raw = response_retention.measure("raw", turns=8, searches=2)
+    artifacts = response_retention.measure("artifacts", turns=8, searches=2)
+    assert artifacts["held_kib_per_turn"] * 3 < raw["held_kib_per_turn"]
@@ -0,0 +1,12 @@
+"""Smoke test for the traceable-decorator overhead benchmark."""
+
+import trace_overhead
+
+
+def test_run_reports_every_state_and_unsampled_is_cheaper_than_sampled():
+    result = trace_overhead.run(number=50)
+    assert set(result) == {
+        "plain_us_per_call", "disabled_overhead_us_per_call",
+        "unsampled_overhead_us_per_call", "sampled_overhead_us_per_call",
+    }
+    assert result["unsampled_overhead_us_per_call"] < result["sampled_overhead_us_per_call"]
@@ -0,0 +1,84 @@
+"""
+Per-call overhead of ``observability.traceable`` in each tracing state.
+
+A small traced call tree (a root wrapping ``FANOUT`` nested traced calls,
+the shape of one orchestrator turn) is timed against the same tree
+undecorated:
+
+- ``disabled``  — tracing off, ``traceable`` is the identity;
+- ``unsampled`` — tracing on, turn dropped by head sampling;
+- ``sampled``   — tracing on, turn kept, spans written by the local file
+  exporter (to the null device, so disk speed is not measured).
+
+LangSmith itself is left out (it needs a project and network). Run from
+``backend/``:
+
+    python tests/performance/trace_overhead.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from typing import Any, Callable, Dict
+from unittest.mock import patch
+
+from agentic_traveler.core import observability
+
+FANOUT = 10
+
+
+def _tree(decorator: Callable) -> Callable[[], int]:
+    @decorator(name="leaf")
+    def leaf(i: int, payload: Dict[str, Any]) -> int:
+        return i + len(payload)
+
+    @decorator(name="root")
+    def root() -> int:
+        payload = {"message": "Plan four days in Lisbon", "history": ["x" * 200] * 5}
+        return sum(leaf(i, payload) for i in range(FANOUT))
+
+    return root
+
+
+def build(state: str) -> Callable[[], int]:
+    """The call tree decorated as in ``state`` (``plain`` = undecorated)."""
+    if state in ("plain", "disabled"):
+        # Tracing off: ``traceable`` is ``_noop_traceable``.
+        return _tree(observability._noop_traceable)
+    exporter = observability.FileTraceExporter(os.devnull)
+    with patch.object(observability, "_langsmith_traceable", None), \
+         patch.object(observability, "_exporter", exporter):
+        return _tree(observability._sampling_traceable)
+
+
+def measure(state: str, number: int = 2000, repeat: int = 5) -> float:
+    """Best-of-``repeat`` µs per traced call (``FANOUT + 1`` calls per run)."""
+    fn = build(state)
+    rate = 1.0 if state == "sampled" else 0.0
+    with patch.object(observability, "_SAMPLE_RATE", rate):
+        best = min(timeit.repeat(fn, number=number, repeat=repeat))
+    return best / number / (FANOUT + 1) * 1e6
+
+
+def run(number: int = 2000) -> Dict[str, float]:
+    plain = measure("plain", number)
+    results = {"plain_us_per_call": round(plain, 3)}
+    for state in ("disabled", "unsampled", "sampled"):
+        results[f"{state}_overhead_us_per_call"] = round(measure(state, number) - plain, 3)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000, help="call trees per repeat")
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.number), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -202,3 +202,87 @@ def test_planning_curiosity_suffix_once_per_day():
                                     EventEmitter(user_id="u1", trip_id="t1"))
     assert suffix == ""
     assert side_effects == []
+
+
+# ── candidate index + hot reload ─────────────────────────────────────────────
+
+def _full_scan_match(p, state, scores, motivations, has_dest):
+    """Every trigger gate checked directly — the reference for the index."""
+    trig = p.trigger
+    if state not in trig.states or (trig.requires_destination and not has_dest):
+        return False
+    if trig.motivation_any and not {m.lower() for m in trig.motivation_any} & motivations:
+        return False
+    return CuriosityPromptInjector._profile_ok(p, scores)
+
+
+def test_index_selects_exactly_what_a_full_scan_would():
+    import random
+
+    rng = random.Random(7)
+    states = sorted(_STATES)
+    tags = ["rest", "aesthetic", "food", "Adventure", "culture"]
+    lib = [
+        _entry(
+            id=f"p{i}",
+            states=rng.sample(states, rng.randint(1, 3)),
+            motivation_any=rng.sample(tags, rng.randint(1, 2)) if rng.random() < 0.6 else None,
+            requires_destination=rng.random() < 0.3,
+            profile={"exploration_tolerance_min": 0.5} if rng.random() < 0.2 else {},
+        )
+        for i in range(300)
+    ]
+    inj = CuriosityPromptInjector(library=lib)
+    for _ in range(200):
+        state = rng.choice(states)
+        motivations = {t.lower() for t in rng.sample(tags, rng.randint(0, 3))}
+        scores = {"exploration_tolerance": rng.random()}
+        has_dest = rng.random() < 0.5
+        expected = [p for p in lib if _full_scan_match(p, state, scores, motivations, has_dest)]
+        got = inj._candidates(state, scores, motivations, has_dest)
+        assert [p.id for p in got] == [p.id for p in expected]
+
+
+def _write_library(path, ids):
+    import yaml
+
+    path.write_text(yaml.safe_dump([
+        {"id": i, "source": {"author": "A", "title": "T"},
+         "trigger": {"states": ["DREAMING"]}, "text": "q", "rationale": "r"}
+        for i in ids
+    ]), encoding="utf-8")
+
+
+def test_reload_swaps_the_index_and_keeps_it_on_a_bad_file(tmp_path):
+    import os
+
+    path = tmp_path / "prompts.yaml"
+    _write_library(path, ["a"])
+    inj = CuriosityPromptInjector(library_path=path, reload_interval_s=0)
+    before = inj._index
+
+    _write_library(path, ["a", "b"])
+    assert inj.reload() is True
+    assert [p.id for p in inj._index.library] == ["a", "b"]
+    assert before.library[0].id == "a"  # a reader holding the old index is unaffected
+
+    path.write_text("- id: broken\n", encoding="utf-8")
+    os.utime(path, (0, 0))
+    assert inj.reload() is False
+    assert [p.id for p in inj._index.library] == ["a", "b"]
+
+
+def test_select_reloads_a_changed_file_in_the_background(tmp_path):
+    import os
+
+    path = tmp_path / "prompts.yaml"
+    _write_library(path, ["a"])
+    inj = CuriosityPromptInjector(library_path=path, reload_interval_s=0.001)
+    _write_library(path, ["b"])
+    os.utime(path, (1, 1))
+
+    inj._next_check = 0.0
+    inj.select("DREAMING", _user(), {})  # served from the old index; reload starts
+    assert inj._reload_lock.acquire(timeout=5)  # background reload finished
+    inj._reload_lock.release()
+    assert inj.select("DREAMING", _user(), {}).id == "b"
@@ -138,3 +138,56 @@ def test_no_pii_keys_in_metadata():
             kwargs = mock_attach.call_args.kwargs
             assert set(kwargs.keys()).issubset({"user_id_hash", "surface"})
 
+
+
+def _file_traced(tmp_path):
+    """Decorate a small call tree with the sampling decorator over a file exporter."""
+    from agentic_traveler.core import observability
+
+    exporter = observability.FileTraceExporter(str(tmp_path / "traces.jsonl"))
+    with patch.object(observability, "_langsmith_traceable", None), \
+         patch.object(observability, "_exporter", exporter):
+        @observability._sampling_traceable(name="inner", process_inputs=lambda i: {"x": i["x"]})
+        def inner(x, client=None):
+            observability.attach_run_metadata(surface="web")
+            return x * 2
+
+        @observability._sampling_traceable(name="outer")
+        def outer(x):
+            return inner(x, client=object()) + 1
+
+    return exporter, outer
+
+
+def test_sampled_turn_writes_a_linked_span_tree(tmp_path):
+    import json
+    from agentic_traveler.core import observability
+
+    exporter, outer = _file_traced(tmp_path)
+    with patch.object(observability, "_SAMPLE_RATE", 1.0):
+        assert outer(3) == 7
+    exporter.close()
+
+    spans = [json.loads(line) for line in open(exporter.path, encoding="utf-8")]
+    inner, outer_span = spans  # children finish first
+    assert (inner["name"], outer_span["name"]) == ("inner", "outer")
+    assert inner["trace_id"] == outer_span["trace_id"]
+    assert inner["parent_id"] == outer_span["span_id"] and outer_span["parent_id"] is None
+    assert inner["inputs"] == {"x": 3} and inner["output"] == 6
+    assert inner["metadata"] == {"surface": "web"}
+    assert observability._turn_sampled.get() is None  # decision scoped to the turn
+
+
+def test_unsampled_turn_skips_tracing_and_decides_once(tmp_path):
+    from agentic_traveler.core import observability
+
+    exporter, outer = _file_traced(tmp_path)
+    with patch.object(observability, "_decide", return_value=False) as decide, \
+         patch("langsmith.run_helpers.get_current_run_tree") as get_rt, \
+         patch.object(observability, "_TRACING_ENABLED", True):
+        assert outer(3) == 7
+        assert outer(4) == 9
+    decide.assert_called()
+    assert decide.call_count == 2  # once per root call, never for nested ones
+    get_rt.assert_not_called()  # metadata lookup skipped for unsampled turns
+    assert not (tmp_path / "traces.jsonl").exists()
@@ -0,0 +1,86 @@
+"""Deferred destination geocoding tests. Nominatim and Supabase mocked."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from agentic_traveler.tools import geocode_queue
+
+_GEOCODE = "agentic_traveler.tools.geocode_queue.geocode_destination"
+_WRITE = "agentic_traveler.tools.trip_repo.TripRepository.set_destination_coords"
+
+
+def _coords(name):
+    return {"lat": float(len(name)), "lon": 0.0, "display_name": name}
+
+
+@pytest.fixture(autouse=True)
+def _drained():
+    yield
+    assert geocode_queue.wait_idle(5.0)
+
+
+def test_enqueue_never_waits_on_the_geocoder():
+    release = threading.Event()
+
+    def slow(name):
+        release.wait(timeout=2.0)
+        return _coords(name)
+
+    with patch(_GEOCODE, side_effect=slow), patch(_WRITE, return_value=2):
+        t = time.perf_counter()
+        geocode_queue.enqueue("trip-1", [("d1", "Kyoto"), ("d2", "Osaka")])
+        assert time.perf_counter() - t < 0.1
+        release.set()
+        assert geocode_queue.wait_idle(5.0)
+
+
+def test_one_batched_write_per_trip():
+    with patch(_GEOCODE, side_effect=_coords), patch(_WRITE, return_value=3) as write:
+        geocode_queue.enqueue("trip-1", [("d1", "Kyoto"), ("d2", "Osaka"), ("d3", "Nara")])
+        assert geocode_queue.wait_idle(5.0)
+    write.assert_called_once()
+    trip_id, coords = write.call_args.args
+    assert trip_id == "trip-1"
+    assert set(coords) == {"d1", "d2", "d3"}
+    assert coords["d1"]["display_name"] == "Kyoto"
+
+
+def test_each_distinct_name_is_geocoded_once_across_trips():
+    gate = threading.Event()
+    calls = []
+
+    def first_blocks(name):
+        calls.append(name)
+        if len(calls) == 1:
+            gate.wait(timeout=2.0)
+        return _coords(name)
+
+    with patch(_GEOCODE, side_effect=first_blocks), patch(_WRITE, return_value=1) as write:
+        geocode_queue.enqueue("trip-0", [("d0", "Lisbon")])
+        # Queued while the worker is busy → drained together in the next pass.
+        geocode_queue.enqueue("trip-1", [("d1", "Kyoto")])
+        geocode_queue.enqueue("trip-2", [("d2", " kyoto ")])
+        gate.set()
+        assert geocode_queue.wait_idle(5.0)
+    assert sorted(calls) == ["Kyoto", "Lisbon"]
+    assert {c.args[0] for c in write.call_args_list} == {"trip-0", "trip-1", "trip-2"}
+
+
+def test_unresolved_names_are_not_written():
+    with patch(_GEOCODE, return_value=None), patch(_WRITE) as write:
+        geocode_queue.enqueue("trip-1", [("d1", "Nowhere-ville")])
+        assert geocode_queue.wait_idle(5.0)
+    write.assert_not_called()
+
+
+def test_write_failure_does_not_stop_the_worker():
+    with patch(_GEOCODE, side_effect=_coords), patch(_WRITE, side_effect=RuntimeError("db down")):
+        geocode_queue.enqueue("trip-1", [("d1", "Kyoto")])
+        assert geocode_queue.wait_idle(5.0)
+    with patch(_GEOCODE, side_effect=_coords), patch(_WRITE, return_value=1) as write:
+        geocode_queue.enqueue("trip-1", [("d1", "Kyoto")])
+        assert geocode_queue.wait_idle(5.0)
+    write.assert_called_once()
@@ -0,0 +1,115 @@
+"""Tests for the Telegram-ID → user-UUID identity cache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agentic_traveler.analytics.usage_tracker import _resolve_user_uuid
+from agentic_traveler.tools import identity_cache
+from agentic_traveler.tools.user_repo import UserRepository
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    identity_cache.clear()
+    yield
+    identity_cache.clear()
+
+
+def _db_returning(data):
+    db = MagicMock()
+    db.table.return_value.select.return_value.eq.return_value.maybe_single.return_value \
+        .execute.return_value.data = data
+    return db
+
+
+def test_resolves_with_narrow_query_then_serves_from_memory():
+    db = _db_returning({"id": "uuid-1"})
+    with patch("agentic_traveler.tools.identity_cache.get_db", return_value=db):
+        for _ in range(5):
+            assert identity_cache.resolve_user_uuid("123") == "uuid-1"
+
+    db.table.return_value.select.assert_called_once_with("id")
+    assert identity_cache.stats() == {"size": 1, "hits": 4, "misses": 1}
+
+
+def test_misses_are_not_cached():
+    db = _db_returning(None)
+    with patch("agentic_traveler.tools.identity_cache.get_db", return_value=db):
+        assert identity_cache.resolve_user_uuid("404") is None
+        assert identity_cache.resolve_user_uuid("404") is None
+    assert db.table.call_count == 2
+
+
+def test_lookup_failure_returns_none():
+    db = MagicMock()
+    db.table.side_effect = ConnectionError("down")
+    with patch("agentic_traveler.tools.identity_cache.get_db", return_value=db):
+        assert identity_cache.resolve_user_uuid("123") is None
+
+
+def test_lru_evicts_least_recently_used():
+    with patch.object(identity_cache, "MAX_ENTRIES", 2):
+        identity_cache.remember("a", "ua")
+        identity_cache.remember("b", "ub")
+        identity_cache.remember("a", "ua")  # touch "a"
+        identity_cache.remember("c", "uc")
+    assert set(identity_cache._cache) == {"a", "c"}
+
+
+def test_invalidate_by_telegram_id_and_by_user_id():
+    identity_cache.remember("a", "u1")
+    identity_cache.remember("b", "u1")
+    identity_cache.remember("c", "u2")
+    identity_cache.invalidate(telegram_id="c")
+    assert "c" not in identity_cache._cache
+    identity_cache.invalidate(user_id="u1")
+    assert identity_cache.stats()["size"] == 0
+
+
+def test_link_flow_invalidates_stale_mapping():
+    identity_cache.remember("tg-9", "old-user")
+    db = MagicMock()
+    db.table.return_value.select.return_value.eq.return_value.maybe_single.return_value \
+        .execute.return_value.data = None
+    db.table.return_value.update.return_value.eq.return_value.execute.return_value.data = [
+        {"id": "web-user"}
+    ]
+    with patch("agentic_traveler.tools.user_repo.get_db", return_value=db):
+        ok, _msg = UserRepository().link_telegram_to_web_user("web-user", "tg-9")
+    assert ok
+    assert "tg-9" not in identity_cache._cache
+
+
+def test_full_user_fetch_primes_cache():
+    row = {"id": "uuid-7", "telegram_id": "77"}
+    db = _db_returning(row)
+    with patch("agentic_traveler.tools.user_repo.get_db", return_value=db):
+        UserRepository().get_user_with_ref("77")
+    with patch("agentic_traveler.tools.identity_cache.get_db") as mock_get_db:
+        assert _resolve_user_uuid("77") == "uuid-7"
+    mock_get_db.assert_not_called()
+
+
+def test_entries_expire_after_ttl():
+    db = _db_returning({"id": "uuid-1"})
+    with patch("agentic_traveler.tools.identity_cache.get_db", return_value=db):
+        with patch.object(identity_cache, "TTL_S", -1):
+            assert identity_cache.resolve_user_uuid("123") == "uuid-1"
+        db.table.return_value.select.return_value.eq.return_value.maybe_single.return_value \
+            .execute.return_value.data = None  # account deleted from the web app
+        assert identity_cache.resolve_user_uuid("123") is None
+
+
+def test_empty_full_user_fetch_invalidates_the_chat():
+    identity_cache.remember("88", "deleted-user")
+    with patch("agentic_traveler.tools.user_repo.get_db", return_value=_db_returning(None)):
+        assert UserRepository().get_user_with_ref("88") == (None, None)
+    assert "88" not in identity_cache._cache
+
+
+def test_usage_tracker_passes_uuids_through():
+    uid = "550e8400-e29b-41d4-a716-446655440000"
+    with patch("agentic_traveler.tools.identity_cache.get_db") as mock_get_db:
+        assert _resolve_user_uuid(uid) == uid
+    mock_get_db.assert_not_called()
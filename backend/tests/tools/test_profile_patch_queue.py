@@ -0,0 +1,210 @@
+"""Tests for the per-user profile patch queue (versioned user_profiles writes)."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from agentic_traveler.orchestrator.profile_agent import ProfileAgent
+from agentic_traveler.tools import profile_patch_queue as ppq
+from agentic_traveler.tools.user_repo import UserRepository
+
+
+class _VersionedProfiles:
+    """In-memory ``user_profiles`` with the version trigger's semantics.
+
+    ``interfere`` makes that many updates lose to a simulated outside writer
+    (the web app, another instance) that bumps the row's version first.
+    """
+
+    def __init__(self, interfere=0):
+        self.rows = {}
+        self.interfere = interfere
+        self.conflicts = 0
+        self._lock = threading.Lock()
+
+    def table(self, name):
+        assert name == "user_profiles"
+        return _Query(self)
+
+
+class _Query:
+    def __init__(self, store):
+        self.store = store
+        self.mode = None
+        self.payload = None
+        self.filters = {}
+
+    def select(self, _cols):
+        self.mode = "select"
+        return self
+
+    def update(self, fields):
+        self.mode, self.payload = "update", fields
+        return self
+
+    def insert(self, row):
+        self.mode, self.payload = "insert", row
+        return self
+
+    def eq(self, col, value):
+        self.filters[col] = value
+        return self
+
+    def maybe_single(self):
+        return self
+
+    def execute(self):
+        store = self.store
+        uid = self.filters.get("user_id") or (self.payload or {}).get("user_id")
+        with store._lock:
+            row = store.rows.get(uid)
+            if self.mode == "select":
+                time.sleep(0.001)  # widen the read→write window
+                return _Resp(dict(row) if row else None)
+            if self.mode == "insert":
+                if row is not None:
+                    raise RuntimeError("duplicate key value violates unique constraint")
+                store.rows[uid] = {"profile_data": {}, "summary": "", "version": 0,
+                                   **{k: v for k, v in self.payload.items() if k != "user_id"}}
+                return _Resp([store.rows[uid]])
+            # update … WHERE user_id = … AND version = …
+            if row is not None and store.interfere > 0:
+                store.interfere -= 1
+                row["version"] += 1
+            if row is None or row["version"] != self.filters.get("version"):
+                store.conflicts += 1
+                return _Resp([])
+            row.update(self.payload)
+            row["version"] += 1
+            return _Resp([row])
+
+
+class _Resp:
+    def __init__(self, data):
+        self.data = data
+
+
+@pytest.fixture
+def store():
+    fake = _VersionedProfiles()
+    with patch("agentic_traveler.tools.db_client.get_db", return_value=fake):
+        yield fake
+
+
+# ── apply_patch ───────────────────────────────────────────────────────────────
+
+def test_add_creates_intermediate_objects():
+    doc = {"profile_data": {}, "summary": ""}
+    out = ppq.apply_patch(doc, [
+        {"op": "add", "path": "/profile_data/answered_questions/q~1a", "value": 1},
+    ])
+    assert out["profile_data"] == {"answered_questions": {"q/a": 1}}
+    assert doc == {"profile_data": {}, "summary": ""}
+
+
+def test_remove_missing_and_failed_test_raise():
+    doc = {"profile_data": {"tags": ["a"]}, "summary": ""}
+    with pytest.raises(ppq.PatchError):
+        ppq.apply_patch(doc, [{"op": "remove", "path": "/profile_data/nope"}])
+    with pytest.raises(ppq.PatchError):
+        ppq.apply_patch(doc, [{"op": "test", "path": "/profile_data/tags", "value": []}])
+    out = ppq.apply_patch(doc, [{"op": "add", "path": "/profile_data/tags/-", "value": "b"}])
+    assert out["profile_data"]["tags"] == ["a", "b"]
+
+
+def test_profile_ops_skip_unchanged_keys():
+    ops = ppq.profile_ops(
+        {"tags": ["x"], "budget": "luxury", "summary": "New."},
+        {"tags": ["x"], "budget": "mid", "summary": "Old."},
+    )
+    assert ops == [
+        {"op": "add", "path": "/profile_data/budget", "value": "luxury"},
+        {"op": "add", "path": "/summary", "value": "New."},
+    ]
+
+
+# ── queue ─────────────────────────────────────────────────────────────────────
+
+def test_concurrent_patches_all_land(store):
+    store.rows["u1"] = {"profile_data": {"tags": ["Solo"]}, "summary": "s", "version": 0}
+    store.interfere = ppq.MAX_ATTEMPTS - 1  # outside writers race the worker repeatedly
+    repo = UserRepository()
+
+    def work(i):
+        if i % 2:
+            repo.merge_answered_question("u1", f"q{i}", i)
+        else:
+            ppq.submit("u1", ppq.profile_ops({f"pref_{i}": i}))
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(work, range(80)))
+
+    profile = store.rows["u1"]["profile_data"]
+    assert profile["tags"] == ["Solo"]
+    assert {f"q{i}" for i in range(1, 80, 2)} == set(profile["answered_questions"])
+    assert all(profile[f"pref_{i}"] == i for i in range(0, 80, 2))
+    assert store.rows["u1"]["summary"] == "s"
+    assert store.conflicts >= ppq.MAX_ATTEMPTS - 1
+
+
+def test_patches_apply_in_enqueue_order(store):
+    futures = [
+        ppq.enqueue("u2", [{"op": "add", "path": "/summary", "value": f"v{i}"}])
+        for i in range(20)
+    ]
+    assert all(f.result(timeout=5) for f in futures)
+    assert store.rows["u2"]["summary"] == "v19"
+
+
+def test_guard_keeps_chat_answer_over_tally_backfill(store):
+    repo = UserRepository()
+    repo.merge_answered_question("u3", "pace", "slow", "chat_tap")
+    repo.merge_answered_question("u3", "pace", "fast", "tally_backfill")
+    assert store.rows["u3"]["profile_data"]["answered_questions"]["pace"]["value"] == "slow"
+
+
+def test_unchanged_since_rejects_a_moved_or_added_key():
+    base = {"tags": ["Solo"], "summary": "s"}
+    doc = {"profile_data": {"tags": ["Solo"]}, "summary": "s"}
+    assert ppq.unchanged_since(base, ["tags", "summary", "budget"])(doc)
+    assert not ppq.unchanged_since(base, ["tags"])({**doc, "profile_data": {"tags": ["Duo"]}})
+    assert not ppq.unchanged_since(base, ["budget"])({**doc, "profile_data": {"budget": "mid"}})
+
+
+def test_concurrent_preferences_on_one_key_both_land(store):
+    store.rows["u5"] = {"profile_data": {"tags": ["Solo"]}, "summary": "", "version": 0}
+    both_read = threading.Barrier(2)
+    calls = []
+
+    def merge(_agent, preference, profile):
+        calls.append(preference)
+        if len(calls) <= 2:
+            both_read.wait(timeout=5)  # both merges start from the same snapshot
+        return {"tags": profile["tags"] + [preference]}, None, 0.0
+
+    agent = ProfileAgent()
+    with patch.object(ProfileAgent, "update_profile", merge):
+        threads = [
+            threading.Thread(target=agent.save_preference, args=(pref, {}, "u5"), kwargs={"_sync": True})
+            for pref in ("Beach", "Food")
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10)
+
+    assert sorted(store.rows["u5"]["profile_data"]["tags"]) == ["Beach", "Food", "Solo"]
+    assert len(calls) == 3  # the stale merge was recomputed once
+
+
+def test_persistent_conflict_surfaces_error(store):
+    store.rows["u4"] = {"profile_data": {}, "summary": "", "version": 0}
+    store.interfere = ppq.MAX_ATTEMPTS
+    with patch.object(ppq, "_BACKOFF_S", 0):
+        fut = ppq.enqueue("u4", [{"op": "add", "path": "/summary", "value": "x"}])
+        with pytest.raises(ppq.ProfileWriteConflict):
+            fut.result(timeout=5)
+    assert store.rows["u4"]["summary"] == ""
@@ -10,9 +10,12 @@ Sample inputs / expected outputs are documented inline with each test.
 
 from __future__ import annotations
 
+import contextvars
+
 import pytest
 from unittest.mock import MagicMock, patch
 
+from agentic_traveler.tools import trip_repo
 from agentic_traveler.tools.trip_repo import (
     Trip,
     TripDestination,
@@ -238,6 +241,74 @@ class TestListTripSummaries:
         assert s.destinations[0]["status"] == "confirmed"
 
 
+class TestTripSummaryIndex:
+    @pytest.fixture(autouse=True)
+    def _empty_index(self):
+        trip_repo.clear_trip_index()
+        yield
+        trip_repo.clear_trip_index()
+
+    def _db(self, rows):
+        db = MagicMock()
+        db.table.return_value.select.return_value.eq.return_value \
+            .order.return_value.order.return_value.execute.return_value \
+            = MagicMock(data=rows)
+        return db
+
+    def test_cached_summaries_hit_until_a_write_invalidates(self):
+        rows = [{
+            "id": "trip-1", "title": "Kyoto", "status": "dreaming",
+            "saga_state": "LIVING", "updated_at": "2026-01-01T00:00:00+00:00",
+            "timeframe": {"start_date": "2027-04-01", "end_date": "2027-04-10"},
+        }]
+        db = self._db(rows)
+        with patch("agentic_traveler.tools.trip_repo.get_db", return_value=db):
+            repo = TripRepository()
+            first = repo.list_trip_summaries("user-1", cached=True)
+            second = repo.list_trip_summaries("user-1", cached=True)
+            assert db.table.call_count == 1
+            assert first == second and first[0].timeframe["end_date"] == "2027-04-10"
+            assert "discovery->timeframe" in db.table.return_value.select.call_args.args[0]
+
+            trip_repo.invalidate_trip_index("user-1")
+            repo.list_trip_summaries("user-1", cached=True)
+            repo.list_trip_summaries("user-1")  # uncached read always queries
+        assert db.table.call_count == 3
+
+    def test_failed_fetch_is_not_cached(self):
+        db = self._db([])
+        db.table.return_value.select.return_value.eq.return_value \
+            .order.return_value.order.return_value.execute.side_effect = [RuntimeError("down"),
+                                                                          MagicMock(data=[])]
+        with patch("agentic_traveler.tools.trip_repo.get_db", return_value=db):
+            repo = TripRepository()
+            assert repo.list_trip_summaries("user-1", cached=True) == []
+            assert repo.list_trip_summaries("user-1", cached=True) == []
+        assert trip_repo.trip_index_stats()["loads"] == 2
+
+    def test_trip_write_invalidates_the_owners_index(self):
+        db = _make_db(trip_row=_TRIP_ROW)
+        with patch("agentic_traveler.tools.trip_repo.get_db", return_value=db), \
+             patch.object(trip_repo, "invalidate_trip_index") as invalidate:
+            TripRepository().upsert_trip("user-1", {"id": "trip-1", "title": "Kyoto"})
+        invalidate.assert_called_once_with("user-1")
+
+    def test_reads_are_counted_per_turn(self):
+        db = _make_db(trip_row=_TRIP_ROW)
+
+        def turn():
+            io = trip_repo.begin_trip_io_capture()
+            with patch("agentic_traveler.tools.trip_repo.get_db", return_value=db):
+                repo = TripRepository()
+                core = repo.get_trip_core("trip-1")
+                repo.get_trip("trip-1", row=core)
+            return io
+
+        io = contextvars.copy_context().run(turn)
+        assert io["queries"] == 6  # parent once + five child tables
+        assert io["bytes"] > len("trip-1")
+
+
 # ---------------------------------------------------------------------------
 # upsert_trip
 # ---------------------------------------------------------------------------
@@ -448,6 +519,53 @@ class TestChildUpserts:
                 repo.upsert_destination("trip-1", "user-1", {"id": "dest-1", "name": "Kyoto"})
 
 
+# ---------------------------------------------------------------------------
+# merge_discovery — atomic discovery || patch via RPC
+# ---------------------------------------------------------------------------
+
+def test_merge_discovery_calls_rpc_and_reports_ownership():
+    """
+    Input:  merge_discovery("trip-1", "user-1", {"destination_brief": {...}})
+    Expect: one merge_trip_discovery RPC; True when the RPC matched the trip,
+            False when it did not (missing trip or another user's).
+    """
+    db = MagicMock()
+    db.rpc.return_value.execute.return_value = MagicMock(data=True)
+    with patch("agentic_traveler.tools.trip_repo.get_db", return_value=db):
+        assert TripRepository().merge_discovery("trip-1", "user-1", {"destination_brief": {"x": 1}})
+        db.rpc.assert_called_once_with("merge_trip_discovery", {
+            "p_trip_id": "trip-1",
+            "p_user_id": "user-1",
+            "p_patch": {"destination_brief": {"x": 1}},
+        })
+        db.rpc.return_value.execute.return_value = MagicMock(data=False)
+        assert not TripRepository().merge_discovery("trip-1", "user-2", {})
+
+
+# ---------------------------------------------------------------------------
+# set_destination_coords — one batched UPDATE via RPC
+# ---------------------------------------------------------------------------
+
+def test_set_destination_coords_writes_all_rows_in_one_rpc():
+    """
+    Input:  coords for two destination rows of one trip
+    Expect: a single set_destination_coords RPC carrying both rows; returns
+            the updated count. No rows → no RPC.
+    """
+    db = MagicMock()
+    db.rpc.return_value.execute.return_value = MagicMock(data=2)
+    coords = {"lat": 35.0, "lon": 135.7}
+    with patch("agentic_traveler.tools.trip_repo.get_db", return_value=db):
+        repo = TripRepository()
+        assert repo.set_destination_coords("trip-1", {"d1": coords, "d2": coords}) == 2
+        db.rpc.assert_called_once_with("set_destination_coords", {
+            "p_trip_id": "trip-1",
+            "p_rows": [{"id": "d1", "coords": coords}, {"id": "d2", "coords": coords}],
+        })
+        assert repo.set_destination_coords("trip-1", {}) == 0
+        assert db.rpc.call_count == 1
+
+
 # ---------------------------------------------------------------------------
 # Integration test (skipped without _INTEGRATION_TESTS=1)
 # ---------------------------------------------------------------------------
@@ -569,6 +687,8 @@ class TestTripRepositoryIntegration:
             state = rpc_resp.data
             # Bookings exist → DETAILING
             assert state == "DETAILING"
+            # ...and the triggers kept the cached column in step
+            assert repo.get_trip(trip_id).saga_state == "DETAILING"
 
         finally:
             # 9. Cleanup — delete the test trip (cascades to all children)
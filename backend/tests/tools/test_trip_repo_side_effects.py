@@ -20,6 +20,29 @@ def test_trip_patch_routes_to_upsert_trip():
     repo.upsert_trip.assert_called_once_with("u1", {"id": "t1", "preferences": {"pace": "slow"}})
 
 
+def test_trip_patch_discovery_is_merged_not_replaced():
+    # A brief merged by the background pipeline mid-turn must survive the
+    # turn's discovery write, so discovery goes through the merge RPC.
+    repo = TripRepository()
+    repo.upsert_trip = MagicMock()
+    repo.merge_discovery = MagicMock(return_value=True)
+    repo.apply_side_effect("u1", _se("trip_patch", {
+        "id": "t1", "discovery": {"advisor": None}, "preferences": {"pace": "slow"},
+    }))
+    repo.merge_discovery.assert_called_once_with("t1", "u1", {"advisor": None})
+    repo.upsert_trip.assert_called_once_with("u1", {"id": "t1", "preferences": {"pace": "slow"}})
+
+
+def test_discovery_only_trip_patch_skips_the_column_update():
+    repo = TripRepository()
+    repo.upsert_trip = MagicMock()
+    repo.get_trip = MagicMock()
+    repo.merge_discovery = MagicMock(return_value=True)
+    repo.apply_side_effect("u1", _se("trip_patch", {"id": "t1", "discovery": {"timeframe": {}}}))
+    repo.upsert_trip.assert_not_called()
+    repo.get_trip.assert_called_once_with("t1")
+
+
 def test_destination_upsert_routes_and_strips_trip_id():
     repo = TripRepository()
     repo.upsert_destination = MagicMock()
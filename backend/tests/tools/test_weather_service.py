@@ -1,9 +1,26 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch, MagicMock
+
+import pytest
+
+from agentic_traveler.tools import weather
 from agentic_traveler.tools.weather import WeatherService
 
+
+@pytest.fixture(autouse=True)
+def _fresh_weather_caches():
+    weather.clear_caches()
+    yield
+    weather.clear_caches()
+
+
 class TestWeatherService:
 
-    @patch("requests.get")
+    @patch("agentic_traveler.tools.weather._http_get")
     def test_get_coordinates_success(self, mock_get):
         mock_resp = MagicMock()
         mock_resp.json.return_value = {
@@ -23,7 +40,7 @@ class TestWeatherService:
             "admin2": ""
         }
 
-    @patch("requests.get")
+    @patch("agentic_traveler.tools.weather._http_get")
     def test_get_coordinates_no_results(self, mock_get):
         mock_resp = MagicMock()
         mock_resp.json.return_value = {"results": []}
@@ -32,13 +49,13 @@ class TestWeatherService:
         coords = WeatherService.get_coordinates("UnknownCity")
         assert coords is None
 
-    @patch("requests.get")
+    @patch("agentic_traveler.tools.weather._http_get")
     def test_get_coordinates_error(self, mock_get):
         mock_get.side_effect = Exception("API Down")
         coords = WeatherService.get_coordinates("Berlin")
         assert coords is None
 
-    @patch("requests.get")
+    @patch("agentic_traveler.tools.weather._http_get")
     def test_get_coordinates_ambiguous_disambiguation(self, mock_get):
         # Mocking a response where "Kute" (wrong) is rank 0 and "Kuta" (correct) is rank 1
         mock_resp = MagicMock()
@@ -79,7 +96,7 @@ class TestWeatherService:
         assert coords["name"] == "Kute"
         assert coords["admin1"] == "West Nusa Tenggara"
 
-    @patch("requests.get")
+    @patch("agentic_traveler.tools.weather._http_get")
     def test_get_weather_success(self, mock_get):
         mock_resp = MagicMock()
         mock_resp.json.return_value = {
@@ -115,3 +132,105 @@ class TestWeatherService:
     def test_format_weather_summary_no_data(self):
         summary = WeatherService.format_weather_summary("Berlin", {})
         assert "couldn't get the weather details" in summary
+
+
+# ── cached data layer against a local stub Open-Meteo ────────────────────────
+
+class _StubOpenMeteo(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so connection reuse is observable
+    calls = {"/v1/search": 0, "/v1/forecast": 0}
+    connections = set()
+    lock = threading.Lock()
+    forecast_delay_s = 0.0
+
+    def setup(self):
+        super().setup()
+        with self.lock:
+            self.connections.add(self.client_address)
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        with self.lock:
+            self.calls[path] = self.calls.get(path, 0) + 1
+        if path == "/v1/search":
+            body = {"results": [{"latitude": 38.7223, "longitude": -9.1393,
+                                 "name": "Lisbon", "country": "Portugal"}]}
+        else:
+            time.sleep(self.forecast_delay_s)
+            body = {"daily": {"time": ["2026-03-08"], "temperature_2m_max": [20.0],
+                              "temperature_2m_min": [12.0], "weather_code": [1]}}
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def stub_open_meteo():
+    _StubOpenMeteo.calls = {"/v1/search": 0, "/v1/forecast": 0}
+    _StubOpenMeteo.connections = set()
+    _StubOpenMeteo.forecast_delay_s = 0.0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubOpenMeteo)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    with patch.object(WeatherService, "GEOCODING_API", f"{base}/v1/search"), \
+         patch.object(WeatherService, "WEATHER_API", f"{base}/v1/forecast"), \
+         patch.object(weather, "_session", None):
+        yield _StubOpenMeteo
+    server.shutdown()
+    server.server_close()
+
+
+def test_repeated_lookups_hit_upstream_once(stub_open_meteo):
+    for _ in range(5):
+        coords = WeatherService.get_coordinates("Lisbon,  Portugal")
+        assert coords["name"] == "Lisbon"
+        assert WeatherService.get_weather(coords["lat"], coords["lng"], days=3)
+    # Nearby coordinates round onto the same forecast entry.
+    assert WeatherService.get_weather(38.7249, -9.1401, days=3)
+
+    assert stub_open_meteo.calls == {"/v1/search": 1, "/v1/forecast": 1}
+
+
+def test_forecast_key_includes_range(stub_open_meteo):
+    WeatherService.get_weather(38.72, -9.14, days=3)
+    WeatherService.get_weather(38.72, -9.14, days=7)
+    assert stub_open_meteo.calls["/v1/forecast"] == 2
+
+
+def test_concurrent_identical_lookups_collapse(stub_open_meteo):
+    stub_open_meteo.forecast_delay_s = 0.2
+    with ThreadPoolExecutor(max_workers=12) as pool:
+        results = list(pool.map(
+            lambda _: WeatherService.get_weather(38.72, -9.14, days=5), range(12)
+        ))
+    assert all(r and r["daily"]["weather_code"] == [1] for r in results)
+    assert stub_open_meteo.calls["/v1/forecast"] == 1
+
+
+def test_requests_reuse_pooled_connection(stub_open_meteo):
+    for name in ("Lisbon", "Porto", "Faro", "Braga"):
+        WeatherService.get_coordinates(name)
+    assert stub_open_meteo.calls["/v1/search"] == 4
+    assert len(stub_open_meteo.connections) == 1
+
+
+def test_forecast_expires_at_model_update(stub_open_meteo):
+    WeatherService.get_weather(38.72, -9.14, days=3)
+    key = next(iter(weather._forecast_cache._data))
+    expires_at, _ = weather._forecast_cache._data[key]
+    assert expires_at <= time.time() + weather.FORECAST_TTL_S
+    # Next top of the hour (the upstream refresh), never later.
+    assert expires_at <= (time.time() // 3600 + 1) * 3600 + 1
+
+
+def test_upstream_errors_are_not_cached():
+    with patch("agentic_traveler.tools.weather._http_get",
+               side_effect=[Exception("boom"), MagicMock(json=lambda: {"daily": {"time": []}})]):
+        assert WeatherService.get_weather(1.0, 2.0) is None
+        assert WeatherService.get_weather(1.0, 2.0) == {"daily": {"time": []}}
@@ -39,38 +39,28 @@ export async function POST(request: Request) {
 
   const svc = createServiceClient();
 
-  // Fetch current credits row (service role bypasses RLS write restriction)
-  const { data: cred, error: credErr } = await svc
-    .from("credits")
-    .select("balance, used_promos")
-    .eq("user_id", userRow.id)
-    .maybeSingle();
+  // One atomic RPC (row lock + ledger row), so concurrent redemptions of the
+  // same code apply exactly once. See supabase/schema_public.sql.
+  const { data: outcome, error: rpcErr } = await svc.rpc("redeem_promo_code", {
+    p_user_id: userRow.id,
+    p_code: code,
+    p_amount: creditsToAdd,
+  });
 
-  if (credErr) {
-    console.error("[redeem-promo] credits fetch:", credErr);
-    return NextResponse.json({ error: "Could not verify promo eligibility." }, { status: 500 });
+  if (rpcErr) {
+    console.error("[redeem-promo] rpc:", rpcErr);
+    return NextResponse.json({ error: "Failed to apply promo code." }, { status: 500 });
   }
 
-  const usedPromos: string[] = cred?.used_promos ?? [];
-  if (usedPromos.includes(code)) {
+  const status = (outcome as { status?: string } | null)?.status;
+  if (status === "already_used") {
     return NextResponse.json(
       { error: "This code has already been applied to your account." },
       { status: 400 }
     );
   }
-
-  // Atomically apply
-  const { error: updateErr } = await svc
-    .from("credits")
-    .update({
-      balance: (cred?.balance ?? 0) + creditsToAdd,
-      used_promos: [...usedPromos, code],
-    })
-    .eq("user_id", userRow.id);
-
-  if (updateErr) {
-    console.error("[redeem-promo] update:", updateErr);
-    return NextResponse.json({ error: "Failed to apply promo code." }, { status: 500 });
+  if (status !== "applied") {
+    return NextResponse.json({ error: "Could not verify promo eligibility." }, { status: 500 });
   }
 
   return NextResponse.json({
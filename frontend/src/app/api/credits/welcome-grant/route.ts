@@ -9,7 +9,9 @@ import { createServiceClient } from "@/utils/supabase/service";
  * Amount is controlled by the DEFAULT_USER_CREDITS server-side env var
  * (same name used by the Python backend — default 500).
  *
- * Idempotency: UPDATE only fires when welcome_credits_claimed_at IS NULL.
+ * Idempotency: the claim UPDATE only fires when welcome_credits_claimed_at
+ * IS NULL, and the balance change goes through the apply_credit_delta RPC
+ * keyed welcome:<user_id>, so it lands in credit_ledger exactly once.
  *
  * Responses:
  *   200 { status: "granted",        balance: number }
@@ -50,17 +52,16 @@ export async function POST(request: Request) {
       10
     );
 
-    // ── 4. Atomic UPDATE — only fires if not yet claimed ──────────────────
+    // ── 4. Atomic claim — only fires if not yet claimed ───────────────────
     const { data: updated, error: updateError } = await service
       .from("credits")
       .update({
-        balance: creditAmount,
         initial_grant: creditAmount,
         welcome_credits_claimed_at: new Date().toISOString(),
       })
       .eq("user_id", user.id)
       .is("welcome_credits_claimed_at", null) // idempotency guard
-      .select("balance")
+      .select("user_id")
       .maybeSingle();
 
     if (updateError) {
@@ -75,7 +76,32 @@ export async function POST(request: Request) {
       return NextResponse.json({ status: "already_claimed" });
     }
 
-    return NextResponse.json({ status: "granted", balance: updated.balance });
+    // ── 5. Credit the grant through the ledger ────────────────────────────
+    const { data: balance, error: grantError } = await service.rpc(
+      "apply_credit_delta",
+      {
+        p_user_id: user.id,
+        p_delta: creditAmount,
+        p_reason: "grant",
+        p_idempotency_key: `welcome:${user.id}`,
+      }
+    );
+
+    if (grantError || balance === null) {
+      console.error("[welcome-grant] ledger grant failed:", grantError);
+      // Release the claim so the user can retry; the ledger key keeps a
+      // retry from double-granting if the RPC actually committed.
+      await service
+        .from("credits")
+        .update({ welcome_credits_claimed_at: null })
+        .eq("user_id", user.id);
+      return NextResponse.json(
+        { error: "Failed to grant credits." },
+        { status: 500 }
+      );
+    }
+
+    return NextResponse.json({ status: "granted", balance });
   } catch (err) {
     // Catch-all: ensures the response is always valid JSON.
     // Typical cause: missing SUPABASE_SERVICE_ROLE_KEY env var.
@@ -615,6 +615,7 @@ export type Database = {
           grounded_prompt_count: number | null
           id: number
           model_name: string
+          total_cached_tokens: number | null
           total_cost_credits: number | null
           total_input_tokens: number | null
           total_output_tokens: number | null
@@ -626,6 +627,7 @@ export type Database = {
           grounded_prompt_count?: number | null
           id?: never
           model_name: string
+          total_cached_tokens?: number | null
           total_cost_credits?: number | null
           total_input_tokens?: number | null
           total_output_tokens?: number | null
@@ -637,6 +639,7 @@ export type Database = {
           grounded_prompt_count?: number | null
           id?: never
           model_name?: string
+          total_cached_tokens?: number | null
           total_cost_credits?: number | null
           total_input_tokens?: number | null
           total_output_tokens?: number | null
@@ -660,6 +663,7 @@ export type Database = {
           summary: string | null
           updated_at: string | null
           user_id: string
+          version: number
         }
         Insert: {
           form_response?: Json | null
@@ -667,6 +671,7 @@ export type Database = {
           summary?: string | null
           updated_at?: string | null
           user_id: string
+          version?: number
         }
         Update: {
           form_response?: Json | null
@@ -674,6 +679,7 @@ export type Database = {
           summary?: string | null
           updated_at?: string | null
           user_id?: string
+          version?: number
         }
         Relationships: [
           {
@@ -774,11 +780,45 @@ export type Database = {
         }
         Returns: undefined
       }
+      apply_credit_delta: {
+        Args: {
+          p_delta: number
+          p_idempotency_key: string
+          p_reason: string
+          p_user_id: string
+        }
+        Returns: number
+      }
+      bill_turn: {
+        Args: {
+          p_cost_credits: number
+          p_idempotency_key: string
+          p_usage: Json
+          p_user_id: string
+        }
+        Returns: number
+      }
       deduct_credits: {
         Args: { p_amount: number; p_user_id: string }
         Returns: number
       }
       derive_saga_state: { Args: { p_trip_id: string }; Returns: string }
+      merge_trip_discovery: {
+        Args: { p_patch: Json; p_trip_id: string; p_user_id: string }
+        Returns: boolean
+      }
+      reconcile_credit_ledger: {
+        Args: never
+        Returns: { balance: number; ledger_sum: number; user_id: string }[]
+      }
+      redeem_promo_code: {
+        Args: { p_amount: number; p_code: string; p_user_id: string }
+        Returns: Json
+      }
+      set_destination_coords: {
+        Args: { p_rows: Json; p_trip_id: string }
+        Returns: number
+      }
     }
     Enums: {
       [_ in never]: never
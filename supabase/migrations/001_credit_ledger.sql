@@ -0,0 +1,26 @@
+-- =============================================================================
+-- 001 — credit ledger backfill
+--
+-- Run ONCE, after the credit_ledger table and RPCs from schema_public.sql are
+-- applied. Seeds one 'opening' ledger row per existing credits row so that
+-- reconcile_credit_ledger() starts from balance == sum(ledger). Idempotent:
+-- the opening:<user_id> key is unique, so re-running inserts nothing.
+--
+-- Projects that applied the ledger RPCs and bill_turn while they were
+-- SECURITY DEFINER let any authenticated client call them through PostgREST;
+-- the ALTERs below bring those functions in line with schema_public.sql
+-- (SECURITY INVOKER).
+-- =============================================================================
+
+ALTER FUNCTION public.apply_credit_delta(uuid, integer, text, text) SECURITY INVOKER;
+ALTER FUNCTION public.redeem_promo_code(uuid, text, integer) SECURITY INVOKER;
+ALTER FUNCTION public.reconcile_credit_ledger() SECURITY INVOKER;
+ALTER FUNCTION public.bill_turn(uuid, integer, jsonb, text) SECURITY INVOKER;
+
+INSERT INTO public.credit_ledger (user_id, delta, reason, idempotency_key, balance_after)
+SELECT c.user_id, c.balance, 'opening', 'opening:' || c.user_id, c.balance
+  FROM public.credits c
+ON CONFLICT (idempotency_key) DO NOTHING;
+
+-- Expect zero rows.
+SELECT * FROM public.reconcile_credit_ledger();
@@ -0,0 +1,10 @@
+-- =============================================================================
+-- 002 — usage_tracking.total_cached_tokens
+--
+-- Run ONCE on existing projects: CREATE TABLE IF NOT EXISTS in
+-- schema_public.sql does not add columns to an existing table, and the
+-- bill_turn RPC writes this one. Idempotent.
+-- =============================================================================
+
+ALTER TABLE public.usage_tracking
+  ADD COLUMN IF NOT EXISTS total_cached_tokens bigint DEFAULT 0;
@@ -0,0 +1,11 @@
+-- =============================================================================
+-- 003 — user_profiles.version
+--
+-- Run ONCE on existing projects: CREATE TABLE IF NOT EXISTS in
+-- schema_public.sql does not add columns to an existing table. The
+-- bump_user_profile_version trigger and the backend's profile patch queue
+-- (optimistic concurrency on this column) depend on it. Idempotent.
+-- =============================================================================
+
+ALTER TABLE public.user_profiles
+  ADD COLUMN IF NOT EXISTS version bigint NOT NULL DEFAULT 0;
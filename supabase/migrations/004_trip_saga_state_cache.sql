@@ -0,0 +1,12 @@
+-- =============================================================================
+-- 004 — trips.saga_state backfill
+--
+-- Run ONCE on existing projects, after schema_public.sql has created the
+-- saga_state triggers and the saga_state_date_refresh job. Trips written
+-- before then have a NULL (or stale) saga_state; this fills it from
+-- derive_saga_state(). refresh_trip_saga_state only writes rows whose cache
+-- differs, so re-running is harmless.
+-- =============================================================================
+
+SELECT count(public.refresh_trip_saga_state(id)) AS refreshed
+  FROM public.trips;
@@ -0,0 +1,11 @@
+-- =============================================================================
+-- 005 — trip RPCs run as the caller
+--
+-- Run ONCE on projects that applied schema_public.sql while these functions
+-- were SECURITY DEFINER: with the default PUBLIC execute grant, any
+-- authenticated client could call them through PostgREST and write to trips
+-- it does not own. Re-running is harmless.
+-- =============================================================================
+
+ALTER FUNCTION public.merge_trip_discovery(uuid, uuid, jsonb) SECURITY INVOKER;
+ALTER FUNCTION public.set_destination_coords(uuid, jsonb) SECURITY INVOKER;
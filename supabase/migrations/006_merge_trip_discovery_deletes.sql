@@ -0,0 +1,30 @@
+-- =============================================================================
+-- 006 — merge_trip_discovery deletes null keys
+--
+-- Run ONCE on projects that applied schema_public.sql before turns wrote
+-- discovery through this RPC. A turn now sends only the discovery keys it
+-- changed, with null for a key it clears (e.g. a resolved advisor proposal),
+-- so the merge drops those keys instead of storing a JSON null. Re-running is
+-- harmless.
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.merge_trip_discovery(
+  p_trip_id uuid,
+  p_user_id uuid,
+  p_patch   jsonb
+)
+RETURNS boolean
+LANGUAGE sql
+SECURITY INVOKER
+AS $$
+  WITH updated AS (
+    UPDATE public.trips
+       SET discovery  = (coalesce(discovery, '{}'::jsonb) || p_patch)
+                        - ARRAY(SELECT key FROM jsonb_each(p_patch)
+                                 WHERE value = 'null'::jsonb),
+           updated_at = now()
+     WHERE id = p_trip_id AND user_id = p_user_id
+    RETURNING 1
+  )
+  SELECT EXISTS (SELECT 1 FROM updated);
+$$;
@@ -61,8 +61,9 @@ CREATE POLICY "profiles_self" ON public.user_profiles
 -- ---------------------------------------------------------------------------
 -- credits — authenticated user may READ their own balance (SELECT only)
 -- All writes (deductions, grants, promos) go through service-role code:
---   • Python backend  → deduct_credits RPC, add_credits function
---   • Next.js Route Handler → /api/credits/welcome-grant
+--   • Python backend  → apply_credit_delta / redeem_promo_code RPCs
+--   • Next.js Route Handlers → /api/credits/welcome-grant, /api/credits/redeem-promo
+--     (same RPCs, so every change lands in credit_ledger)
 -- ---------------------------------------------------------------------------
 CREATE POLICY "credits_self_read" ON public.credits
   FOR SELECT
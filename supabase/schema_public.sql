@@ -56,12 +56,16 @@ CREATE TABLE IF NOT EXISTS public.users (
 --     personality_dimensions_scores: { [dimension]: float },
 --     tone_preference: string,
 --     additional_info: string }
+-- version: bumped by bump_user_profile_version() on every UPDATE; the
+--   backend's profile patch queue writes with WHERE version = <read version>
+--   (optimistic concurrency) and retries on conflict.
 -- ---------------------------------------------------------------------------
 CREATE TABLE IF NOT EXISTS public.user_profiles (
   user_id      uuid  PRIMARY KEY REFERENCES public.users(id) ON DELETE CASCADE,
   profile_data jsonb DEFAULT '{}',
   form_response jsonb DEFAULT '{}',
   summary      text  DEFAULT '',
+  version      bigint NOT NULL DEFAULT 0,
   updated_at   timestamptz DEFAULT now()
 );
 
@@ -104,6 +108,7 @@ CREATE TABLE IF NOT EXISTS public.usage_tracking (
   model_name            text   NOT NULL,
   total_input_tokens    bigint DEFAULT 0,
   total_output_tokens   bigint DEFAULT 0,
+  total_cached_tokens   bigint DEFAULT 0,
   call_count            integer DEFAULT 0,
   grounded_prompt_count integer DEFAULT 0,
   total_cost_credits    bigint DEFAULT 0,
@@ -252,7 +257,7 @@ CREATE TABLE IF NOT EXISTS public.trips (
   -- lifecycle
   status          text        NOT NULL DEFAULT 'dreaming'
                               CHECK (status IN ('dreaming','planning','ready','active','past','archived')),
-  saga_state      text,       -- cached; derive_saga_state() is the source of truth
+  saga_state      text,       -- cache kept by refresh_trip_saga_state(); derive_saga_state() is the source of truth
 
   title           text,
   reference_date  date,       -- for list ordering / index
@@ -300,6 +305,91 @@ CREATE INDEX IF NOT EXISTS trip_destinations_trip_idx
   ON public.trip_destinations (trip_id, ord);
 
 
+-- ---------------------------------------------------------------------------
+-- destination_briefs
+-- Cross-user cache of the non-personalized core of destination briefs, one
+-- row per (normalized destination, travel month). Written by the backend on
+-- a cache miss and by scripts/warm_brief_cache.py; rows older than
+-- BRIEF_CACHE_TTL_S are regenerated. Per-trip, personalised copies live in
+-- trips.discovery.destination_brief.
+--   month : 'JAN' .. 'DEC'
+-- ---------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS public.destination_briefs (
+  destination_key text        NOT NULL,
+  month           text        NOT NULL,
+  destination     text        NOT NULL,
+  brief           jsonb       NOT NULL,
+  model_version   text,
+  captured_at     timestamptz NOT NULL DEFAULT now(),
+  PRIMARY KEY (destination_key, month)
+);
+
+ALTER TABLE public.destination_briefs ENABLE ROW LEVEL SECURITY;
+-- No policies -> service role only
+
+
+-- ---------------------------------------------------------------------------
+-- merge_trip_discovery  (RPC — called by the Python backend)
+-- discovery = discovery || p_patch, minus the keys p_patch sets to null.
+-- Every discovery write goes through here (a turn's trip_patch and the
+-- background destination brief). A single UPDATE, so keys written
+-- concurrently by the other writer survive; bumps updated_at so trip
+-- Realtime subscribers refetch.
+-- Returns false when the trip is missing or not owned by p_user_id.
+-- SECURITY INVOKER: p_user_id is caller-supplied, so the ownership check is
+-- only meaningful for the service role; other callers stay under trips RLS.
+-- ---------------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION public.merge_trip_discovery(
+  p_trip_id uuid,
+  p_user_id uuid,
+  p_patch   jsonb
+)
+RETURNS boolean
+LANGUAGE sql
+SECURITY INVOKER
+AS $$
+  WITH updated AS (
+    UPDATE public.trips
+       SET discovery  = (coalesce(discovery, '{}'::jsonb) || p_patch)
+                        - ARRAY(SELECT key FROM jsonb_each(p_patch)
+                                 WHERE value = 'null'::jsonb),
+           updated_at = now()
+     WHERE id = p_trip_id AND user_id = p_user_id
+    RETURNING 1
+  )
+  SELECT EXISTS (SELECT 1 FROM updated);
+$$;
+
+
+-- ---------------------------------------------------------------------------
+-- set_destination_coords  (RPC — called by the Python backend)
+-- Writes geocoded coords onto several trip_destinations rows of one trip in a
+-- single UPDATE (deferred geocoder). p_rows: [{"id": uuid, "coords": {...}}].
+-- The touch_trip_updated_at trigger bumps trips.updated_at (Realtime refetch).
+-- Returns the number of rows updated.
+-- SECURITY INVOKER: there is no ownership check here, so callers other than
+-- the service role stay under trip_destinations RLS.
+-- ---------------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION public.set_destination_coords(
+  p_trip_id uuid,
+  p_rows    jsonb
+)
+RETURNS integer
+LANGUAGE sql
+SECURITY INVOKER
+AS $$
+  WITH updated AS (
+    UPDATE public.trip_destinations d
+       SET coords     = r.coords,
+           updated_at = now()
+      FROM jsonb_to_recordset(p_rows) AS r(id uuid, coords jsonb)
+     WHERE d.id = r.id AND d.trip_id = p_trip_id
+    RETURNING 1
+  )
+  SELECT count(*)::integer FROM updated;
+$$;
+
+
 -- ---------------------------------------------------------------------------
 -- trip_bookings (Task 34)
 -- User-input bookings (flights, hotels, activities, etc.).
@@ -461,6 +551,107 @@ END;
 $$;
 
 
+-- ---------------------------------------------------------------------------
+-- refresh_trip_saga_state
+-- Keeps the trips.saga_state cache equal to derive_saga_state(), so readers
+-- (the backend's TripSummary, vw_saga_dropoff) get the phase from the row
+-- instead of re-deriving it from the trip and its child tables:
+--   * AFTER triggers recompute it on every write that can move the phase
+--     (trips timeframe / preferences / travelers, destination status,
+--     bookings);
+--   * the nightly saga_state_date_refresh job moves trips across the
+--     date-driven phases (READY_TO_GO / LIVING / REMEMBERING), which change
+--     with current_date alone.
+-- A timeframe that does not parse as a date leaves the cache NULL (readers
+-- then derive) instead of failing the write.
+-- Not recursive: the refresh UPDATEs only saga_state, which is not in the
+-- trips trigger's column list.
+-- ---------------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION public.refresh_trip_saga_state(p_trip_id uuid)
+RETURNS text
+LANGUAGE plpgsql AS $$
+DECLARE
+  v_state text;
+BEGIN
+  BEGIN
+    v_state := public.derive_saga_state(p_trip_id);
+  EXCEPTION WHEN invalid_datetime_format OR datetime_field_overflow THEN
+    v_state := NULL;
+  END;
+  UPDATE public.trips
+     SET saga_state = v_state
+   WHERE id = p_trip_id
+     AND saga_state IS DISTINCT FROM v_state;
+  RETURN v_state;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.refresh_saga_state_on_write() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+  IF TG_TABLE_NAME = 'trips' THEN
+    PERFORM public.refresh_trip_saga_state(NEW.id);
+  ELSE
+    PERFORM public.refresh_trip_saga_state(COALESCE(NEW.trip_id, OLD.trip_id));
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS saga_state_on_trips ON public.trips;
+CREATE TRIGGER saga_state_on_trips
+  AFTER INSERT OR UPDATE OF discovery, preferences, travelers ON public.trips
+  FOR EACH ROW EXECUTE FUNCTION public.refresh_saga_state_on_write();
+
+DROP TRIGGER IF EXISTS saga_state_on_trip_destinations ON public.trip_destinations;
+CREATE TRIGGER saga_state_on_trip_destinations
+  AFTER INSERT OR UPDATE OF status, trip_id OR DELETE ON public.trip_destinations
+  FOR EACH ROW EXECUTE FUNCTION public.refresh_saga_state_on_write();
+
+DROP TRIGGER IF EXISTS saga_state_on_trip_bookings ON public.trip_bookings;
+CREATE TRIGGER saga_state_on_trip_bookings
+  AFTER INSERT OR UPDATE OF trip_id OR DELETE ON public.trip_bookings
+  FOR EACH ROW EXECUTE FUNCTION public.refresh_saga_state_on_write();
+
+-- Date-boundary refresh: only trips whose phase can change with the date —
+-- cached in a date-driven phase, departing within 7 days, or ended within
+-- the last 31. Returns the number of trips whose cache changed.
+CREATE OR REPLACE FUNCTION public.refresh_dated_saga_states()
+RETURNS integer
+LANGUAGE plpgsql AS $$
+DECLARE
+  v_trip    record;
+  v_changed integer := 0;
+BEGIN
+  FOR v_trip IN
+    SELECT id, saga_state
+      FROM public.trips
+     WHERE saga_state IN ('READY_TO_GO', 'LIVING', 'REMEMBERING')
+        -- ISO text compares like the date, without casting malformed values
+        OR left(discovery->'timeframe'->>'start_date', 10)
+             BETWEEN current_date::text AND (current_date + 7)::text
+        OR left(discovery->'timeframe'->>'end_date', 10)
+             BETWEEN (current_date - 31)::text AND current_date::text
+  LOOP
+    IF public.refresh_trip_saga_state(v_trip.id) IS DISTINCT FROM v_trip.saga_state THEN
+      v_changed := v_changed + 1;
+    END IF;
+  END LOOP;
+  RETURN v_changed;
+END;
+$$;
+
+-- Just after midnight UTC (current_date rolls over); requires pg_cron.
+SELECT cron.unschedule(jobid)
+  FROM cron.job
+  WHERE jobname = 'saga_state_date_refresh';
+SELECT cron.schedule(
+  'saga_state_date_refresh',
+  '5 0 * * *',
+  $$ SELECT public.refresh_dated_saga_states(); $$
+);
+
+
 -- ---------------------------------------------------------------------------
 -- touch_trip_updated_at (Task 37)
 -- Bumps trips.updated_at whenever any child row changes, so the frontend's
@@ -513,8 +704,30 @@ ORDER BY 1 DESC, 2;
 
 
 -- ---------------------------------------------------------------------------
--- deduct_credits  (RPC — called by the Python backend)
--- Atomically deducts credits, flooring at 0.
+-- bump_user_profile_version
+-- Increments user_profiles.version on every UPDATE, whoever the writer is
+-- (backend patch queue, Tally upserts, the web app), so a versioned write
+-- from the backend's profile patch queue detects any interleaved change.
+-- ---------------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION public.bump_user_profile_version() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+  NEW.version := OLD.version + 1;
+  NEW.updated_at := now();
+  RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS bump_version_on_user_profiles ON public.user_profiles;
+CREATE TRIGGER bump_version_on_user_profiles
+  BEFORE UPDATE ON public.user_profiles
+  FOR EACH ROW EXECUTE FUNCTION public.bump_user_profile_version();
+
+
+-- ---------------------------------------------------------------------------
+-- deduct_credits  (RPC — legacy; superseded by apply_credit_delta)
+-- Atomically deducts credits, flooring at 0, WITHOUT a ledger row or
+-- idempotency key. Kept for older deploys; the backend no longer calls it.
 -- Returns the new balance.
 -- SECURITY INVOKER: caller must have UPDATE permission (service role only,
 -- since the credits RLS policy only grants SELECT to authenticated users).
@@ -536,7 +749,7 @@ $$;
 
 
 -- ---------------------------------------------------------------------------
--- accumulate_user_usage  (RPC — called by the Python backend)
+-- accumulate_user_usage  (RPC — legacy; superseded by bill_turn)
 -- Atomically increments input/output tokens, call count, grounded prompts, and cost credits.
 -- ---------------------------------------------------------------------------
 CREATE OR REPLACE FUNCTION public.accumulate_user_usage(
@@ -584,6 +797,242 @@ END;
 $$;
 
 
+-- ---------------------------------------------------------------------------
+-- credit_ledger
+-- Append-only record of every balance change. credits.balance is the
+-- materialized running total; reconcile_credit_ledger() checks the invariant
+-- balance == sum(delta). Rows are written only by the RPCs below, which
+-- lock the user's credits row, so concurrent mutations serialize per user.
+--   reason          : 'grant' | 'top_up' | 'promo' | 'turn' | 'opening'
+--   idempotency_key : caller-supplied; a replayed key returns the recorded
+--                     outcome instead of applying the change twice.
+--                     Conventions: turn:<turn_id>, promo:<CODE>:<user_id>,
+--                     top_up:<request key>, grant:<user_id>,
+--                     welcome:<user_id> (web welcome grant),
+--                     opening:<user_id> (migrations/001_credit_ledger.sql).
+--   delta           : the APPLIED change (a debit is floored so the balance
+--                     never goes below 0), so the invariant holds exactly.
+-- ---------------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS public.credit_ledger (
+  id              bigint      GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+  user_id         uuid        NOT NULL REFERENCES public.users(id) ON DELETE CASCADE,
+  delta           integer     NOT NULL,
+  reason          text        NOT NULL
+                              CHECK (reason IN ('grant','top_up','promo','turn','opening')),
+  idempotency_key text        NOT NULL UNIQUE,
+  balance_after   integer     NOT NULL,
+  created_at      timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX IF NOT EXISTS credit_ledger_user_idx
+  ON public.credit_ledger (user_id, id);
+
+ALTER TABLE public.credit_ledger ENABLE ROW LEVEL SECURITY;
+-- No policies -> service role only
+
+
+-- ---------------------------------------------------------------------------
+-- apply_credit_delta  (RPC — called by the Python backend)
+-- The single atomic mutation for credits. Positive p_delta adds, negative
+-- deducts (floored at 0). Returns the balance after the change, the recorded
+-- balance when p_idempotency_key was already applied, or NULL when the user
+-- has no credits row.
+-- SECURITY INVOKER: caller must have UPDATE on credits and INSERT on
+-- credit_ledger (service role only), so clients cannot mint credits via RPC.
+-- ---------------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION public.apply_credit_delta(
+  p_user_id         uuid,
+  p_delta           integer,
+  p_reason          text,
+  p_idempotency_key text
+)
+RETURNS integer
+LANGUAGE plpgsql
+SECURITY INVOKER
+AS $$
+DECLARE
+  v_balance integer;
+  v_applied integer;
+BEGIN
+  -- Row lock serializes all mutations for this user.
+  SELECT balance INTO v_balance
+    FROM public.credits WHERE user_id = p_user_id FOR UPDATE;
+  IF NOT FOUND THEN RETURN NULL; END IF;
+
+  SELECT balance_after INTO v_applied
+    FROM public.credit_ledger WHERE idempotency_key = p_idempotency_key;
+  IF FOUND THEN RETURN v_applied; END IF;
+
+  v_applied := GREATEST(p_delta, -v_balance);
+  UPDATE public.credits
+     SET balance     = balance + v_applied,
+         total_spent = total_spent + GREATEST(0, -v_applied),
+         updated_at  = now()
+   WHERE user_id = p_user_id
+  RETURNING balance INTO v_balance;
+
+  INSERT INTO public.credit_ledger (user_id, delta, reason, idempotency_key, balance_after)
+  VALUES (p_user_id, v_applied, p_reason, p_idempotency_key, v_balance);
+  RETURN v_balance;
+END;
+$$;
+
+
+-- ---------------------------------------------------------------------------
+-- bill_turn  (RPC — called by the Python backend, once per turn)
+-- Bills a whole turn in one transaction: accumulates every model's usage into
+-- usage_tracking and applies the turn's ledger deduction (reason 'turn').
+-- p_usage is the turn's usage vector, one object per model:
+--   {"model_name", "input_tokens", "output_tokens", "cached_tokens",
+--    "is_grounded", "cost_credits"}
+-- A replayed p_idempotency_key returns the recorded balance and accumulates
+-- nothing; a zero-cost turn records a zero-delta ledger row so its replay is
+-- caught too. Returns the balance after the turn, or NULL when the user has
+-- no credits row (usage is still accumulated, and nothing makes a replay of
+-- that turn idempotent: there is no balance to record).
+-- SECURITY INVOKER: service role only, like apply_credit_delta.
+-- ---------------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION public.bill_turn(
+  p_user_id         uuid,
+  p_cost_credits    integer,
+  p_usage           jsonb,
+  p_idempotency_key text
+)
+RETURNS integer
+LANGUAGE plpgsql
+SECURITY INVOKER
+AS $$
+DECLARE
+  v_balance integer;
+  v_applied integer;
+  v_item    jsonb;
+BEGIN
+  -- Same row lock as apply_credit_delta, taken first so concurrent replays of
+  -- one turn serialize before the idempotency check.
+  SELECT balance INTO v_balance
+    FROM public.credits WHERE user_id = p_user_id FOR UPDATE;
+
+  SELECT balance_after INTO v_applied
+    FROM public.credit_ledger WHERE idempotency_key = p_idempotency_key;
+  IF FOUND THEN RETURN v_applied; END IF;
+
+  FOR v_item IN SELECT * FROM jsonb_array_elements(COALESCE(p_usage, '[]'::jsonb)) LOOP
+    INSERT INTO public.usage_tracking (
+      user_id, model_name, total_input_tokens, total_output_tokens,
+      total_cached_tokens, call_count, grounded_prompt_count,
+      total_cost_credits, updated_at
+    )
+    VALUES (
+      p_user_id,
+      v_item->>'model_name',
+      COALESCE((v_item->>'input_tokens')::bigint, 0),
+      COALESCE((v_item->>'output_tokens')::bigint, 0),
+      COALESCE((v_item->>'cached_tokens')::bigint, 0),
+      1,
+      COALESCE((v_item->>'is_grounded')::integer, 0),
+      COALESCE((v_item->>'cost_credits')::bigint, 0),
+      now()
+    )
+    ON CONFLICT (user_id, model_name)
+    DO UPDATE SET
+      total_input_tokens    = public.usage_tracking.total_input_tokens + EXCLUDED.total_input_tokens,
+      total_output_tokens   = public.usage_tracking.total_output_tokens + EXCLUDED.total_output_tokens,
+      total_cached_tokens   = public.usage_tracking.total_cached_tokens + EXCLUDED.total_cached_tokens,
+      call_count            = public.usage_tracking.call_count + 1,
+      grounded_prompt_count = public.usage_tracking.grounded_prompt_count + EXCLUDED.grounded_prompt_count,
+      total_cost_credits    = public.usage_tracking.total_cost_credits + EXCLUDED.total_cost_credits,
+      updated_at            = now();
+  END LOOP;
+
+  IF p_cost_credits > 0 THEN
+    RETURN public.apply_credit_delta(p_user_id, -p_cost_credits, 'turn', p_idempotency_key);
+  END IF;
+  IF v_balance IS NOT NULL THEN
+    INSERT INTO public.credit_ledger (user_id, delta, reason, idempotency_key, balance_after)
+    VALUES (p_user_id, 0, 'turn', p_idempotency_key, v_balance);
+  END IF;
+  RETURN v_balance;
+END;
+$$;
+
+
+-- ---------------------------------------------------------------------------
+-- redeem_promo_code  (RPC — called by the Python backend and /api/credits/redeem-promo)
+-- Atomically checks used_promos, credits p_amount and records the code, keyed
+-- promo:<CODE>:<user_id>. Returns {"status": "applied"|"already_used"|"no_account",
+-- "balance": int|null}.
+-- SECURITY INVOKER: service role only, like apply_credit_delta.
+-- ---------------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION public.redeem_promo_code(
+  p_user_id uuid,
+  p_code    text,
+  p_amount  integer
+)
+RETURNS jsonb
+LANGUAGE plpgsql
+SECURITY INVOKER
+AS $$
+DECLARE
+  v_balance integer;
+  v_used    text[];
+BEGIN
+  SELECT balance, coalesce(used_promos, '{}') INTO v_balance, v_used
+    FROM public.credits WHERE user_id = p_user_id FOR UPDATE;
+  IF NOT FOUND THEN
+    RETURN jsonb_build_object('status', 'no_account', 'balance', NULL);
+  END IF;
+  IF p_code = ANY (v_used) THEN
+    RETURN jsonb_build_object('status', 'already_used', 'balance', v_balance);
+  END IF;
+
+  UPDATE public.credits
+     SET balance     = balance + p_amount,
+         used_promos = array_append(v_used, p_code),
+         updated_at  = now()
+   WHERE user_id = p_user_id
+  RETURNING balance INTO v_balance;
+
+  INSERT INTO public.credit_ledger (user_id, delta, reason, idempotency_key, balance_after)
+  VALUES (p_user_id, p_amount, 'promo', 'promo:' || p_code || ':' || p_user_id, v_balance);
+  RETURN jsonb_build_object('status', 'applied', 'balance', v_balance);
+END;
+$$;
+
+
+-- ---------------------------------------------------------------------------
+-- reconcile_credit_ledger  (RPC + nightly pg_cron job)
+-- Returns every user whose materialized balance disagrees with the sum of
+-- their ledger rows. An empty result means the ledger is consistent.
+-- SECURITY INVOKER: credit_ledger has no policies, so only the service role
+-- (and the cron job, which runs as postgres) sees every user's balance.
+-- ---------------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION public.reconcile_credit_ledger()
+RETURNS TABLE (user_id uuid, balance integer, ledger_sum bigint)
+LANGUAGE sql
+STABLE
+SECURITY INVOKER
+AS $$
+  SELECT c.user_id, c.balance, coalesce(sum(l.delta), 0) AS ledger_sum
+    FROM public.credits c
+    LEFT JOIN public.credit_ledger l ON l.user_id = c.user_id
+   GROUP BY c.user_id, c.balance
+  HAVING c.balance <> coalesce(sum(l.delta), 0);
+$$;
+
+-- Nightly drift check; mismatches surface as error_raised analytics events.
+SELECT cron.unschedule(jobid)
+  FROM cron.job
+  WHERE jobname = 'credit_ledger_reconcile';
+SELECT cron.schedule(
+  'credit_ledger_reconcile',
+  '30 3 * * *',
+  $$ INSERT INTO public.analytics_events (event_name, user_id, payload)
+     SELECT 'error_raised', r.user_id,
+            jsonb_build_object('scope', 'credit_ledger', 'error_class', 'balance_drift',
+                               'balance', r.balance, 'ledger_sum', r.ledger_sum)
+       FROM public.reconcile_credit_ledger() r; $$
+);
+
+
 -- ---------------------------------------------------------------------------
 -- analytics_events (Task 35)
 -- Append-only events log. 7-day rolling window enforced by pg_cron.